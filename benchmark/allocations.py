@@ -0,0 +1,170 @@
+"""Memory allocated by each indicator call.
+
+For every indicator and series length this makes one call under
+``tracemalloc``, which also sees the data buffers of NumPy arrays, and
+reports
+    peak_bytes: the high-water mark of the call over the memory before it
+    retained_bytes: what is still held after it, the outputs
+    temporary_bytes: peak_bytes - retained_bytes, the scratch memory
+    arrays: the arrays created through the NumPy functions of ALLOCATORS
+
+The temporaries are compared to a budget counted in float64 buffers of the
+series length: BUDGETS[name], 0 for the indicators not listed. An indicator
+over its budget by more than TOLERANCE buffers plus SLACK_BYTES is flagged
+and the exit status is 1:
+
+    python benchmark/allocations.py [NAME ...] [--sizes 1000 100000] [--output allocations.json]
+"""
+import argparse
+import contextlib
+import functools
+import gc
+import json
+import sys
+import tracemalloc
+import numpy as np
+
+import harness
+import tabox
+
+SIZES = (1000, 100000)
+# Array creation functions the kernels and helpers look up on the numpy module
+ALLOCATORS = ("empty", "zeros", "ones", "full", "empty_like", "zeros_like", "ones_like", "full_like",
+              "array", "asarray", "ascontiguousarray", "arange", "where", "cumsum", "concatenate", "tile")
+# Scratch float64 buffers of the series length each indicator may allocate,
+# rounded up from the audit. The candle patterns hold their candle shapes
+# and running averages, STOCH* and the MA chains (DEMA, TEMA, MACD*) their
+# intermediate series, MAVP its buffer per period and its period indices.
+BUDGETS = {
+    "ADXR": 1, "APO": 1, "AROON": 3, "AROONOSC": 3, "CDL2CROWS": 11, "CDL3BLACKCROWS": 13,
+    "CDL3INSIDE": 12, "CDL3LINESTRIKE": 12, "CDL3OUTSIDE": 10, "CDL3STARSINSOUTH": 14, "CDL3WHITESOLDIERS": 16,
+    "CDLABANDONEDBABY": 13, "CDLADVANCEBLOCK": 16, "CDLBELTHOLD": 12, "CDLBREAKAWAY": 11,
+    "CDLCLOSINGMARUBOZU": 12, "CDLCONCEALBABYSWALL": 13, "CDLCOUNTERATTACK": 13, "CDLDARKCLOUDCOVER": 11,
+    "CDLDOJI": 10, "CDLDOJISTAR": 12, "CDLDRAGONFLYDOJI": 11, "CDLENGULFING": 10, "CDLEVENINGDOJISTAR": 13,
+    "CDLEVENINGSTAR": 13, "CDLGAPSIDESIDEWHITE": 11, "CDLGRAVESTONEDOJI": 11, "CDLHAMMER": 13,
+    "CDLHANGINGMAN": 13, "CDLHARAMI": 12, "CDLHARAMICROSS": 12, "CDLHIGHWAVE": 11, "CDLHIKKAKE": 12,
+    "CDLHIKKAKEMOD": 13, "CDLHOMINGPIGEON": 12, "CDLIDENTICAL3CROWS": 15, "CDLINNECK": 12,
+    "CDLINVERTEDHAMMER": 12, "CDLKICKING": 14, "CDLKICKINGBYLENGTH": 15, "CDLLADDERBOTTOM": 11,
+    "CDLLONGLEGGEDDOJI": 10, "CDLLONGLINE": 12, "CDLMARUBOZU": 12, "CDLMATCHINGLOW": 11, "CDLMATHOLD": 15,
+    "CDLMORNINGDOJISTAR": 13, "CDLMORNINGSTAR": 13, "CDLONNECK": 12, "CDLPIERCING": 12, "CDLRICKSHAWMAN": 13,
+    "CDLRISEFALL3METHODS": 15, "CDLSEPARATINGLINES": 13, "CDLSHOOTINGSTAR": 12, "CDLSHORTLINE": 12,
+    "CDLSPINNINGTOP": 11, "CDLSTALLEDPATTERN": 17, "CDLSTICKSANDWICH": 11, "CDLTAKURI": 11, "CDLTASUKIGAP": 11,
+    "CDLTHRUSTING": 12, "CDLTRISTAR": 12, "CDLUNIQUE3RIVER": 12, "CDLUPSIDEGAP2CROWS": 12,
+    "CDLXSIDEGAP3METHODS": 10, "DEMA": 2, "MACD": 2, "MACDEXT": 2, "MACDFIX": 2, "MAVP": 2, "MAX": 1,
+    "MAXINDEX": 1, "MIDPOINT": 2, "MIDPRICE": 2, "MIN": 1, "MININDEX": 1, "MINMAX": 1, "MINMAXINDEX": 1,
+    "PPO": 1, "STOCH": 4, "STOCHF": 4, "STOCHRSI": 5, "TEMA": 2, "TRIX": 1, "WILLR": 2,
+}
+TOLERANCE = 0.1
+# Memoryview objects, index buffers and other allocations independent of the
+# length. It hides a new buffer at 1000 bars, not at 100000.
+SLACK_BYTES = 16384
+
+
+@contextlib.contextmanager
+def count_arrays():
+    """Count the new arrays returned by the ALLOCATORS in the block.
+
+    Yields a one-item list holding the count. Arrays returned unchanged
+    (``np.asarray`` of an array) and views are not counted.
+    """
+    counter = [0]
+
+    def counting(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if type(result) is np.ndarray and result.base is None and all(result is not a for a in args):
+                counter[0] += 1
+            return result
+        return wrapper
+
+    originals = {name: getattr(np, name) for name in ALLOCATORS}
+    try:
+        for name, func in originals.items():
+            setattr(np, name, counting(func))
+        yield counter
+    finally:
+        for name, func in originals.items():
+            setattr(np, name, func)
+
+
+def measure(func, args):
+    """Allocations of one call of ``func(*args)``, after a warm-up call."""
+    func(*args)
+    gc.collect()
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+    try:
+        with count_arrays() as counter:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            result = func(*args)
+            current, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        if not started:
+            tracemalloc.stop()
+    return {
+        "peak_bytes": peak - before,
+        "retained_bytes": current - before,
+        "temporary_bytes": peak - current,
+        "arrays": counter[0],
+    }
+
+
+def run(names, sizes=SIZES, seed=harness.SEED, log=None):
+    """Measure ``names`` and return the results document."""
+    results = {}
+    for name in names:
+        cases = []
+        budget = BUDGETS.get(name, 0)
+        for n in sizes:
+            case = {"n": n}
+            try:
+                func = getattr(tabox, name)
+                case.update(measure(func, harness.arguments(func, harness.make_inputs(n, seed))))
+                case["temporary_buffers"] = case["temporary_bytes"] / (8.0 * n)
+                case["flagged"] = case["temporary_bytes"] > (budget + TOLERANCE) * 8 * n + SLACK_BYTES
+            except Exception as e:
+                case["error"] = str(e)
+            cases.append(case)
+            if log is not None:
+                log(format_case(name, case, budget))
+        results[name] = cases
+    return {"meta": dict(harness.meta(seed, 1, 1, 0), tolerance=TOLERANCE, slack_bytes=SLACK_BYTES), "results": results}
+
+
+def format_case(name, case, budget):
+    label = "Function=%s, N=%d" % (name, case["n"])
+    if "error" in case:
+        return "%s, Error=%s" % (label, case["error"])
+    return "%s, Peak=%dB, Retained=%dB, Temporary=%dB (%.2f buffers, budget %s), Arrays=%d" % (
+        label, case["peak_bytes"], case["retained_bytes"], case["temporary_bytes"],
+        case["temporary_buffers"], budget, case["arrays"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="indicators, all of tabox.fast.__all__ by default")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--seed", type=int, default=harness.SEED)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    options = parser.parse_args(argv)
+
+    names = options.names or [name for name in tabox.fast.__all__ if name.isupper()]
+    document = run(names, options.sizes, options.seed, log=print)
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(document, f, indent=1)
+
+    flagged = sorted({name for name, cases in document["results"].items()
+                      for case in cases if case.get("flagged")})
+    for name in flagged:
+        print("Flagged: Function=%s, Budget=%s buffers" % (name, BUDGETS.get(name, 0)))
+    print("%d of %d indicators over their allocation budget" % (len(flagged), len(names)))
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
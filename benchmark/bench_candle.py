@@ -0,0 +1,42 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+N_BARS = 100000
+
+def separate(open, high, low, close):
+    return [getattr(tabox, name)(open, high, low, close) for name in tabox.candle.PATTERNS]
+
+def bench(func, inputs, repeat=3):
+    time_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        func(*inputs)
+        t2 = time.perf_counter()
+        time_list.append(t2 - t1)
+    print("Function=%s, MinTime=%s" % (func.__name__, min(time_list)))
+
+if __name__ == '__main__':
+    close = np.cumsum(np.random.normal(size=N_BARS)) + 1000
+    open = close + np.random.normal(size=N_BARS)
+    high = np.maximum(open, close) + np.random.exponential(0.5, N_BARS)
+    low = np.minimum(open, close) - np.random.exponential(0.5, N_BARS)
+    inputs = (open, high, low, close)
+    bench(separate, inputs)
+    bench(tabox.candle.scan, inputs)
+    try:
+        import talib
+    except ImportError:
+        talib = None
+    if talib is not None:
+        def talib_separate(open, high, low, close):
+            return [getattr(talib, name)(open, high, low, close) for name in tabox.candle.PATTERNS]
+        bench(talib_separate, inputs)
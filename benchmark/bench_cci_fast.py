@@ -0,0 +1,28 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+from tabox import CCI
+
+def bench_cci_fast(n_bars=20000, repeat=3):
+    high = np.random.random(n_bars) + 1.0
+    low = high - np.random.random(n_bars)
+    close = (high + low) / 2.0
+    for t in (14, 50, 100, 200, 500, 1000):
+        for exact in (True, False):
+            time_list = []
+            for i in range(repeat):
+                t1 = time.time()
+                CCI(high, low, close, timeperiod=t, exact=exact)
+                t2 = time.time()
+                time_list.append(t2 - t1)
+            print("Function=CCI, TimePeriod=%d, Exact=%s, MinTime=%s" % (t, exact, min(time_list)))
+
+if __name__ == '__main__':
+    bench_cci_fast()
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+N_BARS = 200000
+CHUNK = 1 << 14
+
+def bench(name, func, repeat=1):
+    time_list = []
+    peak_list = []
+    for i in range(repeat):
+        tracemalloc.start()
+        t1 = time.perf_counter()
+        func()
+        t2 = time.perf_counter()
+        peak_list.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        time_list.append(t2 - t1)
+    print("Function=%s, MinTime=%s, PeakMB=%.1f" % (name, min(time_list), max(peak_list) / 1e6))
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as path:
+        close = np.memmap(os.path.join(path, "close"), dtype=np.float64, mode="w+", shape=(N_BARS,))
+        close[:] = np.cumsum(np.random.normal(size=N_BARS)) + 1000.0
+        out = np.memmap(os.path.join(path, "out"), dtype=np.float64, mode="w+", shape=(N_BARS,))
+        bench("RSI in memory", lambda: tabox.RSI(close, 14))
+        bench("RSI chunked", lambda: tabox.chunked.compute(tabox.RSI, close, out, 14, chunk_bars=CHUNK))
+        bench("MAX in memory", lambda: tabox.MAX(close, 30))
+        bench("MAX chunked", lambda: tabox.chunked.compute(tabox.MAX, close, out, 30, chunk_bars=CHUNK))
+        del close, out
@@ -0,0 +1,42 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+N_BARS = 100000
+
+# Declining highs and rising lows make the extremum leave the window on
+# every bar, which is the worst case of a window rescan.
+INPUTS = {
+    "random": np.random.random(N_BARS),
+    "declining": np.arange(N_BARS, 0, -1, dtype=np.float64),
+    "rising": np.arange(N_BARS, dtype=np.float64),
+}
+
+def bench_extrema(func, n_inputs=1, repeat=3, **kwargs):
+    for name, real in INPUTS.items():
+        for period in (5, 50, 500, 5000):
+            time_list = []
+            for i in range(repeat):
+                t1 = time.perf_counter()
+                func(*([real] * n_inputs), timeperiod=period, **kwargs)
+                t2 = time.perf_counter()
+                time_list.append(t2 - t1)
+            print("Function=%s, Input=%s, Period=%d, MinTime=%s" % (
+                func.__name__, name, period, min(time_list)))
+
+if __name__ == '__main__':
+    bench_extrema(tabox.MAX)
+    bench_extrema(tabox.MIN)
+    bench_extrema(tabox.MINMAX)
+    bench_extrema(tabox.MIDPOINT)
+    bench_extrema(tabox.AROON, n_inputs=2)
+    bench_extrema(tabox.MIDPRICE, n_inputs=2)
+    bench_extrema(tabox.WILLR, n_inputs=3)
@@ -0,0 +1,37 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+N_BARS = 100000
+
+def separate(real):
+    return (
+        tabox.HT_DCPERIOD(real),
+        tabox.HT_DCPHASE(real),
+        tabox.HT_PHASOR(real),
+        tabox.HT_SINE(real),
+        tabox.HT_TRENDLINE(real),
+        tabox.HT_TRENDMODE(real),
+    )
+
+def bench(func, real, repeat=3):
+    time_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        func(real)
+        t2 = time.perf_counter()
+        time_list.append(t2 - t1)
+    print("Function=%s, MinTime=%s" % (func.__name__, min(time_list)))
+
+if __name__ == '__main__':
+    real = np.random.random(N_BARS)
+    bench(separate, real)
+    bench(tabox.HT_ALL, real)
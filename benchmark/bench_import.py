@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+
+SNIPPETS = [
+    ("interpreter", "pass"),
+    ("import numpy", "import numpy"),
+    ("import tabox", "import tabox"),
+    ("import tabox; tabox.SMA", "import tabox; tabox.SMA"),
+    ("import tabox; all names", "import tabox; [getattr(tabox, name) for name in tabox.__all__]"),
+]
+
+def bench_import(code, repeat=10):
+    """Wall time of a fresh interpreter running ``code``."""
+    env = dict(os.environ, TABOX_REQUIRE_COMPILED="0", PYTHONPATH=ROOT)
+    time_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        t2 = time.perf_counter()
+        time_list.append(t2 - t1)
+    return min(time_list)
+
+if __name__ == '__main__':
+    base = None
+    for name, code in SNIPPETS:
+        best = bench_import(code)
+        if base is None:
+            base = best
+        print("Snippet=%s, MinTime=%.4f, OverInterpreter=%.4f" % (name, best, best - base))
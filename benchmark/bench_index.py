@@ -0,0 +1,45 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+def bench_index(n_bars=1000000, periods=(5, 20, 60, 250, 1000), n_windows=100000, repeat=3):
+    high = np.random.random(n_bars)
+    starts = np.random.randint(0, n_bars - 5000, n_windows)
+    stops = starts + np.random.randint(1, 5000, n_windows)
+
+    t1 = time.perf_counter()
+    index = tabox.index.RangeExtremaIndex(high)
+    t2 = time.perf_counter()
+    print("Build, Bars=%d, Time=%s" % (n_bars, t2 - t1))
+
+    for period in periods:
+        max_list = []
+        index_list = []
+        for i in range(repeat):
+            t1 = time.perf_counter()
+            tabox.MAX(high, period)
+            t2 = time.perf_counter()
+            index.rolling_max(period)
+            t3 = time.perf_counter()
+            max_list.append(t2 - t1)
+            index_list.append(t3 - t2)
+        print("Rolling, Period=%d, MAXTime=%s, IndexTime=%s" % (period, min(max_list), min(index_list)))
+
+    time_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        index.max(starts, stops)
+        t2 = time.perf_counter()
+        time_list.append(t2 - t1)
+    print("Windows, Count=%d, Time=%s" % (n_windows, min(time_list)))
+
+if __name__ == '__main__':
+    bench_index()
@@ -0,0 +1,82 @@
+"""Speedup of tabox.parallel.map with the number of workers.
+
+For every indicator this times ``tabox.parallel.map`` over SERIES fixed-seed
+series of N bars (``harness.make_inputs`` with seeds seed..seed+SERIES-1)
+with ``harness.time_calls``, once per number of WORKERS, and reports the
+speedup of each over one worker. Only the functions of
+``tabox.parallel.GIL_FREE`` are expected to scale; the others are marked
+``gil_free: false`` and run with the RuntimeWarning of ``map`` silenced:
+
+    python benchmark/bench_parallel.py [NAME ...] [--series 64] [--n 100000] [--workers 1 2 4 8]
+        [--output parallel.json]
+"""
+import argparse
+import functools
+import json
+import sys
+import warnings
+
+import harness
+import tabox
+
+NAMES = ("SMA", "EMA", "RSI", "ATR", "WMA")
+SERIES = 64
+N = 100000
+WORKERS = (1, 2, 4, 8)
+TIMEPERIOD = 14
+
+
+def make_items(func, series, n, seed=harness.SEED, timeperiod=TIMEPERIOD):
+    """The argument tuple of ``func`` for every series, as ``parallel.map`` takes them."""
+    if not harness.takes_timeperiod(func):
+        timeperiod = None
+    return [tuple(harness.arguments(func, harness.make_inputs(n, seed + i), timeperiod)) for i in range(series)]
+
+
+def run(names, series=SERIES, n=N, workers=WORKERS, seed=harness.SEED, warmup=1, repeat=3,
+        min_time_ns=harness.MIN_TIME_NS, log=None):
+    """Time ``names`` for every number of ``workers`` and return the results document."""
+    results = {}
+    for name in names:
+        func = getattr(tabox, name)
+        items = make_items(func, series, n, seed)
+        cases = []
+        for count in workers:
+            case = {"workers": count}
+            this_func = functools.partial(tabox.parallel.map, func, items, workers=count)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                case.update(harness.time_calls(this_func, [], warmup, repeat, min_time_ns))
+            case["speedup"] = cases[0]["min_ns"] / case["min_ns"] if cases else 1.0
+            cases.append(case)
+            if log is not None:
+                log("Function=%s, Workers=%d, MinTime=%dns, Speedup=%.2f" % (
+                    name, count, case["min_ns"], case["speedup"]))
+        results[name] = {"gil_free": name in tabox.parallel.GIL_FREE, "cases": cases}
+    document = {"meta": harness.meta(seed, warmup, repeat, min_time_ns), "results": results}
+    document["meta"].update(series=series, n=n)
+    return document
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="indicators, %s by default" % " ".join(NAMES))
+    parser.add_argument("--series", type=int, default=SERIES)
+    parser.add_argument("--n", type=int, default=N)
+    parser.add_argument("--workers", type=int, nargs="+", default=WORKERS)
+    parser.add_argument("--seed", type=int, default=harness.SEED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time-ns", type=int, default=harness.MIN_TIME_NS)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    options = parser.parse_args(argv)
+
+    document = run(options.names or NAMES, options.series, options.n, options.workers, options.seed,
+                   repeat=options.repeat, min_time_ns=options.min_time_ns, log=print)
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(document, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
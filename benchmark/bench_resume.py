@@ -0,0 +1,45 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+N_BARS = 100000
+CHUNK = 1000
+
+def bench(name, func, repeat=3):
+    time_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        func()
+        t2 = time.perf_counter()
+        time_list.append(t2 - t1)
+    print("Function=%s, MinTime=%s" % (name, min(time_list)))
+
+def chunked(func, inputs, *params):
+    state = None
+    for begin in range(0, N_BARS, CHUNK):
+        _, state = func(*[real[begin:begin + CHUNK] for real in inputs], *params,
+                        state=state, return_state=True)
+
+def restarted(func, inputs, *params):
+    # Without a state every chunk recomputes the history from bar 0.
+    for begin in range(0, N_BARS, CHUNK):
+        func(*[real[:begin + CHUNK] for real in inputs], *params)
+
+if __name__ == '__main__':
+    high = np.random.random(N_BARS) + 11.0
+    low = high - 1.0 - np.random.random(N_BARS)
+    close = low + np.random.random(N_BARS)
+    bench("RSI", lambda: tabox.RSI(close, 14))
+    bench("RSI chunks=%d resumed" % CHUNK, lambda: chunked(tabox.RSI, [close], 14))
+    bench("RSI chunks=%d restarted" % CHUNK, lambda: restarted(tabox.RSI, [close], 14), repeat=1)
+    bench("ADX", lambda: tabox.ADX(high, low, close, 14))
+    bench("ADX chunks=%d resumed" % CHUNK, lambda: chunked(tabox.ADX, [high, low, close], 14))
+    bench("ADX chunks=%d restarted" % CHUNK, lambda: restarted(tabox.ADX, [high, low, close], 14), repeat=1)
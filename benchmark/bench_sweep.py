@@ -0,0 +1,56 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+def bench_sweep(name, n_bars=100000, periods=range(2, 251), repeat=3):
+    close = np.random.random(n_bars)
+    func = getattr(tabox, name)
+    sweep = getattr(tabox.sweep, name)
+
+    loop_list = []
+    sweep_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        for period in periods:
+            func(close, period)
+        t2 = time.perf_counter()
+        sweep(close, periods)
+        t3 = time.perf_counter()
+        loop_list.append(t2 - t1)
+        sweep_list.append(t3 - t2)
+    print("Function=%s, Periods=%d, LoopTime=%s, SweepTime=%s, Speedup=%.2f" % (
+        name, len(periods), min(loop_list), min(sweep_list), min(loop_list) / min(sweep_list)))
+
+def bench_macd_grid(n_bars=100000, fastperiods=range(5, 20), slowperiods=range(20, 40),
+                    signalperiods=(5, 9), repeat=3):
+    close = np.random.random(n_bars)
+    loop_list = []
+    sweep_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        for fast in fastperiods:
+            for slow in slowperiods:
+                for signal in signalperiods:
+                    tabox.MACD(close, fast, slow, signal)
+        t2 = time.perf_counter()
+        tabox.sweep.MACD(close, fastperiods, slowperiods, signalperiods)
+        t3 = time.perf_counter()
+        loop_list.append(t2 - t1)
+        sweep_list.append(t3 - t2)
+    n_grid = len(fastperiods) * len(slowperiods) * len(signalperiods)
+    print("Function=MACD, Grid=%d, LoopTime=%s, SweepTime=%s, Speedup=%.2f" % (
+        n_grid, min(loop_list), min(sweep_list), min(loop_list) / min(sweep_list)))
+
+if __name__ == '__main__':
+    for name in ("SUM", "SMA", "VAR", "STDDEV", "BBANDS", "MOM", "ROC",
+                 "EMA", "DEMA", "TEMA", "T3", "TRIX"):
+        bench_sweep(name)
+    bench_macd_grid()
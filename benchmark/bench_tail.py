@@ -0,0 +1,34 @@
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+N_BARS = 100000
+LAST = 50
+
+def bench(name, func, repeat=3):
+    time_list = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        func()
+        t2 = time.perf_counter()
+        time_list.append(t2 - t1)
+    print("Function=%s, MinTime=%s" % (name, min(time_list)))
+
+if __name__ == '__main__':
+    high = np.random.random(N_BARS) + 11.0
+    low = high - 1.0 - np.random.random(N_BARS)
+    close = low + np.random.random(N_BARS)
+    bench("SMA", lambda: tabox.SMA(close, 30))
+    bench("SMA last=%d" % LAST, lambda: tabox.SMA(close, 30, last=LAST))
+    bench("RSI", lambda: tabox.RSI(close, 14))
+    bench("RSI last=%d" % LAST, lambda: tabox.RSI(close, 14, last=LAST))
+    bench("ADX", lambda: tabox.ADX(high, low, close, 14))
+    bench("ADX last=%d" % LAST, lambda: tabox.ADX(high, low, close, 14, last=LAST))
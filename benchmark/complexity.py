@@ -0,0 +1,154 @@
+"""Growth of the run time of each indicator with its timeperiod.
+
+An indicator that keeps running sums or a monotonic queue costs the same
+per bar at any timeperiod; one that rescans its window costs
+O(timeperiod) per bar. For every indicator taking a ``timeperiod``, or
+the period of PERIOD_PARAMETERS, this times one series length at the
+PERIODS, on random and on adversarial inputs (monotonic, constant,
+alternating), and fits the exponent k of ``time per bar ~ period ** k``.
+An exponent above MAX_EXPONENT flags the indicator unless it is listed in
+PERIOD_BOUND:
+
+    python benchmark/complexity.py [NAME ...] [--n 20000] [--output complexity.json]
+
+The exit status is 1 when any indicator is flagged.
+"""
+import argparse
+import functools
+import json
+import sys
+import numpy as np
+
+import harness
+import tabox
+
+PERIODS = (5, 50, 500, 5000)
+N = 20000
+MAX_EXPONENT = 0.25
+# The period varied for the indicators without a timeperiod
+PERIOD_PARAMETERS = {
+    "ADOSC": "slow_period", "APO": "slowperiod", "MACD": "slowperiod", "PPO": "slowperiod",
+    "STOCH": "fastk_period", "STOCHF": "fastk_period", "ULTOSC": "timeperiod3",
+}
+# Kernels that rescan their whole window on every bar, O(n * timeperiod):
+# the mean deviation of CCI is taken around the mean of the current window.
+PERIOD_BOUND = {"CCI"}
+
+
+def _prices(close, spread):
+    return {"open": close - 0.1 * spread, "high": close + spread, "low": close - spread, "close": close}
+
+
+def make_shapes(n, seed=harness.SEED):
+    """Inputs of every shape, each a dict like ``harness.make_inputs``."""
+    i = np.arange(n, dtype=np.float64)
+    shapes = {
+        "random": {},
+        "increasing": _prices(100.0 + i * 0.01, 0.5),
+        "decreasing": _prices(100.0 + (n - i) * 0.01, 0.5),
+        "constant": _prices(np.full(n, 100.0), 0.0),
+        "alternating": _prices(100.0 + (-1.0) ** i, 0.5),
+    }
+    result = {}
+    for shape, prices in shapes.items():
+        inputs = harness.make_inputs(n, seed)
+        inputs.update(prices)
+        # The period functions of `real` see the same shape
+        inputs["real"] = inputs["close"]
+        inputs.update(open_=inputs["open"], real0=inputs["high"], real1=inputs["low"],
+                      realHigh=inputs["high"], realLow=inputs["low"], realClose=inputs["close"],
+                      inOpen=inputs["open"], inHigh=inputs["high"], inLow=inputs["low"], inClose=inputs["close"])
+        result[shape] = inputs
+    return result
+
+
+def period_parameter(name):
+    func = getattr(tabox, name)
+    return "timeperiod" if harness.takes_timeperiod(func) else PERIOD_PARAMETERS.get(name)
+
+
+def exponent(periods, ns_per_bar):
+    """Slope of log(ns_per_bar) over log(periods), least squares."""
+    return float(np.polyfit(np.log(periods), np.log(ns_per_bar), 1)[0])
+
+
+def run(names, n=N, periods=PERIODS, seed=harness.SEED, warmup=1, repeat=3, min_time_ns=harness.MIN_TIME_NS,
+        log=None):
+    """Time ``names`` on every shape and return the results document.
+
+    The periods with a lookback covering the whole series are skipped,
+    the kernels return at once there.
+    """
+    shapes = make_shapes(n, seed)
+    results = {}
+    for name in names:
+        try:
+            results[name] = _fit(name, shapes, n, periods, warmup, repeat, min_time_ns, log)
+        except Exception as e:
+            results[name] = {"error": str(e), "flagged": False}
+            if log is not None:
+                log("Function=%s, Error=%s" % (name, e))
+    document = {"meta": harness.meta(seed, warmup, repeat, min_time_ns), "results": results}
+    document["meta"].update(n=n, max_exponent=MAX_EXPONENT)
+    return document
+
+
+def _fit(name, shapes, n, periods, warmup, repeat, min_time_ns, log):
+    func = getattr(tabox, name)
+    parameter = period_parameter(name)
+    if parameter is None:
+        raise Exception("%s takes no period" % name)
+    fits = {}
+    for shape, inputs in shapes.items():
+        cases = []
+        for period in periods:
+            if parameter == "timeperiod":
+                args, kwargs = harness.arguments(func, inputs, period), {}
+            else:
+                args, kwargs = harness.arguments(func, inputs), {parameter: period}
+            if func.lookback(*args, **kwargs) >= n:
+                continue
+            this_func = functools.partial(func, **kwargs)
+            case = {"period": period}
+            case.update(harness.time_calls(this_func, args, warmup, repeat, min_time_ns))
+            case["ns_per_bar"] = case["min_ns"] / n
+            cases.append(case)
+        if len(cases) < 2:
+            raise Exception("%s has less than two periods shorter than the series" % name)
+        fit = exponent([case["period"] for case in cases], [case["ns_per_bar"] for case in cases])
+        fits[shape] = {"exponent": fit, "cases": cases}
+        if log is not None:
+            log("Function=%s, Input=%s, %s, Exponent=%.2f" % (
+                name, shape, ", ".join("P%d=%.2fns" % (case["period"], case["ns_per_bar"])
+                                       for case in cases), fit))
+    worst = max(fit["exponent"] for fit in fits.values())
+    return {"inputs": fits, "exponent": worst, "flagged": worst > MAX_EXPONENT and name not in PERIOD_BOUND}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="indicators, every one taking a period by default")
+    parser.add_argument("--n", type=int, default=N)
+    parser.add_argument("--periods", type=int, nargs="+", default=PERIODS)
+    parser.add_argument("--seed", type=int, default=harness.SEED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time-ns", type=int, default=harness.MIN_TIME_NS)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    options = parser.parse_args(argv)
+
+    names = options.names or [name for name in tabox.fast.__all__ if name.isupper() and period_parameter(name)]
+    document = run(names, options.n, options.periods, options.seed, repeat=options.repeat,
+                   min_time_ns=options.min_time_ns, log=print)
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(document, f, indent=1)
+
+    flagged = [name for name, result in document["results"].items() if result["flagged"]]
+    for name in flagged:
+        print("Flagged: Function=%s, Exponent=%.2f" % (name, document["results"][name]["exponent"]))
+    print("%d of %d indicators grow with their period above k=%.2f" % (len(flagged), len(names), MAX_EXPONENT))
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
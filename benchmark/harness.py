@@ -0,0 +1,230 @@
+"""Timing harness writing its results as JSON.
+
+For every indicator, series length and ``timeperiod`` it times calls on
+fixed-seed inputs with ``time.perf_counter_ns``. Each run first makes warm-up
+calls, then takes REPEAT samples that each last at least MIN_TIME_NS. The results
+hold the min, median, mean and standard deviation of the nanoseconds per call.
+Read along the series lengths, they are the scaling curve of the indicator.
+
+    python benchmark/harness.py SMA EMA --sizes 1000 100000 --output new.json
+    python benchmark/harness.py --baseline base.json --threshold 0.1
+
+With ``--baseline`` the run is compared to the stored results. The exit status
+is 1 when any case got slower than the baseline by more than the threshold.
+``--results`` compares a stored file instead of running. ``--talib`` also times
+TA-Lib on the same inputs, and fails only when ``talib`` is missing.
+"""
+import argparse
+import inspect
+import json
+import statistics
+import sys
+import os
+import time
+import numpy as np
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+)
+
+import tabox
+
+SIZES = (1000, 10000, 100000)
+PERIODS = (5, 14, 50, 200)
+SEED = 0
+WARMUP = 2
+REPEAT = 7
+# Each sample runs calls for at least this long
+MIN_TIME_NS = 2000000
+THRESHOLD = 0.10
+# Parameters some functions take without a default
+PARAMS = {"timeperiod": 14}
+
+
+def make_inputs(n, seed=SEED):
+    """The same random walk bars for a given ``n`` and ``seed`` on every run."""
+    rng = np.random.default_rng(seed)
+    close = np.cumsum(rng.normal(size=n)) + 100.0 + 10.0 * np.sqrt(n)
+    inputs = {
+        "open": close + rng.normal(scale=0.3, size=n), "high": close + rng.random(n),
+        "low": close - rng.random(n), "close": close, "volume": rng.random(n) * 1000.0,
+        # Inside the domain of ACOS, ASIN, LN...
+        "real": rng.random(n) * 0.9 + 0.05,
+        "periods": rng.integers(2, 30, size=n).astype(np.float64),
+    }
+    inputs.update(open_=inputs["open"], real0=inputs["high"], real1=inputs["low"],
+                  realHigh=inputs["high"], realLow=inputs["low"], realClose=inputs["close"],
+                  inOpen=inputs["open"], inHigh=inputs["high"], inLow=inputs["low"], inClose=inputs["close"])
+    return inputs
+
+
+def arguments(func, inputs, timeperiod=None):
+    """Positional arguments of ``func``: its inputs, then ``timeperiod`` when it takes one."""
+    args = []
+    for p in inspect.signature(func).parameters.values():
+        if p.kind != p.POSITIONAL_OR_KEYWORD:
+            continue
+        if p.name == "timeperiod" and timeperiod is not None:
+            args.append(timeperiod)
+        elif p.default is not inspect.Parameter.empty:
+            continue
+        else:
+            args.append(inputs[p.name] if p.name in inputs else PARAMS[p.name])
+    return args
+
+
+def takes_timeperiod(func):
+    return "timeperiod" in inspect.signature(func).parameters
+
+
+def time_calls(func, args, warmup=WARMUP, repeat=REPEAT, min_time_ns=MIN_TIME_NS):
+    """Statistics of the nanoseconds per call of ``func(*args)``."""
+    for i in range(warmup):
+        func(*args)
+    t1 = time.perf_counter_ns()
+    func(*args)
+    calls = max(1, min_time_ns // max(1, time.perf_counter_ns() - t1))
+    samples = []
+    for i in range(repeat):
+        t1 = time.perf_counter_ns()
+        for j in range(calls):
+            func(*args)
+        samples.append((time.perf_counter_ns() - t1) / calls)
+    return {
+        "calls": calls,
+        "min_ns": min(samples),
+        "median_ns": statistics.median(samples),
+        "mean_ns": statistics.fmean(samples),
+        "stdev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def run(names, sizes=SIZES, periods=PERIODS, seed=SEED, warmup=WARMUP, repeat=REPEAT,
+        min_time_ns=MIN_TIME_NS, talib=None, log=None):
+    """Time ``names`` and return the results document.
+
+    ``talib`` is the imported TA-Lib module, or None to time tabox only.
+    ``log`` is called with one line per case.
+    """
+    results = {}
+    for name in names:
+        func = getattr(tabox, name)
+        implementations = [("tabox", func)]
+        if talib is not None and hasattr(talib, name):
+            implementations.append(("talib", getattr(talib, name)))
+        cases = []
+        for n in sizes:
+            inputs = make_inputs(n, seed)
+            for timeperiod in (periods if takes_timeperiod(func) else (None,)):
+                if timeperiod is not None and timeperiod >= n:
+                    continue
+                args = arguments(func, inputs, timeperiod)
+                for impl, this_func in implementations:
+                    case = {"impl": impl, "n": n, "timeperiod": timeperiod}
+                    try:
+                        case.update(time_calls(this_func, args, warmup, repeat, min_time_ns))
+                        case["ns_per_bar"] = case["min_ns"] / n
+                    except Exception as e:
+                        case["error"] = str(e)
+                    cases.append(case)
+                    if log is not None:
+                        log(format_case(name, case))
+        results[name] = cases
+    return {"meta": meta(seed, warmup, repeat, min_time_ns), "results": results}
+
+
+def meta(seed, warmup, repeat, min_time_ns):
+    info = tabox.build_info()
+    return {
+        "compiled": info["compiled"],
+        "python": info["python"],
+        "numpy": info["numpy"],
+        "platform": sys.platform,
+        "seed": seed,
+        "warmup": warmup,
+        "repeat": repeat,
+        "min_time_ns": min_time_ns,
+    }
+
+
+def format_case(name, case):
+    label = "Function=%s, Impl=%s, N=%d, Timeperiod=%s" % (name, case["impl"], case["n"], case["timeperiod"])
+    if "error" in case:
+        return "%s, Error=%s" % (label, case["error"])
+    return "%s, MinTime=%dns, MedianTime=%dns, PerBar=%.2fns" % (
+        label, case["min_ns"], case["median_ns"], case["ns_per_bar"])
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """Cases of ``current`` slower than ``baseline`` by more than ``threshold``.
+
+    Cases are matched on function, implementation, series length and
+    timeperiod and compared on their min time, the least noisy statistic.
+    Returns a list of (name, case, baseline min_ns, current min_ns, ratio).
+    """
+    regressions = []
+    for name, cases in current["results"].items():
+        base_cases = {(case["impl"], case["n"], case["timeperiod"]): case
+                      for case in baseline["results"].get(name, ())}
+        for case in cases:
+            base = base_cases.get((case["impl"], case["n"], case["timeperiod"]))
+            if base is None or "min_ns" not in base or "min_ns" not in case:
+                continue
+            ratio = case["min_ns"] / base["min_ns"]
+            if ratio > 1.0 + threshold:
+                regressions.append((name, case, base["min_ns"], case["min_ns"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="indicators, all of tabox.fast.__all__ by default")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--periods", type=int, nargs="+", default=PERIODS)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--min-time-ns", type=int, default=MIN_TIME_NS)
+    parser.add_argument("--talib", action="store_true", help="also time TA-Lib")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--results", help="compare this JSON file instead of running")
+    parser.add_argument("--baseline", help="JSON file of stored results to compare with")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="relative slowdown reported as a regression, default %(default)s")
+    options = parser.parse_args(argv)
+
+    if options.results:
+        with open(options.results) as f:
+            current = json.load(f)
+    else:
+        talib = None
+        if options.talib:
+            try:
+                import talib
+            except ImportError:
+                parser.error("--talib needs the talib package")
+        names = options.names or [name for name in tabox.fast.__all__ if name.isupper()]
+        current = run(names, options.sizes, options.periods, options.seed, options.warmup,
+                      options.repeat, options.min_time_ns, talib, log=print)
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(current, f, indent=1)
+
+    if not options.baseline:
+        return 0
+    with open(options.baseline) as f:
+        baseline = json.load(f)
+    for key in ("compiled", "python", "numpy"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print("Note: baseline %s=%s, current %s=%s" % (
+                key, baseline["meta"].get(key), key, current["meta"].get(key)))
+    regressions = compare(baseline, current, options.threshold)
+    for name, case, base_ns, ns, ratio in regressions:
+        print("Regression: Function=%s, Impl=%s, N=%d, Timeperiod=%s, Baseline=%dns, Current=%dns, Ratio=%.2f" % (
+            name, case["impl"], case["n"], case["timeperiod"], base_ns, ns, ratio))
+    print("%d regressions above %.0f%%" % (len(regressions), options.threshold * 100))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
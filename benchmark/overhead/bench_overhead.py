@@ -0,0 +1,74 @@
+"""Nanoseconds per call of every indicator on short series.
+
+Below a few hundred bars the fixed cost of a call (argument checks,
+allocations, dispatch) outweighs the loop over the bars. For each size
+this prints the time of ``tabox.NAME`` and of ``tabox.fast.NAME``:
+
+    python benchmark/overhead/bench_overhead.py [NAME ...]
+"""
+import inspect
+import time
+import numpy as np
+
+import sys
+import os
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+)
+
+import tabox
+
+SIZES = (10, 100, 1000)
+# Each measurement runs calls for about this long, the best of REPEAT
+TARGET_NS = 20000000
+REPEAT = 3
+# Parameters some functions take without a default
+PARAMS = {"timeperiod": 14}
+
+def make_inputs(n):
+    rng = np.random.default_rng(0)
+    close = np.cumsum(rng.normal(size=n)) + 100.0
+    inputs = {
+        "open": close + rng.normal(scale=0.3, size=n), "high": close + rng.random(n),
+        "low": close - rng.random(n), "close": close, "volume": rng.random(n) * 1000.0,
+        # Inside the domain of ACOS, ASIN, LN...
+        "real": rng.random(n) * 0.9 + 0.05,
+        "periods": rng.integers(2, 30, size=n).astype(np.float64),
+    }
+    inputs.update(open_=inputs["open"], real0=inputs["high"], real1=inputs["low"],
+                  realHigh=inputs["high"], realLow=inputs["low"], realClose=inputs["close"],
+                  inOpen=inputs["open"], inHigh=inputs["high"], inLow=inputs["low"], inClose=inputs["close"])
+    return inputs
+
+def arguments(func, inputs):
+    names = [p.name for p in inspect.signature(func).parameters.values()
+             if p.kind == p.POSITIONAL_OR_KEYWORD and p.default is inspect.Parameter.empty]
+    return [inputs[name] if name in inputs else PARAMS[name] for name in names]
+
+def ns_per_call(func, args):
+    t1 = time.perf_counter_ns()
+    func(*args)
+    calls = max(1, TARGET_NS // max(1, time.perf_counter_ns() - t1))
+    best = None
+    for i in range(REPEAT):
+        t1 = time.perf_counter_ns()
+        for j in range(calls):
+            func(*args)
+        elapsed = (time.perf_counter_ns() - t1) / calls
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+if __name__ == '__main__':
+    inputs = {n: make_inputs(n) for n in SIZES}
+    names = sys.argv[1:] or [name for name in tabox.fast.__all__ if name.isupper()]
+    for name in names:
+        for n in SIZES:
+            try:
+                args = arguments(getattr(tabox, name), inputs[n])
+                full = ns_per_call(getattr(tabox, name), args)
+                fast = ns_per_call(getattr(tabox.fast, name), args)
+            except Exception as e:
+                print("Function=%s, N=%d, Error=%s" % (name, n, e))
+                continue
+            print("Function=%s, N=%d, Tabox=%dns, Fast=%dns" % (name, n, full, fast))
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+
+import allocations
+import bench_parallel
+import complexity
+import harness
+import tabox
+
+
+class TestHarness(unittest.TestCase):
+
+    def test_run(self):
+        results = harness.run(["SMA", "BOP"], sizes=(50,), periods=(5, 100), warmup=1, repeat=2,
+                              min_time_ns=0)
+        self.assertEqual([(case["n"], case["timeperiod"]) for case in results["results"]["SMA"]], [(50, 5)])
+        self.assertEqual([case["timeperiod"] for case in results["results"]["BOP"]], [None])
+        case = results["results"]["SMA"][0]
+        self.assertLessEqual(case["min_ns"], case["median_ns"])
+        self.assertEqual(case["ns_per_bar"], case["min_ns"] / 50)
+        json.dumps(results)
+        # Same seed, same inputs.
+        self.assertTrue((harness.make_inputs(50)["close"] == harness.make_inputs(50)["close"]).all())
+
+    def test_compare(self):
+        baseline = {"meta": {}, "results": {"SMA": [
+            {"impl": "tabox", "n": 100, "timeperiod": 5, "min_ns": 1000.0},
+            {"impl": "tabox", "n": 100, "timeperiod": 14, "min_ns": 1000.0}]}}
+        current = {"meta": {}, "results": {"SMA": [
+            {"impl": "tabox", "n": 100, "timeperiod": 5, "min_ns": 1050.0},
+            {"impl": "tabox", "n": 100, "timeperiod": 14, "min_ns": 1500.0},
+            {"impl": "tabox", "n": 1000, "timeperiod": 14, "min_ns": 9000.0}]}}
+        regressions = harness.compare(baseline, current, threshold=0.1)
+        self.assertEqual([(case["timeperiod"], ratio) for name, case, base_ns, ns, ratio in regressions], [(14, 1.5)])
+        self.assertEqual(harness.compare(baseline, current, threshold=0.6), [])
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ("baseline.json", "current.json")]
+            for path, document in zip(paths, (baseline, current)):
+                with open(path, "w") as f:
+                    json.dump(document, f)
+            self.assertEqual(harness.main(["--results", paths[1], "--baseline", paths[0]]), 1)
+            self.assertEqual(harness.main(["--results", paths[1], "--baseline", paths[0], "--threshold", "0.6"]), 0)
+
+    def test_complexity(self):
+        self.assertAlmostEqual(complexity.exponent([5, 50, 500], [2.0, 20.0, 200.0]), 1.0)
+        self.assertAlmostEqual(complexity.exponent([5, 50, 500], [3.0, 3.0, 3.0]), 0.0)
+        shapes = complexity.make_shapes(100)
+        self.assertTrue((shapes["constant"]["high"] == shapes["constant"]["low"]).all())
+        self.assertTrue((np.diff(shapes["increasing"]["real"]) > 0).all())
+        results = complexity.run(["SMA", "STOCH", "T3", "BOP"], n=100, periods=(5, 10, 50), repeat=2,
+                                 min_time_ns=0)
+        self.assertEqual(sorted(results["results"]["SMA"]["inputs"]), sorted(shapes))
+        self.assertIn("exponent", results["results"]["STOCH"])
+        # Lookback of T3 at 50 covers the series
+        self.assertEqual([case["period"] for case in results["results"]["T3"]["inputs"]["random"]["cases"]], [5, 10])
+        self.assertIn("error", results["results"]["BOP"])
+
+    def test_allocations(self):
+        results = allocations.run(["SMA", "MACD"], sizes=(10000,))["results"]
+        sma, macd = results["SMA"][0], results["MACD"][0]
+        # One output buffer, no temporaries.
+        self.assertGreaterEqual(sma["retained_bytes"], 80000)
+        self.assertLess(sma["temporary_bytes"], allocations.SLACK_BYTES)
+        self.assertFalse(sma["flagged"])
+        self.assertGreaterEqual(macd["retained_bytes"], 3 * 80000)
+        self.assertGreaterEqual(macd["arrays"], 3)
+        self.assertIs(allocations.np.empty, np.empty)
+        with allocations.count_arrays() as counter:
+            np.zeros(10)
+            np.asarray(np.zeros(10))
+            np.zeros(10)[2:]
+        self.assertEqual(counter[0], 3)
+
+    def test_parallel(self):
+        results = bench_parallel.run(["SMA", "ATR", "WMA"], series=3, n=100, workers=(1, 2), repeat=2,
+                                     min_time_ns=0)["results"]
+        self.assertEqual([case["workers"] for case in results["SMA"]["cases"]], [1, 2])
+        self.assertEqual(results["SMA"]["cases"][0]["speedup"], 1.0)
+        self.assertTrue(results["ATR"]["gil_free"])
+        self.assertFalse(results["WMA"]["gil_free"])
+        items = bench_parallel.make_items(tabox.ATR, 2, 100)
+        self.assertEqual(len(items[0]), 4)
+        self.assertFalse((items[0][2] == items[1][2]).all())
+        json.dumps(results)
+
+
+if __name__ == '__main__':
+    unittest.main()
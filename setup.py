@@ -51,6 +51,6 @@ setuptools.setup(
     cmdclass={'build_ext': CustomBuildExt},
     install_requires=[
         'numpy>=1.19.2',
-        'cython>=0.29.21',
+        'cython>=3.0',
     ]
 )
\ No newline at end of file
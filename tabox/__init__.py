@@ -1,118 +1,179 @@
+"""TA-Box, a Python implementation of TA-Lib.
+
+The indicator functions are loaded on first use (PEP 562): ``import tabox``
+only records where each public name lives, and ``tabox.SMA`` imports
+``tabox.ta_func.ta_SMA`` the first time it is accessed.
+"""
+import importlib
+
+# Compiled extension check
+from .compiled import is_compiled, build_info, check_compiled as _check_compiled
+_check_compiled()
+
+# Public name -> module defining it
+_LAZY_NAMES = {}
+
+
+def _lazy(module, *names):
+    for name in names:
+        _LAZY_NAMES[name] = module
+
 # Math Transform
-from .ta_func.ta_ACOS import TA_ACOS, ACOS
-from .ta_func.ta_ASIN import TA_ASIN, ASIN
-from .ta_func.ta_ATAN import TA_ATAN, ATAN
-from .ta_func.ta_SQRT import TA_SQRT, SQRT
-from .ta_func.ta_TAN import TA_TAN, TAN
-from .ta_func.ta_CEIL import TA_CEIL, CEIL
-from .ta_func.ta_COS import TA_COS, COS
-from .ta_func.ta_COSH import TA_COSH, COSH
-from .ta_func.ta_EXP import TA_EXP, EXP
-from .ta_func.ta_FLOOR import TA_FLOOR, FLOOR
-from .ta_func.ta_LN import TA_LN, LN
-from .ta_func.ta_LOG10 import TA_LOG10, LOG10
-from .ta_func.ta_SINH import TA_SINH, SINH
-from .ta_func.ta_TANH import TA_TANH, TANH
+_lazy(".ta_func.ta_ACOS", "TA_ACOS", "ACOS")
+_lazy(".ta_func.ta_ASIN", "TA_ASIN", "ASIN")
+_lazy(".ta_func.ta_ATAN", "TA_ATAN", "ATAN")
+_lazy(".ta_func.ta_SQRT", "TA_SQRT", "SQRT")
+_lazy(".ta_func.ta_TAN", "TA_TAN", "TAN")
+_lazy(".ta_func.ta_CEIL", "TA_CEIL", "CEIL")
+_lazy(".ta_func.ta_COS", "TA_COS", "COS")
+_lazy(".ta_func.ta_COSH", "TA_COSH", "COSH")
+_lazy(".ta_func.ta_EXP", "TA_EXP", "EXP")
+_lazy(".ta_func.ta_FLOOR", "TA_FLOOR", "FLOOR")
+_lazy(".ta_func.ta_LN", "TA_LN", "LN")
+_lazy(".ta_func.ta_LOG10", "TA_LOG10", "LOG10")
+_lazy(".ta_func.ta_SINH", "TA_SINH", "SINH")
+_lazy(".ta_func.ta_TANH", "TA_TANH", "TANH")
 
 
 # Math Operators
-from .ta_func.ta_ADD import TA_ADD, ADD
-from .ta_func.ta_SUB import TA_SUB, SUB
-from .ta_func.ta_MULT import TA_MULT, MULT
-from .ta_func.ta_DIV import TA_DIV, DIV
-from .ta_func.ta_MAX import TA_MAX, MAX
-from .ta_func.ta_MIN import TA_MIN, MIN
-from .ta_func.ta_MAXINDEX import TA_MAXINDEX, MAXINDEX
-from .ta_func.ta_MININDEX import TA_MININDEX, MININDEX
-from .ta_func.ta_MINMAX import TA_MINMAX, MINMAX
-from .ta_func.ta_MINMAXINDEX import TA_MINMAXINDEX, MINMAXINDEX
-from .ta_func.ta_SUM import TA_SUM, SUM
+_lazy(".ta_func.ta_ADD", "TA_ADD", "ADD")
+_lazy(".ta_func.ta_SUB", "TA_SUB", "SUB")
+_lazy(".ta_func.ta_MULT", "TA_MULT", "MULT")
+_lazy(".ta_func.ta_DIV", "TA_DIV", "DIV")
+_lazy(".ta_func.ta_MAX", "TA_MAX", "MAX")
+_lazy(".ta_func.ta_MIN", "TA_MIN", "MIN")
+_lazy(".ta_func.ta_MAXINDEX", "TA_MAXINDEX", "MAXINDEX")
+_lazy(".ta_func.ta_MININDEX", "TA_MININDEX", "MININDEX")
+_lazy(".ta_func.ta_MINMAX", "TA_MINMAX", "MINMAX")
+_lazy(".ta_func.ta_MINMAXINDEX", "TA_MINMAXINDEX", "MINMAXINDEX")
+_lazy(".ta_func.ta_SUM", "TA_SUM", "SUM")
 
 # Momentum Indicators
-from .ta_func.ta_ADX import TA_ADX, ADX
-from .ta_func.ta_ADXR import TA_ADXR, ADXR
-from .ta_func.ta_APO import TA_APO, APO
-from .ta_func.ta_AROON import TA_AROON, AROON
-from .ta_func.ta_AROONOSC import TA_AROONOSC, AROONOSC
-from .ta_func.ta_BOP import TA_BOP, BOP
-from .ta_func.ta_CCI import TA_CCI, CCI
-from .ta_func.ta_CMO import TA_CMO, CMO
-from .ta_func.ta_DX import TA_DX, DX
-from .ta_func.ta_MINUS_DM import TA_MINUS_DM, MINUS_DM
-from .ta_func.ta_MINUS_DI import TA_MINUS_DI, MINUS_DI
-from .ta_func.ta_MOM import TA_MOM, MOM
-from .ta_func.ta_PLUS_DI import TA_PLUS_DI, PLUS_DI
-from .ta_func.ta_PLUS_DM import TA_PLUS_DM, PLUS_DM
+_lazy(".ta_func.ta_ADX", "TA_ADX", "ADX")
+_lazy(".ta_func.ta_ADXR", "TA_ADXR", "ADXR")
+_lazy(".ta_func.ta_APO", "TA_APO", "APO")
+_lazy(".ta_func.ta_AROON", "TA_AROON", "AROON")
+_lazy(".ta_func.ta_AROONOSC", "TA_AROONOSC", "AROONOSC")
+_lazy(".ta_func.ta_BOP", "TA_BOP", "BOP")
+_lazy(".ta_func.ta_CCI", "TA_CCI", "TA_CCI_FAST", "CCI")
+_lazy(".ta_func.ta_CMO", "TA_CMO", "CMO")
+_lazy(".ta_func.ta_DX", "TA_DX", "DX")
+_lazy(".ta_func.ta_MINUS_DM", "TA_MINUS_DM", "MINUS_DM")
+_lazy(".ta_func.ta_MINUS_DI", "TA_MINUS_DI", "MINUS_DI")
+_lazy(".ta_func.ta_MOM", "TA_MOM", "MOM")
+_lazy(".ta_func.ta_PLUS_DI", "TA_PLUS_DI", "PLUS_DI")
+_lazy(".ta_func.ta_PLUS_DM", "TA_PLUS_DM", "PLUS_DM")
 
 # Overlap Studies
-from .ta_func.ta_MA import TA_MA, MA
-from .ta_func.ta_DEMA import TA_DEMA, DEMA
-from .ta_func.ta_TEMA import TA_TEMA, TEMA
-from .ta_func.ta_TRIMA import TA_TRIMA, TRIMA
-from .ta_func.ta_KAMA import TA_KAMA, KAMA
-from .ta_func.ta_MAMA import TA_MAMA, MAMA
-from .ta_func.ta_T3 import TA_T3, T3
-from .ta_func.ta_SMA import TA_SMA, SMA
-from .ta_func.ta_EMA import TA_EMA, EMA
-from .ta_func.ta_WMA import TA_WMA, WMA
-from .ta_func.ta_BBANDS import TA_BBANDS, BBANDS
-from .ta_func.ta_MIDPOINT import TA_MIDPOINT, MIDPOINT
-from .ta_func.ta_MIDPRICE import TA_MIDPRICE, MIDPRICE
-from .ta_func.ta_MAVP import TA_MAVP, MAVP
-from .ta_func.ta_SAR import TA_SAR, SAR
-from .ta_func.ta_SAREXT import TA_SAREXT, SAREXT
-from .ta_func.ta_HT_TRENDLINE import TA_HT_TRENDLINE, HT_TRENDLINE
+_lazy(".ta_func.ta_MA", "TA_MA", "MA")
+_lazy(".ta_func.ta_DEMA", "TA_DEMA", "DEMA")
+_lazy(".ta_func.ta_TEMA", "TA_TEMA", "TEMA")
+_lazy(".ta_func.ta_TRIMA", "TA_TRIMA", "TRIMA")
+_lazy(".ta_func.ta_KAMA", "TA_KAMA", "KAMA")
+_lazy(".ta_func.ta_MAMA", "TA_MAMA", "MAMA")
+_lazy(".ta_func.ta_T3", "TA_T3", "T3")
+_lazy(".ta_func.ta_SMA", "TA_SMA", "SMA")
+_lazy(".ta_func.ta_EMA", "TA_EMA", "EMA")
+_lazy(".ta_func.ta_WMA", "TA_WMA", "WMA")
+_lazy(".ta_func.ta_BBANDS", "TA_BBANDS", "BBANDS")
+_lazy(".ta_func.ta_MIDPOINT", "TA_MIDPOINT", "MIDPOINT")
+_lazy(".ta_func.ta_MIDPRICE", "TA_MIDPRICE", "MIDPRICE")
+_lazy(".ta_func.ta_MAVP", "TA_MAVP", "MAVP")
+_lazy(".ta_func.ta_SAR", "TA_SAR", "SAR")
+_lazy(".ta_func.ta_SAREXT", "TA_SAREXT", "SAREXT")
+_lazy(".ta_func.ta_HT_TRENDLINE", "TA_HT_TRENDLINE", "HT_TRENDLINE")
+
+# Cycle Indicators
+_lazy(".ta_func.ta_HT_ALL", "HT_ALL")
+_lazy(".ta_func.ta_HT_DCPERIOD", "TA_HT_DCPERIOD", "HT_DCPERIOD")
+_lazy(".ta_func.ta_HT_DCPHASE", "TA_HT_DCPHASE", "HT_DCPHASE")
+_lazy(".ta_func.ta_HT_PHASOR", "TA_HT_PHASOR", "HT_PHASOR")
+_lazy(".ta_func.ta_HT_SINE", "TA_HT_SINE", "HT_SINE")
+_lazy(".ta_func.ta_HT_TRENDMODE", "TA_HT_TRENDMODE", "HT_TRENDMODE")
 
 # Momentum Indicators
-from .ta_func.ta_MACD import TA_MACD, MACD
-from .ta_func.ta_MACDEXT import TA_MACDEXT, MACDEXT
-from .ta_func.ta_MACDFIX import TA_MACDFIX, MACDFIX
-from .ta_func.ta_MFI import TA_MFI, MFI
-from .ta_func.ta_RSI import TA_RSI, RSI
-from .ta_func.ta_STOCH import TA_STOCH, STOCH
-from .ta_func.ta_STOCHF import TA_STOCHF, STOCHF
-from .ta_func.ta_STOCHRSI import TA_STOCHRSI, STOCHRSI
-from .ta_func.ta_TRIX import TA_TRIX, TRIX
-from .ta_func.ta_ROC import TA_ROC, ROC
-from .ta_func.ta_ROCP import TA_ROCP, ROCP
-from .ta_func.ta_ROCR import TA_ROCR, ROCR
-from .ta_func.ta_ROCR100 import TA_ROCR100, ROCR100
-from .ta_func.ta_PPO import TA_PPO, PPO
-from .ta_func.ta_ULTOSC import TA_ULTOSC, ULTOSC
-from .ta_func.ta_WILLR import TA_WILLR, WILLR
+_lazy(".ta_func.ta_MACD", "TA_MACD", "MACD")
+_lazy(".ta_func.ta_MACDEXT", "TA_MACDEXT", "MACDEXT")
+_lazy(".ta_func.ta_MACDFIX", "TA_MACDFIX", "MACDFIX")
+_lazy(".ta_func.ta_MFI", "TA_MFI", "MFI")
+_lazy(".ta_func.ta_RSI", "TA_RSI", "RSI")
+_lazy(".ta_func.ta_STOCH", "TA_STOCH", "STOCH")
+_lazy(".ta_func.ta_STOCHF", "TA_STOCHF", "STOCHF")
+_lazy(".ta_func.ta_STOCHRSI", "TA_STOCHRSI", "STOCHRSI")
+_lazy(".ta_func.ta_TRIX", "TA_TRIX", "TRIX")
+_lazy(".ta_func.ta_ROC", "TA_ROC", "ROC")
+_lazy(".ta_func.ta_ROCP", "TA_ROCP", "ROCP")
+_lazy(".ta_func.ta_ROCR", "TA_ROCR", "ROCR")
+_lazy(".ta_func.ta_ROCR100", "TA_ROCR100", "ROCR100")
+_lazy(".ta_func.ta_PPO", "TA_PPO", "PPO")
+_lazy(".ta_func.ta_ULTOSC", "TA_ULTOSC", "ULTOSC")
+_lazy(".ta_func.ta_WILLR", "TA_WILLR", "WILLR")
+
+# Pattern Recognition
+_lazy(".candle",
+      "CDL2CROWS", "CDL3BLACKCROWS", "CDL3INSIDE", "CDL3LINESTRIKE", "CDL3OUTSIDE",
+      "CDL3STARSINSOUTH", "CDL3WHITESOLDIERS", "CDLABANDONEDBABY", "CDLADVANCEBLOCK",
+      "CDLBELTHOLD", "CDLBREAKAWAY", "CDLCLOSINGMARUBOZU", "CDLCONCEALBABYSWALL",
+      "CDLCOUNTERATTACK", "CDLDARKCLOUDCOVER", "CDLDOJI", "CDLDOJISTAR", "CDLDRAGONFLYDOJI",
+      "CDLENGULFING", "CDLEVENINGDOJISTAR", "CDLEVENINGSTAR", "CDLGAPSIDESIDEWHITE",
+      "CDLGRAVESTONEDOJI", "CDLHAMMER", "CDLHANGINGMAN", "CDLHARAMI", "CDLHARAMICROSS",
+      "CDLHIGHWAVE", "CDLHIKKAKE", "CDLHIKKAKEMOD", "CDLHOMINGPIGEON", "CDLIDENTICAL3CROWS",
+      "CDLINNECK", "CDLINVERTEDHAMMER", "CDLKICKING", "CDLKICKINGBYLENGTH", "CDLLADDERBOTTOM",
+      "CDLLONGLEGGEDDOJI", "CDLLONGLINE", "CDLMARUBOZU", "CDLMATCHINGLOW", "CDLMATHOLD",
+      "CDLMORNINGDOJISTAR", "CDLMORNINGSTAR", "CDLONNECK", "CDLPIERCING", "CDLRICKSHAWMAN",
+      "CDLRISEFALL3METHODS", "CDLSEPARATINGLINES", "CDLSHOOTINGSTAR", "CDLSHORTLINE",
+      "CDLSPINNINGTOP", "CDLSTALLEDPATTERN", "CDLSTICKSANDWICH", "CDLTAKURI", "CDLTASUKIGAP",
+      "CDLTHRUSTING", "CDLTRISTAR", "CDLUNIQUE3RIVER", "CDLUPSIDEGAP2CROWS",
+      "CDLXSIDEGAP3METHODS")
 
 # Price Transform
-from .ta_func.ta_AVGPRICE import TA_AVGPRICE, AVGPRICE
-from .ta_func.ta_MEDPRICE import TA_MEDPRICE, MEDPRICE
-from .ta_func.ta_TYPPRICE import TA_TYPPRICE, TYPPRICE
-from .ta_func.ta_WCLPRICE import TA_WCLPRICE, WCLPRICE
+_lazy(".ta_func.ta_AVGPRICE", "TA_AVGPRICE", "AVGPRICE")
+_lazy(".ta_func.ta_MEDPRICE", "TA_MEDPRICE", "MEDPRICE")
+_lazy(".ta_func.ta_TYPPRICE", "TA_TYPPRICE", "TYPPRICE")
+_lazy(".ta_func.ta_WCLPRICE", "TA_WCLPRICE", "WCLPRICE")
 
 # Statistic Functions
-from .ta_func.ta_BETA import TA_BETA, BETA
-from .ta_func.ta_CORREL import TA_CORREL, CORREL
-from .ta_func.ta_LINEARREG import TA_LINEARREG, LINEARREG
-from .ta_func.ta_LINEARREG_ANGLE import TA_LINEARREG_ANGLE, LINEARREG_ANGLE
-from .ta_func.ta_LINEARREG_INTERCEPT import TA_LINEARREG_INTERCEPT, LINEARREG_INTERCEPT
-from .ta_func.ta_LINEARREG_SLOPE import TA_LINEARREG_SLOPE, LINEARREG_SLOPE
-from .ta_func.ta_STDDEV import TA_STDDEV, STDDEV
-from .ta_func.ta_TSF import TA_TSF, TSF
-from .ta_func.ta_VAR import TA_VAR, VAR
+_lazy(".ta_func.ta_BETA", "TA_BETA", "BETA")
+_lazy(".ta_func.ta_CORREL", "TA_CORREL", "CORREL")
+_lazy(".ta_func.ta_LINEARREG", "TA_LINEARREG", "LINEARREG", "TA_LINEARREG_ALL", "LINEARREG_ALL")
+_lazy(".ta_func.ta_LINEARREG_ANGLE", "TA_LINEARREG_ANGLE", "LINEARREG_ANGLE")
+_lazy(".ta_func.ta_LINEARREG_INTERCEPT", "TA_LINEARREG_INTERCEPT", "LINEARREG_INTERCEPT")
+_lazy(".ta_func.ta_LINEARREG_SLOPE", "TA_LINEARREG_SLOPE", "LINEARREG_SLOPE")
+_lazy(".ta_func.ta_STDDEV", "TA_STDDEV", "STDDEV")
+_lazy(".ta_func.ta_TSF", "TA_TSF", "TSF")
+_lazy(".ta_func.ta_VAR", "TA_VAR", "VAR")
 
 # Volatility Indicators
-from .ta_func.ta_TRANGE import TA_TRANGE, TRANGE
-from .ta_func.ta_ATR import TA_ATR, ATR
-from .ta_func.ta_NATR import TA_NATR, NATR
+_lazy(".ta_func.ta_TRANGE", "TA_TRANGE", "TRANGE")
+_lazy(".ta_func.ta_ATR", "TA_ATR", "ATR")
+_lazy(".ta_func.ta_NATR", "TA_NATR", "NATR")
 
 # Volume Indicators
-from .ta_func.ta_AD import TA_AD, AD
-from .ta_func.ta_ADOSC import TA_ADOSC, ADOSC
-from .ta_func.ta_OBV import TA_OBV, OBV
-
-
-
-
-
-
-
-
-
+_lazy(".ta_func.ta_AD", "TA_AD", "AD")
+_lazy(".ta_func.ta_ADOSC", "TA_ADOSC", "ADOSC")
+_lazy(".ta_func.ta_OBV", "TA_OBV", "OBV")
+
+# Streaming, thread pool over many series, related indicators computed
+# together, indicator graphs with shared nodes, period sweeps, range
+# extremum queries, the candlestick pattern scan, out-of-core chunks, the
+# settings context manager and the lean 1-D functions
+_SUBMODULES = ("stream", "parallel", "bundle", "pipeline", "sweep", "index", "candle", "chunked",
+               "settings", "fast", "ta_func", "retcode")
+
+__all__ = ["is_compiled", "build_info", *_LAZY_NAMES, *_SUBMODULES[:10]]
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    # Cache it, later lookups no longer go through __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_SUBMODULES))
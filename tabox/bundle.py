@@ -0,0 +1,158 @@
+"""Related indicators computed together from shared intermediate buffers.
+
+Each bundle returns a dict of arrays, aligned with the input, holding the
+same values as the standalone functions.
+
+    >>> feats = tabox.bundle.directional(high, low, close, timeperiod=14)
+    >>> feats["adx"], feats["atr"]
+    >>> tabox.bundle.directional(high, low, close, last=50)   # only the last 50 bars
+"""
+import numpy as np
+
+from .retcode import TA_RetCode
+from .ta_func.ta_utils import (
+    check_array,
+    check_begidx1,
+    check_begidx3,
+    check_length3,
+    check_timeperiod,
+    rowwise,
+)
+from .ta_func.ta_BUNDLE import TA_BUNDLE_DIRECTIONAL, TA_BUNDLE_BANDS, TA_BUNDLE_MOVING_AVERAGES
+from .ta_func.ta_ADXR import TA_ADXR_Lookback
+from .ta_func.ta_ATR import TA_ATR_Lookback
+from .ta_func.ta_SMA import TA_SMA_Lookback
+from .ta_func.ta_TRIX import TA_TRIX_Lookback
+
+
+def _check_retcode(retCode: int) -> None:
+    if retCode != TA_RetCode.TA_SUCCESS:
+        raise Exception("function failed with error code %d" % retCode)
+
+
+def _directional_lookback(timeperiod: int) -> int:
+    # NATR has the lookback of ATR
+    return max(TA_ADXR_Lookback(timeperiod), TA_ATR_Lookback(timeperiod))
+
+
+@rowwise("high", "low", "close", lookback=_directional_lookback)
+def directional(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> dict:
+    """directional(high, low, close[, timeperiod=14])
+
+    Directional movement and true range family in one pass
+
+    Inputs:
+        high, low, close: (any ndarray)
+    Parameters:
+        timeperiod: 14
+    Outputs:
+        dict with plus_di, minus_di, dx, adx, adxr, atr, natr
+    """
+    high = check_array(high)
+    low = check_array(low)
+    close = check_array(close)
+    length = check_length3(high, low, close)
+    check_timeperiod(timeperiod)
+    startIdx = check_begidx3(high, low, close)
+    endIdx = length - startIdx - 1
+
+    names = ("plus_di", "minus_di", "dx", "adx", "adxr", "atr", "natr")
+    outputs = {name: np.full(length, np.nan) for name in names}
+
+    retCode = TA_BUNDLE_DIRECTIONAL(
+        endIdx,
+        high[startIdx:],
+        low[startIdx:],
+        close[startIdx:],
+        timeperiod,
+        *[outputs[name][startIdx:] for name in names],
+    )
+    _check_retcode(retCode)
+    return outputs
+
+
+@rowwise("real", lookback=lambda timeperiod, **params: TA_SMA_Lookback(timeperiod))
+def bands(real: np.ndarray, timeperiod: int = 5, nbdevup: float = 2.0, nbdevdn: float = 2.0) -> dict:
+    """bands(real[, timeperiod=5, nbdevup=2.0, nbdevdn=2.0])
+
+    SMA, VAR, STDDEV and Bollinger Bands (SMA middle band) in one pass
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        timeperiod: 5
+        nbdevup: 2.0
+        nbdevdn: 2.0
+    Outputs:
+        dict with sma, var, stddev, upperband, middleband, lowerband
+        (stddev uses nbdev=1, middleband is the same array as sma)
+    """
+    real = check_array(real)
+    check_timeperiod(timeperiod)
+    length = real.shape[0]
+    startIdx = check_begidx1(real)
+    endIdx = length - startIdx - 1
+
+    sma = np.full(length, np.nan)
+    var = np.full(length, np.nan)
+    stddev = np.full(length, np.nan)
+    upperband = np.full(length, np.nan)
+    lowerband = np.full(length, np.nan)
+
+    retCode = TA_BUNDLE_BANDS(
+        endIdx,
+        real[startIdx:],
+        timeperiod,
+        nbdevup,
+        nbdevdn,
+        sma[startIdx:],
+        var[startIdx:],
+        stddev[startIdx:],
+        upperband[startIdx:],
+        lowerband[startIdx:],
+    )
+    _check_retcode(retCode)
+    return {
+        "sma": sma,
+        "var": var,
+        "stddev": stddev,
+        "upperband": upperband,
+        "middleband": sma,
+        "lowerband": lowerband,
+    }
+
+
+@rowwise("real", lookback=lambda timeperiod: TA_TRIX_Lookback(timeperiod))
+def moving_averages(real: np.ndarray, timeperiod: int = 30) -> dict:
+    """moving_averages(real[, timeperiod=30])
+
+    SMA and the EMA family (EMA, DEMA, TEMA, TRIX) from one EMA chain in
+    one pass
+
+    EMA, EMA(EMA) and EMA(EMA(EMA)) are each computed once and combined
+    into every output.
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        timeperiod: 30
+    Outputs:
+        dict with sma, ema, dema, tema, trix
+    """
+    real = check_array(real)
+    check_timeperiod(timeperiod)
+    length = real.shape[0]
+    startIdx = check_begidx1(real)
+    endIdx = length - startIdx - 1
+
+    names = ("sma", "ema", "dema", "tema", "trix")
+    outputs = {name: np.full(length, np.nan) for name in names}
+
+    retCode = TA_BUNDLE_MOVING_AVERAGES(
+        endIdx,
+        real[startIdx:],
+        timeperiod,
+        *[outputs[name][startIdx:] for name in names],
+    )
+    _check_retcode(retCode)
+    return outputs
@@ -0,0 +1,1621 @@
+"""Candlestick pattern recognition, every CDL* pattern from one shared scan.
+
+:func:`scan` takes the OHLC of one series and returns an int8
+(n_patterns, n_bars) matrix, row ``i`` holding ``patterns[i]`` (all of
+:data:`PATTERNS` by default) aligned with the input.
+
+    >>> signals = tabox.candle.scan(open, high, low, close)
+    >>> signals[tabox.candle.PATTERNS.index("CDLDOJI")]     # CDLDOJI / 10
+    >>> tabox.CDLDOJI(open, high, low, close)               # 0 or 100, like TA-Lib
+
+The per-bar quantities (color, real body, shadows, high-low range) are
+computed once per scan, and so are the running totals behind TA-Lib's
+candle averages (``TA_CANDLEAVERAGE``), which are shared by every pattern
+using the same range, period and first bar. Each pattern is then a few
+vector comparisons of shifted views of those arrays, evaluated for all the
+bars at once.
+
+The matrix holds TA-Lib's values divided by :data:`SCALE`, ±100 for a
+pattern, ±80 for the weaker Engulfing/Harami variants and ±200 for a
+confirmed Hikkake, so they fit in an int8 without losing information. The
+``CDL*`` functions return TA-Lib's values in an intp array, and all of them
+are identical to TA-Lib. The candle settings are TA-Lib's, see
+``TA_SetCandleSettings`` in ``tabox.ta_func.ta_utility``.
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .ta_func.ta_utils import (check_array, check_begidx4, check_length4, check_out,
+                               rowwise)
+from .ta_func.ta_utility import TA_Globals, TA_CandleSettingType, TA_RangeType
+
+SCALE = 10
+
+_BODY_LONG = TA_CandleSettingType.TA_BodyLong
+_BODY_VERY_LONG = TA_CandleSettingType.TA_BodyVeryLong
+_BODY_SHORT = TA_CandleSettingType.TA_BodyShort
+_BODY_DOJI = TA_CandleSettingType.TA_BodyDoji
+_SHADOW_LONG = TA_CandleSettingType.TA_ShadowLong
+_SHADOW_VERY_LONG = TA_CandleSettingType.TA_ShadowVeryLong
+_SHADOW_SHORT = TA_CandleSettingType.TA_ShadowShort
+_SHADOW_VERY_SHORT = TA_CandleSettingType.TA_ShadowVeryShort
+_NEAR = TA_CandleSettingType.TA_Near
+_FAR = TA_CandleSettingType.TA_Far
+_EQUAL = TA_CandleSettingType.TA_Equal
+
+
+class _Candles:
+    """One OHLC series and the candle quantities every pattern reads."""
+
+    def __init__(self, open, high, low, close):
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.length = close.shape[0]
+        white = close >= open
+        self.color = np.where(white, 1, -1)
+        self.top = np.where(white, close, open)
+        self.bottom = np.where(white, open, close)
+        self.body = np.fabs(close - open)
+        self.upper = high - self.top
+        self.lower = self.bottom - low
+        self.range = high - low
+        self.settings = list(TA_Globals.candleSettings)
+        self._totals = {}
+
+    def candle_range(self, rangeType: TA_RangeType) -> np.ndarray:
+        if rangeType == TA_RangeType.TA_RangeType_RealBody:
+            return self.body
+        if rangeType == TA_RangeType.TA_RangeType_HighLow:
+            return self.range
+        return self.upper + self.lower
+
+    def total(self, rangeType: TA_RangeType, period: int, first: int) -> np.ndarray:
+        """Running sum of the ``period`` ranges before each candle from ``first`` on.
+
+        Accumulated in TA-Lib's order (the first window summed, then one
+        difference added per candle) so that the averages compare exactly
+        like TA-Lib's. The rounding depends on the first candle, hence the
+        key.
+        """
+        key = (rangeType, period, first)
+        total = self._totals.get(key)
+        if total is None:
+            candle_range = self.candle_range(rangeType)
+            steps = np.empty(self.length - first)
+            steps[0] = np.cumsum(candle_range[first - period:first])[-1]
+            np.subtract(candle_range[first:-1], candle_range[first - period:-1 - period], out=steps[1:])
+            total = self._totals[key] = np.cumsum(steps)
+        return total
+
+
+class _Window:
+    """The candles seen from every bar ``i`` from ``start`` on.
+
+    Each accessor returns the value of candle ``i - k`` for all those bars,
+    as views of the shared arrays.
+    """
+
+    def __init__(self, candles: _Candles, start: int):
+        self.candles = candles
+        self.start = start
+
+    def at(self, array: np.ndarray, k: int) -> np.ndarray:
+        return array[self.start - k:array.shape[0] - k]
+
+    def open(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.open, k)
+
+    def high(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.high, k)
+
+    def low(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.low, k)
+
+    def close(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.close, k)
+
+    def color(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.color, k)
+
+    def top(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.top, k)
+
+    def bottom(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.bottom, k)
+
+    def body(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.body, k)
+
+    def upper(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.upper, k)
+
+    def lower(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.lower, k)
+
+    def range(self, k: int = 0) -> np.ndarray:
+        return self.at(self.candles.range, k)
+
+    def average(self, settingType: TA_CandleSettingType, k: int = 0) -> np.ndarray:
+        """TA_CANDLEAVERAGE of candle ``i - k``."""
+        setting = self.candles.settings[settingType]
+        if setting.avgPeriod == 0:
+            value = self.at(self.candles.candle_range(setting.rangeType), k)
+        else:
+            total = self.candles.total(setting.rangeType, setting.avgPeriod, self.start - k)
+            value = total[:self.candles.length - self.start] / setting.avgPeriod
+        value = setting.factor * value
+        if setting.rangeType == TA_RangeType.TA_RangeType_Shadows:
+            value = value / 2.0
+        return value
+
+    def body_gap_up(self, k2: int, k1: int) -> np.ndarray:
+        return self.bottom(k2) > self.top(k1)
+
+    def body_gap_down(self, k2: int, k1: int) -> np.ndarray:
+        return self.top(k2) < self.bottom(k1)
+
+    def gap_up(self, k2: int, k1: int) -> np.ndarray:
+        return self.low(k2) > self.high(k1)
+
+    def gap_down(self, k2: int, k1: int) -> np.ndarray:
+        return self.high(k2) < self.low(k1)
+
+
+# Pattern name -> (function, lookback from the average periods, default penetration)
+_PATTERNS = {}
+
+
+def _pattern(name: str, lookback, penetration: Optional[float] = None):
+    def decorator(func):
+        _PATTERNS[name] = (func, lookback, penetration)
+        return func
+    return decorator
+
+
+def _signal(mask: np.ndarray, value) -> np.ndarray:
+    return np.where(mask, value, 0)
+
+
+@_pattern("CDL2CROWS", lambda p: p[_BODY_LONG] + 2)
+def _two_crows(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == 1) & (w.body(2) > w.average(_BODY_LONG, 2))
+        & (w.color(1) == -1) & w.body_gap_up(1, 2)
+        & (w.color(0) == -1) & (w.open(0) < w.open(1)) & (w.open(0) > w.close(1))
+        & (w.close(0) > w.open(2)) & (w.close(0) < w.close(2)),
+        -100)
+
+
+@_pattern("CDL3BLACKCROWS", lambda p: p[_SHADOW_VERY_SHORT] + 3)
+def _three_black_crows(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(3) == 1)
+        & (w.color(2) == -1) & (w.lower(2) < w.average(_SHADOW_VERY_SHORT, 2))
+        & (w.color(1) == -1) & (w.lower(1) < w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.color(0) == -1) & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.open(1) < w.open(2)) & (w.open(1) > w.close(2))
+        & (w.open(0) < w.open(1)) & (w.open(0) > w.close(1))
+        & (w.high(3) > w.close(2))
+        & (w.close(2) > w.close(1)) & (w.close(1) > w.close(0)),
+        -100)
+
+
+@_pattern("CDL3INSIDE", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 2)
+def _three_inside(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2))
+        & (w.body(1) <= w.average(_BODY_SHORT, 1))
+        & (w.top(1) < w.top(2)) & (w.bottom(1) > w.bottom(2))
+        & (((w.color(2) == 1) & (w.color(0) == -1) & (w.close(0) < w.open(2)))
+           | ((w.color(2) == -1) & (w.color(0) == 1) & (w.close(0) > w.open(2)))),
+        -100 * w.color(2))
+
+
+@_pattern("CDL3LINESTRIKE", lambda p: p[_NEAR] + 3)
+def _three_line_strike(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(3) == w.color(2)) & (w.color(2) == w.color(1)) & (w.color(0) == -w.color(1))
+        & (w.open(2) >= w.bottom(3) - w.average(_NEAR, 3))
+        & (w.open(2) <= w.top(3) + w.average(_NEAR, 3))
+        & (w.open(1) >= w.bottom(2) - w.average(_NEAR, 2))
+        & (w.open(1) <= w.top(2) + w.average(_NEAR, 2))
+        & (((w.color(1) == 1) & (w.close(1) > w.close(2)) & (w.close(2) > w.close(3))
+            & (w.open(0) > w.close(1)) & (w.close(0) < w.open(3)))
+           | ((w.color(1) == -1) & (w.close(1) < w.close(2)) & (w.close(2) < w.close(3))
+              & (w.open(0) < w.close(1)) & (w.close(0) > w.open(3)))),
+        100 * w.color(1))
+
+
+@_pattern("CDL3OUTSIDE", lambda p: 3)
+def _three_outside(w: _Window) -> np.ndarray:
+    return _signal(
+        ((w.color(1) == 1) & (w.color(2) == -1) & (w.close(1) > w.open(2))
+         & (w.open(1) < w.close(2)) & (w.close(0) > w.close(1)))
+        | ((w.color(1) == -1) & (w.color(2) == 1) & (w.open(1) > w.close(2))
+           & (w.close(1) < w.open(2)) & (w.close(0) < w.close(1))),
+        100 * w.color(1))
+
+
+@_pattern("CDL3STARSINSOUTH", lambda p: max(p[_SHADOW_VERY_SHORT], p[_SHADOW_LONG],
+                                              p[_BODY_LONG], p[_BODY_SHORT]) + 2)
+def _three_stars_in_south(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == -1) & (w.color(1) == -1) & (w.color(0) == -1)
+        # 1st: long body with a long lower shadow
+        & (w.body(2) > w.average(_BODY_LONG, 2)) & (w.lower(2) > w.average(_SHADOW_LONG, 2))
+        # 2nd: smaller, opens within the 1st range, does not go below its low, has a lower shadow
+        & (w.body(1) < w.body(2)) & (w.open(1) > w.close(2)) & (w.open(1) <= w.high(2))
+        & (w.low(1) < w.close(2)) & (w.low(1) >= w.low(2))
+        & (w.lower(1) > w.average(_SHADOW_VERY_SHORT, 1))
+        # 3rd: small marubozu inside the 2nd range
+        & (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.low(0) > w.low(1)) & (w.high(0) < w.high(1)),
+        100)
+
+
+@_pattern("CDL3WHITESOLDIERS", lambda p: max(p[_SHADOW_VERY_SHORT], p[_BODY_SHORT],
+                                               p[_FAR], p[_NEAR]) + 2)
+def _three_white_soldiers(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == 1) & (w.upper(2) < w.average(_SHADOW_VERY_SHORT, 2))
+        & (w.color(1) == 1) & (w.upper(1) < w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.color(0) == 1) & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.close(0) > w.close(1)) & (w.close(1) > w.close(2))
+        & (w.open(1) > w.open(2)) & (w.open(1) <= w.close(2) + w.average(_NEAR, 2))
+        & (w.open(0) > w.open(1)) & (w.open(0) <= w.close(1) + w.average(_NEAR, 1))
+        & (w.body(1) > w.body(2) - w.average(_FAR, 2))
+        & (w.body(0) > w.body(1) - w.average(_FAR, 1))
+        & (w.body(0) > w.average(_BODY_SHORT, 0)),
+        100)
+
+
+@_pattern("CDLABANDONEDBABY", lambda p: max(p[_BODY_DOJI], p[_BODY_LONG], p[_BODY_SHORT]) + 2, 0.3)
+def _abandoned_baby(w: _Window, penetration: float) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2))
+        & (w.body(1) <= w.average(_BODY_DOJI, 1))
+        & (w.body(0) > w.average(_BODY_SHORT, 0))
+        & (((w.color(2) == 1) & (w.color(0) == -1)
+            & (w.close(0) < w.close(2) - w.body(2) * penetration)
+            & w.gap_up(1, 2) & w.gap_down(0, 1))
+           | ((w.color(2) == -1) & (w.color(0) == 1)
+              & (w.close(0) > w.close(2) + w.body(2) * penetration)
+              & w.gap_down(1, 2) & w.gap_up(0, 1))),
+        100 * w.color(0))
+
+
+@_pattern("CDLADVANCEBLOCK", lambda p: max(p[_SHADOW_LONG], p[_SHADOW_SHORT], p[_FAR],
+                                             p[_NEAR], p[_BODY_LONG]) + 2)
+def _advance_block(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == 1) & (w.color(1) == 1) & (w.color(0) == 1)
+        & (w.close(0) > w.close(1)) & (w.close(1) > w.close(2))
+        & (w.open(1) > w.open(2)) & (w.open(1) <= w.close(2) + w.average(_NEAR, 2))
+        & (w.open(0) > w.open(1)) & (w.open(0) <= w.close(1) + w.average(_NEAR, 1))
+        & (w.body(2) > w.average(_BODY_LONG, 2))
+        & (w.upper(2) < w.average(_SHADOW_SHORT, 2))
+        & (
+            # 2 far smaller than 1 and 3 not longer than 2
+            ((w.body(1) < w.body(2) - w.average(_FAR, 2))
+             & (w.body(0) < w.body(1) + w.average(_NEAR, 1)))
+            # 3 far smaller than 2
+            | (w.body(0) < w.body(1) - w.average(_FAR, 1))
+            # 3 smaller than 2, 2 smaller than 1 and 3 or 2 has a shadow that is not short
+            | ((w.body(0) < w.body(1)) & (w.body(1) < w.body(2))
+               & ((w.upper(0) > w.average(_SHADOW_SHORT, 0))
+                  | (w.upper(1) > w.average(_SHADOW_SHORT, 1))))
+            # 3 smaller than 2 with a long upper shadow
+            | ((w.body(0) < w.body(1)) & (w.upper(0) > w.average(_SHADOW_LONG, 0)))
+        ),
+        -100)
+
+
+@_pattern("CDLBELTHOLD", lambda p: max(p[_BODY_LONG], p[_SHADOW_VERY_SHORT]))
+def _belt_hold(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) > w.average(_BODY_LONG, 0))
+        & (((w.color(0) == 1) & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0)))
+           | ((w.color(0) == -1) & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0)))),
+        100 * w.color(0))
+
+
+@_pattern("CDLBREAKAWAY", lambda p: p[_BODY_LONG] + 4)
+def _breakaway(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(4) > w.average(_BODY_LONG, 4))
+        & (w.color(4) == w.color(3)) & (w.color(3) == w.color(1)) & (w.color(1) == -w.color(0))
+        & (((w.color(4) == -1) & w.body_gap_down(3, 4)
+            & (w.high(2) < w.high(3)) & (w.low(2) < w.low(3))
+            & (w.high(1) < w.high(2)) & (w.low(1) < w.low(2))
+            & (w.close(0) > w.open(3)) & (w.close(0) < w.close(4)))
+           | ((w.color(4) == 1) & w.body_gap_up(3, 4)
+              & (w.high(2) > w.high(3)) & (w.low(2) > w.low(3))
+              & (w.high(1) > w.high(2)) & (w.low(1) > w.low(2))
+              & (w.close(0) < w.open(3)) & (w.close(0) > w.close(4)))),
+        100 * w.color(0))
+
+
+@_pattern("CDLCLOSINGMARUBOZU", lambda p: max(p[_BODY_LONG], p[_SHADOW_VERY_SHORT]))
+def _closing_marubozu(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) > w.average(_BODY_LONG, 0))
+        & (((w.color(0) == 1) & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0)))
+           | ((w.color(0) == -1) & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0)))),
+        100 * w.color(0))
+
+
+@_pattern("CDLCONCEALBABYSWALL", lambda p: p[_SHADOW_VERY_SHORT] + 3)
+def _concealing_baby_swallow(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(3) == -1) & (w.color(2) == -1) & (w.color(1) == -1) & (w.color(0) == -1)
+        # 1st and 2nd: marubozu
+        & (w.lower(3) < w.average(_SHADOW_VERY_SHORT, 3))
+        & (w.upper(3) < w.average(_SHADOW_VERY_SHORT, 3))
+        & (w.lower(2) < w.average(_SHADOW_VERY_SHORT, 2))
+        & (w.upper(2) < w.average(_SHADOW_VERY_SHORT, 2))
+        # 3rd: gaps down with an upper shadow reaching into the 2nd body
+        & w.body_gap_down(1, 2)
+        & (w.upper(1) > w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.high(1) > w.close(2))
+        # 4th: engulfs the 3rd, shadows included
+        & (w.high(0) > w.high(1)) & (w.low(0) < w.low(1)),
+        100)
+
+
+@_pattern("CDLCOUNTERATTACK", lambda p: max(p[_EQUAL], p[_BODY_LONG]) + 1)
+def _counterattack(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -w.color(0))
+        & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.body(0) > w.average(_BODY_LONG, 0))
+        & (w.close(0) <= w.close(1) + w.average(_EQUAL, 1))
+        & (w.close(0) >= w.close(1) - w.average(_EQUAL, 1)),
+        100 * w.color(0))
+
+
+@_pattern("CDLDARKCLOUDCOVER", lambda p: p[_BODY_LONG] + 1, 0.5)
+def _dark_cloud_cover(w: _Window, penetration: float) -> np.ndarray:
+    return _signal(
+        (w.color(1) == 1) & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.color(0) == -1) & (w.open(0) > w.high(1))
+        & (w.close(0) > w.open(1)) & (w.close(0) < w.close(1) - w.body(1) * penetration),
+        -100)
+
+
+@_pattern("CDLDOJI", lambda p: p[_BODY_DOJI])
+def _doji(w: _Window) -> np.ndarray:
+    return _signal(w.body(0) <= w.average(_BODY_DOJI, 0), 100)
+
+
+@_pattern("CDLDOJISTAR", lambda p: max(p[_BODY_DOJI], p[_BODY_LONG]) + 1)
+def _doji_star(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.body(0) <= w.average(_BODY_DOJI, 0))
+        & (((w.color(1) == 1) & w.body_gap_up(0, 1))
+           | ((w.color(1) == -1) & w.body_gap_down(0, 1))),
+        -100 * w.color(1))
+
+
+@_pattern("CDLDRAGONFLYDOJI", lambda p: max(p[_BODY_DOJI], p[_SHADOW_VERY_SHORT]))
+def _dragonfly_doji(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) <= w.average(_BODY_DOJI, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.lower(0) > w.average(_SHADOW_VERY_SHORT, 0)),
+        100)
+
+
+@_pattern("CDLENGULFING", lambda p: 2)
+def _engulfing(w: _Window) -> np.ndarray:
+    found = (
+        ((w.color(0) == 1) & (w.color(1) == -1)
+         & (((w.close(0) >= w.open(1)) & (w.open(0) < w.close(1)))
+            | ((w.close(0) > w.open(1)) & (w.open(0) <= w.close(1)))))
+        | ((w.color(0) == -1) & (w.color(1) == 1)
+           & (((w.open(0) >= w.close(1)) & (w.close(0) < w.open(1)))
+              | ((w.open(0) > w.close(1)) & (w.close(0) <= w.open(1)))))
+    )
+    # Equal opens or closes make a weaker signal
+    strict = (w.open(0) != w.close(1)) & (w.close(0) != w.open(1))
+    return _signal(found, np.where(strict, 100, 80) * w.color(0))
+
+
+@_pattern("CDLEVENINGDOJISTAR", lambda p: max(p[_BODY_DOJI], p[_BODY_LONG], p[_BODY_SHORT]) + 2, 0.3)
+def _evening_doji_star(w: _Window, penetration: float) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2)) & (w.color(2) == 1)
+        & (w.body(1) <= w.average(_BODY_DOJI, 1)) & w.body_gap_up(1, 2)
+        & (w.body(0) > w.average(_BODY_SHORT, 0)) & (w.color(0) == -1)
+        & (w.close(0) < w.close(2) - w.body(2) * penetration),
+        -100)
+
+
+@_pattern("CDLEVENINGSTAR", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 2, 0.3)
+def _evening_star(w: _Window, penetration: float) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2)) & (w.color(2) == 1)
+        & (w.body(1) <= w.average(_BODY_SHORT, 1)) & w.body_gap_up(1, 2)
+        & (w.body(0) > w.average(_BODY_SHORT, 0)) & (w.color(0) == -1)
+        & (w.close(0) < w.close(2) - w.body(2) * penetration),
+        -100)
+
+
+@_pattern("CDLGAPSIDESIDEWHITE", lambda p: max(p[_NEAR], p[_EQUAL]) + 2)
+def _gap_side_side_white(w: _Window) -> np.ndarray:
+    gap_up = w.body_gap_up(1, 2)
+    return _signal(
+        ((gap_up & w.body_gap_up(0, 2)) | (w.body_gap_down(1, 2) & w.body_gap_down(0, 2)))
+        & (w.color(1) == 1) & (w.color(0) == 1)
+        & (w.body(0) >= w.body(1) - w.average(_NEAR, 1))
+        & (w.body(0) <= w.body(1) + w.average(_NEAR, 1))
+        & (w.open(0) >= w.open(1) - w.average(_EQUAL, 1))
+        & (w.open(0) <= w.open(1) + w.average(_EQUAL, 1)),
+        np.where(gap_up, 100, -100))
+
+
+@_pattern("CDLGRAVESTONEDOJI", lambda p: max(p[_BODY_DOJI], p[_SHADOW_VERY_SHORT]))
+def _gravestone_doji(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) <= w.average(_BODY_DOJI, 0))
+        & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.upper(0) > w.average(_SHADOW_VERY_SHORT, 0)),
+        100)
+
+
+@_pattern("CDLHAMMER", lambda p: max(p[_BODY_SHORT], p[_SHADOW_LONG],
+                                       p[_SHADOW_VERY_SHORT], p[_NEAR]) + 1)
+def _hammer(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.lower(0) > w.average(_SHADOW_LONG, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.bottom(0) <= w.low(1) + w.average(_NEAR, 1)),
+        100)
+
+
+@_pattern("CDLHANGINGMAN", lambda p: max(p[_BODY_SHORT], p[_SHADOW_LONG],
+                                           p[_SHADOW_VERY_SHORT], p[_NEAR]) + 1)
+def _hanging_man(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.lower(0) > w.average(_SHADOW_LONG, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.bottom(0) >= w.high(1) - w.average(_NEAR, 1)),
+        -100)
+
+
+def _harami(w: _Window, small: np.ndarray) -> np.ndarray:
+    found = (w.body(1) > w.average(_BODY_LONG, 1)) & small
+    inside = (w.top(0) < w.top(1)) & (w.bottom(0) > w.bottom(1))
+    touching = (w.top(0) <= w.top(1)) & (w.bottom(0) >= w.bottom(1))
+    value = np.where(inside, -100, np.where(touching, -80, 0)) * w.color(1)
+    return _signal(found, value)
+
+
+@_pattern("CDLHARAMI", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 1)
+def _harami_pattern(w: _Window) -> np.ndarray:
+    return _harami(w, w.body(0) <= w.average(_BODY_SHORT, 0))
+
+
+@_pattern("CDLHARAMICROSS", lambda p: max(p[_BODY_DOJI], p[_BODY_LONG]) + 1)
+def _harami_cross(w: _Window) -> np.ndarray:
+    return _harami(w, w.body(0) <= w.average(_BODY_DOJI, 0))
+
+
+@_pattern("CDLHIGHWAVE", lambda p: max(p[_BODY_SHORT], p[_SHADOW_VERY_LONG]))
+def _high_wave(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.upper(0) > w.average(_SHADOW_VERY_LONG, 0))
+        & (w.lower(0) > w.average(_SHADOW_VERY_LONG, 0)),
+        100 * w.color(0))
+
+
+def _hikkake(w: _Window, found: np.ndarray) -> np.ndarray:
+    """Hikkake signals from the inside bar patterns ``found`` from bar ``w.start`` on.
+
+    A pattern is confirmed (±200) by the first close beyond the high (low)
+    of its inside bar within the next 3 bars, unless a newer pattern came
+    first. TA-Lib keeps that state bar by bar; here the bars are grouped by
+    the last pattern before them.
+    """
+    candles = w.candles
+    bull = w.high(0) < w.high(1)
+    signal = np.where(bull, 100, -100)
+    bars = np.arange(w.start, candles.length)
+    last = np.maximum.accumulate(np.where(found, bars, -1))
+    pending = ~found & (last >= 0) & (bars <= last + 3)
+    patternIdx = last[pending]
+    close = candles.close[bars[pending]]
+    patternSignal = signal[patternIdx - w.start]
+    confirm = np.flatnonzero(pending)[
+        ((patternSignal > 0) & (close > candles.high[patternIdx - 1]))
+        | ((patternSignal < 0) & (close < candles.low[patternIdx - 1]))]
+    # Only the first confirmation of each pattern counts
+    confirm = confirm[np.unique(last[confirm], return_index=True)[1]]
+    result = _signal(found, signal)
+    result[confirm] = 2 * signal[last[confirm] - w.start]
+    return result
+
+
+@_pattern("CDLHIKKAKE", lambda p: 5)
+def _hikkake_pattern(w: _Window) -> np.ndarray:
+    # The 3 bars before the first output can hold a pattern to confirm.
+    w = _Window(w.candles, w.start - 3)
+    found = (
+        (w.high(1) < w.high(2)) & (w.low(1) > w.low(2))
+        & (((w.high(0) < w.high(1)) & (w.low(0) < w.low(1)))
+           | ((w.high(0) > w.high(1)) & (w.low(0) > w.low(1))))
+    )
+    return _hikkake(w, found)[3:]
+
+
+@_pattern("CDLHIKKAKEMOD", lambda p: max(1, p[_NEAR]) + 5)
+def _hikkake_modified(w: _Window) -> np.ndarray:
+    w = _Window(w.candles, w.start - 3)
+    found = (
+        (w.high(2) < w.high(3)) & (w.low(2) > w.low(3))
+        & (w.high(1) < w.high(2)) & (w.low(1) > w.low(2))
+        & (((w.high(0) < w.high(1)) & (w.low(0) < w.low(1))
+            & (w.close(2) <= w.low(2) + w.average(_NEAR, 2)))
+           | ((w.high(0) > w.high(1)) & (w.low(0) > w.low(1))
+              & (w.close(2) >= w.high(2) - w.average(_NEAR, 2))))
+    )
+    return _hikkake(w, found)[3:]
+
+
+@_pattern("CDLHOMINGPIGEON", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 1)
+def _homing_pigeon(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -1) & (w.color(0) == -1)
+        & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.body(0) <= w.average(_BODY_SHORT, 0))
+        & (w.open(0) < w.open(1)) & (w.close(0) > w.close(1)),
+        100)
+
+
+@_pattern("CDLIDENTICAL3CROWS", lambda p: max(p[_SHADOW_VERY_SHORT], p[_EQUAL]) + 2)
+def _identical_three_crows(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == -1) & (w.lower(2) < w.average(_SHADOW_VERY_SHORT, 2))
+        & (w.color(1) == -1) & (w.lower(1) < w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.color(0) == -1) & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.close(2) > w.close(1)) & (w.close(1) > w.close(0))
+        & (w.open(1) <= w.close(2) + w.average(_EQUAL, 2))
+        & (w.open(1) >= w.close(2) - w.average(_EQUAL, 2))
+        & (w.open(0) <= w.close(1) + w.average(_EQUAL, 1))
+        & (w.open(0) >= w.close(1) - w.average(_EQUAL, 1)),
+        -100)
+
+
+@_pattern("CDLINNECK", lambda p: max(p[_EQUAL], p[_BODY_LONG]) + 1)
+def _in_neck(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -1) & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.color(0) == 1) & (w.open(0) < w.low(1))
+        & (w.close(0) <= w.close(1) + w.average(_EQUAL, 1)) & (w.close(0) >= w.close(1)),
+        -100)
+
+
+@_pattern("CDLINVERTEDHAMMER", lambda p: max(p[_BODY_SHORT], p[_SHADOW_LONG], p[_SHADOW_VERY_SHORT]) + 1)
+def _inverted_hammer(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.upper(0) > w.average(_SHADOW_LONG, 0))
+        & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & w.body_gap_down(0, 1),
+        100)
+
+
+def _kicking(w: _Window) -> np.ndarray:
+    return (
+        (w.color(1) == -w.color(0))
+        & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.upper(1) < w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.lower(1) < w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.body(0) > w.average(_BODY_LONG, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (((w.color(1) == -1) & w.gap_up(0, 1)) | ((w.color(1) == 1) & w.gap_down(0, 1)))
+    )
+
+
+@_pattern("CDLKICKING", lambda p: max(p[_SHADOW_VERY_SHORT], p[_BODY_LONG]) + 1)
+def _kicking_pattern(w: _Window) -> np.ndarray:
+    return _signal(_kicking(w), 100 * w.color(0))
+
+
+@_pattern("CDLKICKINGBYLENGTH", lambda p: max(p[_SHADOW_VERY_SHORT], p[_BODY_LONG]) + 1)
+def _kicking_by_length(w: _Window) -> np.ndarray:
+    longer = np.where(w.body(0) > w.body(1), w.color(0), w.color(1))
+    return _signal(_kicking(w), 100 * longer)
+
+
+@_pattern("CDLLADDERBOTTOM", lambda p: p[_SHADOW_VERY_SHORT] + 4)
+def _ladder_bottom(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(4) == -1) & (w.color(3) == -1) & (w.color(2) == -1)
+        & (w.open(4) > w.open(3)) & (w.open(3) > w.open(2))
+        & (w.close(4) > w.close(3)) & (w.close(3) > w.close(2))
+        & (w.color(1) == -1) & (w.upper(1) > w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.color(0) == 1) & (w.open(0) > w.open(1)) & (w.close(0) > w.high(1)),
+        100)
+
+
+@_pattern("CDLLONGLEGGEDDOJI", lambda p: max(p[_BODY_DOJI], p[_SHADOW_LONG]))
+def _long_legged_doji(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) <= w.average(_BODY_DOJI, 0))
+        & ((w.lower(0) > w.average(_SHADOW_LONG, 0)) | (w.upper(0) > w.average(_SHADOW_LONG, 0))),
+        100)
+
+
+@_pattern("CDLLONGLINE", lambda p: max(p[_BODY_LONG], p[_SHADOW_SHORT]))
+def _long_line(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) > w.average(_BODY_LONG, 0))
+        & (w.upper(0) < w.average(_SHADOW_SHORT, 0))
+        & (w.lower(0) < w.average(_SHADOW_SHORT, 0)),
+        100 * w.color(0))
+
+
+@_pattern("CDLMARUBOZU", lambda p: max(p[_BODY_LONG], p[_SHADOW_VERY_SHORT]))
+def _marubozu(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) > w.average(_BODY_LONG, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0)),
+        100 * w.color(0))
+
+
+@_pattern("CDLMATCHINGLOW", lambda p: p[_EQUAL] + 1)
+def _matching_low(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -1) & (w.color(0) == -1)
+        & (w.close(0) <= w.close(1) + w.average(_EQUAL, 1))
+        & (w.close(0) >= w.close(1) - w.average(_EQUAL, 1)),
+        100)
+
+
+@_pattern("CDLMATHOLD", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 4, 0.5)
+def _mat_hold(w: _Window, penetration: float) -> np.ndarray:
+    limit = w.close(4) - w.body(4) * penetration
+    return _signal(
+        (w.body(4) > w.average(_BODY_LONG, 4))
+        & (w.body(3) < w.average(_BODY_SHORT, 3))
+        & (w.body(2) < w.average(_BODY_SHORT, 2))
+        & (w.body(1) < w.average(_BODY_SHORT, 1))
+        & (w.color(4) == 1) & (w.color(3) == -1) & (w.color(0) == 1)
+        & w.body_gap_up(3, 4)
+        # 3rd and 4th hold within the 1st body, less than penetration deep
+        & (w.bottom(2) < w.close(4)) & (w.bottom(1) < w.close(4))
+        & (w.bottom(2) > limit) & (w.bottom(1) > limit)
+        # 2nd to 4th are falling
+        & (w.top(2) < w.open(3)) & (w.top(1) < w.top(2))
+        # 5th opens above the prior close and closes above the reaction highs
+        & (w.open(0) > w.close(1))
+        & (w.close(0) > np.maximum(np.maximum(w.high(3), w.high(2)), w.high(1))),
+        100)
+
+
+@_pattern("CDLMORNINGDOJISTAR", lambda p: max(p[_BODY_DOJI], p[_BODY_LONG], p[_BODY_SHORT]) + 2, 0.3)
+def _morning_doji_star(w: _Window, penetration: float) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2)) & (w.color(2) == -1)
+        & (w.body(1) <= w.average(_BODY_DOJI, 1)) & w.body_gap_down(1, 2)
+        & (w.body(0) > w.average(_BODY_SHORT, 0)) & (w.color(0) == 1)
+        & (w.close(0) > w.close(2) + w.body(2) * penetration),
+        100)
+
+
+@_pattern("CDLMORNINGSTAR", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 2, 0.3)
+def _morning_star(w: _Window, penetration: float) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2)) & (w.color(2) == -1)
+        & (w.body(1) <= w.average(_BODY_SHORT, 1)) & w.body_gap_down(1, 2)
+        & (w.body(0) > w.average(_BODY_SHORT, 0)) & (w.color(0) == 1)
+        & (w.close(0) > w.close(2) + w.body(2) * penetration),
+        100)
+
+
+@_pattern("CDLONNECK", lambda p: max(p[_EQUAL], p[_BODY_LONG]) + 1)
+def _on_neck(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -1) & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.color(0) == 1) & (w.open(0) < w.low(1))
+        & (w.close(0) <= w.low(1) + w.average(_EQUAL, 1))
+        & (w.close(0) >= w.low(1) - w.average(_EQUAL, 1)),
+        -100)
+
+
+@_pattern("CDLPIERCING", lambda p: p[_BODY_LONG] + 1)
+def _piercing(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -1) & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.color(0) == 1) & (w.body(0) > w.average(_BODY_LONG, 0))
+        & (w.open(0) < w.low(1)) & (w.close(0) < w.open(1))
+        & (w.close(0) > w.close(1) + w.body(1) * 0.5),
+        100)
+
+
+@_pattern("CDLRICKSHAWMAN", lambda p: max(p[_BODY_DOJI], p[_SHADOW_LONG], p[_NEAR]))
+def _rickshaw_man(w: _Window) -> np.ndarray:
+    middle = w.low(0) + w.range(0) / 2
+    return _signal(
+        (w.body(0) <= w.average(_BODY_DOJI, 0))
+        & (w.lower(0) > w.average(_SHADOW_LONG, 0))
+        & (w.upper(0) > w.average(_SHADOW_LONG, 0))
+        & (w.bottom(0) <= middle + w.average(_NEAR, 0))
+        & (w.top(0) >= middle - w.average(_NEAR, 0)),
+        100)
+
+
+@_pattern("CDLRISEFALL3METHODS", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 4)
+def _rise_fall_three_methods(w: _Window) -> np.ndarray:
+    color = w.color(4)
+    return _signal(
+        # 1st long, then 3 small, 5th long
+        (w.body(4) > w.average(_BODY_LONG, 4))
+        & (w.body(3) < w.average(_BODY_SHORT, 3))
+        & (w.body(2) < w.average(_BODY_SHORT, 2))
+        & (w.body(1) < w.average(_BODY_SHORT, 1))
+        & (w.body(0) > w.average(_BODY_LONG, 0))
+        # white, 3 black, white or black, 3 white, black
+        & (color == -w.color(3)) & (w.color(3) == w.color(2))
+        & (w.color(2) == w.color(1)) & (w.color(1) == -w.color(0))
+        # 2nd to 4th hold within the 1st range
+        & (w.bottom(3) < w.high(4)) & (w.top(3) > w.low(4))
+        & (w.bottom(2) < w.high(4)) & (w.top(2) > w.low(4))
+        & (w.bottom(1) < w.high(4)) & (w.top(1) > w.low(4))
+        # 2nd to 4th are falling (rising)
+        & (w.close(2) * color < w.close(3) * color)
+        & (w.close(1) * color < w.close(2) * color)
+        # 5th opens above (below) the prior close and closes above (below) the 1st close
+        & (w.open(0) * color > w.close(1) * color)
+        & (w.close(0) * color > w.close(4) * color),
+        100 * color)
+
+
+@_pattern("CDLSEPARATINGLINES", lambda p: max(p[_SHADOW_VERY_SHORT], p[_BODY_LONG], p[_EQUAL]) + 1)
+def _separating_lines(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -w.color(0))
+        & (w.open(0) <= w.open(1) + w.average(_EQUAL, 1))
+        & (w.open(0) >= w.open(1) - w.average(_EQUAL, 1))
+        & (w.body(0) > w.average(_BODY_LONG, 0))
+        & (((w.color(0) == 1) & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0)))
+           | ((w.color(0) == -1) & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0)))),
+        100 * w.color(0))
+
+
+@_pattern("CDLSHOOTINGSTAR", lambda p: max(p[_BODY_SHORT], p[_SHADOW_LONG], p[_SHADOW_VERY_SHORT]) + 1)
+def _shooting_star(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.upper(0) > w.average(_SHADOW_LONG, 0))
+        & (w.lower(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & w.body_gap_up(0, 1),
+        -100)
+
+
+@_pattern("CDLSHORTLINE", lambda p: max(p[_BODY_SHORT], p[_SHADOW_SHORT]))
+def _short_line(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.upper(0) < w.average(_SHADOW_SHORT, 0))
+        & (w.lower(0) < w.average(_SHADOW_SHORT, 0)),
+        100 * w.color(0))
+
+
+@_pattern("CDLSPINNINGTOP", lambda p: p[_BODY_SHORT])
+def _spinning_top(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.upper(0) > w.body(0)) & (w.lower(0) > w.body(0)),
+        100 * w.color(0))
+
+
+@_pattern("CDLSTALLEDPATTERN", lambda p: max(p[_BODY_LONG], p[_BODY_SHORT],
+                                               p[_SHADOW_VERY_SHORT], p[_NEAR]) + 2)
+def _stalled_pattern(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == 1) & (w.color(1) == 1) & (w.color(0) == 1)
+        & (w.close(0) > w.close(1)) & (w.close(1) > w.close(2))
+        & (w.body(2) > w.average(_BODY_LONG, 2))
+        & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.upper(1) < w.average(_SHADOW_VERY_SHORT, 1))
+        & (w.open(1) > w.open(2)) & (w.open(1) <= w.close(2) + w.average(_NEAR, 2))
+        & (w.body(0) < w.average(_BODY_SHORT, 0))
+        & (w.open(0) >= w.close(1) - w.body(0) - w.average(_NEAR, 1)),
+        -100)
+
+
+@_pattern("CDLSTICKSANDWICH", lambda p: p[_EQUAL] + 2)
+def _stick_sandwich(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == -1) & (w.color(1) == 1) & (w.color(0) == -1)
+        & (w.low(1) > w.close(2))
+        & (w.close(0) <= w.close(2) + w.average(_EQUAL, 2))
+        & (w.close(0) >= w.close(2) - w.average(_EQUAL, 2)),
+        100)
+
+
+@_pattern("CDLTAKURI", lambda p: max(p[_BODY_DOJI], p[_SHADOW_VERY_SHORT], p[_SHADOW_VERY_LONG]))
+def _takuri(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(0) <= w.average(_BODY_DOJI, 0))
+        & (w.upper(0) < w.average(_SHADOW_VERY_SHORT, 0))
+        & (w.lower(0) > w.average(_SHADOW_VERY_LONG, 0)),
+        100)
+
+
+@_pattern("CDLTASUKIGAP", lambda p: p[_NEAR] + 2)
+def _tasuki_gap(w: _Window) -> np.ndarray:
+    near = np.fabs(w.body(1) - w.body(0)) < w.average(_NEAR, 1)
+    return _signal(
+        (w.body_gap_up(1, 2) & (w.color(1) == 1) & (w.color(0) == -1)
+         & (w.open(0) < w.close(1)) & (w.open(0) > w.open(1))
+         & (w.close(0) < w.open(1)) & (w.close(0) > w.top(2)) & near)
+        | (w.body_gap_down(1, 2) & (w.color(1) == -1) & (w.color(0) == 1)
+           & (w.open(0) < w.open(1)) & (w.open(0) > w.close(1))
+           & (w.close(0) > w.open(1)) & (w.close(0) < w.bottom(2)) & near),
+        100 * w.color(1))
+
+
+@_pattern("CDLTHRUSTING", lambda p: max(p[_EQUAL], p[_BODY_LONG]) + 1)
+def _thrusting(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(1) == -1) & (w.body(1) > w.average(_BODY_LONG, 1))
+        & (w.color(0) == 1) & (w.open(0) < w.low(1))
+        & (w.close(0) > w.close(1) + w.average(_EQUAL, 1))
+        & (w.close(0) <= w.close(1) + w.body(1) * 0.5),
+        -100)
+
+
+@_pattern("CDLTRISTAR", lambda p: p[_BODY_DOJI] + 2)
+def _tristar(w: _Window) -> np.ndarray:
+    # The three dojis are all measured against the average before the 1st.
+    doji = w.average(_BODY_DOJI, 2)
+    found = (w.body(2) <= doji) & (w.body(1) <= doji) & (w.body(0) <= doji)
+    value = np.where(w.body_gap_down(1, 2) & (w.bottom(0) > w.bottom(1)), 100,
+                     np.where(w.body_gap_up(1, 2) & (w.top(0) < w.top(1)), -100, 0))
+    return _signal(found, value)
+
+
+@_pattern("CDLUNIQUE3RIVER", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 2)
+def _unique_three_river(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.body(2) > w.average(_BODY_LONG, 2)) & (w.color(2) == -1)
+        & (w.color(1) == -1) & (w.close(1) > w.close(2)) & (w.open(1) <= w.open(2))
+        & (w.low(1) < w.low(2))
+        & (w.body(0) < w.average(_BODY_SHORT, 0)) & (w.color(0) == 1) & (w.open(0) > w.low(1)),
+        100)
+
+
+@_pattern("CDLUPSIDEGAP2CROWS", lambda p: max(p[_BODY_SHORT], p[_BODY_LONG]) + 2)
+def _upside_gap_two_crows(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == 1) & (w.body(2) > w.average(_BODY_LONG, 2))
+        & (w.color(1) == -1) & (w.body(1) <= w.average(_BODY_SHORT, 1)) & w.body_gap_up(1, 2)
+        & (w.color(0) == -1) & (w.open(0) > w.open(1)) & (w.close(0) < w.close(1))
+        & (w.close(0) > w.close(2)),
+        -100)
+
+
+@_pattern("CDLXSIDEGAP3METHODS", lambda p: 2)
+def _xside_gap_three_methods(w: _Window) -> np.ndarray:
+    return _signal(
+        (w.color(2) == w.color(1)) & (w.color(1) == -w.color(0))
+        & (w.open(0) < w.top(1)) & (w.open(0) > w.bottom(1))
+        & (w.close(0) < w.top(2)) & (w.close(0) > w.bottom(2))
+        & (((w.color(2) == 1) & w.body_gap_up(1, 2))
+           | ((w.color(2) == -1) & w.body_gap_down(1, 2))),
+        100 * w.color(2))
+
+
+PATTERNS = tuple(sorted(_PATTERNS))
+"""Names of every pattern, the default rows of :func:`scan`."""
+
+
+def _lookback(name: str):
+    """Lookback of a CDL* wrapper for ``start``/``last``, from the current candle settings."""
+    lookback = _PATTERNS[name][1]
+
+    def wrapper_lookback(**params):
+        return lookback([setting.avgPeriod for setting in TA_Globals.candleSettings])
+    return wrapper_lookback
+
+
+def _evaluate(candles: _Candles, name: str, penetration: Optional[float]):
+    """Lookback and TA-Lib values from the lookback on, None if the series is too short."""
+    func, lookback, default = _PATTERNS[name]
+    start = lookback([setting.avgPeriod for setting in candles.settings])
+    if start >= candles.length:
+        return start, None
+    window = _Window(candles, start)
+    if default is None:
+        return start, func(window)
+    if penetration is None:
+        penetration = default
+    elif penetration < 0:
+        raise Exception("penetration must not be negative")
+    return start, func(window, penetration)
+
+
+def _prepare(open, high, low, close):
+    open = check_array(open)
+    high = check_array(high)
+    low = check_array(low)
+    close = check_array(close)
+    check_length4(open, high, low, close)
+    startIdx = check_begidx4(open, high, low, close)
+    return startIdx, _Candles(open[startIdx:], high[startIdx:], low[startIdx:], close[startIdx:])
+
+
+def _check_matrix(out: Optional[np.ndarray], shape: tuple) -> np.ndarray:
+    """Return the zero filled int8 output of the given shape, ``out`` if given."""
+    if out is None:
+        return np.zeros(shape, dtype=np.int8)
+    if not isinstance(out, np.ndarray):
+        raise Exception("output array is not an ndarray")
+    if out.dtype != np.int8:
+        raise Exception("output array type is not int8")
+    if out.shape != shape:
+        raise Exception("output array shape is not %s" % (shape,))
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise Exception("output array is not a writeable contiguous array")
+    out.fill(0)
+    return out
+
+
+def scan(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+         patterns: Optional[Iterable[str]] = None, penetration: Optional[dict] = None,
+         out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Every candlestick pattern of one OHLC series.
+
+    Returns an int8 (n_patterns, n_bars) matrix, row ``i`` is TA-Lib's
+    ``patterns[i]`` (default :data:`PATTERNS`) divided by :data:`SCALE`,
+    0 in its lookback. ``penetration`` maps pattern names to their
+    penetration parameter, the others keep TA-Lib's default.
+    """
+    patterns = PATTERNS if patterns is None else tuple(patterns)
+    for name in patterns:
+        if name not in _PATTERNS:
+            raise Exception("unknown pattern %s" % name)
+    penetration = {} if penetration is None else dict(penetration)
+    for name in penetration:
+        if name not in _PATTERNS or _PATTERNS[name][2] is None:
+            raise Exception("pattern %s has no penetration" % name)
+
+    startIdx, candles = _prepare(open, high, low, close)
+    result = _check_matrix(out, (len(patterns), startIdx + candles.length))
+    for row, name in enumerate(patterns):
+        start, values = _evaluate(candles, name, penetration.get(name))
+        if values is not None:
+            result[row, startIdx + start:] = values // SCALE
+    return result
+
+
+def _single(name: str, open, high, low, close, out, penetration: Optional[float] = None) -> np.ndarray:
+    startIdx, candles = _prepare(open, high, low, close)
+    outInteger = check_out(out, close, fill=0, dtype=np.intp)
+    start, values = _evaluate(candles, name, penetration)
+    if values is not None:
+        outInteger[startIdx + start:] = values
+    return outInteger
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL2CROWS"))
+def CDL2CROWS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL2CROWS(open, high, low, close)
+
+    Two Crows (Pattern Recognition)
+    """
+    return _single("CDL2CROWS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL3BLACKCROWS"))
+def CDL3BLACKCROWS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL3BLACKCROWS(open, high, low, close)
+
+    Three Black Crows (Pattern Recognition)
+    """
+    return _single("CDL3BLACKCROWS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL3INSIDE"))
+def CDL3INSIDE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL3INSIDE(open, high, low, close)
+
+    Three Inside Up/Down (Pattern Recognition)
+    """
+    return _single("CDL3INSIDE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL3LINESTRIKE"))
+def CDL3LINESTRIKE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL3LINESTRIKE(open, high, low, close)
+
+    Three-Line Strike (Pattern Recognition)
+    """
+    return _single("CDL3LINESTRIKE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL3OUTSIDE"))
+def CDL3OUTSIDE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL3OUTSIDE(open, high, low, close)
+
+    Three Outside Up/Down (Pattern Recognition)
+    """
+    return _single("CDL3OUTSIDE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL3STARSINSOUTH"))
+def CDL3STARSINSOUTH(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL3STARSINSOUTH(open, high, low, close)
+
+    Three Stars In The South (Pattern Recognition)
+    """
+    return _single("CDL3STARSINSOUTH", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDL3WHITESOLDIERS"))
+def CDL3WHITESOLDIERS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDL3WHITESOLDIERS(open, high, low, close)
+
+    Three Advancing White Soldiers (Pattern Recognition)
+    """
+    return _single("CDL3WHITESOLDIERS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLABANDONEDBABY"))
+def CDLABANDONEDBABY(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     penetration: float = 0.3, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLABANDONEDBABY(open, high, low, close[, penetration=0.3])
+
+    Abandoned Baby (Pattern Recognition)
+    """
+    return _single("CDLABANDONEDBABY", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLADVANCEBLOCK"))
+def CDLADVANCEBLOCK(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLADVANCEBLOCK(open, high, low, close)
+
+    Advance Block (Pattern Recognition)
+    """
+    return _single("CDLADVANCEBLOCK", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLBELTHOLD"))
+def CDLBELTHOLD(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLBELTHOLD(open, high, low, close)
+
+    Belt-hold (Pattern Recognition)
+    """
+    return _single("CDLBELTHOLD", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLBREAKAWAY"))
+def CDLBREAKAWAY(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLBREAKAWAY(open, high, low, close)
+
+    Breakaway (Pattern Recognition)
+    """
+    return _single("CDLBREAKAWAY", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLCLOSINGMARUBOZU"))
+def CDLCLOSINGMARUBOZU(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLCLOSINGMARUBOZU(open, high, low, close)
+
+    Closing Marubozu (Pattern Recognition)
+    """
+    return _single("CDLCLOSINGMARUBOZU", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLCONCEALBABYSWALL"))
+def CDLCONCEALBABYSWALL(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLCONCEALBABYSWALL(open, high, low, close)
+
+    Concealing Baby Swallow (Pattern Recognition)
+    """
+    return _single("CDLCONCEALBABYSWALL", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLCOUNTERATTACK"))
+def CDLCOUNTERATTACK(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLCOUNTERATTACK(open, high, low, close)
+
+    Counterattack (Pattern Recognition)
+    """
+    return _single("CDLCOUNTERATTACK", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLDARKCLOUDCOVER"))
+def CDLDARKCLOUDCOVER(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      penetration: float = 0.5, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLDARKCLOUDCOVER(open, high, low, close[, penetration=0.5])
+
+    Dark Cloud Cover (Pattern Recognition)
+    """
+    return _single("CDLDARKCLOUDCOVER", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLDOJI"))
+def CDLDOJI(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+            out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLDOJI(open, high, low, close)
+
+    Doji (Pattern Recognition)
+    """
+    return _single("CDLDOJI", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLDOJISTAR"))
+def CDLDOJISTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLDOJISTAR(open, high, low, close)
+
+    Doji Star (Pattern Recognition)
+    """
+    return _single("CDLDOJISTAR", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLDRAGONFLYDOJI"))
+def CDLDRAGONFLYDOJI(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLDRAGONFLYDOJI(open, high, low, close)
+
+    Dragonfly Doji (Pattern Recognition)
+    """
+    return _single("CDLDRAGONFLYDOJI", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLENGULFING"))
+def CDLENGULFING(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLENGULFING(open, high, low, close)
+
+    Engulfing Pattern (Pattern Recognition)
+    """
+    return _single("CDLENGULFING", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLEVENINGDOJISTAR"))
+def CDLEVENINGDOJISTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       penetration: float = 0.3, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLEVENINGDOJISTAR(open, high, low, close[, penetration=0.3])
+
+    Evening Doji Star (Pattern Recognition)
+    """
+    return _single("CDLEVENINGDOJISTAR", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLEVENINGSTAR"))
+def CDLEVENINGSTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   penetration: float = 0.3, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLEVENINGSTAR(open, high, low, close[, penetration=0.3])
+
+    Evening Star (Pattern Recognition)
+    """
+    return _single("CDLEVENINGSTAR", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLGAPSIDESIDEWHITE"))
+def CDLGAPSIDESIDEWHITE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLGAPSIDESIDEWHITE(open, high, low, close)
+
+    Up/Down-gap side-by-side white lines (Pattern Recognition)
+    """
+    return _single("CDLGAPSIDESIDEWHITE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLGRAVESTONEDOJI"))
+def CDLGRAVESTONEDOJI(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLGRAVESTONEDOJI(open, high, low, close)
+
+    Gravestone Doji (Pattern Recognition)
+    """
+    return _single("CDLGRAVESTONEDOJI", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHAMMER"))
+def CDLHAMMER(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHAMMER(open, high, low, close)
+
+    Hammer (Pattern Recognition)
+    """
+    return _single("CDLHAMMER", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHANGINGMAN"))
+def CDLHANGINGMAN(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHANGINGMAN(open, high, low, close)
+
+    Hanging Man (Pattern Recognition)
+    """
+    return _single("CDLHANGINGMAN", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHARAMI"))
+def CDLHARAMI(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHARAMI(open, high, low, close)
+
+    Harami Pattern (Pattern Recognition)
+    """
+    return _single("CDLHARAMI", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHARAMICROSS"))
+def CDLHARAMICROSS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHARAMICROSS(open, high, low, close)
+
+    Harami Cross Pattern (Pattern Recognition)
+    """
+    return _single("CDLHARAMICROSS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHIGHWAVE"))
+def CDLHIGHWAVE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHIGHWAVE(open, high, low, close)
+
+    High-Wave Candle (Pattern Recognition)
+    """
+    return _single("CDLHIGHWAVE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHIKKAKE"))
+def CDLHIKKAKE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHIKKAKE(open, high, low, close)
+
+    Hikkake Pattern (Pattern Recognition)
+    """
+    return _single("CDLHIKKAKE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHIKKAKEMOD"))
+def CDLHIKKAKEMOD(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHIKKAKEMOD(open, high, low, close)
+
+    Modified Hikkake Pattern (Pattern Recognition)
+    """
+    return _single("CDLHIKKAKEMOD", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLHOMINGPIGEON"))
+def CDLHOMINGPIGEON(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLHOMINGPIGEON(open, high, low, close)
+
+    Homing Pigeon (Pattern Recognition)
+    """
+    return _single("CDLHOMINGPIGEON", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLIDENTICAL3CROWS"))
+def CDLIDENTICAL3CROWS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLIDENTICAL3CROWS(open, high, low, close)
+
+    Identical Three Crows (Pattern Recognition)
+    """
+    return _single("CDLIDENTICAL3CROWS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLINNECK"))
+def CDLINNECK(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLINNECK(open, high, low, close)
+
+    In-Neck Pattern (Pattern Recognition)
+    """
+    return _single("CDLINNECK", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLINVERTEDHAMMER"))
+def CDLINVERTEDHAMMER(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLINVERTEDHAMMER(open, high, low, close)
+
+    Inverted Hammer (Pattern Recognition)
+    """
+    return _single("CDLINVERTEDHAMMER", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLKICKING"))
+def CDLKICKING(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLKICKING(open, high, low, close)
+
+    Kicking (Pattern Recognition)
+    """
+    return _single("CDLKICKING", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLKICKINGBYLENGTH"))
+def CDLKICKINGBYLENGTH(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLKICKINGBYLENGTH(open, high, low, close)
+
+    Kicking - bull/bear determined by the longer marubozu (Pattern Recognition)
+    """
+    return _single("CDLKICKINGBYLENGTH", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLLADDERBOTTOM"))
+def CDLLADDERBOTTOM(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLLADDERBOTTOM(open, high, low, close)
+
+    Ladder Bottom (Pattern Recognition)
+    """
+    return _single("CDLLADDERBOTTOM", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLLONGLEGGEDDOJI"))
+def CDLLONGLEGGEDDOJI(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLLONGLEGGEDDOJI(open, high, low, close)
+
+    Long Legged Doji (Pattern Recognition)
+    """
+    return _single("CDLLONGLEGGEDDOJI", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLLONGLINE"))
+def CDLLONGLINE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLLONGLINE(open, high, low, close)
+
+    Long Line Candle (Pattern Recognition)
+    """
+    return _single("CDLLONGLINE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLMARUBOZU"))
+def CDLMARUBOZU(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLMARUBOZU(open, high, low, close)
+
+    Marubozu (Pattern Recognition)
+    """
+    return _single("CDLMARUBOZU", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLMATCHINGLOW"))
+def CDLMATCHINGLOW(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLMATCHINGLOW(open, high, low, close)
+
+    Matching Low (Pattern Recognition)
+    """
+    return _single("CDLMATCHINGLOW", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLMATHOLD"))
+def CDLMATHOLD(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               penetration: float = 0.5, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLMATHOLD(open, high, low, close[, penetration=0.5])
+
+    Mat Hold (Pattern Recognition)
+    """
+    return _single("CDLMATHOLD", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLMORNINGDOJISTAR"))
+def CDLMORNINGDOJISTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       penetration: float = 0.3, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLMORNINGDOJISTAR(open, high, low, close[, penetration=0.3])
+
+    Morning Doji Star (Pattern Recognition)
+    """
+    return _single("CDLMORNINGDOJISTAR", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLMORNINGSTAR"))
+def CDLMORNINGSTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   penetration: float = 0.3, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLMORNINGSTAR(open, high, low, close[, penetration=0.3])
+
+    Morning Star (Pattern Recognition)
+    """
+    return _single("CDLMORNINGSTAR", open, high, low, close, out, penetration)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLONNECK"))
+def CDLONNECK(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLONNECK(open, high, low, close)
+
+    On-Neck Pattern (Pattern Recognition)
+    """
+    return _single("CDLONNECK", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLPIERCING"))
+def CDLPIERCING(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLPIERCING(open, high, low, close)
+
+    Piercing Pattern (Pattern Recognition)
+    """
+    return _single("CDLPIERCING", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLRICKSHAWMAN"))
+def CDLRICKSHAWMAN(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLRICKSHAWMAN(open, high, low, close)
+
+    Rickshaw Man (Pattern Recognition)
+    """
+    return _single("CDLRICKSHAWMAN", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLRISEFALL3METHODS"))
+def CDLRISEFALL3METHODS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLRISEFALL3METHODS(open, high, low, close)
+
+    Rising/Falling Three Methods (Pattern Recognition)
+    """
+    return _single("CDLRISEFALL3METHODS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLSEPARATINGLINES"))
+def CDLSEPARATINGLINES(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLSEPARATINGLINES(open, high, low, close)
+
+    Separating Lines (Pattern Recognition)
+    """
+    return _single("CDLSEPARATINGLINES", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLSHOOTINGSTAR"))
+def CDLSHOOTINGSTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLSHOOTINGSTAR(open, high, low, close)
+
+    Shooting Star (Pattern Recognition)
+    """
+    return _single("CDLSHOOTINGSTAR", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLSHORTLINE"))
+def CDLSHORTLINE(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLSHORTLINE(open, high, low, close)
+
+    Short Line Candle (Pattern Recognition)
+    """
+    return _single("CDLSHORTLINE", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLSPINNINGTOP"))
+def CDLSPINNINGTOP(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLSPINNINGTOP(open, high, low, close)
+
+    Spinning Top (Pattern Recognition)
+    """
+    return _single("CDLSPINNINGTOP", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLSTALLEDPATTERN"))
+def CDLSTALLEDPATTERN(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLSTALLEDPATTERN(open, high, low, close)
+
+    Stalled Pattern (Pattern Recognition)
+    """
+    return _single("CDLSTALLEDPATTERN", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLSTICKSANDWICH"))
+def CDLSTICKSANDWICH(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLSTICKSANDWICH(open, high, low, close)
+
+    Stick Sandwich (Pattern Recognition)
+    """
+    return _single("CDLSTICKSANDWICH", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLTAKURI"))
+def CDLTAKURI(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLTAKURI(open, high, low, close)
+
+    Takuri (Dragonfly Doji with very long lower shadow) (Pattern Recognition)
+    """
+    return _single("CDLTAKURI", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLTASUKIGAP"))
+def CDLTASUKIGAP(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLTASUKIGAP(open, high, low, close)
+
+    Tasuki Gap (Pattern Recognition)
+    """
+    return _single("CDLTASUKIGAP", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLTHRUSTING"))
+def CDLTHRUSTING(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLTHRUSTING(open, high, low, close)
+
+    Thrusting Pattern (Pattern Recognition)
+    """
+    return _single("CDLTHRUSTING", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLTRISTAR"))
+def CDLTRISTAR(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLTRISTAR(open, high, low, close)
+
+    Tristar Pattern (Pattern Recognition)
+    """
+    return _single("CDLTRISTAR", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLUNIQUE3RIVER"))
+def CDLUNIQUE3RIVER(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLUNIQUE3RIVER(open, high, low, close)
+
+    Unique 3 River (Pattern Recognition)
+    """
+    return _single("CDLUNIQUE3RIVER", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLUPSIDEGAP2CROWS"))
+def CDLUPSIDEGAP2CROWS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLUPSIDEGAP2CROWS(open, high, low, close)
+
+    Upside Gap Two Crows (Pattern Recognition)
+    """
+    return _single("CDLUPSIDEGAP2CROWS", open, high, low, close, out)
+
+
+@rowwise("open", "high", "low", "close", lookback=_lookback("CDLXSIDEGAP3METHODS"))
+def CDLXSIDEGAP3METHODS(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """CDLXSIDEGAP3METHODS(open, high, low, close)
+
+    Upside/Downside Gap Three Methods (Pattern Recognition)
+    """
+    return _single("CDLXSIDEGAP3METHODS", open, high, low, close, out)
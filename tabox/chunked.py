@@ -0,0 +1,99 @@
+"""Indicators over series larger than memory, one chunk at a time.
+
+:func:`compute` runs a function over inputs and outputs that are usually
+``np.memmap`` files, ``chunk_bars`` bars at a time, so only a chunk of
+each array is resident, and gives the same values as one in-memory call.
+
+    >>> close = np.memmap("close.f8", dtype=np.float64, mode="r")
+    >>> rsi = np.memmap("rsi.f8", dtype=np.float64, mode="w+", shape=close.shape)
+    >>> tabox.chunked.compute(tabox.RSI, close, rsi, timeperiod=14, chunk_bars=1 << 22)
+    >>> tabox.chunked.compute(tabox.ATR, (high, low, close), atr, 14)
+
+The functions that take ``state=`` (EMA, RSI, ATR, ADX, KAMA, MAMA, SAR,
+T3) carry their state from one chunk to the next. The windowed functions
+of ``WINDOWED`` recompute their lookback before each chunk. The other
+ones keep running totals or recursive averages over the whole history,
+so their values depend, at least in the last bits, on where the
+computation starts: they are refused unless ``exact=False``, where they
+are computed like ``start=`` does, with their lookback as the overlap.
+"""
+import inspect
+from typing import Any, Callable
+
+import numpy as np
+
+# Functions whose values only depend on the bars of their lookback
+# window, an overlap of that many bars reproduces them exactly.
+WINDOWED = frozenset((
+    "ACOS", "ADD", "AROON", "AROONOSC", "ASIN", "ATAN", "AVGPRICE", "BOP", "CEIL", "COS",
+    "COSH", "DIV", "EXP", "FLOOR", "LN", "LOG10", "MAX", "MAXINDEX", "MEDPRICE", "MIDPOINT",
+    "MIDPRICE", "MIN", "MININDEX", "MINMAX", "MINMAXINDEX", "MOM", "MULT", "ROC", "ROCP",
+    "ROCR", "ROCR100", "SINH", "SQRT", "SUB", "TAN", "TANH", "TRANGE", "TYPPRICE",
+    "WCLPRICE", "WILLR",
+))
+
+
+def _arrays(value: Any, what: str) -> list:
+    arrays = list(value) if isinstance(value, (tuple, list)) else [value]
+    for array in arrays:
+        if not isinstance(array, np.ndarray) or array.ndim != 1:
+            raise Exception("%s must be 1-D ndarrays" % what)
+    return arrays
+
+
+def compute(func: Callable, inputs: Any, out: Any, *args: Any, chunk_bars: int = 1 << 20,
+            exact: bool = True, **params: Any) -> Any:
+    """Run ``func`` over ``inputs`` chunk by chunk into ``out`` and return ``out``.
+
+    ``inputs`` is an array or a tuple of the arrays ``func`` takes, ``out``
+    an array, or a tuple of them for multi-output functions, as long as
+    the inputs and of the output type. ``args`` and ``params`` are the
+    parameters of ``func``. Each output chunk is flushed once written.
+    """
+    inputs = _arrays(inputs, "inputs")
+    outputs = _arrays(out, "outputs")
+    length = inputs[0].shape[0]
+    if any(array.shape[0] != length for array in inputs + outputs):
+        raise Exception("input and output array lengths are different")
+    if chunk_bars < 1:
+        raise Exception("chunk_bars must be positive")
+
+    name = func.__name__
+    resumable = "return_state" in inspect.signature(func).parameters
+    if not resumable and name not in WINDOWED and exact:
+        raise Exception("%s depends on the whole history and cannot be computed in chunks exactly, "
+                        "pass exact=False to compute it with its lookback as overlap" % name)
+    if not resumable:
+        warmup = func.lookback(*inputs, *args, **params)
+
+    state = None
+    first_valid = None
+    for begin in range(0, length, chunk_bars):
+        end = min(begin + chunk_bars, length)
+        targets = [array[begin:end] for array in outputs]
+        target = targets[0] if len(targets) == 1 else tuple(targets)
+        if resumable:
+            _, state = func(*[array[begin:end] for array in inputs], *args, out=target,
+                            state=state, return_state=True, **params)
+        else:
+            first = max(0, begin - warmup) if warmup >= 0 else 0
+            valid = ~np.isnan(inputs[0][first:end])
+            started = valid.any()
+            if not started:
+                # Still in the leading NaN, left as the wrappers leave it
+                for array in targets:
+                    array.fill(np.nan if array.dtype.kind == "f" else 0)
+            else:
+                func(*[array[first:end] for array in inputs], *args, start=begin - first, out=target, **params)
+            if started and func.positions:
+                # Positions count from the first bar of the series that is
+                # not NaN, not from the first bar of this chunk.
+                offset = first + int(np.argmax(valid))
+                if first_valid is None:
+                    first_valid = offset
+                for array in targets:
+                    array += offset - first_valid
+        for array in outputs:
+            if isinstance(array, np.memmap):
+                array.flush()
+    return out
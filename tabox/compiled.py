@@ -0,0 +1,83 @@
+"""Report whether the ``ta_func`` modules run as compiled extensions.
+
+``setup.py`` cythonizes every ``tabox/ta_func/*.py`` module. When that build
+is skipped or fails, the same modules still import as plain Python, only
+100-1000x slower. :func:`build_info` tells which modules were compiled and
+:func:`is_compiled` whether all of them were.
+
+At import time tabox warns when some modules run as pure Python. Set the
+environment variable ``TABOX_REQUIRE_COMPILED=1`` to raise ``ImportError``
+instead, or ``TABOX_REQUIRE_COMPILED=0`` to silence the warning.
+"""
+import importlib.machinery
+import os
+import warnings
+from typing import Dict
+
+_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ta_func")
+
+
+def _compiled_modules() -> Dict[str, bool]:
+    # One directory listing, no module is imported. The import system
+    # picks an extension module over the .py source with the same name.
+    suffixes = set(importlib.machinery.EXTENSION_SUFFIXES)
+    modules = {}
+    for filename in os.listdir(_DIRECTORY):
+        name, dot, suffix = filename.partition(".")
+        if dot + suffix in suffixes:
+            modules[name] = True
+        elif suffix == "py":
+            modules.setdefault(name, False)
+    return dict(sorted(modules.items()))
+
+
+def is_compiled() -> bool:
+    """is_compiled() -> bool
+
+    True when every ``ta_func`` module is a compiled extension.
+    """
+    return all(_compiled_modules().values())
+
+
+def build_info() -> dict:
+    """build_info() -> dict
+
+    Build report of the installed package.
+
+    Outputs:
+        dict with
+            compiled: True when every ``ta_func`` module is compiled
+            modules: {module name: compiled} for every ``ta_func`` module
+            python: interpreter version and implementation
+            numpy: numpy version
+    """
+    import platform
+
+    import numpy as np
+
+    modules = _compiled_modules()
+    return {
+        "compiled": all(modules.values()),
+        "modules": modules,
+        "python": "%s %s" % (platform.python_implementation(), platform.python_version()),
+        "numpy": np.__version__,
+    }
+
+
+def check_compiled() -> None:
+    """Warn, or raise with ``TABOX_REQUIRE_COMPILED=1``, when some
+    ``ta_func`` modules are not compiled.
+    """
+    mode = os.environ.get("TABOX_REQUIRE_COMPILED", "")
+    if mode == "0":
+        return
+    missing = [name for name, compiled in _compiled_modules().items() if not compiled]
+    if not missing:
+        return
+    message = "%d of the tabox.ta_func modules are not compiled and run as pure Python (%s)" % (
+        len(missing),
+        ", ".join(missing[:5]) + (", ..." if len(missing) > 5 else ""),
+    )
+    if mode == "1":
+        raise ImportError(message + "; TABOX_REQUIRE_COMPILED=1 requires the compiled extension")
+    warnings.warn(message + "; build them with `python setup.py build_ext --inplace`", RuntimeWarning, stacklevel=2)
@@ -0,0 +1,39 @@
+"""The indicators without their array-dispatch layer, for short series.
+
+``tabox.fast.SMA(real, 30)`` returns the values of ``tabox.SMA(real, 30)``
+with less work per call: it takes only 1-D inputs and the function
+parameters, and skips the handling of 2-D inputs and of the ``axis``,
+``start``, ``last``, ``state``, ``unstable_period`` and ``compatibility``
+keywords. ``out=`` is still accepted, but must not share memory with the
+inputs: only the full functions compute in place. On series of a few
+hundred bars and less, where the fixed cost of a call outweighs the loop
+over the bars, this is the lean path; ``benchmark/overhead`` measures it
+against the full functions.
+
+The functions are loaded on first use like the ones of ``tabox``.
+"""
+from typing import Callable
+
+from . import _LAZY_NAMES
+
+__all__ = [name for name in _LAZY_NAMES if not name.startswith("TA_")]
+
+
+def _plain(func: Callable) -> Callable:
+    # The 1-D function wrapped by rowwise, see functools.wraps
+    return getattr(func, "__wrapped__", func)
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    import tabox
+
+    value = _plain(getattr(tabox, name))
+    # Cache it, later lookups no longer go through __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
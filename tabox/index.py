@@ -0,0 +1,179 @@
+"""Range extremum queries on one series from a precomputed sparse table.
+
+:class:`RangeExtremaIndex` preprocesses a series once in O(n log n) and
+then answers the highest/lowest value, and where it is, over any window in
+O(1), so many windows, anchors and rolling periods can be queried without
+rescanning the data.
+
+    >>> index = tabox.index.RangeExtremaIndex(high)
+    >>> index.max(100, 250), index.argmax(100, 250)
+    >>> index.rolling_max(20)           # same values as tabox.MAX(high, 20)
+    >>> index = tabox.index.RangeExtremaIndex(high, path="high.idx")
+    >>> index = tabox.index.RangeExtremaIndex.open("high.idx")   # memory-mapped
+
+Level ``k`` of the table holds, for every bar ``i``, the position of the
+extremum of ``series[i:i + 2**k]``. A window is covered by two overlapping
+blocks of the largest level that fits, and the better of the two is the
+answer. Ties go to the earliest position, like ``numpy.argmax``, and NaN
+values are skipped, a window of NaN only yields NaN. The tables take
+``16 * n * log2(n)`` bytes.
+"""
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+from .ta_func.ta_utils import check_array, check_timeperiod
+
+_FILES = ("series.npy", "argmax.npy", "argmin.npy")
+
+
+def _better(series: np.ndarray, left: np.ndarray, right: np.ndarray, is_max: bool) -> np.ndarray:
+    """Mask of the windows where ``right`` strictly beats ``left``."""
+    left_value = series[left]
+    right_value = series[right]
+    if is_max:
+        mask = right_value > left_value
+    else:
+        mask = right_value < left_value
+    mask |= np.isnan(left_value) & ~np.isnan(right_value)
+    return mask
+
+
+def _build(series: np.ndarray, table: np.ndarray, is_max: bool) -> None:
+    length = series.shape[0]
+    table[0] = np.arange(length)
+    for level in range(1, table.shape[0]):
+        half = 1 << (level - 1)
+        count = length - (1 << level) + 1
+        left = table[level - 1, :count]
+        right = table[level - 1, half:half + count]
+        table[level, :count] = np.where(_better(series, left, right, is_max), right, left)
+        # Windows running past the end keep the shorter block.
+        table[level, count:] = table[level - 1, count:]
+
+
+class RangeExtremaIndex:
+    """Sparse table of window maxima and minima positions of a series.
+
+    ``path`` builds the tables as ``.npy`` files in that directory, filled
+    through memory maps, so that :meth:`open` can map them in any process.
+    """
+
+    def __init__(self, series: Any, path: Optional[str] = None):
+        series = check_array(series)
+        length = series.shape[0]
+        if length == 0:
+            raise Exception("input array is empty")
+        shape = (length.bit_length(), length)
+        if path is None:
+            self.series = series
+            self._argmax = np.empty(shape, dtype=np.intp)
+            self._argmin = np.empty(shape, dtype=np.intp)
+        else:
+            os.makedirs(path, exist_ok=True)
+            np.save(os.path.join(path, _FILES[0]), series)
+            self.series = np.load(os.path.join(path, _FILES[0]), mmap_mode="r")
+            self._argmax = np.lib.format.open_memmap(os.path.join(path, _FILES[1]), mode="w+",
+                                                     dtype=np.intp, shape=shape)
+            self._argmin = np.lib.format.open_memmap(os.path.join(path, _FILES[2]), mode="w+",
+                                                     dtype=np.intp, shape=shape)
+        _build(self.series, self._argmax, True)
+        _build(self.series, self._argmin, False)
+        if path is not None:
+            self._argmax.flush()
+            self._argmin.flush()
+
+    @classmethod
+    def open(cls, path: str, mmap_mode: Optional[str] = "r") -> "RangeExtremaIndex":
+        """Load an index saved with ``path=`` or :meth:`save`, memory-mapped by default."""
+        self = cls.__new__(cls)
+        self.series, self._argmax, self._argmin = (
+            np.load(os.path.join(path, name), mmap_mode=mmap_mode) for name in _FILES)
+        if self._argmax.shape != (self.series.shape[0].bit_length(), self.series.shape[0]):
+            raise Exception("index files do not match the series")
+        return self
+
+    def save(self, path: str) -> None:
+        """Write the series and the tables as ``.npy`` files in ``path``."""
+        os.makedirs(path, exist_ok=True)
+        for name, array in zip(_FILES, (self.series, self._argmax, self._argmin)):
+            np.save(os.path.join(path, name), array)
+
+    def __len__(self) -> int:
+        return self.series.shape[0]
+
+    def _query(self, table: np.ndarray, start: Any, stop: Any, is_max: bool):
+        start = np.asarray(start, dtype=np.intp)
+        stop = np.asarray(stop, dtype=np.intp)
+        if np.any(start < 0) or np.any(stop > len(self)) or np.any(stop <= start):
+            raise Exception("window is empty or out of range")
+        # Largest level whose block fits in the window, frexp is exact here.
+        level = np.frexp(stop - start)[1] - 1
+        left = table[level, start]
+        right = table[level, stop - (1 << level)]
+        index = np.where(_better(self.series, left, right, is_max), right, left)
+        return index[()] if index.ndim == 0 else index
+
+    def argmax(self, start: Any, stop: Any):
+        """Position of the highest value of ``series[start:stop]``, arrays give arrays."""
+        return self._query(self._argmax, start, stop, True)
+
+    def argmin(self, start: Any, stop: Any):
+        """Position of the lowest value of ``series[start:stop]``, arrays give arrays."""
+        return self._query(self._argmin, start, stop, False)
+
+    def max(self, start: Any, stop: Any):
+        """Highest value of ``series[start:stop]``, arrays give arrays."""
+        return self.series[self.argmax(start, stop)]
+
+    def min(self, start: Any, stop: Any):
+        """Lowest value of ``series[start:stop]``, arrays give arrays."""
+        return self.series[self.argmin(start, stop)]
+
+    def _rolling(self, table: np.ndarray, period: int, is_max: bool):
+        """Positions of the rolling extremum and the first bar that has one."""
+        check_timeperiod(period)
+        # Skip the leading NaN like the wrappers do.
+        valid = ~np.isnan(self.series)
+        if not valid.any():
+            raise Exception("inputs are all NaN")
+        begin = int(np.argmax(valid)) + period - 1
+        if begin >= len(self):
+            return np.empty(0, dtype=np.intp), len(self)
+        stop = np.arange(begin + 1, len(self) + 1)
+        return self._query(table, stop - period, stop, is_max), begin
+
+    def rolling_argmax(self, period: int) -> np.ndarray:
+        """Rolling position of the highest value, aligned like ``tabox.MAXINDEX`` (0 in the lookback).
+
+        Equal highs give the earliest position, ``tabox.MAXINDEX`` may give a later one.
+        """
+        index, begin = self._rolling(self._argmax, period, True)
+        out = np.zeros(len(self), dtype=np.intp)
+        out[begin:] = index
+        return out
+
+    def rolling_argmin(self, period: int) -> np.ndarray:
+        """Rolling position of the lowest value, aligned like ``tabox.MININDEX`` (0 in the lookback).
+
+        Equal lows give the earliest position, ``tabox.MININDEX`` may give a later one.
+        """
+        index, begin = self._rolling(self._argmin, period, False)
+        out = np.zeros(len(self), dtype=np.intp)
+        out[begin:] = index
+        return out
+
+    def rolling_max(self, period: int) -> np.ndarray:
+        """Rolling highest value, same values as ``tabox.MAX(series, period)``."""
+        index, begin = self._rolling(self._argmax, period, True)
+        out = np.full(len(self), np.nan)
+        out[begin:] = self.series[index]
+        return out
+
+    def rolling_min(self, period: int) -> np.ndarray:
+        """Rolling lowest value, same values as ``tabox.MIN(series, period)``."""
+        index, begin = self._rolling(self._argmin, period, False)
+        out = np.full(len(self), np.nan)
+        out[begin:] = self.series[index]
+        return out
@@ -0,0 +1,75 @@
+"""Run one indicator over many independent series on a thread pool.
+
+The compiled kernels of the functions in :data:`GIL_FREE` release the GIL
+around their main loop, so the threads below run those loops truly in
+parallel. Other functions still work, they just serialize on the GIL, and
+:func:`map` warns when it gets one with more than one worker. The workers
+run with the ``tabox.settings(...)`` overrides of the caller.
+"""
+import contextvars
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+
+# The functions whose compiled kernel runs its main loop without the GIL
+GIL_FREE = frozenset((
+    "ADX", "ATR", "CMO", "DX", "EMA", "KAMA", "MFI", "MINUS_DI", "MINUS_DM", "NATR", "PLUS_DI",
+    "PLUS_DM", "RSI", "SMA", "SUM", "TRANGE", "VAR",
+))
+
+
+def _as_args(item):
+    if isinstance(item, tuple):
+        return item
+    return (item,)
+
+
+def map(func: Callable, arrays: Iterable, workers: Optional[int] = None, **kwargs) -> List:
+    """map(func, arrays[, workers=None, **kwargs]) -> list
+
+    Call ``func(array, **kwargs)`` for every series in ``arrays`` and return
+    the results in input order.
+
+    Only the functions of ``GIL_FREE`` release the GIL in their compiled
+    kernels and get faster with more workers. Any other function runs one
+    worker at a time, no faster than a plain loop, and with more than one
+    worker a ``RuntimeWarning`` says so.
+
+    Inputs:
+        func: any tabox function, e.g. ``tabox.RSI``
+        arrays: a sequence of 1-D ndarrays, a 2-D ndarray (one series per
+            row), or a sequence of tuples for multi-input functions such as
+            ``(high, low, close)``
+    Parameters:
+        workers: number of threads, defaults to ``os.cpu_count()``
+        kwargs: passed through to ``func``
+    Outputs:
+        list of results
+    """
+    if isinstance(arrays, np.ndarray):
+        if arrays.ndim != 2:
+            raise Exception("arrays must be a 2-D ndarray or a sequence of series")
+        arrays = [np.ascontiguousarray(row) for row in arrays]
+    else:
+        arrays = list(arrays)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise Exception("workers must be at least 1")
+
+    if workers == 1 or len(arrays) <= 1:
+        return [func(*_as_args(item), **kwargs) for item in arrays]
+    name = getattr(func, "__name__", repr(func))
+    if name not in GIL_FREE:
+        warnings.warn("%s holds the GIL, its workers run one at a time" % name, RuntimeWarning, stacklevel=2)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(arrays))) as executor:
+        # A context can only be entered by one thread at a time, so every
+        # call gets its own copy of the caller's.
+        futures = [executor.submit(contextvars.copy_context().run, func, *_as_args(item), **kwargs)
+                   for item in arrays]
+        return [future.result() for future in futures]
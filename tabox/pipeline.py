@@ -0,0 +1,278 @@
+"""Declarative indicator graphs with common-subexpression elimination.
+
+A :class:`Graph` records indicator calls as nodes instead of running them.
+Identical calls, i.e. the same function on the same input nodes with the
+same parameters (defaults included), collapse into one node. A few
+composite indicators are expanded into their building blocks so they can
+share them, e.g. ``STOCHRSI`` reuses an ``RSI`` node and ``BBANDS`` reuses
+the ``SMA`` and ``STDDEV`` nodes. Expansions are only used where they give
+bit-identical results: ``axis``, ``unstable_period`` and ``compatibility``
+are passed on to the building blocks, and calls with ``out``, ``start`` or
+``last`` are not expanded.
+
+    >>> g = tabox.pipeline.Graph()
+    >>> close = g.input("close")
+    >>> g.output("rsi", g.RSI(close, 14))
+    >>> g.output("stochrsi", g.STOCHRSI(close, 14))   # reuses the RSI node
+    >>> g.output("sma_rsi", g.SMA(g.RSI(close, timeperiod=14), 5))
+    >>> result = g.run(close=close_array)
+
+:meth:`Graph.run` only evaluates the nodes the outputs depend on, in
+topological order. It drops every intermediate array as soon as its last
+consumer has run, so scratch memory is bounded by the graph width rather
+than the number of nodes.
+"""
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class Node:
+    """One unique computation in a :class:`Graph`."""
+
+    __slots__ = ("graph", "id", "func", "inputs", "params", "name")
+
+    def __init__(self, graph: "Graph", id: int, func: Optional[Callable],
+                 inputs: Tuple["Node", ...], params: Tuple, name: str):
+        self.graph = graph
+        self.id = id
+        self.func = func
+        self.inputs = inputs
+        self.params = params
+        self.name = name
+
+    def __getitem__(self, index: int) -> "Node":
+        """Select one output of a multi-output node, e.g. ``macd[0]``."""
+        return self.graph._node(_select, (self,), (("index", index),), "%s[%d]" % (self.name, index))
+
+    def __repr__(self) -> str:
+        return "<Node %d %s>" % (self.id, self.name)
+
+
+def _hashable(value: Any) -> Any:
+    """Key of a parameter value for the node dict.
+
+    Lists and dicts are keyed by their items, other unhashable values
+    (arrays...) by identity, so only the same object is merged.
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if isinstance(value, (tuple, list)):
+        return (type(value).__name__,) + tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        items = sorted(value.items(), key=lambda item: repr(item[0]))
+        return ("dict",) + tuple((key, _hashable(item)) for key, item in items)
+    return ("id", id(value))
+
+
+def _select(value, index):
+    return value[index]
+
+
+def _input(name):
+    raise RuntimeError("input nodes are not computed")
+
+
+class Graph:
+    """A DAG of indicator calls evaluated with :meth:`run`.
+
+    Any tabox function is available as a method, so ``g.EMA(close, 12)``
+    is the same as ``g.add(tabox.EMA, close, 12)``.
+    """
+
+    def __init__(self):
+        self._nodes: List[Node] = []
+        self._keys: Dict[Tuple, Node] = {}
+        self._inputs: Dict[str, Node] = {}
+        self._outputs: Dict[str, Node] = {}
+
+    def __len__(self) -> int:
+        """Number of unique nodes, inputs included."""
+        return len(self._nodes)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        import tabox
+        func = getattr(tabox, name, None)
+        if not callable(func):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.add(func, *args, **kwargs)
+
+    def _node(self, func: Optional[Callable], inputs: Tuple[Node, ...], params: Tuple, name: str) -> Node:
+        key = (func, tuple(node.id for node in inputs), _hashable(params))
+        node = self._keys.get(key)
+        if node is None:
+            node = Node(self, len(self._nodes), func, inputs, params, name)
+            self._nodes.append(node)
+            self._keys[key] = node
+        return node
+
+    def input(self, name: str) -> Node:
+        """Declare (or fetch) the input array called ``name``."""
+        if name not in self._inputs:
+            self._inputs[name] = self._node(_input, (), (("name", name),), name)
+        return self._inputs[name]
+
+    def add(self, func: Callable, *args, **kwargs) -> Node:
+        """Add ``func(*args, **kwargs)``. Node arguments become edges and
+        every other argument, defaults included, is part of the node key.
+        """
+        try:
+            signature = inspect.signature(func)
+            # Keywords of the rowwise wrapper (axis, unstable_period...) are
+            # not in the signature of the wrapped function.
+            extra = sorted((key, value) for key, value in kwargs.items() if key not in signature.parameters)
+            bound = signature.bind(*args, **{key: value for key, value in kwargs.items()
+                                             if key in signature.parameters})
+            bound.apply_defaults()
+            arguments = list(bound.arguments.items()) + extra
+        except (TypeError, ValueError):
+            extra = sorted(kwargs.items())
+            arguments = list(enumerate(args)) + extra
+
+        inputs = tuple(value for _, value in arguments if isinstance(value, Node))
+        if not inputs:
+            raise Exception("%s needs at least one input node" % getattr(func, "__name__", func))
+        for node in inputs:
+            if node.graph is not self:
+                raise Exception("input node belongs to another graph")
+        params = tuple((key, value) for key, value in arguments if not isinstance(value, Node))
+
+        name = getattr(func, "__name__", repr(func))
+        expand = _EXPANSIONS.get(name)
+        if (expand is not None and dict(params).get("out") is None
+                and all(key in _FORWARDED or value is None for key, value in extra)):
+            forward = {key: value for key, value in extra if value is not None}
+            node = expand(self, inputs, dict(params), forward)
+            if node is not None:
+                return node
+        return self._node(func, inputs, params, name)
+
+    def output(self, name: str, node: Node) -> Node:
+        """Mark ``node`` as an output returned by :meth:`run` under ``name``."""
+        if node.graph is not self:
+            raise Exception("output node belongs to another graph")
+        self._outputs[name] = node
+        return node
+
+    def run(self, **arrays: Any) -> Dict[str, Any]:
+        """Evaluate the outputs for the given input arrays."""
+        for name in self._inputs:
+            if name not in arrays:
+                raise Exception("missing input array: %s" % name)
+
+        # Only the nodes reachable from the outputs, in creation order
+        # which is a topological order.
+        needed = set()
+        stack = list(self._outputs.values())
+        while stack:
+            node = stack.pop()
+            if node.id not in needed:
+                needed.add(node.id)
+                stack.extend(node.inputs)
+
+        consumers = dict.fromkeys(needed, 0)
+        for node_id in needed:
+            for node in self._nodes[node_id].inputs:
+                consumers[node.id] += 1
+        keep = {node.id for node in self._outputs.values()}
+
+        values: Dict[int, Any] = {}
+        for node in self._nodes:
+            if node.id not in needed:
+                continue
+            if node.func is _input:
+                values[node.id] = arrays[node.name]
+                continue
+            # Positions are the keys of the arguments of a call not bound
+            # to a signature, they follow the inputs.
+            args = [values[parent.id] for parent in node.inputs]
+            args += [value for key, value in node.params if isinstance(key, int)]
+            kwargs = {key: value for key, value in node.params if not isinstance(key, int)}
+            values[node.id] = node.func(*args, **kwargs)
+            for parent in node.inputs:
+                consumers[parent.id] -= 1
+                if consumers[parent.id] == 0 and parent.id not in keep:
+                    del values[parent.id]
+
+        return {name: values[node.id] for name, node in self._outputs.items()}
+
+
+# Expansions of composite indicators into shared building blocks.
+
+def _iszero(values: np.ndarray) -> np.ndarray:
+    return (-0.00000001 < values) & (values < 0.00000001)
+
+
+def _sub(fast, slow):
+    return fast - slow
+
+
+def _percent(fast, slow):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(_iszero(slow), 0.0, ((fast - slow) / slow) * 100.0)
+
+
+def _bands(middle, stddev, nbdevup, nbdevdn):
+    return middle + stddev * nbdevup, middle, middle - stddev * nbdevdn
+
+
+# Keywords of the rowwise wrapper an expansion passes on to its building
+# blocks. The others (start, last) apply to the whole call.
+_FORWARDED = ("axis", "unstable_period", "compatibility")
+
+
+def _expand_ma(graph: Graph, inputs, params, forward):
+    import tabox
+    if params.get("matype") == 0:
+        return graph.add(tabox.SMA, inputs[0], timeperiod=params["timeperiod"], **forward)
+    if params.get("matype") == 1:
+        return graph.add(tabox.EMA, inputs[0], timeperiod=params["timeperiod"], **forward)
+    return None
+
+
+def _expand_po(combine):
+    def expand(graph: Graph, inputs, params, forward):
+        import tabox
+        if params.get("matype") != 0:
+            return None
+        fast, slow = params["fastperiod"], params["slowperiod"]
+        if slow < fast:
+            fast, slow = slow, fast
+        return graph._node(combine, (graph.add(tabox.SMA, inputs[0], timeperiod=fast, **forward),
+                                     graph.add(tabox.SMA, inputs[0], timeperiod=slow, **forward)),
+                           (), combine.__name__)
+    return expand
+
+
+def _expand_stochrsi(graph: Graph, inputs, params, forward):
+    import tabox
+    rsi = graph.add(tabox.RSI, inputs[0], timeperiod=params["timeperiod"], **forward)
+    return graph.add(tabox.STOCHF, rsi, rsi, rsi,
+                     fastk_period=params["fastk_period"],
+                     fastd_period=params["fastd_period"],
+                     fastd_matype=params["fastd_matype"], **forward)
+
+
+def _expand_bbands(graph: Graph, inputs, params, forward):
+    import tabox
+    if params.get("matype") != 0:
+        return None
+    middle = graph.add(tabox.MA, inputs[0], timeperiod=params["timeperiod"], matype=params["matype"], **forward)
+    stddev = graph.add(tabox.STDDEV, inputs[0], timeperiod=params["timeperiod"], nbdev=1.0, **forward)
+    return graph._node(_bands, (middle, stddev),
+                       (("nbdevup", params["nbdevup"]), ("nbdevdn", params["nbdevdn"])), "BBANDS")
+
+
+_EXPANSIONS = {
+    "MA": _expand_ma,
+    "APO": _expand_po(_sub),
+    "PPO": _expand_po(_percent),
+    "STOCHRSI": _expand_stochrsi,
+    "BBANDS": _expand_bbands,
+}
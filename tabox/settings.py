@@ -1 +1,85 @@
-TA_FUNC_NO_RANGE_CHECK: bool = True
\ No newline at end of file
+"""Library settings.
+
+``TA_FUNC_NO_RANGE_CHECK`` skips the parameter range checks of the TA_*
+kernels. The unstable periods and the compatibility mode default to the
+process-wide values of ``TA_SetUnstablePeriod`` and ``TA_SetCompatibility``
+and can be overridden in one context (thread, asyncio task) with::
+
+    with tabox.settings(unstable_period=100, compatibility="metastock"):
+        tabox.RSI(close, 14)
+    tabox.EMA(close, 10, unstable_period={"EMA": 50})
+
+Overrides nest, apply to the functions called inside (MACD computes its
+EMAs with the EMA unstable period), and are not seen by other threads,
+so they can run with different settings at the same time.
+"""
+import contextlib
+import sys
+import types
+from typing import Any, Iterator, Optional
+
+TA_FUNC_NO_RANGE_CHECK: bool = True
+
+
+def _unstable_ids(unstable_period: Any) -> dict:
+    from .ta_func.ta_utility import TA_FuncUnstId
+
+    if unstable_period is None:
+        return {}
+    if not isinstance(unstable_period, dict):
+        unstable_period = {TA_FuncUnstId.TA_FUNC_UNST_ALL: unstable_period}
+    ids = {}
+    for key, period in unstable_period.items():
+        if isinstance(key, str):
+            name = "TA_FUNC_UNST_" + key.upper()
+            if name not in TA_FuncUnstId.__members__:
+                raise Exception("%s has no unstable period" % key)
+            key = TA_FuncUnstId[name]
+        key = TA_FuncUnstId(key)
+        if key == TA_FuncUnstId.TA_FUNC_UNST_NONE:
+            raise Exception("TA_FUNC_UNST_NONE has no unstable period")
+        if int(period) != period or period < 0:
+            raise Exception("unstable period must be a non-negative integer")
+        ids[key] = int(period)
+    return ids
+
+
+def _compatibility(compatibility: Any) -> Any:
+    from .ta_func.ta_utility import TA_Compatibility
+
+    if compatibility is None:
+        return None
+    if isinstance(compatibility, str):
+        name = "TA_COMPATIBILITY_" + compatibility.upper()
+        if name not in TA_Compatibility.__members__:
+            raise Exception("unknown compatibility %s" % compatibility)
+        return TA_Compatibility[name]
+    return TA_Compatibility(compatibility)
+
+
+@contextlib.contextmanager
+def using(unstable_period: Any = None, compatibility: Any = None) -> Iterator[None]:
+    """Override the settings until the block exits, in this context only.
+
+    ``unstable_period`` is a period for all the functions or a dict
+    mapping function names (``"EMA"``) or ``TA_FuncUnstId`` values to
+    periods. ``compatibility`` is a ``TA_Compatibility`` or its name
+    (``"default"``, ``"metastock"``). None leaves a setting as it is.
+    """
+    from .ta_func.ta_utility import TA_ContextOverrides, TA_OverrideSettings
+
+    token = TA_OverrideSettings(_unstable_ids(unstable_period), _compatibility(compatibility))
+    try:
+        yield
+    finally:
+        TA_ContextOverrides.reset(token)
+
+
+class _SettingsModule(types.ModuleType):
+    """The module itself is the context manager, ``tabox.settings(...)``."""
+
+    def __call__(self, unstable_period: Optional[Any] = None, compatibility: Optional[Any] = None):
+        return using(unstable_period=unstable_period, compatibility=compatibility)
+
+
+sys.modules[__name__].__class__ = _SettingsModule
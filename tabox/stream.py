@@ -0,0 +1,538 @@
+"""
+Streaming indicators
+
+Every class in this module keeps the same running state as the loop of the
+matching ``TA_*`` kernel (``periodTotal`` for SMA, ``prevGain``/``prevLoss``
+for RSI, the smoothed +DM/-DM/TR for ADX, ...) so that feeding a series one
+bar at a time through ``update`` gives exactly the values the batch wrapper
+returns for the whole series. Each ``update`` call is O(1).
+
+    >>> rsi = tabox.stream.RSI(timeperiod=14)
+    >>> rsi.update_many(history)
+    >>> value = rsi.update(last_price)
+
+Leading NaN inputs are skipped the same way the batch wrappers skip them
+with ``check_begidx*``: they return NaN and do not advance the state.
+"""
+from collections import deque
+from math import fabs, isnan, nan, sqrt
+from typing import Tuple, Union
+
+import numpy as np
+
+from .ta_func.ta_utils import check_array, check_timeperiod
+from .ta_func.ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId, TA_MAType
+
+
+def _is_zero(v: float) -> bool:
+    return (-0.00000001) < v < 0.00000001
+
+
+class _Stream:
+    """Base class of the streaming indicators.
+
+    Subclasses set ``n_inputs``/``n_outputs`` and implement ``_update``
+    which receives one value per input and returns one float per output.
+    """
+
+    n_inputs: int = 1
+    n_outputs: int = 1
+
+    def __init__(self):
+        self._started = False
+
+    def _nan_result(self):
+        if self.n_outputs == 1:
+            return nan
+        return (nan,) * self.n_outputs
+
+    def update(self, *values: float) -> Union[float, Tuple[float, ...]]:
+        if len(values) != self.n_inputs:
+            raise TypeError(
+                f"{type(self).__name__}.update() takes {self.n_inputs} input value(s)"
+            )
+        if not self._started:
+            for v in values:
+                if isnan(v):
+                    return self._nan_result()
+            self._started = True
+        return self._update(*values)
+
+    def update_many(self, *arrays: np.ndarray) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+        if len(arrays) != self.n_inputs:
+            raise TypeError(
+                f"{type(self).__name__}.update_many() takes {self.n_inputs} input array(s)"
+            )
+        arrays = [check_array(a) for a in arrays]
+        length = arrays[0].shape[0]
+        for a in arrays[1:]:
+            if a.shape[0] != length:
+                raise Exception("input array lengths are different")
+
+        outputs = [np.empty(length, dtype=np.float64) for _ in range(self.n_outputs)]
+        update = self.update
+        if self.n_outputs == 1:
+            out = outputs[0]
+            for i, values in enumerate(zip(*[a.tolist() for a in arrays])):
+                out[i] = update(*values)
+            return out
+
+        for i, values in enumerate(zip(*[a.tolist() for a in arrays])):
+            result = update(*values)
+            for out, v in zip(outputs, result):
+                out[i] = v
+        return tuple(outputs)
+
+    def _update(self, *values: float):
+        raise NotImplementedError
+
+
+class SUM(_Stream):
+    """SUM(timeperiod=30)
+
+    Streaming Summation (Math Operators)
+    """
+
+    def __init__(self, timeperiod: int = 30):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        self.timeperiod = timeperiod
+        self._window = deque(maxlen=timeperiod)
+        self._periodTotal = 0.0
+
+    def _update(self, real: float) -> float:
+        window = self._window
+        self._periodTotal += real
+        window.append(real)
+        if len(window) < self.timeperiod:
+            return nan
+        tempReal = self._periodTotal
+        self._periodTotal -= window[0]
+        return tempReal
+
+
+class SMA(SUM):
+    """SMA(timeperiod=30)
+
+    Streaming Simple Moving Average (Overlap Studies)
+    """
+
+    def _update(self, real: float) -> float:
+        return super()._update(real) / self.timeperiod
+
+
+class EMA(_Stream):
+    """EMA(timeperiod=30)
+
+    Streaming Exponential Moving Average (Overlap Studies)
+
+    The first value is seeded with the SMA of the first ``timeperiod`` bars
+    and the EMA unstable period is honoured like ``TA_EMA_Lookback`` does.
+    """
+
+    def __init__(self, timeperiod: int = 30):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        self._init_state(timeperiod)
+
+    def _init_state(self, timeperiod: int) -> None:
+        self.timeperiod = timeperiod
+        self._k = 2.0 / (timeperiod + 1)
+        self._lookback = timeperiod - 1 + TA_GLOBALS_UNSTABLE_PERIOD(
+            TA_FuncUnstId.TA_FUNC_UNST_EMA
+        )
+        self._today = 0
+        self._prevMA = 0.0
+
+    def _update(self, real: float) -> float:
+        today = self._today
+        self._today = today + 1
+        if today < self.timeperiod:
+            self._prevMA += real
+            if today < self.timeperiod - 1:
+                return nan
+            self._prevMA = self._prevMA / self.timeperiod
+        else:
+            self._prevMA = ((real - self._prevMA) * self._k) + self._prevMA
+        if today < self._lookback:
+            return nan
+        return self._prevMA
+
+
+class MOM(_Stream):
+    """MOM(timeperiod=10)
+
+    Streaming Momentum (Momentum Indicators)
+    """
+
+    def __init__(self, timeperiod: int = 10):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        self.timeperiod = timeperiod
+        self._window = deque(maxlen=timeperiod + 1)
+
+    def _update(self, real: float) -> float:
+        window = self._window
+        window.append(real)
+        if len(window) <= self.timeperiod:
+            return nan
+        return real - window[0]
+
+
+class VAR(_Stream):
+    """VAR(timeperiod=5, nbdev=1.0)
+
+    Streaming Variance (Statistic Functions)
+    """
+
+    def __init__(self, timeperiod: int = 5, nbdev: float = 1.0):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        if nbdev == 0:
+            nbdev = 1.0
+        self.timeperiod = timeperiod
+        self.nbdev = nbdev
+        self._window = deque(maxlen=timeperiod)
+        self._periodTotal1 = 0.0
+        self._periodTotal2 = 0.0
+
+    def _update(self, real: float) -> float:
+        window = self._window
+        window.append(real)
+        self._periodTotal1 += real
+        self._periodTotal2 += real * real
+        if len(window) < self.timeperiod:
+            return nan
+
+        meanValue1 = self._periodTotal1 / self.timeperiod
+        meanValue2 = self._periodTotal2 / self.timeperiod
+
+        tempReal = window[0]
+        self._periodTotal1 -= tempReal
+        self._periodTotal2 -= tempReal * tempReal
+        return meanValue2 - meanValue1 * meanValue1
+
+
+class STDDEV(VAR):
+    """STDDEV(timeperiod=5, nbdev=1.0)
+
+    Streaming Standard Deviation (Statistic Functions)
+    """
+
+    def _update(self, real: float) -> float:
+        tempReal = super()._update(real)
+        if len(self._window) < self.timeperiod:
+            return nan
+        if tempReal > 0:
+            return sqrt(tempReal) * self.nbdev
+        return 0.0
+
+
+class BBANDS(_Stream):
+    """BBANDS(timeperiod=5, nbdevup=2.0, nbdevdn=2.0, matype=0)
+
+    Streaming Bollinger Bands (Overlap Studies)
+
+    Only the SMA middle band is supported, which is the case the batch
+    kernel computes with ``INT_stddev_using_precalc_ma``.
+
+    Outputs:
+        upperband, middleband, lowerband
+    """
+
+    n_outputs = 3
+
+    def __init__(
+        self,
+        timeperiod: int = 5,
+        nbdevup: float = 2.0,
+        nbdevdn: float = 2.0,
+        matype: int = 0,
+    ):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        if matype != TA_MAType.TA_MAType_SMA:
+            raise ValueError("streaming BBANDS only supports matype=0 (SMA)")
+        self.timeperiod = timeperiod
+        self.nbdevup = nbdevup
+        self.nbdevdn = nbdevdn
+        self._window = deque(maxlen=timeperiod)
+        self._periodTotal = 0.0
+        self._periodTotal2 = 0.0
+
+    def _update(self, real: float) -> Tuple[float, float, float]:
+        window = self._window
+        window.append(real)
+        self._periodTotal += real
+        self._periodTotal2 += real * real
+        if len(window) < self.timeperiod:
+            return nan, nan, nan
+
+        middle = self._periodTotal / self.timeperiod
+        meanValue2 = self._periodTotal2 / self.timeperiod
+
+        tempReal = window[0]
+        self._periodTotal -= tempReal
+        self._periodTotal2 -= tempReal * tempReal
+
+        meanValue2 -= middle * middle
+        stddev = sqrt(meanValue2) if meanValue2 > 0 else 0.0
+        return (
+            middle + (stddev * self.nbdevup),
+            middle,
+            middle - (stddev * self.nbdevdn),
+        )
+
+
+class RSI(_Stream):
+    """RSI(timeperiod=14)
+
+    Streaming Relative Strength Index (Momentum Indicators)
+
+    Follows the classic (non-Metastock) Wilder smoothing of ``TA_RSI``.
+    """
+
+    def __init__(self, timeperiod: int = 14):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        self.timeperiod = timeperiod
+        self._today = 0
+        self._prevValue = 0.0
+        self._prevGain = 0.0
+        self._prevLoss = 0.0
+
+    def _update(self, real: float) -> float:
+        today = self._today
+        self._today = today + 1
+        tempValue2 = real - self._prevValue
+        self._prevValue = real
+        if today == 0:
+            return nan
+
+        optInTimePeriod = self.timeperiod
+        if today <= optInTimePeriod:
+            if tempValue2 < 0.0:
+                self._prevLoss -= tempValue2
+            else:
+                self._prevGain += tempValue2
+            if today < optInTimePeriod:
+                return nan
+            self._prevLoss /= optInTimePeriod
+            self._prevGain /= optInTimePeriod
+        else:
+            self._prevLoss *= optInTimePeriod - 1
+            self._prevGain *= optInTimePeriod - 1
+            if tempValue2 < 0.0:
+                self._prevLoss -= tempValue2
+            else:
+                self._prevGain += tempValue2
+            self._prevLoss /= optInTimePeriod
+            self._prevGain /= optInTimePeriod
+
+        tempValue1 = self._prevGain + self._prevLoss
+        if not _is_zero(tempValue1):
+            return 100.0 * (self._prevGain / tempValue1)
+        return 0.0
+
+
+def _true_range(high: float, low: float, prevClose: float) -> float:
+    greatest = high - low
+    val2 = fabs(prevClose - high)
+    if val2 > greatest:
+        greatest = val2
+    val3 = fabs(prevClose - low)
+    if val3 > greatest:
+        greatest = val3
+    return greatest
+
+
+class TRANGE(_Stream):
+    """TRANGE()
+
+    Streaming True Range (Volatility Indicators)
+    """
+
+    n_inputs = 3
+
+    def __init__(self):
+        super().__init__()
+        self._today = 0
+        self._prevClose = 0.0
+
+    def _update(self, high: float, low: float, close: float) -> float:
+        today = self._today
+        self._today = today + 1
+        prevClose = self._prevClose
+        self._prevClose = close
+        if today == 0:
+            return nan
+        return _true_range(high, low, prevClose)
+
+
+class ATR(_Stream):
+    """ATR(timeperiod=14)
+
+    Streaming Average True Range (Volatility Indicators)
+    """
+
+    n_inputs = 3
+
+    def __init__(self, timeperiod: int = 14):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        self.timeperiod = timeperiod
+        self._lookback = timeperiod + TA_GLOBALS_UNSTABLE_PERIOD(
+            TA_FuncUnstId.TA_FUNC_UNST_ATR
+        )
+        self._today = 0
+        self._prevClose = 0.0
+        self._prevATR = 0.0
+
+    def _update(self, high: float, low: float, close: float) -> float:
+        today = self._today
+        self._today = today + 1
+        prevClose = self._prevClose
+        self._prevClose = close
+        if today == 0:
+            return nan
+
+        optInTimePeriod = self.timeperiod
+        tr = _true_range(high, low, prevClose)
+        if today <= optInTimePeriod:
+            self._prevATR += tr
+            if today < optInTimePeriod:
+                return nan
+            self._prevATR = self._prevATR / optInTimePeriod
+        else:
+            self._prevATR *= optInTimePeriod - 1
+            self._prevATR += tr
+            self._prevATR /= optInTimePeriod
+        if today < self._lookback:
+            return nan
+        return self._prevATR
+
+
+class ADX(_Stream):
+    """ADX(timeperiod=14)
+
+    Streaming Average Directional Movement Index (Momentum Indicators)
+
+    Keeps the smoothed +DM, -DM and TR of ``TA_ADX`` and honours the ADX
+    unstable period.
+    """
+
+    n_inputs = 3
+
+    def __init__(self, timeperiod: int = 14):
+        super().__init__()
+        check_timeperiod(timeperiod)
+        self.timeperiod = timeperiod
+        self._lookback = 2 * timeperiod + TA_GLOBALS_UNSTABLE_PERIOD(
+            TA_FuncUnstId.TA_FUNC_UNST_ADX
+        ) - 1
+        self._today = 0
+        self._prevHigh = 0.0
+        self._prevLow = 0.0
+        self._prevClose = 0.0
+        self._prevMinusDM = 0.0
+        self._prevPlusDM = 0.0
+        self._prevTR = 0.0
+        self._sumDX = 0.0
+        self._prevADX = 0.0
+
+    def _update(self, high: float, low: float, close: float) -> float:
+        today = self._today
+        self._today = today + 1
+        if today == 0:
+            self._prevHigh = high
+            self._prevLow = low
+            self._prevClose = close
+            return nan
+
+        optInTimePeriod = self.timeperiod
+        diffP = high - self._prevHigh
+        self._prevHigh = high
+        diffM = self._prevLow - low
+        self._prevLow = low
+
+        if today >= optInTimePeriod:
+            self._prevMinusDM -= self._prevMinusDM / optInTimePeriod
+            self._prevPlusDM -= self._prevPlusDM / optInTimePeriod
+
+        if (diffM > 0) and (diffP < diffM):
+            self._prevMinusDM += diffM
+        elif (diffP > 0) and (diffP > diffM):
+            self._prevPlusDM += diffP
+
+        tr = _true_range(high, low, self._prevClose)
+        self._prevClose = close
+        if today < optInTimePeriod:
+            self._prevTR += tr
+            return nan
+        prevTR = self._prevTR = self._prevTR - (self._prevTR / optInTimePeriod) + tr
+
+        firstADX = 2 * optInTimePeriod - 1
+        if not _is_zero(prevTR):
+            minusDI = 100.0 * (self._prevMinusDM / prevTR)
+            plusDI = 100.0 * (self._prevPlusDM / prevTR)
+            tempReal = minusDI + plusDI
+            if not _is_zero(tempReal):
+                tempReal = 100.0 * (fabs(minusDI - plusDI) / tempReal)
+                if today < firstADX + 1:
+                    self._sumDX += tempReal
+                else:
+                    self._prevADX = (
+                        (self._prevADX * (optInTimePeriod - 1)) + tempReal
+                    ) / optInTimePeriod
+
+        if today < firstADX:
+            return nan
+        if today == firstADX:
+            self._prevADX = self._sumDX / optInTimePeriod
+        if today < self._lookback:
+            return nan
+        return self._prevADX
+
+
+class MACD(_Stream):
+    """MACD(fastperiod=12, slowperiod=26, signalperiod=9)
+
+    Streaming Moving Average Convergence/Divergence (Momentum Indicators)
+
+    Like ``TA_INT_MACD`` the fast EMA is seeded on the last ``fastperiod``
+    bars of the first ``slowperiod`` bars so both EMAs start together.
+
+    Outputs:
+        macd, macdsignal, macdhist
+    """
+
+    n_outputs = 3
+
+    def __init__(self, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9):
+        super().__init__()
+        if slowperiod < fastperiod:
+            fastperiod, slowperiod = slowperiod, fastperiod
+        self.fastperiod = fastperiod
+        self.slowperiod = slowperiod
+        self.signalperiod = signalperiod
+        self._today = 0
+        self._fast = EMA(fastperiod)
+        self._slow = EMA(slowperiod)
+        # TA-Lib accepts a signal period of 1, which EMA() itself rejects
+        self._signal = EMA.__new__(EMA)
+        self._signal._init_state(signalperiod)
+
+    def _update(self, real: float) -> Tuple[float, float, float]:
+        today = self._today
+        self._today = today + 1
+        slow = self._slow._update(real)
+        if today < self.slowperiod - self.fastperiod:
+            return nan, nan, nan
+        fast = self._fast._update(real)
+        if today < self._slow._lookback:
+            return nan, nan, nan
+        macd = fast - slow
+        signal = self._signal._update(macd)
+        if self._signal._today <= self._signal._lookback:
+            return nan, nan, nan
+        return macd, signal, macd - signal
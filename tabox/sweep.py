@@ -0,0 +1,535 @@
+"""One indicator over many periods from shared intermediate results.
+
+Each function takes a 1-D series and an iterable of periods and returns an
+(n_periods, n_bars) matrix whose row ``i`` holds the indicator for
+``periods[i]``, aligned with the input like the standalone function.
+
+    >>> sma = tabox.sweep.SMA(close, periods=range(2, 251))
+    >>> sma[12]     # same values as tabox.SMA(close, timeperiod=14)
+
+The input is validated and its NaN prefix located once. The window-sum
+family (SMA, SUM, VAR, STDDEV, BBANDS) then shares one cumulative sum (and
+sum of squares), so each period costs a few O(n) vector operations written
+into its row with no further allocation. The results match the standalone
+functions up to floating point rounding, since a window sum taken as a
+difference of cumulative sums rounds differently from a running sum.
+
+The EMA family (EMA, DEMA, TEMA, T3, TRIX) runs every EMA it needs, the
+EMAs of EMAs included, in one pass over the bars with an array of states
+(``TA_SWEEP_EMA``), and the indicators are assembled from those rows.
+``MACD`` takes lists of fast, slow and signal periods and computes the
+whole grid from the unique fast and slow EMAs. These results are
+bit-identical to the standalone functions.
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .retcode import TA_RetCode
+from .ta_func.ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_func.ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
+from .ta_func.ta_SWEEP import TA_SWEEP_EMA
+
+
+def _check_periods(periods: Iterable[int]) -> tuple:
+    periods = tuple(int(period) for period in periods)
+    if len(periods) == 0:
+        raise Exception("periods is empty")
+    for period in periods:
+        check_timeperiod(period)
+    return periods
+
+
+def _check_matrix(out: Optional[np.ndarray], shape: tuple) -> np.ndarray:
+    """Return the NaN filled output of the given shape, ``out`` if given."""
+    if out is None:
+        return np.full(shape, np.nan)
+    if not isinstance(out, np.ndarray):
+        raise Exception("output array is not an ndarray")
+    if out.dtype != np.float64:
+        raise Exception("output array type is not float64")
+    if out.shape != shape:
+        raise Exception("output array shape is not %s" % (shape,))
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise Exception("output array is not a writeable contiguous array")
+    out.fill(np.nan)
+    return out
+
+
+def _check_outputs(out, shape: tuple, count: int):
+    if count == 1:
+        return _check_matrix(out, shape)
+    if out is None:
+        out = (None,) * count
+    elif not isinstance(out, (tuple, list)) or len(out) != count:
+        raise Exception("out must be a tuple of %d arrays" % count)
+    return tuple(_check_matrix(o, shape) for o in out)
+
+
+def _prepare(real, periods, out, count=1):
+    real = check_array(real)
+    periods = _check_periods(periods)
+    startIdx = check_begidx1(real)
+    outputs = _check_outputs(out, (len(periods), real.shape[0]), count)
+    return real[startIdx:], periods, startIdx, outputs
+
+
+def _check_retcode(retCode: int) -> None:
+    if retCode != TA_RetCode.TA_SUCCESS:
+        raise Exception("function failed with error code %d" % retCode)
+
+
+def _ema_chains(real: np.ndarray, periods: tuple, depth: int, t3Form: bool = False) -> list:
+    """EMA, EMA of EMA, ... ``depth`` levels deep for every period.
+
+    Returns one (len(periods), n_bars) matrix per level, all computed in a
+    single TA_SWEEP_EMA pass. Level 0 rows read ``real``, the rows of the
+    next level read the previous level, which comes first in ``work``.
+    """
+    if t3Form:
+        unstablePeriod = 0
+    else:
+        unstablePeriod = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_EMA)
+    count = len(periods)
+    work = np.full((1 + depth * count, real.shape[0]), np.nan)
+    work[0] = real
+    inRow = np.zeros(depth * count, dtype=np.intp)
+    inBegIdx = np.empty(depth * count, dtype=np.intp)
+    for level in range(depth):
+        for i, period in enumerate(periods):
+            row = level * count + i
+            if level > 0:
+                inRow[row] = row + 1 - count
+            inBegIdx[row] = level * (period - 1 + unstablePeriod)
+    timePeriod = np.tile(np.array(periods, dtype=np.intc), depth)
+    _check_retcode(TA_SWEEP_EMA(real.shape[0] - 1, work, inRow, inBegIdx, timePeriod,
+                                unstablePeriod, t3Form, work[1:]))
+    return [work[1 + level * count:1 + (level + 1) * count] for level in range(depth)]
+
+
+def _cumsum(real: np.ndarray) -> np.ndarray:
+    """Cumulative sum with a leading 0, window sums are differences."""
+    total = np.empty(real.shape[0] + 1)
+    total[0] = 0.0
+    np.cumsum(real, out=total[1:])
+    return total
+
+
+def _window(total: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    return np.subtract(total[period:], total[:-period], out=out)
+
+
+def _moments(real: np.ndarray):
+    """Cumulative sum and sum of squares of ``real`` minus its first value.
+
+    The variance does not depend on the shift, and shifting keeps the
+    squares small so that mean(x^2) - mean(x)^2 cancels less.
+    """
+    shifted = real - real[0]
+    total = _cumsum(shifted)
+    np.multiply(shifted, shifted, out=shifted)
+    total2 = _cumsum(shifted)
+    return total, total2
+
+
+def _variance(total, total2, period, out, scratch):
+    """Window variance of ``period`` bars into ``out``, as TA_VAR."""
+    _window(total, period, scratch)
+    scratch /= period
+    scratch *= scratch
+    _window(total2, period, out)
+    out /= period
+    out -= scratch
+    return out
+
+
+def _stddev(variance: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Square root in place, 0 where the variance is not positive (as TA_STDDEV)."""
+    np.greater(variance, 0.0, out=mask)
+    np.sqrt(variance, out=variance, where=mask)
+    np.logical_not(mask, out=mask)
+    variance[mask] = 0.0
+    return variance
+
+
+def SUM(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """SUM(real, periods)
+
+    Summation for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    total = _cumsum(real)
+    for row, period in zip(outReal, periods):
+        if period <= real.shape[0]:
+            _window(total, period, row[startIdx + period - 1:])
+    return outReal
+
+
+def SMA(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """SMA(real, periods)
+
+    Simple Moving Average for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    total = _cumsum(real)
+    for row, period in zip(outReal, periods):
+        if period <= real.shape[0]:
+            window = _window(total, period, row[startIdx + period - 1:])
+            window /= period
+    return outReal
+
+
+def VAR(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """VAR(real, periods)
+
+    Variance for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    total, total2 = _moments(real)
+    scratch = np.empty(real.shape[0])
+    for row, period in zip(outReal, periods):
+        if period <= real.shape[0]:
+            count = real.shape[0] - period + 1
+            _variance(total, total2, period, row[startIdx + period - 1:], scratch[:count])
+    return outReal
+
+
+def STDDEV(real: np.ndarray, periods: Iterable[int], nbdev: float = 1.0,
+           out: Optional[np.ndarray] = None) -> np.ndarray:
+    """STDDEV(real, periods[, nbdev=1.0])
+
+    Standard Deviation for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+        nbdev: 1.0
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    total, total2 = _moments(real)
+    scratch = np.empty(real.shape[0])
+    mask = np.empty(real.shape[0], dtype=bool)
+    for row, period in zip(outReal, periods):
+        if period <= real.shape[0]:
+            count = real.shape[0] - period + 1
+            window = _variance(total, total2, period, row[startIdx + period - 1:], scratch[:count])
+            _stddev(window, mask[:count])
+            if nbdev != 1.0:
+                window *= nbdev
+    return outReal
+
+
+def BBANDS(real: np.ndarray, periods: Iterable[int], nbdevup: float = 2.0, nbdevdn: float = 2.0,
+           out: Optional[tuple] = None) -> tuple:
+    """BBANDS(real, periods[, nbdevup=2.0, nbdevdn=2.0])
+
+    Bollinger Bands with a simple moving average for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+        nbdevup: 2.0
+        nbdevdn: 2.0
+    Outputs:
+        upperband, middleband, lowerband: (n_periods, n_bars) ndarrays
+    """
+    real, periods, startIdx, (outUpper, outMiddle, outLower) = _prepare(real, periods, out, 3)
+    total, total2 = _moments(real)
+    scratch = np.empty(real.shape[0])
+    mask = np.empty(real.shape[0], dtype=bool)
+    for i, period in enumerate(periods):
+        if period > real.shape[0]:
+            continue
+        begin = startIdx + period - 1
+        count = real.shape[0] - period + 1
+        # The shifted window sum gives the mean after adding back the shift.
+        middle = _window(total, period, outMiddle[i, begin:])
+        middle /= period
+        stddev = _variance(total, total2, period, outUpper[i, begin:], scratch[:count])
+        _stddev(stddev, mask[:count])
+        np.multiply(stddev, nbdevdn, out=outLower[i, begin:])
+        np.subtract(middle, outLower[i, begin:], out=outLower[i, begin:])
+        stddev *= nbdevup
+        stddev += middle
+        outLower[i, begin:] += real[0]
+        outUpper[i, begin:] += real[0]
+        middle += real[0]
+    return outUpper, outMiddle, outLower
+
+
+def MOM(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """MOM(real, periods)
+
+    Momentum for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    for row, period in zip(outReal, periods):
+        if period < real.shape[0]:
+            np.subtract(real[period:], real[:-period], out=row[startIdx + period:])
+    return outReal
+
+
+def ROC(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """ROC(real, periods)
+
+    Rate of change ((price/prevPrice)-1)*100 for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    mask = np.empty(real.shape[0], dtype=bool)
+    for row, period in zip(outReal, periods):
+        if period < real.shape[0]:
+            count = real.shape[0] - period
+            window = row[startIdx + period:]
+            previous = real[:-period]
+            nonzero = np.not_equal(previous, 0.0, out=mask[:count])
+            np.divide(real[period:], previous, out=window, where=nonzero)
+            window -= 1.0
+            window *= 100.0
+            np.logical_not(nonzero, out=nonzero)
+            window[nonzero] = 0.0
+    return outReal
+
+
+def EMA(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """EMA(real, periods)
+
+    Exponential Moving Average for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    unique = tuple(dict.fromkeys(periods))
+    ema, = _ema_chains(real, unique, 1)
+    for row, period in zip(outReal, periods):
+        row[startIdx:] = ema[unique.index(period)]
+    return outReal
+
+
+def DEMA(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """DEMA(real, periods)
+
+    Double Exponential Moving Average for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    unique = tuple(dict.fromkeys(periods))
+    firstEMA, secondEMA = _ema_chains(real, unique, 2)
+    for row, period in zip(outReal, periods):
+        i = unique.index(period)
+        dema = np.multiply(firstEMA[i], 2.0, out=row[startIdx:])
+        dema -= secondEMA[i]
+    return outReal
+
+
+def TEMA(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """TEMA(real, periods)
+
+    Triple Exponential Moving Average for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    unique = tuple(dict.fromkeys(periods))
+    firstEMA, secondEMA, thirdEMA = _ema_chains(real, unique, 3)
+    scratch = np.empty(real.shape[0])
+    for row, period in zip(outReal, periods):
+        i = unique.index(period)
+        tema = np.multiply(firstEMA[i], 3.0, out=row[startIdx:])
+        tema -= np.multiply(secondEMA[i], 3.0, out=scratch)
+        tema += thirdEMA[i]
+    return outReal
+
+
+def T3(real: np.ndarray, periods: Iterable[int], vfactor: float = 0.7,
+       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """T3(real, periods[, vfactor=0.7])
+
+    Triple Exponential Moving Average (T3) for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+        vfactor: 0.7
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    if vfactor < 0.0 or vfactor > 1.0:
+        raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
+    if vfactor == 0.0:
+        vfactor = 0.7  # as TA_T3
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    unique = tuple(dict.fromkeys(periods))
+    e1, e2, e3, e4, e5, e6 = _ema_chains(real, unique, 6, t3Form=True)
+
+    tempReal = vfactor * vfactor
+    c1 = -(tempReal * vfactor)
+    c2 = 3.0 * (tempReal - c1)
+    c3 = -6.0 * tempReal - 3.0 * (vfactor - c1)
+    c4 = 1.0 + 3.0 * vfactor - c1 + 3.0 * tempReal
+
+    scratch = np.empty(real.shape[0])
+    for row, period in zip(outReal, periods):
+        i = unique.index(period)
+        t3 = np.multiply(e6[i], c1, out=row[startIdx:])
+        t3 += np.multiply(e5[i], c2, out=scratch)
+        t3 += np.multiply(e4[i], c3, out=scratch)
+        t3 += np.multiply(e3[i], c4, out=scratch)
+    return outReal
+
+
+def TRIX(real: np.ndarray, periods: Iterable[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """TRIX(real, periods)
+
+    1-day Rate-Of-Change (ROC) of a Triple Smooth EMA for every period
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        periods: iterable of timeperiods
+    Outputs:
+        (n_periods, n_bars) ndarray
+    """
+    real, periods, startIdx, outReal = _prepare(real, periods, out)
+    unique = tuple(dict.fromkeys(periods))
+    thirdEMA = _ema_chains(real, unique, 3)[2]
+    mask = np.empty(real.shape[0] - 1, dtype=bool)
+    for row, period in zip(outReal, periods):
+        ema = thirdEMA[unique.index(period)]
+        # ROC with a period of 1, the NaN prefix of the EMA carries over
+        window = row[startIdx + 1:]
+        nonzero = np.not_equal(ema[:-1], 0.0, out=mask)
+        np.divide(ema[1:], ema[:-1], out=window, where=nonzero)
+        window -= 1.0
+        window *= 100.0
+        np.logical_not(nonzero, out=nonzero)
+        window[nonzero] = 0.0
+    return outReal
+
+
+def MACD(real: np.ndarray, fastperiods: Iterable[int], slowperiods: Iterable[int],
+         signalperiods: Iterable[int], out: Optional[tuple] = None) -> tuple:
+    """MACD(real, fastperiods, slowperiods, signalperiods)
+
+    Moving Average Convergence/Divergence over a grid of periods
+
+    Every (fast, slow, signal) combination is computed, from one EMA per
+    unique fast or slow period (TA_INT_MACD seeds the fast EMA late, so that
+    it lines up with the slow one) and one signal EMA per unique
+    combination.
+
+    Inputs:
+        real: (any ndarray)
+    Parameters:
+        fastperiods: iterable of fast periods
+        slowperiods: iterable of slow periods
+        signalperiods: iterable of signal periods
+    Outputs:
+        macd, macdsignal, macdhist: (n_fast, n_slow, n_signal, n_bars) ndarrays
+    """
+    real = check_array(real)
+    fastperiods = _check_periods(fastperiods)
+    slowperiods = _check_periods(slowperiods)
+    signalperiods = _check_periods(signalperiods)
+    startIdx = check_begidx1(real)
+    shape = (len(fastperiods), len(slowperiods), len(signalperiods), real.shape[0])
+    outMACD, outMACDSignal, outMACDHist = _check_outputs(out, shape, 3)
+    real = real[startIdx:]
+    unstablePeriod = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_EMA)
+
+    # Slow EMAs start at bar 0, fast EMAs at bar slow - fast.
+    pairs = tuple(dict.fromkeys((min(fast, slow), max(fast, slow))
+                                for fast in fastperiods for slow in slowperiods))
+    keys = tuple(dict.fromkeys(key for fast, slow in pairs
+                               for key in ((slow, 0), (fast, slow - fast))))
+    work = np.full((1 + len(keys), real.shape[0]), np.nan)
+    work[0] = real
+    _check_retcode(TA_SWEEP_EMA(
+        real.shape[0] - 1, work,
+        np.zeros(len(keys), dtype=np.intp),
+        np.array([begIdx for period, begIdx in keys], dtype=np.intp),
+        np.array([period for period, begIdx in keys], dtype=np.intc),
+        unstablePeriod, False, work[1:]))
+
+    macd = np.empty((len(pairs), real.shape[0]))
+    for i, (fast, slow) in enumerate(pairs):
+        np.subtract(work[1 + keys.index((fast, slow - fast))], work[1 + keys.index((slow, 0))],
+                    out=macd[i])
+
+    # The signal line is the EMA of the MACD line from its first value on.
+    signals = tuple((i, signal) for i in range(len(pairs)) for signal in dict.fromkeys(signalperiods))
+    signal = np.full((len(signals), real.shape[0]), np.nan)
+    _check_retcode(TA_SWEEP_EMA(
+        real.shape[0] - 1, macd,
+        np.array([i for i, period in signals], dtype=np.intp),
+        np.array([pairs[i][1] - 1 + unstablePeriod for i, period in signals], dtype=np.intp),
+        np.array([period for i, period in signals], dtype=np.intc),
+        unstablePeriod, False, signal))
+
+    for a, fast in enumerate(fastperiods):
+        for b, slow in enumerate(slowperiods):
+            i = pairs.index((min(fast, slow), max(fast, slow)))
+            for c, period in enumerate(signalperiods):
+                lookback = (pairs[i][1] - 1 + unstablePeriod) + (period - 1 + unstablePeriod)
+                if lookback >= real.shape[0]:
+                    continue
+                row = signal[signals.index((i, period))]
+                outMACD[a, b, c, startIdx + lookback:] = macd[i, lookback:]
+                outMACDSignal[a, b, c, startIdx + lookback:] = row[lookback:]
+                np.subtract(macd[i, lookback:], row[lookback:], out=outMACDHist[a, b, c, startIdx + lookback:])
+    return outMACD, outMACDSignal, outMACDHist
@@ -1,5 +1,8 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 
+cdef extern from "math.h":
+    double atan(double x)
+
 
 cdef class HilbertVariable:
     cdef double odd[3]
@@ -13,4 +16,24 @@ cdef class HilbertVariable:
     cdef void do_transform(self, double input_value, int hilbert_idx, double a, double b, double adjusted_prev_period, bint is_odd)
 
 cdef void do_odd(HilbertVariable hilbert_variable, double input_value, int hilbert_idx, double a, double b, double adjusted_prev_period)
-cdef void do_even(HilbertVariable hilbert_variable, double input_value, int hilbert_idx, double a, double b, double adjusted_prev_period)
\ No newline at end of file
+cdef void do_even(HilbertVariable hilbert_variable, double input_value, int hilbert_idx, double a, double b, double adjusted_prev_period)
+
+cdef class HilbertCycle:
+    cdef HilbertVariable detrender
+    cdef HilbertVariable Q1
+    cdef HilbertVariable jI
+    cdef HilbertVariable jQ
+    cdef int hilbert_idx
+    cdef double period
+    cdef double smooth_period
+    cdef double in_phase
+    cdef double prev_I2
+    cdef double prev_Q2
+    cdef double Re
+    cdef double Im
+    cdef double I1_for_odd_prev2
+    cdef double I1_for_odd_prev3
+    cdef double I1_for_even_prev2
+    cdef double I1_for_even_prev3
+
+    cdef void update(self, Py_ssize_t today, double smoothed_value, double rad2deg)
@@ -2,6 +2,9 @@
 import cython
 from typing import List, Union
 
+if not cython.compiled:
+    from math import atan
+
 
 class HilbertVariable:
     def __init__(self):
@@ -66,3 +69,96 @@ def do_even(
     adjusted_prev_period: cython.double,
 ):
     hilbert_variable.do_transform(input_value, hilbert_idx, a, b, adjusted_prev_period, False)
+
+
+class HilbertCycle:
+    """Dominant cycle measurement of the HT_* functions
+
+    Runs the detrender, quadrature and in-phase transforms on the smoothed
+    price one bar at a time and keeps the measured period, smoothed period
+    and the in-phase/quadrature components of the bar.
+    """
+    def __init__(self):
+        self.detrender: HilbertVariable = HilbertVariable()
+        self.Q1: HilbertVariable = HilbertVariable()
+        self.jI: HilbertVariable = HilbertVariable()
+        self.jQ: HilbertVariable = HilbertVariable()
+        self.hilbert_idx: cython.int = 0
+        self.period: cython.double = 0.0
+        self.smooth_period: cython.double = 0.0
+        self.in_phase: cython.double = 0.0
+        self.prev_I2: cython.double = 0.0
+        self.prev_Q2: cython.double = 0.0
+        self.Re: cython.double = 0.0
+        self.Im: cython.double = 0.0
+        self.I1_for_odd_prev2: cython.double = 0.0
+        self.I1_for_odd_prev3: cython.double = 0.0
+        self.I1_for_even_prev2: cython.double = 0.0
+        self.I1_for_even_prev3: cython.double = 0.0
+
+    @property
+    def quadrature(self) -> cython.double:
+        return self.Q1.current_value
+
+    def update(self, today: cython.Py_ssize_t, smoothed_value: cython.double, rad2deg: cython.double):
+        a: cython.double = 0.0962
+        b: cython.double = 0.5769
+        adjusted_prev_period: cython.double = (0.075 * self.period) + 0.54
+        Q2: cython.double
+        I2: cython.double
+        prev_period: cython.double
+        bound: cython.double
+
+        if (today % 2) == 0:
+            do_even(self.detrender, smoothed_value, self.hilbert_idx, a, b, adjusted_prev_period)
+            do_even(self.Q1, self.detrender.current_value, self.hilbert_idx, a, b, adjusted_prev_period)
+            self.in_phase = self.I1_for_even_prev3
+            do_even(self.jI, self.I1_for_even_prev3, self.hilbert_idx, a, b, adjusted_prev_period)
+            do_even(self.jQ, self.Q1.current_value, self.hilbert_idx, a, b, adjusted_prev_period)
+
+            self.hilbert_idx += 1
+            if self.hilbert_idx == 3:
+                self.hilbert_idx = 0
+
+            Q2 = (0.2 * (self.Q1.current_value + self.jI.current_value)) + (0.8 * self.prev_Q2)
+            I2 = (0.2 * (self.I1_for_even_prev3 - self.jQ.current_value)) + (0.8 * self.prev_I2)
+
+            # Delayed values for the odd bars
+            self.I1_for_odd_prev3 = self.I1_for_odd_prev2
+            self.I1_for_odd_prev2 = self.detrender.current_value
+        else:
+            do_odd(self.detrender, smoothed_value, self.hilbert_idx, a, b, adjusted_prev_period)
+            do_odd(self.Q1, self.detrender.current_value, self.hilbert_idx, a, b, adjusted_prev_period)
+            self.in_phase = self.I1_for_odd_prev3
+            do_odd(self.jI, self.I1_for_odd_prev3, self.hilbert_idx, a, b, adjusted_prev_period)
+            do_odd(self.jQ, self.Q1.current_value, self.hilbert_idx, a, b, adjusted_prev_period)
+
+            Q2 = (0.2 * (self.Q1.current_value + self.jI.current_value)) + (0.8 * self.prev_Q2)
+            I2 = (0.2 * (self.I1_for_odd_prev3 - self.jQ.current_value)) + (0.8 * self.prev_I2)
+
+            # Delayed values for the even bars
+            self.I1_for_even_prev3 = self.I1_for_even_prev2
+            self.I1_for_even_prev2 = self.detrender.current_value
+
+        # Period of the dominant cycle
+        self.Re = (0.2 * ((I2 * self.prev_I2) + (Q2 * self.prev_Q2))) + (0.8 * self.Re)
+        self.Im = (0.2 * ((I2 * self.prev_Q2) - (Q2 * self.prev_I2))) + (0.8 * self.Im)
+        self.prev_Q2 = Q2
+        self.prev_I2 = I2
+
+        prev_period = self.period
+        if self.Im != 0.0 and self.Re != 0.0:
+            self.period = 360.0 / (atan(self.Im / self.Re) * rad2deg)
+        bound = 1.5 * prev_period
+        if self.period > bound:
+            self.period = bound
+        bound = 0.67 * prev_period
+        if self.period < bound:
+            self.period = bound
+        if self.period < 6:
+            self.period = 6
+        elif self.period > 50:
+            self.period = 50
+        self.period = (0.2 * self.period) + (0.8 * prev_period)
+
+        self.smooth_period = (0.33 * self.period) + (0.67 * self.smooth_period)
@@ -1,7 +1,8 @@
 import cython
 from cython.parallel import prange
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 def TA_AD_Lookback() -> cython.Py_ssize_t:
@@ -13,10 +14,10 @@ def TA_AD_Lookback() -> cython.Py_ssize_t:
 def TA_AD(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
-    inVolume: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    inVolume: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -57,7 +58,8 @@ def TA_AD(
     return TA_RetCode.TA_SUCCESS
 
 
-def AD(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+@rowwise("high", "low", "close", "volume")
+def AD(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, out: Optional[np.ndarray] = None):
     """AD(high, low, close, volume)
 
     Chaikin A/D Line (Volume Indicators)
@@ -75,15 +77,14 @@ def AD(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray)
     close = check_array(close)
     volume = check_array(volume)
 
-    outReal = np.full_like(high, np.nan)
+    outReal = check_out(out, high)
     length: cython.Py_ssize_t = high.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(high)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_AD_Lookback()
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_AD(0, endIdx, high[startIdx:], low[startIdx:], close[startIdx:], volume[startIdx:],
           outBegIdx, outNBElement, outReal[lookback:])
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx2, check_length2
+from .ta_utils import check_array, check_begidx2, check_length2, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 def TA_ADD_Lookback() -> cython.Py_ssize_t:
@@ -12,8 +13,8 @@ def TA_ADD_Lookback() -> cython.Py_ssize_t:
 def TA_ADD(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal0: cython.double[::1],
-    inReal1: cython.double[::1],
+    inReal0: cython.const[cython.double][::1],
+    inReal1: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -35,7 +36,8 @@ def TA_ADD(
     return TA_RetCode.TA_SUCCESS
 
 
-def ADD(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
+@rowwise("real0", "real1")
+def ADD(real0: np.ndarray, real1: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """ADD(real0, real1)
 
     Vector Arithmetic Add (Math Operators)
@@ -53,8 +55,7 @@ def ADD(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
 
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_ADD_Lookback()
-    outReal = np.full_like(real0, np.nan)
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real0)
+    outBegIdx, outNBElement = index_buffers()
     retCode = TA_ADD(0, endIdx, real0[startIdx:], real1[startIdx:], outBegIdx, outNBElement, outReal[lookback:])
     return outReal
@@ -1,7 +1,7 @@
 import numpy as np
 import cython
 
-from .ta_utils import check_array, check_length4, check_begidx4
+from .ta_utils import check_array, check_length4, check_begidx4, rowwise, check_out, index_buffers
 from .ta_EMA import TA_EMA_Lookback
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -27,10 +27,10 @@ def TA_ADOSC_Lookback(
 def TA_ADOSC(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
-    inVolume: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    inVolume: cython.const[cython.double][::1],
     optInFastPeriod: cython.Py_ssize_t,
     optInSlowPeriod: cython.Py_ssize_t,
     outBegIdx: cython.Py_ssize_t[::1],
@@ -131,7 +131,8 @@ def TA_ADOSC(
     return 0
 
 
-def ADOSC(high, low, close, volume, fast_period=3, slow_period=10):
+@rowwise("high", "low", "close", "volume")
+def ADOSC(high, low, close, volume, fast_period=3, slow_period=10, out=None):
     """
     Chaikin A/D Oscillator (ADOSC)
 
@@ -176,9 +177,8 @@ def ADOSC(high, low, close, volume, fast_period=3, slow_period=10):
     lookback = begidx + TA_ADOSC_Lookback(fast_period, slow_period)
 
     # Prepare output array
-    out = np.full(length, np.nan, dtype=np.float64)
-    out_beg_idx = np.array([0], dtype=np.intp)
-    out_nb_element = np.array([0], dtype=np.intp)
+    outReal = check_out(out, high)
+    out_beg_idx, out_nb_element = index_buffers()
 
     # Call C function
     ret = TA_ADOSC(
@@ -192,10 +192,10 @@ def ADOSC(high, low, close, volume, fast_period=3, slow_period=10):
         slow_period,
         out_beg_idx,
         out_nb_element,
-        out[lookback:],
+        outReal[lookback:],
     )
 
     if ret != TA_RetCode.TA_SUCCESS:
         raise Exception("Error calculating ADOSC")
 
-    return out
+    return outReal
@@ -2,7 +2,8 @@ from .ta_utility cimport TA_INTEGER_DEFAULT
 from .ta_utility cimport TA_IS_ZERO
 
 cdef extern from "math.h":
-    cpdef double fabs(double x)
+    cpdef double fabs(double x) nogil
+    bint isnan(double x) nogil
 
 cdef double round_pos(double x) noexcept nogil
 
@@ -10,9 +11,21 @@ cdef double TRUE_RANGE(
     double th,
     double tl,
     double yc
-)
+) noexcept nogil
 
 cpdef Py_ssize_t TA_ADX_Lookback(int optInTimePeriod)
+cdef int TA_ADX_nogil(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
+    int optInTimePeriod,
+    int unstablePeriod,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal
+) noexcept nogil
 cpdef int TA_ADX(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
@@ -23,4 +36,26 @@ cpdef int TA_ADX(
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
     double[::1] outReal
-)
\ No newline at end of file
+)
+
+cdef class ADXState:
+    cdef public tuple params
+    cdef public int timeperiod
+    cdef public Py_ssize_t lookback
+    cdef public Py_ssize_t today
+    cdef public double prevHigh
+    cdef public double prevLow
+    cdef public double prevClose
+    cdef public double prevMinusDM
+    cdef public double prevPlusDM
+    cdef public double prevTR
+    cdef public double sumDX
+    cdef public double prevADX
+
+cpdef int TA_ADX_Resume(
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
+    ADXState state,
+    double[::1] outReal
+)
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -9,7 +10,7 @@ if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 
 if not cython.compiled:
-    from math import fabs
+    from math import fabs, isnan
 
 if not cython.compiled:
     from .ta_utility import TA_IS_ZERO
@@ -33,8 +34,8 @@ def TRUE_RANGE(
     Output:
         (float) True Range
     """
-    tr = th - tl
-    temp_real2 = fabs(th - yc)
+    tr: cython.double = th - tl
+    temp_real2: cython.double = fabs(th - yc)
     if temp_real2 > tr:
         tr = temp_real2
     temp_real2 = fabs(tl - yc)
@@ -68,48 +69,23 @@ def TA_ADX_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_ADX(
+def TA_ADX_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
-) -> int:
-    """
-    TA_ADX - Average Directional Movement Index
-
-    Input  = High, Low, Close
-    Output = double
+) -> cython.int:
+    """ADX loop without parameter checks, runs without the GIL
 
-    Optional Parameters
-    -------------------
-    optInTimePeriod:(From 2 to 100000)
-        Number of period
+    The ADX unstable period is passed in by the caller.
     """
-    # parameters check
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if optInTimePeriod == 0:  # default value handling
-            optInTimePeriod = 14
-        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        if inHigh is None or inLow is None or inClose is None:
-            return TA_RetCode.TA_BAD_PARAM
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
-    lookbackTotal: cython.Py_ssize_t = (
-        (2 * optInTimePeriod)
-        + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ADX)
-        - 1
-    )
+    lookbackTotal: cython.Py_ssize_t = (2 * optInTimePeriod) + unstablePeriod - 1
 
     # Adjust startIdx to account for the lookback period
     if startIdx < lookbackTotal:
@@ -119,7 +95,7 @@ def TA_ADX(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Indicate where the next output should be put in the outReal
     outIdx: cython.Py_ssize_t = 0
@@ -131,7 +107,7 @@ def TA_ADX(
     prevMinusDM: cython.double = 0.0
     prevPlusDM: cython.double = 0.0
     prevTR: cython.double = 0.0
-    today: cython.Py_ssize_t = startIdx - lookbackTotal
+    today = startIdx - lookbackTotal
     prevHigh: cython.double = inHigh[today]
     prevLow: cython.double = inLow[today]
     prevClose: cython.double = inClose[today]
@@ -169,7 +145,7 @@ def TA_ADX(
         prevClose = inClose[today]
 
     # Add up all the initial DX
-    sumDX = 0.0
+    sumDX: cython.double = 0.0
     i = optInTimePeriod
     while i > 0:
         i -= 1
@@ -210,7 +186,7 @@ def TA_ADX(
     prevADX = round_pos(sumDX / optInTimePeriod)
 
     # Skip the unstable period
-    i = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ADX)
+    i = unstablePeriod
     while i > 0:
         i -= 1
         today += 1
@@ -296,11 +272,189 @@ def TA_ADX(
         outIdx += 1
 
     outNBElement[0] = outIdx
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_ADX(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """
+    TA_ADX - Average Directional Movement Index
+
+    Input  = High, Low, Close
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 2 to 100000)
+        Number of period
+    """
+    # parameters check
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if optInTimePeriod == 0:  # default value handling
+            optInTimePeriod = 14
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if inHigh is None or inLow is None or inClose is None:
+            return TA_RetCode.TA_BAD_PARAM
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ADX)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_ADX_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
+
+
+class ADXState:
+    """Terminal state of an ADX, the seed of the next call
+
+    Holds the last high, low and close, the smoothed +DM, -DM and TR, the
+    sum of the first DX values and the smoothed ``prevADX``.
+    """
+    def __init__(self, timeperiod: cython.int):
+        self.params = (timeperiod,)
+        self.timeperiod: cython.int = timeperiod
+        self.lookback: cython.Py_ssize_t = TA_ADX_Lookback(timeperiod)
+        self.today: cython.Py_ssize_t = 0
+        self.prevHigh: cython.double = 0.0
+        self.prevLow: cython.double = 0.0
+        self.prevClose: cython.double = 0.0
+        self.prevMinusDM: cython.double = 0.0
+        self.prevPlusDM: cython.double = 0.0
+        self.prevTR: cython.double = 0.0
+        self.sumDX: cython.double = 0.0
+        self.prevADX: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_ADX_Resume(
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    state: ADXState,
+    outReal: cython.double[::1],
+) -> cython.int:
+    """ADX loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    optInTimePeriod: cython.int = state.timeperiod
+    lookbackTotal: cython.Py_ssize_t = state.lookback
+    firstADX: cython.Py_ssize_t = 2 * optInTimePeriod - 1
+    today: cython.Py_ssize_t = state.today
+    prevHigh: cython.double = state.prevHigh
+    prevLow: cython.double = state.prevLow
+    prevClose: cython.double = state.prevClose
+    prevMinusDM: cython.double = state.prevMinusDM
+    prevPlusDM: cython.double = state.prevPlusDM
+    prevTR: cython.double = state.prevTR
+    sumDX: cython.double = state.sumDX
+    prevADX: cython.double = state.prevADX
+    tempReal: cython.double
+    diffP: cython.double
+    diffM: cython.double
+    minusDI: cython.double
+    plusDI: cython.double
+    length: cython.Py_ssize_t = inHigh.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first high that is not NaN
+    if today == 0:
+        while i < length and isnan(inHigh[i]):
+            i += 1
+
+    while i < length:
+        if today == 0:
+            prevHigh = inHigh[i]
+            prevLow = inLow[i]
+            prevClose = inClose[i]
+            today += 1
+            i += 1
+            continue
+
+        tempReal = inHigh[i]
+        diffP = tempReal - prevHigh  # Plus Delta
+        prevHigh = tempReal
+
+        tempReal = inLow[i]
+        diffM = prevLow - tempReal  # Minus Delta
+        prevLow = tempReal
+
+        if today >= optInTimePeriod:
+            prevMinusDM -= prevMinusDM / optInTimePeriod
+            prevPlusDM -= prevPlusDM / optInTimePeriod
+
+        if (diffM > 0) and (diffP < diffM):
+            # Case 2 and 4: +DM=0,-DM=diffM
+            prevMinusDM += diffM
+        elif (diffP > 0) and (diffP > diffM):
+            # Case 1 and 3: +DM=diffP,-DM=0
+            prevPlusDM += diffP
+
+        if today < optInTimePeriod:
+            prevTR += TRUE_RANGE(prevHigh, prevLow, prevClose)
+        else:
+            prevTR = prevTR - (prevTR / optInTimePeriod) + TRUE_RANGE(prevHigh, prevLow, prevClose)
+            if not TA_IS_ZERO(prevTR):
+                minusDI = round_pos(100.0 * (prevMinusDM / prevTR))
+                plusDI = round_pos(100.0 * (prevPlusDM / prevTR))
+                tempReal = minusDI + plusDI
+                if not TA_IS_ZERO(tempReal):
+                    tempReal = round_pos(100.0 * (fabs(minusDI - plusDI) / tempReal))
+                    if today <= firstADX:
+                        # Accumulate the initial DX
+                        sumDX += tempReal
+                    else:
+                        prevADX = round_pos(
+                            ((prevADX * (optInTimePeriod - 1)) + tempReal) / optInTimePeriod
+                        )
+            if today == firstADX:
+                prevADX = round_pos(sumDX / optInTimePeriod)
+        prevClose = inClose[i]
+
+        if today >= lookbackTotal:
+            outReal[i] = prevADX
+        today += 1
+        i += 1
+
+    state.today = today
+    state.prevHigh = prevHigh
+    state.prevLow = prevLow
+    state.prevClose = prevClose
+    state.prevMinusDM = prevMinusDM
+    state.prevPlusDM = prevPlusDM
+    state.prevTR = prevTR
+    state.sumDX = sumDX
+    state.prevADX = prevADX
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("high", "low", "close")
 def ADX(
-    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None,
+    state: Optional[ADXState] = None, return_state: bool = False,
 ) -> np.ndarray:
     """
     ADX(high, low, close[, timeperiod=14])
@@ -315,20 +469,28 @@ def ADX(
         timeperiod: 14
     Outputs:
         real: ADX values
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(real, state)``.
     """
     high = check_array(high)
     low = check_array(low)
     close = check_array(close)
     check_timeperiod(timeperiod)
 
+    if state is not None or return_state:
+        state = resume_state(state, ADXState, timeperiod)
+        outReal = check_out(out, high)
+        TA_ADX_Resume(high, low, close, state, outReal)
+        return (outReal, state) if return_state else outReal
+
     length = high.shape[0]
     startIdx = check_begidx1(high)
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_ADX_Lookback(timeperiod)
 
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_ADX(
         0,
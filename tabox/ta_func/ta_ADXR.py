@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId, TA_INTEGER_DEFAULT
@@ -29,9 +30,9 @@ def TA_ADXR_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_ADXR(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -110,7 +111,8 @@ def TA_ADXR(
 
     return TA_RetCode.TA_SUCCESS
 
-def ADXR(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+@rowwise("high", "low", "close")
+def ADXR(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """ADXR(high, low, close[, timeperiod=14])
 
     Average Directional Movement Index Rating (Overlap Studies)
@@ -138,9 +140,8 @@ def ADXR(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int =
     lookback: cython.Py_ssize_t = startIdx + TA_ADXR_Lookback(timeperiod)
 
     # Initialize output array with NaN values
-    outReal: cython.double[::1] = np.full_like(high, np.nan)
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     # Calculate ADXR
     retCode = TA_ADXR(
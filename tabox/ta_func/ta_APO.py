@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId, TA_MAType
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -51,7 +52,7 @@ def TA_APO_Lookback(optInFastPeriod: cython.int,
 def TA_INT_APO(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastPeriod: cython.int,
     optInSlowPeriod: cython.int,
     optInMAType: cython.int,
@@ -93,8 +94,8 @@ def TA_INT_APO(
         
         if retCode == TA_RetCode.TA_SUCCESS:
             tempInteger = outBegIdx1[0] - outBegIdx2[0]
-            i: cython.Py_ssize_t = 0
-            j: cython.Py_ssize_t = 0
+            i = 0
+            j = 0
             if doPercentageOutput != 0:
                 # Calculate ((fast MA)-(slow MA))/(slow MA)*100
                 i = 0
@@ -133,7 +134,7 @@ def TA_INT_APO(
 def TA_APO(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastPeriod: cython.int,
     optInSlowPeriod: cython.int,
     optInMAType: cython.int,
@@ -192,8 +193,9 @@ def TA_APO(
     
     return retCode
 
+@rowwise("real")
 def APO(real: np.ndarray, fastperiod: int = 12, slowperiod: int = 26, 
-        matype: int = 0, percentage: bool = False) -> np.ndarray:
+        matype: int = 0, percentage: bool = False, out: Optional[np.ndarray] = None) -> np.ndarray:
     """APO(real[, fastperiod=12, slowperiod=26, matype=0, percentage=False])
     
     Absolute Price Oscillator (Overlap Studies)
@@ -220,9 +222,8 @@ def APO(real: np.ndarray, fastperiod: int = 12, slowperiod: int = 26,
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_APO_Lookback(fastperiod, slowperiod, matype)
     
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_APO(
         0, endIdx, real[startIdx:], fastperiod, slowperiod, matype,
@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -30,8 +32,8 @@ def TA_AROON_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_INT_AROON(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -39,12 +41,6 @@ def TA_INT_AROON(
     outAroonUp: cython.double[::1],
 ) -> cython.int:
     """Internal AROON implementation without parameter checks"""
-    # This function is using a speed optimized algorithm
-    # for the min/max logic.
-    #
-    # You might want to first look at how TA_MIN/TA_MAX works
-    # and this function will become easier to understand.
-    
     # Move up the start index if there is not
     # enough initial data.
     if startIdx < optInTimePeriod:
@@ -56,58 +52,22 @@ def TA_INT_AROON(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
     
-    # Proceed with the calculation for the requested range.
-    # Note that this algorithm allows the input and
-    # output to be the same buffer.
+    # The window is optInTimePeriod + 1 bars and ties go to the most
+    # recent bar. O(n) for any period and any input, see TA_INT_EXTREMA
+    nbElement: cython.Py_ssize_t = endIdx - startIdx + 1
+    lowestIdx: cython.Py_ssize_t[::1] = np.empty(nbElement, dtype=np.intp)
+    highestIdx: cython.Py_ssize_t[::1] = np.empty(nbElement, dtype=np.intp)
+    TA_INT_EXTREMA(startIdx, endIdx, inLow, optInTimePeriod + 1, False, True, None, lowestIdx)
+    TA_INT_EXTREMA(startIdx, endIdx, inHigh, optInTimePeriod + 1, True, True, None, highestIdx)
+    
     outIdx: cython.Py_ssize_t = 0
     today: cython.Py_ssize_t = startIdx
-    trailingIdx: cython.Py_ssize_t = startIdx - optInTimePeriod
-    lowestIdx: cython.Py_ssize_t = -1
-    highestIdx: cython.Py_ssize_t = -1
-    lowest: cython.double = 0.0
-    highest: cython.double = 0.0
     factor: cython.double = 100.0 / optInTimePeriod
     
     while today <= endIdx:
-        # Keep track of the lowestIdx
-        tmp: cython.double = inLow[today]
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inLow[lowestIdx]
-            i: cython.Py_ssize_t = lowestIdx
-            while i <= today:
-                tmp = inLow[i]
-                if tmp <= lowest:
-                    lowestIdx = i
-                    lowest = tmp
-                i += 1
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-        
-        # Keep track of the highestIdx
-        tmp = inHigh[today]
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inHigh[highestIdx]
-            i = highestIdx
-            while i <= today:
-                tmp = inHigh[i]
-                if tmp >= highest:
-                    highestIdx = i
-                    highest = tmp
-                i += 1
-        elif tmp >= highest:
-            highestIdx = today
-            highest = tmp
-        
-        # Note: Do not forget that input and output buffer can be the same,
-        #       so writing to the output is the last thing being done here.
-        outAroonUp[outIdx] = factor * (optInTimePeriod - (today - highestIdx))
-        outAroonDown[outIdx] = factor * (optInTimePeriod - (today - lowestIdx))
-        
+        outAroonUp[outIdx] = factor * (optInTimePeriod - (today - highestIdx[outIdx]))
+        outAroonDown[outIdx] = factor * (optInTimePeriod - (today - lowestIdx[outIdx]))
         outIdx += 1
-        trailingIdx += 1
         today += 1
     
     # Keep the outBegIdx relative to the
@@ -119,8 +79,8 @@ def TA_INT_AROON(
 def TA_AROON(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -156,10 +116,12 @@ def TA_AROON(
         outBegIdx, outNBElement, outAroonDown, outAroonUp
     )
 
+@rowwise("high", "low")
 def AROON(
     high: np.ndarray,
     low: np.ndarray,
-    timeperiod: int = 14
+    timeperiod: int = 14,
+    out: Optional[tuple] = None
 ) -> tuple[np.ndarray, np.ndarray]:
     """AROON(high, low[, timeperiod=14])
     
@@ -189,10 +151,9 @@ def AROON(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_AROON_Lookback(timeperiod)
     
-    outAroonDown = np.full_like(high, np.nan)
-    outAroonUp = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outAroonDown = check_out(out, high, 0, 2)
+    outAroonUp = check_out(out, high, 1, 2)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_AROON(
         0, endIdx, high[startIdx:], low[startIdx:], timeperiod,
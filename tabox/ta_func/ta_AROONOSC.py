@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -28,8 +30,8 @@ def TA_AROONOSC_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_INT_AROONOSC(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -42,25 +44,6 @@ def TA_INT_AROONOSC(
     #
     #  AroonOsc = AroonUp- AroonDown;
     #
-    # This function is using a speed optimized algorithm
-    # for the min/max logic.
-    #
-    # You might want to first look at how TA_MIN/TA_MAX works
-    # and this function will become easier to understand.
-    
-    # Initialize variables
-    lowest: cython.double = 0.0
-    highest: cython.double = 0.0
-    tmp: cython.double = 0.0
-    factor: cython.double = 0.0
-    aroon: cython.double = 0.0
-    outIdx: cython.int = 0
-    trailingIdx: cython.int = 0
-    lowestIdx: cython.int = 0
-    highestIdx: cython.int = 0
-    today: cython.int = 0
-    i: cython.int = 0
-
     # Ensure there is enough initial data
     if startIdx < optInTimePeriod:
         startIdx = optInTimePeriod
@@ -70,58 +53,22 @@ def TA_INT_AROONOSC(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
     
-    # Proceed with the calculation for the requested range
-    outIdx = 0
-    today = startIdx
-    trailingIdx = startIdx - optInTimePeriod
-    lowestIdx = -1
-    highestIdx = -1
-    lowest = 0.0
-    highest = 0.0
-    factor = 100.0 / optInTimePeriod
-    
-    while today <= endIdx:
-        # Keep track of the lowestIdx
-        tmp = inLow[today]
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inLow[lowestIdx]
-            i = lowestIdx
-            while i <= today:
-                tmp = inLow[i]
-                if tmp <= lowest:
-                    lowestIdx = i
-                    lowest = tmp
-                i += 1
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-        
-        # Keep track of the highestIdx
-        tmp = inHigh[today]
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inHigh[highestIdx]
-            i = highestIdx
-            while i <= today:
-                tmp = inHigh[i]
-                if tmp >= highest:
-                    highestIdx = i
-                    highest = tmp
-                i += 1
-        elif tmp >= highest:
-            highestIdx = today
-            highest = tmp
-        
+    # The window is optInTimePeriod + 1 bars and ties go to the most
+    # recent bar. O(n) for any period and any input, see TA_INT_EXTREMA
+    nbElement: cython.Py_ssize_t = endIdx - startIdx + 1
+    lowestIdx: cython.Py_ssize_t[::1] = np.empty(nbElement, dtype=np.intp)
+    highestIdx: cython.Py_ssize_t[::1] = np.empty(nbElement, dtype=np.intp)
+    TA_INT_EXTREMA(startIdx, endIdx, inLow, optInTimePeriod + 1, False, True, None, lowestIdx)
+    TA_INT_EXTREMA(startIdx, endIdx, inHigh, optInTimePeriod + 1, True, True, None, highestIdx)
+    
+    outIdx: cython.Py_ssize_t = 0
+    factor: cython.double = 100.0 / optInTimePeriod
+    
+    while outIdx < nbElement:
         # The oscillator calculation
         # Aroon = factor*(highestIdx-lowestIdx)
-        aroon = factor * (highestIdx - lowestIdx)
-        
-        # Write to output
-        outReal[outIdx] = aroon
+        outReal[outIdx] = factor * (highestIdx[outIdx] - lowestIdx[outIdx])
         outIdx += 1
-        trailingIdx += 1
-        today += 1
     
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
@@ -130,8 +77,8 @@ def TA_INT_AROONOSC(
 def TA_AROONOSC(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -166,10 +113,12 @@ def TA_AROONOSC(
         outBegIdx, outNBElement, outReal
     )
 
+@rowwise("high", "low")
 def AROONOSC(
     high: np.ndarray,
     low: np.ndarray,
-    timeperiod: int = 14
+    timeperiod: int = 14,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """AROONOSC(high, low[, timeperiod=14])
     
@@ -198,9 +147,8 @@ def AROONOSC(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_AROONOSC_Lookback(timeperiod)
     
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_AROONOSC(
         0, endIdx, high[startIdx:], low[startIdx:], timeperiod,
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 if not cython.compiled:
@@ -16,7 +17,7 @@ def TA_ASIN_Lookback() -> cython.Py_ssize_t:
 def TA_ASIN(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -38,7 +39,8 @@ def TA_ASIN(
     return TA_RetCode.TA_SUCCESS
 
 
-def ASIN(real: np.ndarray):
+@rowwise("real")
+def ASIN(real: np.ndarray, out: Optional[np.ndarray] = None):
     """ASIN(real)
 
     Vector Trigonometric ASIN (Math Transform)
@@ -50,15 +52,14 @@ def ASIN(real: np.ndarray):
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.int = real.shape[0]
 
     startIdx: cython.int = check_begidx1(real)
     endIdx: cython.int = length - startIdx - 1
     lookback = startIdx + TA_ASIN_Lookback()
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_ASIN(0, endIdx, real[startIdx:], outBegIdx, outNBElement, outReal[lookback:])
     return outReal
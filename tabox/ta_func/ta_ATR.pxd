@@ -1,3 +1,19 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_TRANGE cimport TA_TRANGE_nogil
+from .ta_DX cimport TRUE_RANGE
 cpdef Py_ssize_t TA_ATR_Lookback(Py_ssize_t optInTimePeriod)
-cpdef int TA_ATR(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inHigh, double[::1] inLow, double[::1] inClose, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
\ No newline at end of file
+cdef int TA_ATR_nogil(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, int optInTimePeriod, int unstablePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef int TA_ATR(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+cdef extern from "math.h":
+    double fabs(double x) nogil
+    bint isnan(double x) nogil
+
+cdef class ATRState:
+    cdef public tuple params
+    cdef public int timeperiod
+    cdef public Py_ssize_t lookback
+    cdef public Py_ssize_t today
+    cdef public double prevClose
+    cdef public double prevATR
+
+cpdef int TA_ATR_Resume(const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, ATRState state, double[::1] outReal)
@@ -1,12 +1,14 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx3, check_length3, make_double_array
-from .ta_TRANGE import TA_TRANGE
-from .ta_SMA import TA_INT_SMA
+from .ta_utils import check_array, check_begidx3, check_length3, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 if not cython.compiled:
+    from math import fabs, isnan
     from .ta_utility import TA_INTEGER_DEFAULT
+    from .ta_TRANGE import TA_TRANGE_nogil
+    from .ta_DX import TRUE_RANGE
 
 def TA_ATR_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
     unstable_period = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ATR)
@@ -16,20 +18,26 @@ def TA_ATR_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_ATR(
+def TA_ATR_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
+    """ATR loop without parameter checks, runs without the GIL
+
+    The true ranges are computed as the loop reaches them instead of into
+    a buffer. The ATR unstable period is passed in by the caller.
+    """
     # 计算总lookback周期
-    lookbackTotal: cython.Py_ssize_t = TA_ATR_Lookback(optInTimePeriod)
-    
+    lookbackTotal: cython.Py_ssize_t = optInTimePeriod + unstablePeriod
+
     # 调整起始索引
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
@@ -37,62 +45,37 @@ def TA_ATR(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     if optInTimePeriod <= 1:
-        return TA_TRANGE(startIdx, endIdx, inHigh, inLow, inClose, outBegIdx, outNBElement, outReal)
-
-    # 计算临时缓冲区大小，与C语言一致
-    buffer_size: cython.Py_ssize_t = lookbackTotal + (endIdx - startIdx) + 1
-    tempBuffer: cython.double[::1] = np.zeros(buffer_size, dtype=float)
-    prevATRTemp: cython.double[::1] = np.zeros(1, dtype=float)
-    outBegIdx1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-
-    # 计算真实范围(TRANGE)
-    tr_start: cython.Py_ssize_t = startIdx - lookbackTotal + 1
-    retCode = TA_TRANGE(tr_start, endIdx, inHigh, inLow, inClose, outBegIdx1, outNBElement1, tempBuffer)
-    if retCode != TA_RetCode.TA_SUCCESS:
-        return retCode
-
-    # 计算第一个ATR值，使用SMA
-    retCode = TA_INT_SMA(
-        optInTimePeriod - 1,
-        optInTimePeriod - 1,
-        tempBuffer,
-        optInTimePeriod,
-        outBegIdx1,
-        outNBElement1,
-        prevATRTemp,
-    )
-    if retCode != TA_RetCode.TA_SUCCESS:
-        return retCode
-
-    prevATR: cython.double = prevATRTemp[0]
+        return TA_TRANGE_nogil(startIdx, endIdx, inHigh, inLow, inClose, outBegIdx, outNBElement, outReal)
+
+    # 计算第一个ATR值，即前optInTimePeriod个真实范围的简单平均
+    today: cython.Py_ssize_t = startIdx - lookbackTotal + 1
+    prevATR: cython.double = 0.0
+    i: cython.Py_ssize_t
+    for i in range(optInTimePeriod):
+        prevATR += TRUE_RANGE(inHigh[today], inLow[today], inClose[today - 1])
+        today += 1
+    prevATR /= optInTimePeriod
 
-    # 获取不稳定周期，修正之前的硬编码问题
-    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ATR)
-    
     # 处理不稳定周期
-    today: cython.Py_ssize_t = optInTimePeriod
-    outIdx: cython.Py_ssize_t = 0
-    while unstablePeriod != 0:
+    i = unstablePeriod
+    while i != 0:
         prevATR *= optInTimePeriod - 1
-        prevATR += tempBuffer[today]
+        prevATR += TRUE_RANGE(inHigh[today], inLow[today], inClose[today - 1])
         today += 1
         prevATR /= optInTimePeriod
-        unstablePeriod -= 1
+        i -= 1
 
     # 写入第一个ATR值
-    outReal[outIdx] = prevATR
-    outIdx += 1
+    outReal[0] = prevATR
+    outIdx: cython.Py_ssize_t = 1
 
     # 计算剩余的ATR值
-    nbATR: cython.Py_ssize_t = (endIdx - startIdx) + 1
-    while nbATR - 1 != 0:
-        nbATR -= 1
+    while today <= endIdx:
         prevATR *= optInTimePeriod - 1
-        prevATR += tempBuffer[today]
+        prevATR += TRUE_RANGE(inHigh[today], inLow[today], inClose[today - 1])
         today += 1
         prevATR /= optInTimePeriod
         outReal[outIdx] = prevATR
@@ -100,11 +83,112 @@ def TA_ATR(
 
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
+    return 0  # TA_SUCCESS
+
+
+def TA_ATR(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ATR)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_ATR_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
+
+
+class ATRState:
+    """Terminal state of an ATR, the seed of the next call
+
+    ``prevATR`` is the smoothed true range (the sum of the first
+    ``timeperiod`` true ranges until the seed) and ``prevClose`` the last
+    close.
+    """
+    def __init__(self, timeperiod: cython.int):
+        if timeperiod < 1:
+            raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
+        self.params = (timeperiod,)
+        self.timeperiod: cython.int = timeperiod
+        self.lookback: cython.Py_ssize_t = TA_ATR_Lookback(timeperiod)
+        self.today: cython.Py_ssize_t = 0
+        self.prevClose: cython.double = 0.0
+        self.prevATR: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_ATR_Resume(
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    state: ATRState,
+    outReal: cython.double[::1],
+) -> cython.int:
+    """ATR loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    optInTimePeriod: cython.int = state.timeperiod
+    lookbackTotal: cython.Py_ssize_t = state.lookback
+    today: cython.Py_ssize_t = state.today
+    prevClose: cython.double = state.prevClose
+    prevATR: cython.double = state.prevATR
+    tr: cython.double
+    tempReal: cython.double
+    length: cython.Py_ssize_t = inHigh.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first bar without NaN
+    if today == 0:
+        while i < length and (isnan(inHigh[i]) or isnan(inLow[i]) or isnan(inClose[i])):
+            i += 1
+
+    while i < length:
+        if today > 0:
+            # True range of the bar
+            tr = inHigh[i] - inLow[i]
+            tempReal = fabs(prevClose - inHigh[i])
+            if tempReal > tr:
+                tr = tempReal
+            tempReal = fabs(prevClose - inLow[i])
+            if tempReal > tr:
+                tr = tempReal
+
+            if today <= optInTimePeriod:
+                prevATR += tr
+                if today == optInTimePeriod:
+                    prevATR = prevATR / optInTimePeriod
+            else:
+                prevATR *= optInTimePeriod - 1
+                prevATR += tr
+                prevATR /= optInTimePeriod
+            if today >= lookbackTotal:
+                outReal[i] = prevATR
+        prevClose = inClose[i]
+        today += 1
+        i += 1
+
+    state.today = today
+    state.prevClose = prevClose
+    state.prevATR = prevATR
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("high", "low", "close")
 def ATR(
-    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None,
+    state: Optional[ATRState] = None, return_state: bool = False,
 ) -> np.ndarray:
     """ATR(high, low, close[, timeperiod=?])
 
@@ -116,19 +200,28 @@ def ATR(
         timeperiod: 14
     Outputs:
         real
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(real, state)``.
     """
 
     high = check_array(high)
     low = check_array(low)
     close = check_array(close)
     length = check_length3(high, low, close)
+
+    if state is not None or return_state:
+        state = resume_state(state, ATRState, timeperiod)
+        outreal = check_out(out, high)
+        TA_ATR_Resume(high, low, close, state, outreal)
+        return (outreal, state) if return_state else outreal
+
     startIdx = check_begidx3(high, low, close)
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_ATR_Lookback(timeperiod)
-    outreal = make_double_array(length, lookback)
+    outreal = check_out(out, high)
     
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     
     TA_ATR(
         0,
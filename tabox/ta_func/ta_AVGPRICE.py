@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -16,10 +17,10 @@ def TA_AVGPRICE_Lookback() -> cython.Py_ssize_t:
 def TA_AVGPRICE(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inOpen: cython.double[::1],
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inOpen: cython.const[cython.double][::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -70,11 +71,13 @@ def TA_AVGPRICE(
 
     return TA_RetCode.TA_SUCCESS
 
+@rowwise("inOpen", "inHigh", "inLow", "inClose")
 def AVGPRICE(
     inOpen: np.ndarray,
     inHigh: np.ndarray,
     inLow: np.ndarray,
     inClose: np.ndarray,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     AVGPRICE(inOpen, inHigh, inLow, inClose)
@@ -106,9 +109,8 @@ def AVGPRICE(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_AVGPRICE_Lookback()
 
-    outReal = np.full_like(inOpen, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, inOpen)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_AVGPRICE(
         0,
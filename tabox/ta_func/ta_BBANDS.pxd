@@ -1,4 +1,4 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 cpdef Py_ssize_t TA_BBANDS_Lookback(Py_ssize_t optInTimePeriod, double optInNbDevUp, double optInNbDevDn, int optInMAType)
-cpdef int TA_INT_BBANDS(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, double optInNbDevUp, double optInNbDevDn, int optInMAType, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outRealUpperBand, double[::1] outRealMiddleBand, double[::1] outRealLowerBand)
-cpdef int TA_BBANDS(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, double optInNbDevUp, double optInNbDevDn, int optInMAType, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outRealUpperBand, double[::1] outRealMiddleBand, double[::1] outRealLowerBand)
\ No newline at end of file
+cpdef int TA_INT_BBANDS(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInNbDevUp, double optInNbDevDn, int optInMAType, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outRealUpperBand, double[::1] outRealMiddleBand, double[::1] outRealLowerBand)
+cpdef int TA_BBANDS(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInNbDevUp, double optInNbDevDn, int optInMAType, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outRealUpperBand, double[::1] outRealMiddleBand, double[::1] outRealLowerBand)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId, TA_MAType
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -61,7 +62,7 @@ def TA_BBANDS_Lookback(
 def TA_INT_BBANDS(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInNbDevUp: cython.double,
     optInNbDevDn: cython.double,
@@ -161,7 +162,7 @@ def TA_INT_BBANDS(
 def TA_BBANDS(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInNbDevUp: cython.double,
     optInNbDevDn: cython.double,
@@ -224,12 +225,14 @@ def TA_BBANDS(
     )
 
 
+@rowwise("real")
 def BBANDS(
     real: np.ndarray,
     timeperiod: int = 5,
     nbdevup: float = 2.0,
     nbdevdn: float = 2.0,
-    matype: int = 0
+    matype: int = 0,
+    out: Optional[tuple] = None
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """BBANDS(real[, timeperiod=5, nbdevup=2, nbdevdn=2, matype=0])
     
@@ -253,12 +256,11 @@ def BBANDS(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_BBANDS_Lookback(timeperiod, nbdevup, nbdevdn, matype)
     
-    outUpperBand = np.full_like(real, np.nan)
-    outMiddleBand = np.full_like(real, np.nan)
-    outLowerBand = np.full_like(real, np.nan)
+    outUpperBand = check_out(out, real, 0, 3)
+    outMiddleBand = check_out(out, real, 1, 3)
+    outLowerBand = check_out(out, real, 2, 3)
     
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_BBANDS(
         0,
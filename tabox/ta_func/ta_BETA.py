@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -25,8 +26,8 @@ def TA_BETA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_BETA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal0: cython.double[::1],
-    inReal1: cython.double[::1],
+    inReal0: cython.const[cython.double][::1],
+    inReal1: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -193,7 +194,8 @@ def TA_BETA(
     return TA_RetCode.TA_SUCCESS
 
 
-def BETA(real0: np.ndarray, real1: np.ndarray, timeperiod: int = 5) -> np.ndarray:
+@rowwise("real0", "real1")
+def BETA(real0: np.ndarray, real1: np.ndarray, timeperiod: int = 5, out: Optional[np.ndarray] = None) -> np.ndarray:
     """BETA(real0, real1[, timeperiod=5])
     
     Beta (Momentum Indicators)
@@ -230,9 +232,8 @@ def BETA(real0: np.ndarray, real1: np.ndarray, timeperiod: int = 5) -> np.ndarra
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + timeperiod  # TA_BETA_Lookback returns timeperiod directly
 
-    outReal = np.full_like(real0, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real0)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_BETA(
         0,
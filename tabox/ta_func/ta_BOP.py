@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -25,10 +26,10 @@ def TA_BOP_Lookback() -> cython.Py_ssize_t:
 def TA_BOP(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inOpen: cython.double[::1],
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inOpen: cython.const[cython.double][::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -68,7 +69,8 @@ def TA_BOP(
     outNBElement[0] = outIdx
     return TA_RetCode.TA_SUCCESS
 
-def BOP(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+@rowwise("open_", "high", "low", "close")
+def BOP(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """BOP(open, high, low, close)
 
     Balance Of Power (Momentum Indicators)
@@ -94,9 +96,8 @@ def BOP(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_BOP_Lookback()
 
-    outReal = np.full_like(open_, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, open_)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_BOP(
         0, endIdx, open_[startIdx:], high[startIdx:], low[startIdx:], close[startIdx:],
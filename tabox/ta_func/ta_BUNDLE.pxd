@@ -0,0 +1,8 @@
+from .ta_utility cimport TA_IS_ZERO
+cdef extern from "math.h":
+    cpdef double fabs(double x)
+    cpdef double sqrt(double x)
+
+cpdef int TA_BUNDLE_DIRECTIONAL(Py_ssize_t endIdx, const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, int optInTimePeriod, double[::1] outPlusDI, double[::1] outMinusDI, double[::1] outDX, double[::1] outADX, double[::1] outADXR, double[::1] outATR, double[::1] outNATR)
+cpdef int TA_BUNDLE_BANDS(Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInNbDevUp, double optInNbDevDn, double[::1] outMean, double[::1] outVar, double[::1] outStdDev, double[::1] outUpperBand, double[::1] outLowerBand)
+cpdef int TA_BUNDLE_MOVING_AVERAGES(Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double[::1] outSMA, double[::1] outEMA, double[::1] outDEMA, double[::1] outTEMA, double[::1] outTRIX)
@@ -0,0 +1,332 @@
+import cython
+import numpy as np
+from ..retcode import TA_RetCode
+from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
+
+if not cython.compiled:
+    from math import fabs, sqrt
+    from .ta_utility import TA_IS_ZERO
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_BUNDLE_DIRECTIONAL(
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outPlusDI: cython.double[::1],
+    outMinusDI: cython.double[::1],
+    outDX: cython.double[::1],
+    outADX: cython.double[::1],
+    outADXR: cython.double[::1],
+    outATR: cython.double[::1],
+    outNATR: cython.double[::1],
+) -> cython.int:
+    """
+    TA_BUNDLE_DIRECTIONAL - PLUS_DI, MINUS_DI, DX, ADX, ADXR, ATR and NATR
+    in a single pass over bars 0..endIdx
+
+    The true range and the Wilder smoothed +DM, -DM and TR are computed once
+    per bar and shared by every output. The outputs are aligned with the
+    inputs: each one is written from its own lookback (including its
+    unstable period) onwards, the caller fills the leading bars. The values
+    are identical to the standalone functions.
+    """
+    if optInTimePeriod < 2 or optInTimePeriod > 100000:
+        return TA_RetCode.TA_BAD_PARAM
+
+    lbPlusDI: cython.Py_ssize_t = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_PLUS_DI)
+    lbMinusDI: cython.Py_ssize_t = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DI)
+    lbDX: cython.Py_ssize_t = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_DX)
+    lbADX: cython.Py_ssize_t = 2 * optInTimePeriod - 1 + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ADX)
+    lbADXR: cython.Py_ssize_t = lbADX + optInTimePeriod - 1
+    lbATR: cython.Py_ssize_t = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_ATR)
+    lbNATR: cython.Py_ssize_t = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_NATR)
+
+    if endIdx < 1:
+        return TA_RetCode.TA_SUCCESS
+
+    prevHigh: cython.double = inHigh[0]
+    prevLow: cython.double = inLow[0]
+    prevClose: cython.double = inClose[0]
+    prevPlusDM: cython.double = 0.0
+    prevMinusDM: cython.double = 0.0
+    prevTR: cython.double = 0.0
+    prevATR: cython.double = 0.0
+    prevADX: cython.double = 0.0
+    prevDX: cython.double = 0.0
+    sumDX: cython.double = 0.0
+    tempReal: cython.double
+    diffP: cython.double
+    diffM: cython.double
+    tr: cython.double
+    plusDI: cython.double
+    minusDI: cython.double
+    dx: cython.double = 0.0
+    dxValid: cython.bint
+    today: cython.Py_ssize_t
+
+    for today in range(1, endIdx + 1):
+        tempReal = inHigh[today]
+        diffP = tempReal - prevHigh  # Plus Delta
+        prevHigh = tempReal
+
+        tempReal = inLow[today]
+        diffM = prevLow - tempReal  # Minus Delta
+        prevLow = tempReal
+
+        # True range of the bar, shared by the DM smoothing and the ATR.
+        tr = prevHigh - prevLow
+        tempReal = fabs(prevHigh - prevClose)
+        if tempReal > tr:
+            tr = tempReal
+        tempReal = fabs(prevLow - prevClose)
+        if tempReal > tr:
+            tr = tempReal
+        prevClose = inClose[today]
+
+        # ATR: simple average of the first period, then Wilder smoothing.
+        if today <= optInTimePeriod:
+            prevATR += tr
+            if today == optInTimePeriod:
+                prevATR = prevATR / optInTimePeriod
+        else:
+            prevATR *= optInTimePeriod - 1
+            prevATR += tr
+            prevATR /= optInTimePeriod
+        if today >= lbATR:
+            outATR[today] = prevATR
+        if today >= lbNATR:
+            if not TA_IS_ZERO(prevClose):
+                outNATR[today] = (prevATR / prevClose) * 100.0
+            else:
+                outNATR[today] = 0.0
+
+        # +DM, -DM and TR: sum of the first period-1 bars, then Wilder smoothing.
+        if today < optInTimePeriod:
+            if (diffM > 0) and (diffP < diffM):
+                # Case 2 and 4: +DM=0,-DM=diffM
+                prevMinusDM += diffM
+            elif (diffP > 0) and (diffP > diffM):
+                # Case 1 and 3: +DM=diffP,-DM=0
+                prevPlusDM += diffP
+            prevTR += tr
+            continue
+
+        prevMinusDM -= prevMinusDM / optInTimePeriod
+        prevPlusDM -= prevPlusDM / optInTimePeriod
+        if (diffM > 0) and (diffP < diffM):
+            prevMinusDM += diffM
+        elif (diffP > 0) and (diffP > diffM):
+            prevPlusDM += diffP
+        prevTR = prevTR - (prevTR / optInTimePeriod) + tr
+
+        dxValid = False
+        if not TA_IS_ZERO(prevTR):
+            minusDI = 100.0 * (prevMinusDM / prevTR)
+            plusDI = 100.0 * (prevPlusDM / prevTR)
+            tempReal = minusDI + plusDI
+            if not TA_IS_ZERO(tempReal):
+                dx = 100.0 * (fabs(minusDI - plusDI) / tempReal)
+                dxValid = True
+        else:
+            minusDI = 0.0
+            plusDI = 0.0
+
+        if today >= lbPlusDI:
+            outPlusDI[today] = plusDI
+        if today >= lbMinusDI:
+            outMinusDI[today] = minusDI
+        if today >= lbDX:
+            # DX keeps its previous value when it is undefined.
+            if dxValid:
+                prevDX = dx
+            elif today == lbDX:
+                prevDX = 0.0
+            outDX[today] = prevDX
+
+        # ADX: average of the first period of DX, then Wilder smoothing.
+        if today < 2 * optInTimePeriod:
+            if dxValid:
+                sumDX += dx
+            if today == 2 * optInTimePeriod - 1:
+                prevADX = sumDX / optInTimePeriod
+        elif dxValid:
+            prevADX = ((prevADX * (optInTimePeriod - 1)) + dx) / optInTimePeriod
+        if today >= lbADX:
+            outADX[today] = prevADX
+        if today >= lbADXR:
+            outADXR[today] = (prevADX + outADX[today - (optInTimePeriod - 1)]) / 2.0
+
+    return TA_RetCode.TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_BUNDLE_BANDS(
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInNbDevUp: cython.double,
+    optInNbDevDn: cython.double,
+    outMean: cython.double[::1],
+    outVar: cython.double[::1],
+    outStdDev: cython.double[::1],
+    outUpperBand: cython.double[::1],
+    outLowerBand: cython.double[::1],
+) -> cython.int:
+    """
+    TA_BUNDLE_BANDS - SMA, VAR, STDDEV and the SMA based BBANDS in a single
+    pass over bars 0..endIdx
+
+    The running sums of the values and of their squares are shared by every
+    output. The outputs are aligned with the input and written from bar
+    optInTimePeriod-1 onwards. The values are identical to SMA, VAR,
+    STDDEV (nbdev=1) and BBANDS (matype=0).
+    """
+    if optInTimePeriod < 2 or optInTimePeriod > 100000:
+        return TA_RetCode.TA_BAD_PARAM
+
+    periodTotal1: cython.double = 0.0
+    periodTotal2: cython.double = 0.0
+    meanValue1: cython.double
+    meanValue2: cython.double
+    tempReal: cython.double
+    stdDev: cython.double
+    trailingIdx: cython.Py_ssize_t = 0
+    i: cython.Py_ssize_t = 0
+
+    while i < optInTimePeriod - 1 and i <= endIdx:
+        tempReal = inReal[i]
+        periodTotal1 += tempReal
+        tempReal *= tempReal
+        periodTotal2 += tempReal
+        i += 1
+
+    while i <= endIdx:
+        tempReal = inReal[i]
+        periodTotal1 += tempReal
+        tempReal *= tempReal
+        periodTotal2 += tempReal
+
+        meanValue1 = periodTotal1 / optInTimePeriod
+        meanValue2 = periodTotal2 / optInTimePeriod
+
+        tempReal = inReal[trailingIdx]
+        periodTotal1 -= tempReal
+        tempReal *= tempReal
+        periodTotal2 -= tempReal
+
+        meanValue2 -= meanValue1 * meanValue1
+        if meanValue2 > 0:
+            stdDev = sqrt(meanValue2)
+        else:
+            stdDev = 0.0
+
+        outMean[i] = meanValue1
+        outVar[i] = meanValue2
+        outStdDev[i] = stdDev
+        outUpperBand[i] = meanValue1 + stdDev * optInNbDevUp
+        outLowerBand[i] = meanValue1 - stdDev * optInNbDevDn
+        i += 1
+        trailingIdx += 1
+
+    return TA_RetCode.TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_BUNDLE_MOVING_AVERAGES(
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outSMA: cython.double[::1],
+    outEMA: cython.double[::1],
+    outDEMA: cython.double[::1],
+    outTEMA: cython.double[::1],
+    outTRIX: cython.double[::1],
+) -> cython.int:
+    """
+    TA_BUNDLE_MOVING_AVERAGES - SMA, EMA, DEMA, TEMA and TRIX in a single
+    pass over bars 0..endIdx
+
+    The running sum of the SMA and the three levels of the EMA chain are
+    updated once per bar and shared by every output. Each EMA level takes
+    the previous one from its first output bar, seeds itself with the
+    average of its first optInTimePeriod values and skips the EMA unstable
+    period. The outputs are aligned with the input and written from their
+    own lookback onwards, the caller fills the leading bars. The values are
+    identical to the standalone functions.
+    """
+    if optInTimePeriod < 2 or optInTimePeriod > 100000:
+        return TA_RetCode.TA_BAD_PARAM
+
+    k: cython.double = 2.0 / (optInTimePeriod + 1)
+    lbSMA: cython.Py_ssize_t = optInTimePeriod - 1
+    lbEMA: cython.Py_ssize_t = optInTimePeriod - 1 + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_EMA)
+
+    periodTotal: cython.double = 0.0
+    prevEMA1: cython.double = 0.0
+    prevEMA2: cython.double = 0.0
+    prevEMA3: cython.double = 0.0
+    lastEMA3: cython.double = 0.0
+    tempReal: cython.double
+    today: cython.Py_ssize_t
+    level: cython.Py_ssize_t
+
+    for today in range(endIdx + 1):
+        tempReal = inReal[today]
+        periodTotal += tempReal
+        if today >= lbSMA:
+            outSMA[today] = periodTotal / optInTimePeriod
+            periodTotal -= inReal[today - lbSMA]
+
+        # EMA: sum of the first period, then the exponential smoothing.
+        if today < lbSMA:
+            prevEMA1 += tempReal
+        elif today == lbSMA:
+            prevEMA1 = (prevEMA1 + tempReal) / optInTimePeriod
+        else:
+            prevEMA1 = ((tempReal - prevEMA1) * k) + prevEMA1
+        if today < lbEMA:
+            continue
+        outEMA[today] = prevEMA1
+
+        # EMA(EMA) over the EMA from its first output bar.
+        level = today - lbEMA
+        if level < lbSMA:
+            prevEMA2 += prevEMA1
+        elif level == lbSMA:
+            prevEMA2 = (prevEMA2 + prevEMA1) / optInTimePeriod
+        else:
+            prevEMA2 = ((prevEMA1 - prevEMA2) * k) + prevEMA2
+        if level < lbEMA:
+            continue
+        outDEMA[today] = 2.0 * prevEMA1 - prevEMA2
+
+        # EMA(EMA(EMA)) over the EMA(EMA) from its first output bar.
+        level -= lbEMA
+        lastEMA3 = prevEMA3
+        if level < lbSMA:
+            prevEMA3 += prevEMA2
+        elif level == lbSMA:
+            prevEMA3 = (prevEMA3 + prevEMA2) / optInTimePeriod
+        else:
+            prevEMA3 = ((prevEMA2 - prevEMA3) * k) + prevEMA3
+        if level < lbEMA:
+            continue
+        outTEMA[today] = prevEMA3 + ((3.0 * prevEMA1) - (3.0 * prevEMA2))
+
+        # TRIX: rate of change of EMA(EMA(EMA)) from its second output bar.
+        if level > lbEMA:
+            if lastEMA3 != 0.0:
+                outTRIX[today] = ((prevEMA3 / lastEMA3) - 1.0) * 100.0
+            else:
+                outTRIX[today] = 0.0
+
+    return TA_RetCode.TA_SUCCESS
@@ -1,4 +1,6 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+cdef extern from "math.h":
+    bint isnan(double x) nogil
 cpdef Py_ssize_t TA_CCI_Lookback(int optInTimePeriod)
 cpdef int TA_CCI(
     Py_ssize_t startIdx,
@@ -10,4 +12,15 @@ cpdef int TA_CCI(
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
     double[::1] outReal,
+)
+cpdef int TA_CCI_FAST(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
+    int optInTimePeriod,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal,
 )
\ No newline at end of file
@@ -1,8 +1,10 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
+    from math import isnan
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -31,9 +33,9 @@ def TA_CCI_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_CCI(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -135,10 +137,194 @@ def TA_CCI(
     return TA_RetCode.TA_SUCCESS
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_CCI_FAST(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_CCI_FAST - Commodity Channel Index in O(n log n)
+
+    Same inputs and outputs as TA_CCI. The average comes from a running
+    sum and the mean absolute deviation from two Fenwick trees (count and
+    sum of the typical prices, indexed by rank), so each bar costs
+    O(log n) instead of O(period). The results match TA_CCI up to
+    floating point rounding. Like TA_CCI, bars whose window holds a NaN
+    are NaN: the NaN typical prices are counted, not added to the sums.
+    """
+    # Parameter checks
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if inHigh is None or inLow is None or inClose is None or outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    tempReal: cython.double
+    tempReal2: cython.double
+    theAverage: cython.double
+    lastValue: cython.double
+    sumBelow: cython.double
+    cntBelow: cython.Py_ssize_t
+    cntSame: cython.Py_ssize_t
+    nanCount: cython.Py_ssize_t = 0
+    i: cython.Py_ssize_t
+    j: cython.Py_ssize_t
+    k: cython.Py_ssize_t
+    lo: cython.Py_ssize_t
+    hi: cython.Py_ssize_t
+    lookbackTotal: cython.Py_ssize_t
+
+    # Identify the minimum number of price bar needed to calculate at least one output.
+    lookbackTotal = optInTimePeriod - 1
+
+    # Move up the start index if there is not enough initial data.
+    if startIdx < lookbackTotal:
+        startIdx = lookbackTotal
+
+    # Make sure there is still something to evaluate.
+    if startIdx > endIdx:
+        outBegIdx[0] = 0
+        outNBElement[0] = 0
+        return TA_RetCode.TA_SUCCESS
+
+    # Typical prices of every bar used, shifted by the first one that is
+    # not NaN to keep the running sums small, and their ranks in sorted
+    # order (the NaN are sorted last and never enter the trees).
+    firstIdx: cython.Py_ssize_t = startIdx - lookbackTotal
+    nbValues: cython.Py_ssize_t = endIdx - firstIdx + 1
+    shift: cython.double = 0.0
+    typPrice: cython.double[::1] = np.empty(nbValues, dtype=np.double)
+    for i in range(nbValues):
+        typPrice[i] = (inHigh[firstIdx + i] + inLow[firstIdx + i] + inClose[firstIdx + i]) / 3
+    for i in range(nbValues):
+        if not isnan(typPrice[i]):
+            shift = typPrice[i]
+            break
+    for i in range(nbValues):
+        typPrice[i] -= shift
+    sortedPrice: cython.double[::1] = np.sort(typPrice)
+    rank: cython.Py_ssize_t[::1] = np.searchsorted(sortedPrice, typPrice).astype(np.intp)
+
+    # Fenwick trees over the ranks: number of values and their sum.
+    treeCount: cython.Py_ssize_t[::1] = np.zeros(nbValues + 1, dtype=np.intp)
+    treeSum: cython.double[::1] = np.zeros(nbValues + 1, dtype=np.double)
+
+    # Add-up the initial period, except for the last value.
+    periodTotal: cython.double = 0.0
+    i = 0
+    while i < lookbackTotal:
+        if isnan(typPrice[i]):
+            nanCount += 1
+        else:
+            periodTotal += typPrice[i]
+            k = rank[i] + 1
+            while k <= nbValues:
+                treeCount[k] += 1
+                treeSum[k] += typPrice[i]
+                k += k & -k
+        i += 1
+
+    # Proceed with the calculation for the requested range.
+    outIdx: cython.Py_ssize_t = 0
+    while i < nbValues:
+        lastValue = typPrice[i]
+        if isnan(lastValue):
+            nanCount += 1
+        else:
+            periodTotal += lastValue
+            k = rank[i] + 1
+            while k <= nbValues:
+                treeCount[k] += 1
+                treeSum[k] += lastValue
+                k += k & -k
+
+        theAverage = periodTotal / optInTimePeriod
+
+        # Number of values strictly below the newest one, to spot a flat window.
+        cntSame = 0
+        k = rank[i] + 1
+        while k > 0:
+            cntSame += treeCount[k]
+            k -= k & -k
+        k = rank[i]
+        while k > 0:
+            cntSame -= treeCount[k]
+            k -= k & -k
+
+        if nanCount > 0:
+            outReal[outIdx] = np.nan
+        elif cntSame == optInTimePeriod:
+            outReal[outIdx] = 0.0
+        else:
+            # Count and sum of the values not above the average.
+            lo = 0
+            hi = nbValues
+            while lo < hi:
+                j = (lo + hi) // 2
+                if sortedPrice[j] <= theAverage:
+                    lo = j + 1
+                else:
+                    hi = j
+            cntBelow = 0
+            sumBelow = 0.0
+            k = lo
+            while k > 0:
+                cntBelow += treeCount[k]
+                sumBelow += treeSum[k]
+                k -= k & -k
+
+            # SUM(ABS(TypePrice-average)) split at the average.
+            tempReal2 = periodTotal - 2.0 * sumBelow + theAverage * (2 * cntBelow - optInTimePeriod)
+            tempReal = lastValue - theAverage
+
+            if tempReal != 0.0 and tempReal2 > 0.0:
+                outReal[outIdx] = tempReal / (0.015 * (tempReal2 / optInTimePeriod))
+            else:
+                outReal[outIdx] = 0.0
+
+        outIdx += 1
+
+        # Remove the oldest value of the window.
+        j = i - lookbackTotal
+        if isnan(typPrice[j]):
+            nanCount -= 1
+        else:
+            periodTotal -= typPrice[j]
+            k = rank[j] + 1
+            while k <= nbValues:
+                treeCount[k] -= 1
+                treeSum[k] -= typPrice[j]
+                k += k & -k
+        i += 1
+
+    # All done. Indicate the output limits and return.
+    outBegIdx[0] = startIdx
+    outNBElement[0] = outIdx
+
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("high", "low", "close")
 def CCI(
-    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14,
+    exact: bool = True,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    """CCI(high, low, close[, timeperiod=14])
+    """CCI(high, low, close[, timeperiod=14, exact=True])
 
     Commodity Channel Index (Momentum Indicators)
 
@@ -151,6 +337,8 @@ def CCI(
         close: (any ndarray) Close prices
     Parameters:
         timeperiod: 14 Number of periods to use for the CCI calculation
+        exact: True rescans the window on every bar like TA-Lib (O(n*period)),
+            False uses TA_CCI_FAST (O(n log n)), equal up to rounding
     Outputs:
         real
     """
@@ -168,11 +356,11 @@ def CCI(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_CCI_Lookback(timeperiod)
 
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
-    retCode = TA_CCI(
+    kernel = TA_CCI if exact else TA_CCI_FAST
+    retCode = kernel(
         0,
         endIdx,
         high[startIdx:],
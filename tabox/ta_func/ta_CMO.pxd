@@ -1,7 +1,19 @@
-from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_utility cimport TA_INTEGER_DEFAULT, TA_COMPATIBILITY_METASTOCK
+from .ta_utils cimport kernel_rows
 from .ta_utility cimport TA_IS_ZERO
 
 cpdef Py_ssize_t TA_CMO_Lookback(int optInTimePeriod)
+cdef int TA_CMO_nogil(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inReal,
+    int optInTimePeriod,
+    int unstablePeriod,
+    int compatibility,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal,
+) noexcept nogil
 cpdef int TA_CMO(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
@@ -10,4 +22,6 @@ cpdef int TA_CMO(
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
     double[::1] outReal,
-)
\ No newline at end of file
+)
+cdef int TA_CMO_Row(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInReal, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef Py_ssize_t TA_CMO_Rows(const double[:, ::1] inReal, int optInTimePeriod, double[:, ::1] outReal)
@@ -1,12 +1,14 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_GLOBALS_COMPATIBILITY, TA_Compatibility, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
 if not cython.compiled:
-    from .ta_utility import TA_INTEGER_DEFAULT
+    from .ta_utility import TA_INTEGER_DEFAULT, TA_COMPATIBILITY_METASTOCK
+    from .ta_utils import kernel_rows
 
 if not cython.compiled:
     from .ta_utility import TA_IS_ZERO
@@ -39,43 +41,26 @@ def TA_CMO_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_CMO(
+def TA_CMO_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """TA_CMO - Chande Momentum Oscillator
-
-    Input  = double
-    Output = double
+    """CMO loop without parameter checks, runs without the GIL
 
-    Optional Parameters
-    -------------------
-    optInTimePeriod:(From 2 to 100000)
-       Number of period
+    The CMO unstable period and the compatibility mode are passed in by the caller.
     """
-    # Parameter checks
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if optInTimePeriod == 0:  # 默认值处理
-            optInTimePeriod = 14
-        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        if inReal is None or outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
     outIdx: cython.Py_ssize_t = 0
     today: cython.Py_ssize_t
     lookbackTotal: cython.Py_ssize_t
-    unstablePeriod: cython.Py_ssize_t
     i: cython.Py_ssize_t
+    idx: cython.Py_ssize_t
     prevGain: cython.double
     prevLoss: cython.double
     prevValue: cython.double
@@ -86,7 +71,9 @@ def TA_CMO(
     tempValue4: cython.double
 
     # Adjust startIdx to account for the lookback period
-    lookbackTotal = TA_CMO_Lookback(optInTimePeriod)
+    lookbackTotal = optInTimePeriod + unstablePeriod
+    if compatibility == TA_COMPATIBILITY_METASTOCK:
+        lookbackTotal -= 1
 
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
@@ -95,7 +82,7 @@ def TA_CMO(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Trap special case where the period is '1'
     if optInTimePeriod == 1:
@@ -105,16 +92,14 @@ def TA_CMO(
         # Copy input to output
         for idx in range(i):
             outReal[idx] = inReal[startIdx + idx]
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Accumulate Wilder's "Average Gain" and "Average Loss" among the initial period
     today = startIdx - lookbackTotal
     prevValue = inReal[today]
 
-    unstablePeriod = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_CMO)
-
     # Handle Metastock compatibility for initial calculation
-    if (unstablePeriod == 0) and (TA_GLOBALS_COMPATIBILITY() == TA_Compatibility.TA_COMPATIBILITY_METASTOCK):
+    if (unstablePeriod == 0) and (compatibility == TA_COMPATIBILITY_METASTOCK):
         savePrevValue = prevValue
         prevGain = 0.0
         prevLoss = 0.0
@@ -144,7 +129,7 @@ def TA_CMO(
         if today > endIdx:
             outBegIdx[0] = startIdx
             outNBElement[0] = outIdx
-            return TA_RetCode.TA_SUCCESS
+            return 0  # TA_SUCCESS
 
         # Reset for next calculation
         today -= optInTimePeriod
@@ -218,10 +203,93 @@ def TA_CMO(
 
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_CMO(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_CMO - Chande Momentum Oscillator
+
+    Input  = double
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 2 to 100000)
+       Number of period
+    """
+    # Parameter checks
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if optInTimePeriod == 0:  # 默认值处理
+            optInTimePeriod = 14
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if inReal is None or outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_CMO)
+    compatibility: cython.int = TA_GLOBALS_COMPATIBILITY()
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_CMO_nogil(
+            startIdx, endIdx, inReal, optInTimePeriod, unstablePeriod, compatibility,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
+
+
+def TA_CMO_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_CMO_nogil as the row_kernel of TA_CMO_Rows"""
+    return TA_CMO_nogil(startIdx, endIdx, inReal, optInTimePeriod, unstablePeriod, compatibility,
+                        outBegIdx, outNBElement, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_CMO_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """CMO of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``CMO``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    check_timeperiod(optInTimePeriod)
+    lookback: cython.Py_ssize_t = TA_CMO_Lookback(optInTimePeriod)
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_CMO)
+    compatibility: cython.int = TA_GLOBALS_COMPATIBILITY()
+    return kernel_rows(TA_CMO_Row, inReal, lookback, optInTimePeriod, 0.0, unstablePeriod, compatibility, outReal)
 
 
-def CMO(real: np.ndarray, timeperiod: int = 14):
+@rowwise("real", rows=TA_CMO_Rows)
+def CMO(real: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None):
     """CMO(real[, timeperiod=14])
 
     Chande Momentum Oscillator (Overlap Studies)
@@ -244,9 +312,8 @@ def CMO(real: np.ndarray, timeperiod: int = 14):
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_CMO_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_CMO(
         0,
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -38,8 +39,8 @@ def TA_CORREL_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_CORREL(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal0: cython.double[::1],
-    inReal1: cython.double[::1],
+    inReal0: cython.const[cython.double][::1],
+    inReal1: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -155,7 +156,8 @@ def TA_CORREL(
     outNBElement[0] = outIdx
     return TA_RetCode.TA_SUCCESS
 
-def CORREL(real0: np.ndarray, real1: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real0", "real1")
+def CORREL(real0: np.ndarray, real1: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     CORREL(real0, real1[, timeperiod=30])
 
@@ -185,9 +187,8 @@ def CORREL(real0: np.ndarray, real1: np.ndarray, timeperiod: int = 30) -> np.nda
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_CORREL_Lookback(timeperiod)
 
-    outReal = np.full_like(real0, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real0)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_CORREL(
         0,
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx2, check_length2
+from .ta_utils import check_array, check_begidx2, check_length2, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -15,8 +16,8 @@ def TA_DIV_Lookback() -> cython.Py_ssize_t:
 def TA_DIV(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal0: cython.double[::1],
-    inReal1: cython.double[::1],
+    inReal0: cython.const[cython.double][::1],
+    inReal1: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -40,7 +41,8 @@ def TA_DIV(
     return TA_RetCode.TA_SUCCESS
 
 
-def DIV(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
+@rowwise("real0", "real1")
+def DIV(real0: np.ndarray, real1: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """DIV(real0, real1)
 
     Vector Arithmetic Div (Math Operators)
@@ -57,9 +59,8 @@ def DIV(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
     startIdx = check_begidx2(real0, real1)
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_DIV_Lookback()
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outReal = np.full_like(real0, np.nan)
+    outBegIdx, outNBElement = index_buffers()
+    outReal = check_out(out, real0)
     retCode = TA_DIV(
         0,
         endIdx,
@@ -5,4 +5,5 @@ cdef extern from "math.h":
     double fabs(double x) nogil
 
 cdef double TRUE_RANGE(double th, double tl, double yc) noexcept nogil
-cdef double round_pos(double x) noexcept nogil
\ No newline at end of file
+cdef double round_pos(double x) noexcept nogil
+cdef int TA_DX_nogil(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, int optInTimePeriod, int unstablePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
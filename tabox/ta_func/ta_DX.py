@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -57,18 +58,22 @@ def TA_DX_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_INT_DX(
+def TA_DX_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """Internal DX implementation without parameter checks"""
+    """Internal DX implementation without parameter checks
+
+    Runs without the GIL; the DX unstable period is passed in by the caller.
+    """
     # Insert local variable here
     today: cython.Py_ssize_t
     lookbackTotal: cython.Py_ssize_t
@@ -86,6 +91,7 @@ def TA_INT_DX(
     minusDI: cython.double
     plusDI: cython.double
     i: cython.Py_ssize_t
+    tr: cython.double
 
     """
     The DM1 (one period) is base on the largest part of
@@ -146,9 +152,7 @@ def TA_INT_DX(
     # you can comment out the following #undef/#define and rebuild the library.
 
     if optInTimePeriod > 1:
-        lookbackTotal = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(
-            TA_FuncUnstId.TA_FUNC_UNST_DX
-        )
+        lookbackTotal = optInTimePeriod + unstablePeriod
     else:
         lookbackTotal = 2
 
@@ -160,7 +164,7 @@ def TA_INT_DX(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Indicate where the next output should be put in the outReal.
     outIdx = 0
@@ -200,7 +204,7 @@ def TA_INT_DX(
 
     # Skip the unstable period. Note that this loop must be executed
     # at least ONCE to calculate the first DI.
-    i = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_DX) + 1
+    i = unstablePeriod + 1
     while i > 0:  # 修复: 原C代码是i-- != 0，Python中应为i > 0
         # Calculate the prevMinusDM and prevPlusDM
         today += 1
@@ -281,15 +285,15 @@ def TA_INT_DX(
         outIdx += 1
 
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
 
 
 def TA_DX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -319,21 +323,19 @@ def TA_DX(
             return TA_RetCode.TA_BAD_PARAM
         if outReal is None:
             return TA_RetCode.TA_BAD_PARAM
-    return TA_INT_DX(
-        startIdx,
-        endIdx,
-        inHigh,
-        inLow,
-        inClose,
-        optInTimePeriod,
-        outBegIdx,
-        outNBElement,
-        outReal,
-    )
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_DX)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_DX_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
 
 
+@rowwise("high", "low", "close")
 def DX(
-    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """DX(high, low, close[, timeperiod=14])
 
@@ -365,9 +367,8 @@ def DX(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_DX_Lookback(timeperiod)
 
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_DX(
         0,
@@ -1,4 +1,19 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_utils cimport kernel_rows
 cpdef Py_ssize_t TA_EMA_Lookback(Py_ssize_t optInTimePeriod)
-cpdef int TA_EMA(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
-cpdef int TA_INT_EMA(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, double optInK_1, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
\ No newline at end of file
+cpdef int TA_EMA(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+cdef int TA_EMA_nogil(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInK_1, int unstablePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef int TA_INT_EMA(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInK_1, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+cdef extern from "math.h":
+    bint isnan(double x) nogil
+
+cdef class EMAState:
+    cdef public tuple params
+    cdef public int timeperiod
+    cdef public Py_ssize_t lookback
+    cdef public Py_ssize_t today
+    cdef public double prevMA
+
+cpdef int TA_EMA_Resume(const double[::1] inReal, EMAState state, double[::1] outReal)
+cdef int TA_EMA_Row(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInReal, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef Py_ssize_t TA_EMA_Rows(const double[:, ::1] inReal, int optInTimePeriod, double[:, ::1] outReal)
@@ -1,12 +1,15 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
 if not cython.compiled:
+    from math import isnan
     from .ta_utility import TA_INTEGER_DEFAULT
+    from .ta_utils import kernel_rows
 
 
 def TA_EMA_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
@@ -31,17 +34,22 @@ def TA_EMA_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_INT_EMA(
+@cython.cdivision(True)
+def TA_EMA_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInK_1: cython.double,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """Internal EMA implementation without parameter checks"""
+    """EMA loop without parameter checks, runs without the GIL
+
+    The EMA unstable period is passed in by the caller.
+    """
     tempReal: cython.double
     prevMA: cython.double
     i: cython.Py_ssize_t
@@ -49,7 +57,7 @@ def TA_INT_EMA(
     outIdx: cython.Py_ssize_t
     lookbackTotal: cython.Py_ssize_t
 
-    lookbackTotal = TA_EMA_Lookback(optInTimePeriod)
+    lookbackTotal = optInTimePeriod - 1 + unstablePeriod
 
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
@@ -57,7 +65,7 @@ def TA_INT_EMA(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     outBegIdx[0] = startIdx
 
@@ -89,13 +97,36 @@ def TA_INT_EMA(
         today += 1
 
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_INT_EMA(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInK_1: cython.double,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """Internal EMA implementation without parameter checks"""
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_EMA)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_EMA_nogil(
+            startIdx, endIdx, inReal, optInTimePeriod, optInK_1, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
 
 
 def TA_EMA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -133,7 +164,100 @@ def TA_EMA(
     )
 
 
-def EMA(real: np.ndarray, timeperiod: int = 30):
+class EMAState:
+    """Terminal state of an EMA, the seed of the next call
+
+    ``today`` counts the bars seen since the first one that is not NaN and
+    ``prevMA`` is the running average (the seed sum during the first
+    ``timeperiod`` bars).
+    """
+    def __init__(self, timeperiod: cython.int):
+        self.params = (timeperiod,)
+        self.timeperiod: cython.int = timeperiod
+        self.lookback: cython.Py_ssize_t = TA_EMA_Lookback(timeperiod)
+        self.today: cython.Py_ssize_t = 0
+        self.prevMA: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_EMA_Resume(inReal: cython.const[cython.double][::1], state: EMAState, outReal: cython.double[::1]) -> cython.int:
+    """EMA loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    optInTimePeriod: cython.int = state.timeperiod
+    k: cython.double = 2.0 / (optInTimePeriod + 1)
+    lookbackTotal: cython.Py_ssize_t = state.lookback
+    today: cython.Py_ssize_t = state.today
+    prevMA: cython.double = state.prevMA
+    length: cython.Py_ssize_t = inReal.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first value that is not NaN
+    if today == 0:
+        while i < length and isnan(inReal[i]):
+            i += 1
+
+    while i < length:
+        if today < optInTimePeriod:
+            # Sum of the first values, the seed
+            prevMA += inReal[i]
+            if today == optInTimePeriod - 1:
+                prevMA = prevMA / optInTimePeriod
+        else:
+            prevMA = ((inReal[i] - prevMA) * k) + prevMA
+        if today >= lookbackTotal:
+            outReal[i] = prevMA
+        today += 1
+        i += 1
+
+    state.today = today
+    state.prevMA = prevMA
+    return TA_RetCode.TA_SUCCESS
+
+
+def TA_EMA_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_EMA_nogil as the row_kernel of TA_EMA_Rows, ``optInReal`` is the smoothing factor"""
+    return TA_EMA_nogil(startIdx, endIdx, inReal, optInTimePeriod, optInReal, unstablePeriod,
+                        outBegIdx, outNBElement, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_EMA_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """EMA of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``EMA``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    check_timeperiod(optInTimePeriod)
+    lookback: cython.Py_ssize_t = TA_EMA_Lookback(optInTimePeriod)
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_EMA)
+    return kernel_rows(TA_EMA_Row, inReal, lookback, optInTimePeriod, 2.0 / (optInTimePeriod + 1),
+                       unstablePeriod, 0, outReal)
+
+
+@rowwise("real", rows=TA_EMA_Rows)
+def EMA(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None,
+        state: Optional[EMAState] = None, return_state: bool = False):
     """EMA(real[, timeperiod=30])
 
     Exponential Moving average (Overlap Studies)
@@ -144,18 +268,26 @@ def EMA(real: np.ndarray, timeperiod: int = 30):
         timeperiod: 30
     Outputs:
         real
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(real, state)``.
     """
     real = check_array(real)
     check_timeperiod(timeperiod)
 
+    if state is not None or return_state:
+        state = resume_state(state, EMAState, timeperiod)
+        outReal = check_out(out, real)
+        TA_EMA_Resume(real, state, outReal)
+        return (outReal, state) if return_state else outReal
+
     length: cython.Py_ssize_t = real.shape[0]
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_EMA_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_EMA(
         0,
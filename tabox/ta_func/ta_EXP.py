@@ -1,7 +1,8 @@
 import cython
 from cython.parallel import prange
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 if not cython.compiled:
@@ -17,7 +18,7 @@ def TA_EXP_Lookback() -> cython.Py_ssize_t:
 def TA_EXP(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -44,7 +45,8 @@ def TA_EXP(
     return TA_RetCode.TA_SUCCESS
 
 
-def EXP(real: np.ndarray):
+@rowwise("real")
+def EXP(real: np.ndarray, out: Optional[np.ndarray] = None):
     """EXP(real)
 
     Vector Exponential (Math Transform)
@@ -56,15 +58,14 @@ def EXP(real: np.ndarray):
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_EXP_Lookback()
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_EXP(0, endIdx, real[startIdx:], outBegIdx, outNBElement, outReal[lookback:])
     return outReal 
\ No newline at end of file
@@ -0,0 +1,10 @@
+cpdef int TA_INT_EXTREMA(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inReal,
+    int optInTimePeriod,
+    bint isMax,
+    bint latestOnTie,
+    double[::1] outValue,
+    Py_ssize_t[::1] outIndex,
+)
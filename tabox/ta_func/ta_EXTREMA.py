@@ -0,0 +1,82 @@
+import cython
+from typing import Optional
+import numpy as np
+from ..retcode import TA_RetCode
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_INT_EXTREMA(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    isMax: cython.bint,
+    latestOnTie: cython.bint,
+    outValue: Optional[cython.double[::1]],
+    outIndex: Optional[cython.Py_ssize_t[::1]],
+) -> cython.int:
+    """
+    TA_INT_EXTREMA - Highest (isMax) or lowest value over optInTimePeriod
+    bars and its index, for every bar from startIdx to endIdx
+
+    The caller makes sure that startIdx >= optInTimePeriod - 1. outValue and
+    outIndex receive endIdx - startIdx + 1 elements, either one may be None.
+
+    A monotonic deque of candidate indices is kept: a new bar drops every
+    older candidate it beats, so each index is pushed and popped at most
+    once and the whole range is O(n) whatever the period or the shape of the
+    input (the TA-Lib loop rescans the window each time the extremum leaves
+    it, which is O(n * period) on monotonic prices).
+
+    Ties are resolved like the TA-Lib loops: a new bar equal to the extremum
+    takes it over, and when the extremum leaves the window the earliest
+    (latestOnTie=False, MAX/MIN/WILLR/STOCH) or the latest (latestOnTie=True,
+    AROON) of the equal values in the window is picked.
+    """
+    trailingIdx: cython.Py_ssize_t = startIdx - (optInTimePeriod - 1)
+    if trailingIdx < 0 or endIdx < startIdx:
+        return TA_RetCode.TA_BAD_PARAM
+
+    writeValue: cython.bint = outValue is not None
+    writeIndex: cython.bint = outIndex is not None
+
+    # Comparing sign * value turns the lowest value search into a highest
+    # value search, negation is exact.
+    sign: cython.double = 1.0 if isMax else -1.0
+    queue: cython.Py_ssize_t[::1] = np.empty(endIdx - trailingIdx + 1, dtype=np.intp)
+    head: cython.Py_ssize_t = 0
+    tail: cython.Py_ssize_t = 0
+    extremumIdx: cython.Py_ssize_t = -1
+    outIdx: cython.Py_ssize_t = 0
+    today: cython.Py_ssize_t = trailingIdx
+    tmp: cython.double
+
+    while today <= endIdx:
+        tmp = sign * inReal[today]
+        if latestOnTie:
+            while tail > head and tmp >= sign * inReal[queue[tail - 1]]:
+                tail -= 1
+        else:
+            while tail > head and tmp > sign * inReal[queue[tail - 1]]:
+                tail -= 1
+        queue[tail] = today
+        tail += 1
+
+        if today >= startIdx:
+            while queue[head] < trailingIdx:
+                head += 1
+            if extremumIdx < trailingIdx:
+                # The front of the queue is what a rescan of the window finds.
+                extremumIdx = queue[head]
+            elif tmp >= sign * inReal[extremumIdx]:
+                extremumIdx = today
+            if writeValue:
+                outValue[outIdx] = inReal[extremumIdx]
+            if writeIndex:
+                outIndex[outIdx] = extremumIdx
+            outIdx += 1
+            trailingIdx += 1
+        today += 1
+
+    return TA_RetCode.TA_SUCCESS
@@ -0,0 +1,30 @@
+cdef extern from "math.h":
+    double atan(double x)
+    double cos(double x)
+    double fabs(double x)
+    double sin(double x)
+
+from tabox.ta_func.hilbert_transform cimport HilbertCycle
+
+cpdef Py_ssize_t TA_HT_ALL_Lookback()
+
+cpdef int TA_INT_HT(
+    Py_ssize_t begIdx,
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inReal,
+    int unstDCPeriod,
+    int unstPhasor,
+    int unstDCPhase,
+    int unstSine,
+    int unstTrendline,
+    int unstTrendMode,
+    double[::1] outDCPeriod,
+    double[::1] outDCPhase,
+    double[::1] outInPhase,
+    double[::1] outQuadrature,
+    double[::1] outSine,
+    double[::1] outLeadSine,
+    double[::1] outTrendline,
+    Py_ssize_t[::1] outTrendMode,
+)
@@ -0,0 +1,308 @@
+import cython
+from typing import Optional
+import numpy as np
+from .ta_utils import check_array, check_begidx1, rowwise, check_out
+from ..retcode import TA_RetCode
+from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
+from .hilbert_transform import HilbertCycle
+
+if not cython.compiled:
+    from math import atan, cos, fabs, sin
+
+
+def TA_HT_ALL_Lookback() -> cython.Py_ssize_t:
+    """
+    TA_HT_ALL_Lookback - Lookback of the longest HT_* output, each with its
+    own unstable period
+    """
+    lookback: cython.Py_ssize_t = 32 + max(TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPERIOD),
+                                           TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_PHASOR))
+    return max(lookback, 63 + max(TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPHASE),
+                                  TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_SINE),
+                                  TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDLINE),
+                                  TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDMODE)))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_INT_HT(
+    begIdx: cython.Py_ssize_t,
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    unstDCPeriod: cython.int,
+    unstPhasor: cython.int,
+    unstDCPhase: cython.int,
+    unstSine: cython.int,
+    unstTrendline: cython.int,
+    unstTrendMode: cython.int,
+    outDCPeriod: cython.double[::1],
+    outDCPhase: cython.double[::1],
+    outInPhase: cython.double[::1],
+    outQuadrature: cython.double[::1],
+    outSine: cython.double[::1],
+    outLeadSine: cython.double[::1],
+    outTrendline: cython.double[::1],
+    outTrendMode: cython.Py_ssize_t[::1],
+) -> cython.int:
+    """
+    TA_INT_HT - Hilbert Transform cycle family in a single pass over bars
+    begIdx..endIdx
+
+    The price smoother (4 bars WMA) runs once for every output. TA-Lib warms
+    the Hilbert transform up from bar begIdx + 12 for HT_DCPERIOD and
+    HT_PHASOR and from bar begIdx + 37 for the others, so two cycle
+    measurements advance side by side to stay identical to the standalone
+    functions; each one only runs when one of its outputs is requested.
+
+    Every output may be None. Output k is written at index today - startIdx
+    for the bars from startIdx, and from begIdx plus its own lookback
+    (including its unstable period), onwards. The unstable periods are
+    passed in by the caller, unstPhasor for outInPhase and outQuadrature
+    and unstSine for outSine and outLeadSine.
+    """
+    firstDCPeriod: cython.Py_ssize_t = max(startIdx, begIdx + 32 + unstDCPeriod)
+    firstPhasor: cython.Py_ssize_t = max(startIdx, begIdx + 32 + unstPhasor)
+    firstDCPhase: cython.Py_ssize_t = max(startIdx, begIdx + 63 + unstDCPhase)
+    firstSine: cython.Py_ssize_t = max(startIdx, begIdx + 63 + unstSine)
+    firstTrendline: cython.Py_ssize_t = max(startIdx, begIdx + 63 + unstTrendline)
+    firstTrendMode: cython.Py_ssize_t = max(startIdx, begIdx + 63 + unstTrendMode)
+
+    doPeriod: cython.bint = outDCPeriod is not None or outInPhase is not None or outQuadrature is not None
+    doTrendMode: cython.bint = outTrendMode is not None
+    doSine: cython.bint = outSine is not None or outLeadSine is not None or doTrendMode
+    doDCPhase: cython.bint = outDCPhase is not None or doSine
+    doTrendline: cython.bint = outTrendline is not None or doTrendMode
+    doCycle: cython.bint = doDCPhase or doTrendline
+
+    SMOOTH_PRICE_SIZE: cython.int = 50
+    smoothPrice: cython.double[::1] = np.zeros(SMOOTH_PRICE_SIZE, dtype=np.double)  # Circular buffer
+    smoothPrice_Idx: cython.int = 0
+
+    today: cython.Py_ssize_t
+    trailingWMAIdx: cython.Py_ssize_t
+    idx: cython.Py_ssize_t
+    i: cython.int
+    tempReal: cython.double
+    todayValue: cython.double
+    periodWMASub: cython.double
+    periodWMASum: cython.double
+    trailingWMAValue: cython.double
+    smoothedValue: cython.double
+    smoothPeriod: cython.double
+    DCPeriodInt: cython.int
+    realPart: cython.double
+    imagPart: cython.double
+    DCPhase: cython.double = 0.0
+    prevDCPhase: cython.double = 0.0
+    sine: cython.double = 0.0
+    leadSine: cython.double = 0.0
+    prevSine: cython.double
+    prevLeadSine: cython.double
+    trendline: cython.double = 0.0
+    iTrend1: cython.double = 0.0
+    iTrend2: cython.double = 0.0
+    iTrend3: cython.double = 0.0
+    daysInTrend: cython.Py_ssize_t = 0
+    trend: cython.Py_ssize_t
+
+    rad2Deg: cython.double = 45.0 / atan(1.0)
+    deg2Rad: cython.double = 1.0 / rad2Deg
+    constDeg2RadBy360: cython.double = atan(1.0) * 8.0
+
+    shortCycle: HilbertCycle = HilbertCycle()
+    longCycle: HilbertCycle = HilbertCycle()
+
+    if endIdx < begIdx + 3:
+        return TA_RetCode.TA_SUCCESS
+
+    # Price smoother, unrolled over the first 3 bars
+    trailingWMAIdx = begIdx
+    today = begIdx
+
+    tempReal = inReal[today]
+    today += 1
+    periodWMASub = tempReal
+    periodWMASum = tempReal
+
+    tempReal = inReal[today]
+    today += 1
+    periodWMASub += tempReal
+    periodWMASum += tempReal * 2.0
+
+    tempReal = inReal[today]
+    today += 1
+    periodWMASub += tempReal
+    periodWMASum += tempReal * 3.0
+
+    trailingWMAValue = 0.0
+
+    while today <= endIdx:
+        todayValue = inReal[today]
+        periodWMASub += todayValue
+        periodWMASub -= trailingWMAValue
+        periodWMASum += todayValue * 4.0
+        trailingWMAValue = inReal[trailingWMAIdx]
+        trailingWMAIdx += 1
+        smoothedValue = periodWMASum * 0.1
+        periodWMASum -= periodWMASub
+
+        # HT_DCPERIOD and HT_PHASOR
+        if doPeriod and today >= begIdx + 12:
+            shortCycle.update(today, smoothedValue, rad2Deg)
+            if outDCPeriod is not None and today >= firstDCPeriod:
+                outDCPeriod[today - startIdx] = shortCycle.smooth_period
+            if today >= firstPhasor:
+                if outInPhase is not None:
+                    outInPhase[today - startIdx] = shortCycle.in_phase
+                if outQuadrature is not None:
+                    outQuadrature[today - startIdx] = shortCycle.Q1.current_value
+
+        # HT_DCPHASE, HT_SINE, HT_TRENDLINE and HT_TRENDMODE
+        if doCycle and today >= begIdx + 37:
+            smoothPrice[smoothPrice_Idx] = smoothedValue
+            longCycle.update(today, smoothedValue, rad2Deg)
+            smoothPeriod = longCycle.smooth_period
+            DCPeriodInt = cython.cast(cython.int, smoothPeriod + 0.5)
+
+            if doDCPhase:
+                # Dominant cycle phase
+                realPart = 0.0
+                imagPart = 0.0
+                idx = smoothPrice_Idx
+                for i in range(DCPeriodInt):
+                    tempReal = (cython.cast(cython.double, i) * constDeg2RadBy360) / cython.cast(cython.double, DCPeriodInt)
+                    realPart += sin(tempReal) * smoothPrice[idx]
+                    imagPart += cos(tempReal) * smoothPrice[idx]
+                    if idx == 0:
+                        idx = SMOOTH_PRICE_SIZE - 1
+                    else:
+                        idx -= 1
+
+                tempReal = fabs(imagPart)
+                if tempReal > 0.0:
+                    DCPhase = atan(realPart / imagPart) * rad2Deg
+                elif tempReal <= 0.01:
+                    if realPart < 0.0:
+                        DCPhase -= 90.0
+                    elif realPart > 0.0:
+                        DCPhase += 90.0
+                DCPhase += 90.0
+                # Compensate for the one bar lag of the smoother
+                DCPhase += 360.0 / smoothPeriod
+                if imagPart < 0.0:
+                    DCPhase += 180.0
+                if DCPhase > 315.0:
+                    DCPhase -= 360.0
+
+                if outDCPhase is not None and today >= firstDCPhase:
+                    outDCPhase[today - startIdx] = DCPhase
+
+            if doSine:
+                prevSine = sine
+                prevLeadSine = leadSine
+                sine = sin(DCPhase * deg2Rad)
+                leadSine = sin((DCPhase + 45) * deg2Rad)
+                if today >= firstSine:
+                    if outSine is not None:
+                        outSine[today - startIdx] = sine
+                    if outLeadSine is not None:
+                        outLeadSine[today - startIdx] = leadSine
+
+            if doTrendline:
+                # Instantaneous trendline, averaged over the dominant cycle
+                idx = today
+                tempReal = 0.0
+                for i in range(DCPeriodInt):
+                    tempReal += inReal[idx]
+                    idx -= 1
+                if DCPeriodInt > 0:
+                    tempReal = tempReal / cython.cast(cython.double, DCPeriodInt)
+                trendline = (4.0 * tempReal + 3.0 * iTrend1 + 2.0 * iTrend2 + iTrend3) / 10.0
+                iTrend3 = iTrend2
+                iTrend2 = iTrend1
+                iTrend1 = tempReal
+                if outTrendline is not None and today >= firstTrendline:
+                    outTrendline[today - startIdx] = trendline
+
+            if doTrendMode:
+                trend = 1
+                # A sine/leadsine crossing starts a cycle mode
+                if (sine > leadSine and prevSine <= prevLeadSine) or (sine < leadSine and prevSine >= prevLeadSine):
+                    daysInTrend = 0
+                    trend = 0
+                daysInTrend += 1
+                if daysInTrend < (0.5 * smoothPeriod):
+                    trend = 0
+                tempReal = DCPhase - prevDCPhase
+                if smoothPeriod != 0.0 and tempReal > (0.67 * 360.0 / smoothPeriod) and tempReal < (1.5 * 360.0 / smoothPeriod):
+                    trend = 0
+                tempReal = smoothPrice[smoothPrice_Idx]
+                if trendline != 0.0 and fabs((tempReal - trendline) / trendline) >= 0.015:
+                    trend = 1
+                prevDCPhase = DCPhase
+                if today >= firstTrendMode:
+                    outTrendMode[today - startIdx] = trend
+
+            smoothPrice_Idx += 1
+            if smoothPrice_Idx == SMOOTH_PRICE_SIZE:
+                smoothPrice_Idx = 0
+
+        today += 1
+
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("real")
+def HT_ALL(real: np.ndarray, out: Optional[tuple] = None):
+    """
+    HT_ALL(real)
+
+    Hilbert Transform cycle family in one pass (Cycle Indicators)
+
+    Smooths the price and runs the Hilbert transform once and returns every
+    value the HT_* functions derive from it, each aligned like its
+    standalone function.
+
+    Inputs:
+        real: (any ndarray) Input series
+    Outputs:
+        dcperiod, dcphase, inphase, quadrature, sine, leadsine, trendline,
+        trendmode
+    """
+    real = check_array(real)
+    length: cython.Py_ssize_t = real.shape[0]
+    startIdx: cython.Py_ssize_t = check_begidx1(real)
+    endIdx: cython.Py_ssize_t = length - startIdx - 1
+
+    outDCPeriod = check_out(out, real, 0, 8)
+    outDCPhase = check_out(out, real, 1, 8)
+    outInPhase = check_out(out, real, 2, 8)
+    outQuadrature = check_out(out, real, 3, 8)
+    outSine = check_out(out, real, 4, 8)
+    outLeadSine = check_out(out, real, 5, 8)
+    outTrendline = check_out(out, real, 6, 8)
+    outTrendMode = check_out(out, real, 7, 8, fill=0, dtype=np.intp)
+
+    TA_INT_HT(
+        0,
+        0,
+        endIdx,
+        real[startIdx:],
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPERIOD),
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_PHASOR),
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPHASE),
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_SINE),
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDLINE),
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDMODE),
+        outDCPeriod[startIdx:],
+        outDCPhase[startIdx:],
+        outInPhase[startIdx:],
+        outQuadrature[startIdx:],
+        outSine[startIdx:],
+        outLeadSine[startIdx:],
+        outTrendline[startIdx:],
+        outTrendMode[startIdx:],
+    )
+    return outDCPeriod, outDCPhase, outInPhase, outQuadrature, outSine, outLeadSine, outTrendline, outTrendMode
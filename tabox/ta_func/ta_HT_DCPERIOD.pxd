@@ -0,0 +1,11 @@
+from tabox.ta_func.ta_HT_ALL cimport TA_INT_HT
+
+cpdef Py_ssize_t TA_HT_DCPERIOD_Lookback()
+cpdef int TA_HT_DCPERIOD(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inReal,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal,
+)
@@ -0,0 +1,113 @@
+import cython
+from typing import Optional
+import numpy as np
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
+from ..retcode import TA_RetCode
+from ..settings import TA_FUNC_NO_RANGE_CHECK
+from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
+from .ta_HT_ALL import TA_INT_HT
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_HT_DCPERIOD_Lookback() -> cython.Py_ssize_t:
+    """
+    TA_HT_DCPERIOD_Lookback - Hilbert Transform - Dominant Cycle Period Lookback
+
+    Returns:
+        Number of lookback periods
+    """
+    # See TA_MAMA_Lookback for an explanation of the "32".
+    return 32 + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPERIOD)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_HT_DCPERIOD(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """
+    TA_HT_DCPERIOD - Hilbert Transform - Dominant Cycle Period
+
+    Input  = double
+    Output = double
+    """
+    lookbackTotal: cython.Py_ssize_t
+
+    # Parameter validation
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inReal is None or outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPERIOD)
+    lookbackTotal = 32 + unstablePeriod
+
+    # Adjust start index if insufficient data
+    if startIdx < lookbackTotal:
+        startIdx = lookbackTotal
+
+    # Check if output is possible
+    if startIdx > endIdx:
+        outBegIdx[0] = 0
+        outNBElement[0] = 0
+        return TA_RetCode.TA_SUCCESS
+
+    TA_INT_HT(
+        startIdx - lookbackTotal,
+        startIdx,
+        endIdx,
+        inReal,
+        unstablePeriod,
+        0,
+        0,
+        0,
+        0,
+        0,
+        outReal,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    )
+
+    outBegIdx[0] = startIdx
+    outNBElement[0] = endIdx - startIdx + 1
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("real")
+def HT_DCPERIOD(real: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    HT_DCPERIOD(real)
+
+    Hilbert Transform - Dominant Cycle Period (Cycle Indicators)
+
+    Inputs:
+        real: (any ndarray) Input price data
+    Outputs:
+        real: Dominant cycle period in bars
+    """
+    real = check_array(real)
+    length: cython.Py_ssize_t = real.shape[0]
+
+    startIdx: cython.Py_ssize_t = check_begidx1(real)
+    endIdx: cython.Py_ssize_t = length - startIdx - 1
+    lookback: cython.Py_ssize_t = startIdx + TA_HT_DCPERIOD_Lookback()
+
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
+
+    TA_HT_DCPERIOD(0, endIdx, real[startIdx:], outBegIdx, outNBElement, outReal[lookback:])
+    return outReal
@@ -0,0 +1,12 @@
+from tabox.ta_func.ta_HT_ALL cimport TA_INT_HT
+
+cpdef Py_ssize_t TA_HT_PHASOR_Lookback()
+cpdef int TA_HT_PHASOR(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inReal,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outInPhase,
+    double[::1] outQuadrature,
+)
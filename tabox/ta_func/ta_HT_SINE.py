@@ -0,0 +1,122 @@
+import cython
+from typing import Optional
+import numpy as np
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
+from ..retcode import TA_RetCode
+from ..settings import TA_FUNC_NO_RANGE_CHECK
+from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
+from .ta_HT_ALL import TA_INT_HT
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_HT_SINE_Lookback() -> cython.Py_ssize_t:
+    """
+    TA_HT_SINE_Lookback - Hilbert Transform - SineWave Lookback
+
+    Returns:
+        Number of lookback periods
+    """
+    # 31 inputs are skipped
+    # +32 outputs are skipped to account for misc lookback
+    # ---
+    # 63 Total Lookback
+    #
+    # 31 is for compatibility with Tradestation.
+    # See TA_MAMA_Lookback for an explanation of the "32".
+    return 63 + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_SINE)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_HT_SINE(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outSine: cython.double[::1],
+    outLeadSine: cython.double[::1],
+) -> cython.int:
+    """
+    TA_HT_SINE - Hilbert Transform - SineWave
+
+    Input  = double
+    Output = double, double
+    """
+    lookbackTotal: cython.Py_ssize_t
+
+    # Parameter validation
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inReal is None or outSine is None or outLeadSine is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_SINE)
+    lookbackTotal = 63 + unstablePeriod
+
+    # Adjust start index if insufficient data
+    if startIdx < lookbackTotal:
+        startIdx = lookbackTotal
+
+    # Check if output is possible
+    if startIdx > endIdx:
+        outBegIdx[0] = 0
+        outNBElement[0] = 0
+        return TA_RetCode.TA_SUCCESS
+
+    TA_INT_HT(
+        startIdx - lookbackTotal,
+        startIdx,
+        endIdx,
+        inReal,
+        0,
+        0,
+        0,
+        unstablePeriod,
+        0,
+        0,
+        None,
+        None,
+        None,
+        None,
+        outSine,
+        outLeadSine,
+        None,
+        None,
+    )
+
+    outBegIdx[0] = startIdx
+    outNBElement[0] = endIdx - startIdx + 1
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("real")
+def HT_SINE(real: np.ndarray, out: Optional[tuple] = None):
+    """
+    HT_SINE(real)
+
+    Hilbert Transform - SineWave (Cycle Indicators)
+
+    Inputs:
+        real: (any ndarray) Input price data
+    Outputs:
+        sine: Sine of the dominant cycle phase
+        leadsine: Sine of the phase advanced by 45 degrees
+    """
+    real = check_array(real)
+    length: cython.Py_ssize_t = real.shape[0]
+
+    startIdx: cython.Py_ssize_t = check_begidx1(real)
+    endIdx: cython.Py_ssize_t = length - startIdx - 1
+    lookback: cython.Py_ssize_t = startIdx + TA_HT_SINE_Lookback()
+
+    outSine = check_out(out, real, 0, 2)
+    outLeadSine = check_out(out, real, 1, 2)
+    outBegIdx, outNBElement = index_buffers()
+
+    TA_HT_SINE(0, endIdx, real[startIdx:], outBegIdx, outNBElement, outSine[lookback:], outLeadSine[lookback:])
+    return outSine, outLeadSine
@@ -0,0 +1,119 @@
+import cython
+from typing import Optional
+import numpy as np
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
+from ..retcode import TA_RetCode
+from ..settings import TA_FUNC_NO_RANGE_CHECK
+from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
+from .ta_HT_ALL import TA_INT_HT
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_HT_TRENDMODE_Lookback() -> cython.Py_ssize_t:
+    """
+    TA_HT_TRENDMODE_Lookback - Hilbert Transform - Trend vs Cycle Mode Lookback
+
+    Returns:
+        Number of lookback periods
+    """
+    # 31 inputs are skipped
+    # +32 outputs are skipped to account for misc lookback
+    # ---
+    # 63 Total Lookback
+    #
+    # 31 is for compatibility with Tradestation.
+    # See TA_MAMA_Lookback for an explanation of the "32".
+    return 63 + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDMODE)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_HT_TRENDMODE(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outInteger: cython.Py_ssize_t[::1],
+) -> cython.int:
+    """
+    TA_HT_TRENDMODE - Hilbert Transform - Trend vs Cycle Mode
+
+    Input  = double
+    Output = int
+    """
+    lookbackTotal: cython.Py_ssize_t
+
+    # Parameter validation
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inReal is None or outInteger is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDMODE)
+    lookbackTotal = 63 + unstablePeriod
+
+    # Adjust start index if insufficient data
+    if startIdx < lookbackTotal:
+        startIdx = lookbackTotal
+
+    # Check if output is possible
+    if startIdx > endIdx:
+        outBegIdx[0] = 0
+        outNBElement[0] = 0
+        return TA_RetCode.TA_SUCCESS
+
+    TA_INT_HT(
+        startIdx - lookbackTotal,
+        startIdx,
+        endIdx,
+        inReal,
+        0,
+        0,
+        0,
+        0,
+        0,
+        unstablePeriod,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        outInteger,
+    )
+
+    outBegIdx[0] = startIdx
+    outNBElement[0] = endIdx - startIdx + 1
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("real")
+def HT_TRENDMODE(real: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    HT_TRENDMODE(real)
+
+    Hilbert Transform - Trend vs Cycle Mode (Cycle Indicators)
+
+    Inputs:
+        real: (any ndarray) Input price data
+    Outputs:
+        integer: 1 in a trend mode, 0 in a cycle mode
+    """
+    real = check_array(real)
+    length: cython.Py_ssize_t = real.shape[0]
+
+    startIdx: cython.Py_ssize_t = check_begidx1(real)
+    endIdx: cython.Py_ssize_t = length - startIdx - 1
+    lookback: cython.Py_ssize_t = startIdx + TA_HT_TRENDMODE_Lookback()
+
+    outInteger = check_out(out, real, fill=0, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
+
+    TA_HT_TRENDMODE(0, endIdx, real[startIdx:], outBegIdx, outNBElement, outInteger[lookback:])
+    return outInteger
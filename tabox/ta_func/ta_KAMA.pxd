@@ -1,8 +1,25 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_utils cimport kernel_rows
 from .ta_utility cimport TA_IS_ZERO
 
 cdef extern from "math.h":
-    double fabs(double x)
+    double fabs(double x) nogil
+    bint isnan(double x) nogil
 
 cpdef Py_ssize_t TA_KAMA_Lookback(int optInTimePeriod)
-cpdef int TA_KAMA(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+cdef int TA_KAMA_nogil(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, int unstablePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef int TA_KAMA(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+
+cdef class KAMAState:
+    cdef public tuple params
+    cdef public int timeperiod
+    cdef public Py_ssize_t lookback
+    cdef public Py_ssize_t today
+    cdef public object window
+    cdef public double sumROC1
+    cdef public double trailingValue
+    cdef public double prevKAMA
+
+cpdef int TA_KAMA_Resume(const double[::1] inReal, KAMAState state, double[::1] outReal)
+cdef int TA_KAMA_Row(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInReal, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef Py_ssize_t TA_KAMA_Rows(const double[:, ::1] inReal, int optInTimePeriod, double[:, ::1] outReal)
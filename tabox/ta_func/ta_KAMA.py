@@ -1,15 +1,17 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
+    from .ta_utils import kernel_rows
 
 if not cython.compiled:
-    from math import fabs
+    from math import fabs, isnan
 
 if not cython.compiled:
     from .ta_utility import TA_IS_ZERO
@@ -36,15 +38,20 @@ def TA_KAMA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_KAMA(
+def TA_KAMA_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
+    """KAMA loop without parameter checks, runs without the GIL
+
+    The KAMA unstable period is passed in by the caller.
+    """
     # Local variables
     constMax: cython.double = 2.0 / (30.0 + 1.0)
     constDiff: cython.double = 2.0 / (2.0 + 1.0) - constMax
@@ -61,26 +68,12 @@ def TA_KAMA(
     trailingValue: cython.double
     period: cython.int = optInTimePeriod
 
-    # Parameter validation
-    if not TA_FUNC_NO_RANGE_CHECK:
-        # Validate start and end indices
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-
-        # Validate time period parameter
-        if period == TA_INTEGER_DEFAULT:
-            period = 30
-        elif period < 2 or period > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-
     # Set default return value
     outBegIdx[0] = 0
     outNBElement[0] = 0
 
     # Calculate the minimum required data
-    lookbackTotal = period + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_KAMA)
+    lookbackTotal = period + unstablePeriod
 
     # Adjust the start index to ensure there is enough historical data
     if startIdx < lookbackTotal:
@@ -88,7 +81,7 @@ def TA_KAMA(
 
     # Check if there is data to process
     if startIdx > endIdx:
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Initialize variables and process lookback period
     sumROC1 = 0.0
@@ -192,10 +185,180 @@ def TA_KAMA(
     # Set the output element count
     outNBElement[0] = outIdx
 
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_KAMA(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    period: cython.int = optInTimePeriod
+
+    # Parameter validation
+    if not TA_FUNC_NO_RANGE_CHECK:
+        # Validate start and end indices
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+
+        # Validate time period parameter
+        if period == TA_INTEGER_DEFAULT:
+            period = 30
+        elif period < 2 or period > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_KAMA)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_KAMA_nogil(
+            startIdx, endIdx, inReal, period, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
+
+
+class KAMAState:
+    """Terminal state of a KAMA, the seed of the next call
+
+    ``window`` holds the last ``timeperiod`` inputs, ring-indexed by
+    ``today``, ``sumROC1`` the sum of their absolute one-bar changes and
+    ``prevKAMA`` the adaptive average.
+    """
+    def __init__(self, timeperiod: cython.int):
+        lookback: cython.Py_ssize_t = TA_KAMA_Lookback(timeperiod)
+        if lookback < 0:
+            raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
+        self.params = (timeperiod,)
+        self.timeperiod: cython.int = 30 if timeperiod == TA_INTEGER_DEFAULT else timeperiod
+        self.lookback: cython.Py_ssize_t = lookback
+        self.today: cython.Py_ssize_t = 0
+        self.window = np.zeros(self.timeperiod)
+        self.sumROC1: cython.double = 0.0
+        self.trailingValue: cython.double = 0.0
+        self.prevKAMA: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_KAMA_Resume(inReal: cython.const[cython.double][::1], state: KAMAState, outReal: cython.double[::1]) -> cython.int:
+    """KAMA loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    constMax: cython.double = 2.0 / (30.0 + 1.0)
+    constDiff: cython.double = 2.0 / (2.0 + 1.0) - constMax
+    period: cython.int = state.timeperiod
+    lookbackTotal: cython.Py_ssize_t = state.lookback
+    today: cython.Py_ssize_t = state.today
+    window: cython.double[::1] = state.window
+    sumROC1: cython.double = state.sumROC1
+    trailingValue: cython.double = state.trailingValue
+    prevKAMA: cython.double = state.prevKAMA
+    tempReal: cython.double
+    tempReal2: cython.double
+    prevValue: cython.double
+    periodROC: cython.double
+    length: cython.Py_ssize_t = inReal.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first value that is not NaN
+    if today == 0:
+        while i < length and isnan(inReal[i]):
+            i += 1
+
+    while i < length:
+        tempReal = inReal[i]
+        if today > 0:
+            # window[today % period] is still the input period bars ago
+            tempReal2 = window[today % period]
+            prevValue = window[(today - 1) % period]
+            if today <= period:
+                # Initial price change total
+                sumROC1 += fabs(prevValue - tempReal)
+            if today >= period:
+                if today == period:
+                    prevKAMA = prevValue
+                else:
+                    # Adjust the price change total
+                    sumROC1 -= fabs(trailingValue - tempReal2)
+                    sumROC1 += fabs(tempReal - prevValue)
+                periodROC = tempReal - tempReal2
+                trailingValue = tempReal2
+
+                # Calculate the efficiency ratio
+                if sumROC1 <= fabs(periodROC) or TA_IS_ZERO(sumROC1):
+                    tempReal2 = 1.0
+                else:
+                    tempReal2 = fabs(periodROC / sumROC1)
+
+                # Calculate the smoothing constant
+                tempReal2 = (tempReal2 * constDiff) + constMax
+                tempReal2 *= tempReal2
+
+                prevKAMA = ((tempReal - prevKAMA) * tempReal2) + prevKAMA
+                if today >= lookbackTotal:
+                    outReal[i] = prevKAMA
+        window[today % period] = tempReal
+        today += 1
+        i += 1
+
+    state.today = today
+    state.sumROC1 = sumROC1
+    state.trailingValue = trailingValue
+    state.prevKAMA = prevKAMA
     return TA_RetCode.TA_SUCCESS
 
 
-def KAMA(real: np.ndarray, timeperiod: int = 30):
+def TA_KAMA_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_KAMA_nogil as the row_kernel of TA_KAMA_Rows"""
+    return TA_KAMA_nogil(startIdx, endIdx, inReal, optInTimePeriod, unstablePeriod,
+                         outBegIdx, outNBElement, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_KAMA_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """KAMA of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``KAMA``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    lookback: cython.Py_ssize_t = TA_KAMA_Lookback(optInTimePeriod)
+    if optInTimePeriod == TA_INTEGER_DEFAULT:
+        optInTimePeriod = 30
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_KAMA)
+    return kernel_rows(TA_KAMA_Row, inReal, lookback, optInTimePeriod, 0.0, unstablePeriod, 0, outReal)
+
+
+@rowwise("real", rows=TA_KAMA_Rows)
+def KAMA(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None,
+         state: Optional[KAMAState] = None, return_state: bool = False):
     """KAMA(real, timeperiod=30)
 
     Kaufman Adaptive Moving Average
@@ -205,18 +368,26 @@ def KAMA(real: np.ndarray, timeperiod: int = 30):
         timeperiod: (int) Number of period
     Outputs:
         kama: (ndarray) Kaufman Adaptive Moving Average
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(kama, state)``.
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    if state is not None or return_state:
+        state = resume_state(state, KAMAState, timeperiod)
+        outReal = check_out(out, real)
+        TA_KAMA_Resume(real, state, outReal)
+        return (outReal, state) if return_state else outReal
+
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_KAMA_Lookback(timeperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_KAMA(
         0,
@@ -1,3 +1,9 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+cdef extern from "math.h":
+    cpdef double atan(double x)
+
 cpdef Py_ssize_t TA_LINEARREG_Lookback(int optInTimePeriod)
-cpdef int TA_LINEARREG(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
\ No newline at end of file
+cpdef int TA_LINEARREG(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+cpdef int TA_INT_LINEARREG(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outLinearReg, double[::1] outSlope, double[::1] outIntercept, double[::1] outAngle, double[::1] outTSF)
+cpdef Py_ssize_t TA_LINEARREG_ALL_Lookback(int optInTimePeriod)
+cpdef int TA_LINEARREG_ALL(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outLinearReg, double[::1] outSlope, double[::1] outIntercept, double[::1] outAngle, double[::1] outTSF)
\ No newline at end of file
@@ -1,9 +1,11 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
+    from math import atan
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
 
@@ -29,51 +31,41 @@ def TA_LINEARREG_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_LINEARREG(
+@cython.cdivision(True)
+def TA_INT_LINEARREG(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
-    outReal: cython.double[::1],
+    outLinearReg: Optional[cython.double[::1]],
+    outSlope: Optional[cython.double[::1]],
+    outIntercept: Optional[cython.double[::1]],
+    outAngle: Optional[cython.double[::1]],
+    outTSF: Optional[cython.double[::1]],
 ) -> cython.int:
     """
-    TA_LINEARREG - Linear Regression
-
-    Input  = double
-    Output = double
+    Rolling linear regression shared by the LINEARREG family.
 
-    Optional Parameters
-    -------------------
-    optInTimePeriod:(From 2 to 100000)
-       Number of period
+    Any of the outputs may be None. SumY and SumXY are updated in O(1) per
+    bar, and recomputed from scratch once every optInTimePeriod bars so the
+    rounding error does not build up. The total cost stays O(n).
     """
-    # 参数检查
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        if inReal is None or outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
     outIdx: cython.Py_ssize_t = 0
     today: cython.Py_ssize_t
     lookbackTotal: cython.Py_ssize_t
     SumX: cython.double
-    SumXY: cython.double
-    SumY: cython.double
+    SumXY: cython.double = 0.0
+    SumY: cython.double = 0.0
     SumXSqr: cython.double
     Divisor: cython.double
     m: cython.double
     b: cython.double
     i: cython.Py_ssize_t
     tempValue1: cython.double
+    resync: cython.Py_ssize_t = 0
+    PI: cython.double = 3.141592653589793
 
     """
     Linear Regression is a concept also known as the
@@ -94,7 +86,7 @@ def TA_LINEARREG(
     """
 
     # 调整startIdx以考虑回溯期
-    lookbackTotal = TA_LINEARREG_Lookback(optInTimePeriod)
+    lookbackTotal = optInTimePeriod - 1
 
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
@@ -114,19 +106,36 @@ def TA_LINEARREG(
 
     # 主要计算循环
     while today <= endIdx:
-        SumXY = 0.0
-        SumY = 0.0
-        for i in range(optInTimePeriod - 1, -1, -1):
-            tempValue1 = inReal[today - i]
-            SumY += tempValue1
-            SumXY += cython.cast(cython.double, i) * tempValue1
+        if resync == 0:
+            # Full rescan of the window, x is the age of the bar.
+            SumXY = 0.0
+            SumY = 0.0
+            for i in range(optInTimePeriod - 1, -1, -1):
+                tempValue1 = inReal[today - i]
+                SumY += tempValue1
+                SumXY += cython.cast(cython.double, i) * tempValue1
+            resync = optInTimePeriod
+        else:
+            # Every bar gets one period older and the oldest one leaves.
+            tempValue1 = inReal[today - optInTimePeriod]
+            SumXY += SumY - optInTimePeriod * tempValue1
+            SumY += inReal[today] - tempValue1
+        resync -= 1
 
         # 计算斜率和截距
         m = (optInTimePeriod * SumXY - SumX * SumY) / Divisor
         b = (SumY - m * SumX) / cython.cast(cython.double, optInTimePeriod)
 
-        # 计算线性回归值并存储
-        outReal[outIdx] = b + m * cython.cast(cython.double, optInTimePeriod - 1)
+        if outLinearReg is not None:
+            outLinearReg[outIdx] = b + m * cython.cast(cython.double, optInTimePeriod - 1)
+        if outSlope is not None:
+            outSlope[outIdx] = m
+        if outIntercept is not None:
+            outIntercept[outIdx] = b
+        if outAngle is not None:
+            outAngle[outIdx] = atan(m) * (180.0 / PI)
+        if outTSF is not None:
+            outTSF[outIdx] = b + m * cython.cast(cython.double, optInTimePeriod)
         outIdx += 1
         today += 1
 
@@ -136,7 +145,49 @@ def TA_LINEARREG(
     return TA_RetCode.TA_SUCCESS
 
 
-def LINEARREG(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_LINEARREG(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """
+    TA_LINEARREG - Linear Regression
+
+    Input  = double
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 2 to 100000)
+       Number of period
+    """
+    # 参数检查
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if inReal is None or outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    return TA_INT_LINEARREG(
+        startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement,
+        outReal, None, None, None, None,
+    )
+
+
+@rowwise("real")
+def LINEARREG(real: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     LINEARREG(real[, timeperiod=14])
 
@@ -161,9 +212,8 @@ def LINEARREG(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_LINEARREG_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_LINEARREG(
         0,
@@ -177,3 +227,104 @@ def LINEARREG(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
     if retCode != TA_RetCode.TA_SUCCESS:
         return outReal
     return outReal
+
+
+def TA_LINEARREG_ALL_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
+    """
+    TA_LINEARREG_ALL_Lookback - Same lookback for the five outputs
+    """
+    return TA_LINEARREG_Lookback(optInTimePeriod)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_LINEARREG_ALL(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outLinearReg: Optional[cython.double[::1]],
+    outSlope: Optional[cython.double[::1]],
+    outIntercept: Optional[cython.double[::1]],
+    outAngle: Optional[cython.double[::1]],
+    outTSF: Optional[cython.double[::1]],
+) -> cython.int:
+    """
+    TA_LINEARREG_ALL - LINEARREG, LINEARREG_SLOPE, LINEARREG_INTERCEPT,
+    LINEARREG_ANGLE and TSF in a single pass
+
+    Input  = double
+    Output = double, double, double, double, double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 2 to 100000)
+       Number of period
+    """
+    # Parameter checks
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if inReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    return TA_INT_LINEARREG(
+        startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement,
+        outLinearReg, outSlope, outIntercept, outAngle, outTSF,
+    )
+
+
+@rowwise("real")
+def LINEARREG_ALL(real: np.ndarray, timeperiod: int = 14, out: Optional[tuple] = None):
+    """
+    LINEARREG_ALL(real[, timeperiod=14])
+
+    Linear Regression family in one pass (Statistic Functions)
+
+    Computes the regression line y = b + m*x once per bar and returns every
+    value the LINEARREG family derives from it.
+
+    Inputs:
+        real: (any ndarray) Input series
+    Parameters:
+        timeperiod: 14 Number of periods
+    Outputs:
+        linearreg, slope, intercept, angle, tsf
+    """
+    real = check_array(real)
+    check_timeperiod(timeperiod)
+
+    length: cython.Py_ssize_t = real.shape[0]
+    startIdx: cython.Py_ssize_t = check_begidx1(real)
+    endIdx: cython.Py_ssize_t = length - startIdx - 1
+    lookback: cython.Py_ssize_t = startIdx + TA_LINEARREG_Lookback(timeperiod)
+
+    outLinearReg = check_out(out, real, 0, 5)
+    outSlope = check_out(out, real, 1, 5)
+    outIntercept = check_out(out, real, 2, 5)
+    outAngle = check_out(out, real, 3, 5)
+    outTSF = check_out(out, real, 4, 5)
+    outBegIdx, outNBElement = index_buffers()
+
+    TA_LINEARREG_ALL(
+        0,
+        endIdx,
+        real[startIdx:],
+        timeperiod,
+        outBegIdx,
+        outNBElement,
+        outLinearReg[lookback:],
+        outSlope[lookback:],
+        outIntercept[lookback:],
+        outAngle[lookback:],
+        outTSF[lookback:],
+    )
+    return outLinearReg, outSlope, outIntercept, outAngle, outTSF
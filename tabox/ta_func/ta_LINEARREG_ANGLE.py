@@ -1,13 +1,13 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
+from .ta_LINEARREG import TA_INT_LINEARREG
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
-if not cython.compiled:
-    from math import atan
 
 def TA_LINEARREG_ANGLE_Lookback(
     optInTimePeriod: cython.int,
@@ -34,7 +34,7 @@ def TA_LINEARREG_ANGLE_Lookback(
 def TA_LINEARREG_ANGLE(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -51,7 +51,6 @@ def TA_LINEARREG_ANGLE(
     optInTimePeriod:(From 2 to 100000)
        Number of period
     """
-    PI: cython.double = 3.141592653589793
     # 参数检查
     if not TA_FUNC_NO_RANGE_CHECK:
         if startIdx < 0:
@@ -65,52 +64,14 @@ def TA_LINEARREG_ANGLE(
         if inReal is None or outReal is None:
             return TA_RetCode.TA_BAD_PARAM
 
-    # 计算回溯期
-    lookbackTotal: cython.Py_ssize_t = TA_LINEARREG_ANGLE_Lookback(optInTimePeriod)
-
-    # 调整起始索引以考虑回溯期
-    if startIdx < lookbackTotal:
-        startIdx = lookbackTotal
-
-    # 确保有数据可计算
-    if startIdx > endIdx:
-        outBegIdx[0] = 0
-        outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+    return TA_INT_LINEARREG(
+        startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement,
+        None, None, None, outReal, None,
+    )
 
-    outIdx: cython.Py_ssize_t = 0  # 输出索引
-    today: cython.Py_ssize_t = startIdx
 
-    # 预计算常数项
-    SumX: cython.double = optInTimePeriod * (optInTimePeriod - 1) * 0.5
-    SumXSqr: cython.double = (
-        optInTimePeriod * (optInTimePeriod - 1) * (2 * optInTimePeriod - 1) / 6
-    )
-    Divisor: cython.double = SumX * SumX - optInTimePeriod * SumXSqr
-
-    # 主计算循环
-    while today <= endIdx:
-        SumXY: cython.double = 0.0
-        SumY: cython.double = 0.0
-        i: cython.Py_ssize_t = optInTimePeriod - 1
-        for i in range(optInTimePeriod - 1, -1, -1):
-            tempValue1: cython.double = inReal[today - i]
-            SumY += tempValue1
-            SumXY += cython.cast(cython.double, i) * tempValue1
-
-        # 计算斜率 m
-        m: cython.double = (optInTimePeriod * SumXY - SumX * SumY) / Divisor
-        # 计算角度并转换为度数
-        outReal[outIdx] = atan(m) * (180.0 / PI)
-        outIdx += 1
-        today += 1
-
-    outBegIdx[0] = startIdx
-    outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
-
-
-def LINEARREG_ANGLE(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+@rowwise("real")
+def LINEARREG_ANGLE(real: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     LINEARREG_ANGLE(real[, timeperiod=14])
 
@@ -135,9 +96,8 @@ def LINEARREG_ANGLE(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_LINEARREG_ANGLE_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_LINEARREG_ANGLE(
         0,
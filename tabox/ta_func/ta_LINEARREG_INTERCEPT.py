@@ -1,6 +1,8 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
+from .ta_LINEARREG import TA_INT_LINEARREG
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -32,7 +34,7 @@ def TA_LINEARREG_INTERCEPT_Lookback(optInTimePeriod: cython.int) -> cython.Py_ss
 def TA_LINEARREG_INTERCEPT(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -61,66 +63,14 @@ def TA_LINEARREG_INTERCEPT(
         if inReal is None or outReal is None:
             return TA_RetCode.TA_BAD_PARAM
 
-    # 局部变量
-    outIdx: cython.Py_ssize_t = 0
-    today: cython.Py_ssize_t
-    lookbackTotal: cython.Py_ssize_t
-    SumX: cython.double
-    SumXY: cython.double
-    SumY: cython.double
-    SumXSqr: cython.double
-    Divisor: cython.double
-    m: cython.double
-    i: cython.Py_ssize_t
-    tempValue1: cython.double
-
-    # 计算回溯期
-    lookbackTotal = TA_LINEARREG_INTERCEPT_Lookback(optInTimePeriod)
-
-    # 调整起始索引
-    if startIdx < lookbackTotal:
-        startIdx = lookbackTotal
-
-    # 检查是否有数据需要处理
-    if startIdx > endIdx:
-        outBegIdx[0] = 0
-        outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
-
-    # 预计算固定值
-    SumX = optInTimePeriod * (optInTimePeriod - 1) * 0.5
-    SumXSqr = optInTimePeriod * (optInTimePeriod - 1) * (2 * optInTimePeriod - 1) / 6
-    Divisor = SumX * SumX - optInTimePeriod * SumXSqr
-
-    today = startIdx
-
-    # 主计算循环
-    while today <= endIdx:
-        SumXY = 0.0
-        SumY = 0.0
-        for i in range(optInTimePeriod - 1, -1, -1):
-            tempValue1 = inReal[today - i]
-            SumY += tempValue1
-            SumXY += cython.cast(cython.double, i) * tempValue1
-
-        # 计算斜率 m
-        m = (optInTimePeriod * SumXY - SumX * SumY) / Divisor
-
-        # 计算截距 b 并存储到输出数组
-        outReal[outIdx] = (SumY - m * SumX) / cython.cast(
-            cython.double, optInTimePeriod
-        )
-        outIdx += 1
-        today += 1
-
-    # 设置输出参数
-    outBegIdx[0] = startIdx
-    outNBElement[0] = outIdx
-
-    return TA_RetCode.TA_SUCCESS
-
-
-def LINEARREG_INTERCEPT(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    return TA_INT_LINEARREG(
+        startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement,
+        None, None, outReal, None, None,
+    )
+
+
+@rowwise("real")
+def LINEARREG_INTERCEPT(real: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """LINEARREG_INTERCEPT(real[, timeperiod=14])
 
     Linear Regression Intercept (Overlap Studies)
@@ -147,9 +97,8 @@ def LINEARREG_INTERCEPT(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_LINEARREG_INTERCEPT_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_LINEARREG_INTERCEPT(
         0,
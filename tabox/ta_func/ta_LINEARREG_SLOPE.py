@@ -1,6 +1,8 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
+from .ta_LINEARREG import TA_INT_LINEARREG
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -33,7 +35,7 @@ def TA_LINEARREG_SLOPE_Lookback(
 def TA_LINEARREG_SLOPE(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -63,72 +65,14 @@ def TA_LINEARREG_SLOPE(
         if inReal is None or outReal is None:
             return TA_RetCode.TA_BAD_PARAM
 
-    """
-    Linear Regression is a concept also known as the
-    "least squares method" or "best fit." Linear
-    Regression attempts to fit a straight line between
-    several data points in such a way that distance
-    between each data point and the line is minimized.
-
-    For each point, a straight line over the specified
-    previous bar period is determined in terms
-    of y = b + m*x:
-
-    TA_LINEARREG          : Returns b+m*(period-1)
-    TA_LINEARREG_SLOPE    : Returns 'm'
-    TA_LINEARREG_ANGLE    : Returns 'm' in degree.
-    TA_LINEARREG_INTERCEPT: Returns 'b'
-    TA_TSF                : Returns b+m*(period)
-    """
+    return TA_INT_LINEARREG(
+        startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement,
+        None, outReal, None, None, None,
+    )
+
 
-    # 调整startIdx以考虑回溯期
-    lookbackTotal: cython.Py_ssize_t = TA_LINEARREG_SLOPE_Lookback(optInTimePeriod)
-    if startIdx < lookbackTotal:
-        startIdx = lookbackTotal
-
-    # 确保仍有数据可评估
-    if startIdx > endIdx:
-        outBegIdx[0] = 0
-        outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
-
-    outIdx: cython.Py_ssize_t = 0  # 输出索引
-    today: cython.Py_ssize_t = startIdx
-
-    # 预计算固定值
-    SumX: cython.double = optInTimePeriod * (optInTimePeriod - 1) * 0.5
-    SumXSqr: cython.double = optInTimePeriod * (optInTimePeriod - 1) * (2 * optInTimePeriod - 1) / 6
-    Divisor: cython.double = SumX * SumX - optInTimePeriod * SumXSqr
-
-    SumXY: cython.double = 0.0
-    SumY: cython.double = 0.0
-    tempValue1: cython.double = 0.0
-    i: cython.Py_ssize_t = 0
-
-    # 处理除零情况
-    if Divisor == 0:
-        outBegIdx[0] = 0
-        outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
-
-    while today <= endIdx:
-        SumXY = 0.0
-        SumY = 0.0
-        for i in range(optInTimePeriod - 1, -1, -1):
-            tempValue1 = inReal[today - i]
-            SumY += tempValue1
-            SumXY += cython.cast(cython.double, i) * tempValue1
-
-        outReal[outIdx] = (optInTimePeriod * SumXY - SumX * SumY) / Divisor
-        outIdx += 1
-        today += 1
-
-    outBegIdx[0] = startIdx
-    outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
-
-
-def LINEARREG_SLOPE(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+@rowwise("real")
+def LINEARREG_SLOPE(real: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     LINEARREG_SLOPE(real[, timeperiod=14])
 
@@ -152,9 +96,8 @@ def LINEARREG_SLOPE(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_LINEARREG_SLOPE_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_LINEARREG_SLOPE(
         0,
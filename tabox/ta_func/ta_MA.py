@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_SMA import TA_SMA, TA_SMA_Lookback
 from .ta_EMA import TA_EMA, TA_EMA_Lookback
@@ -60,7 +61,7 @@ def TA_MA_Lookback(
 def TA_MA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInMAType: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
@@ -147,7 +148,8 @@ def TA_MA(
         return TA_RetCode.TA_BAD_PARAM
 
 
-def MA(real: np.ndarray, timeperiod: int = 30, matype: int = 0):
+@rowwise("real")
+def MA(real: np.ndarray, timeperiod: int = 30, matype: int = 0, out: Optional[np.ndarray] = None):
     """MA(real, timeperiod=30, matype=0)
 
     Moving Average
@@ -170,15 +172,14 @@ def MA(real: np.ndarray, timeperiod: int = 30, matype: int = 0):
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_MA_Lookback(timeperiod, matype)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_MA(
         0,
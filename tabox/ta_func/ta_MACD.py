@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_EMA import TA_EMA, TA_EMA_Lookback, TA_INT_EMA
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -40,7 +41,7 @@ def TA_MACD_Lookback(
 def TA_INT_MACD(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastPeriod: cython.int,
     optInSlowPeriod: cython.int,
     optInSignalPeriod_2: cython.int,
@@ -50,6 +51,7 @@ def TA_INT_MACD(
     outMACDSignal: cython.double[::1],
     outMACDHist: cython.double[::1],
 ) -> cython.int:
+    tempInteger: cython.Py_ssize_t
     # Make sure slow is really slower than the fast period
     if optInSlowPeriod < optInFastPeriod:
         tempInteger = optInSlowPeriod
@@ -82,11 +84,11 @@ def TA_INT_MACD(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
 
-    tempInteger: cython.Py_ssize_t = (endIdx - startIdx) + 1 + lookbackSignal
+    tempInteger = (endIdx - startIdx) + 1 + lookbackSignal
     fastEMABuffer: cython.double[::1] = np.zeros(tempInteger, dtype=np.float64)
     slowEMABuffer: cython.double[::1] = np.zeros(tempInteger, dtype=np.float64)
 
-    tempInteger: cython.Py_ssize_t = startIdx - lookbackSignal
+    tempInteger = startIdx - lookbackSignal
     outBegIdx1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
     outNbElement1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
     outBegIdx2: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
@@ -174,7 +176,7 @@ def TA_INT_MACD(
 def TA_MACD(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastPeriod: cython.int,
     optInSlowPeriod: cython.int,
     optInSignalPeriod: cython.int,
@@ -222,8 +224,9 @@ def TA_MACD(
     return retCode
 
 
+@rowwise("real")
 def MACD(
-    real: np.ndarray, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9
+    real: np.ndarray, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9, out: Optional[tuple] = None
 ):
     """MACD(real, fastperiod=12, slowperiod=26, signalperiod=9)
 
@@ -241,17 +244,16 @@ def MACD(
     """
     real = check_array(real)
 
-    outMACD = np.full_like(real, np.nan)
-    outMACDSignal = np.full_like(real, np.nan)
-    outMACDHist = np.full_like(real, np.nan)
+    outMACD = check_out(out, real, 0, 3)
+    outMACDSignal = check_out(out, real, 1, 3)
+    outMACDHist = check_out(out, real, 2, 3)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_MACD_Lookback(fastperiod, slowperiod, signalperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_MACD(
         0,
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_MA import TA_MA, TA_MA_Lookback
 
@@ -45,7 +46,7 @@ def TA_MACDEXT_Lookback(optInFastPeriod: cython.int, optInFastMAType: cython.int
 def TA_MACDEXT(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastPeriod: cython.int,
     optInFastMAType: cython.int,
     optInSlowPeriod: cython.int,
@@ -163,9 +164,11 @@ def TA_MACDEXT(
 
     return TA_RetCode.TA_SUCCESS
 
+@rowwise("real")
 def MACDEXT(real: np.ndarray, fastperiod: int = 12, fastmatype: int = 0,
            slowperiod: int = 26, slowmatype: int = 0,
-           signalperiod: int = 9, signalmatype: int = 0):
+           signalperiod: int = 9, signalmatype: int = 0,
+           out: Optional[tuple] = None):
     """MACDEXT(real, fastperiod=12, fastmatype=0, slowperiod=26, slowmatype=0, signalperiod=9, signalmatype=0)
 
     Moving Average Convergence/Divergence with controllable MA type
@@ -185,9 +188,9 @@ def MACDEXT(real: np.ndarray, fastperiod: int = 12, fastmatype: int = 0,
     """
     real = check_array(real)
 
-    outMACD = np.full_like(real, np.nan)
-    outMACDSignal = np.full_like(real, np.nan)
-    outMACDHist = np.full_like(real, np.nan)
+    outMACD = check_out(out, real, 0, 3)
+    outMACDSignal = check_out(out, real, 1, 3)
+    outMACDHist = check_out(out, real, 2, 3)
     length = real.shape[0]
 
     startIdx = check_begidx1(real)
@@ -195,8 +198,7 @@ def MACDEXT(real: np.ndarray, fastperiod: int = 12, fastmatype: int = 0,
     lookback = startIdx + TA_MACDEXT_Lookback(fastperiod, fastmatype, slowperiod, slowmatype,
                                             signalperiod, signalmatype)
 
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_MACDEXT(0, endIdx, real[startIdx:], fastperiod, fastmatype, slowperiod, slowmatype,
               signalperiod, signalmatype, outBegIdx, outNBElement,
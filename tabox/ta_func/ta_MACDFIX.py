@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_EMA import TA_EMA_Lookback, TA_INT_EMA
 from .ta_MACD import TA_MACD_Lookback, TA_INT_MACD
@@ -34,7 +35,7 @@ def TA_MACDFIX_Lookback(optInSignalPeriod: cython.int) -> cython.Py_ssize_t:
 def TA_MACDFIX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInSignalPeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -82,7 +83,8 @@ def TA_MACDFIX(
     
     return retCode
 
-def MACDFIX(real: np.ndarray, signalperiod: int = 9):
+@rowwise("real")
+def MACDFIX(real: np.ndarray, signalperiod: int = 9, out: Optional[tuple] = None):
     """MACD(real, signalperiod=9)
 
     Moving Average Convergence/Divergence Fix 12/26
@@ -98,17 +100,16 @@ def MACDFIX(real: np.ndarray, signalperiod: int = 9):
     """
     real = check_array(real)
 
-    outMACD = np.full_like(real, np.nan)
-    outMACDSignal = np.full_like(real, np.nan)
-    outMACDHist = np.full_like(real, np.nan)
+    outMACD = check_out(out, real, 0, 3)
+    outMACDSignal = check_out(out, real, 1, 3)
+    outMACDHist = check_out(out, real, 2, 3)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_MACDFIX_Lookback(signalperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_MACDFIX(
         0, 
@@ -1,7 +1,28 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 cdef extern from "math.h":
     double atan(double x)
+    bint isnan(double x) nogil
 
-from tabox.ta_func.hilbert_transform cimport HilbertVariable, do_odd, do_even
+from tabox.ta_func.hilbert_transform cimport HilbertVariable, HilbertCycle, do_odd, do_even
 cpdef Py_ssize_t TA_MAMA_Lookback(double optInFastLimit, double optInSlowLimit)
-cpdef int TA_MAMA(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, double optInFastLimit, double optInSlowLimit, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outMAMA, double[::1] outFAMA)
+cdef int TA_INT_MAMA(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, double optInFastLimit, double optInSlowLimit, int unstablePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outMAMA, double[::1] outFAMA)
+cpdef int TA_MAMA(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, double optInFastLimit, double optInSlowLimit, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outMAMA, double[::1] outFAMA)
+
+cdef class MAMAState:
+    cdef public tuple params
+    cdef public double fastlimit
+    cdef public double slowlimit
+    cdef public Py_ssize_t lookback
+    cdef public Py_ssize_t today
+    cdef public double periodWMASub
+    cdef public double periodWMASum
+    cdef public double trailingWMAValue
+    cdef public double price1
+    cdef public double price2
+    cdef public double price3
+    cdef public HilbertCycle cycle
+    cdef public double mama
+    cdef public double fama
+    cdef public double prevPhase
+
+cpdef int TA_MAMA_Resume(const double[::1] inReal, MAMAState state, double[::1] outMAMA, double[::1] outFAMA)
@@ -1,13 +1,14 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
-from .hilbert_transform import HilbertVariable
+from .hilbert_transform import HilbertVariable, HilbertCycle
 
 if not cython.compiled:
-    from math import atan
+    from math import atan, isnan
     from .hilbert_transform import do_odd, do_even
     from .ta_utility import TA_INTEGER_DEFAULT
 
@@ -50,28 +51,21 @@ def TA_MAMA_Lookback(optInFastLimit: cython.double, optInSlowLimit: cython.doubl
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_MAMA(
+def TA_INT_MAMA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastLimit: cython.double,
     optInSlowLimit: cython.double,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outMAMA: cython.double[::1],
     outFAMA: cython.double[::1],
 ) -> cython.int:
-    """TA_MAMA - MESA Adaptive Moving Average calculation function.
-    
-    Input  = double
-    Output = double, double (MAMA and FAMA)
-    
-    Optional Parameters:
-    -------------------
-    optInFastLimit:(From 0.01 to 0.99)
-        Upper limit use in the adaptive algorithm
-    optInSlowLimit:(From 0.01 to 0.99)
-        Lower limit use in the adaptive algorithm
+    """MAMA without parameter checks
+
+    The MAMA unstable period is passed in by the caller.
     """
     today: cython.Py_ssize_t = 0
     trailingWMAIdx: cython.Py_ssize_t = 0
@@ -82,28 +76,9 @@ def TA_MAMA(
     trailingWMAValue: cython.double = 0.0
     smoothedValue: cython.double = 0.0
     
-    # Parameter validation section
-    if not TA_FUNC_NO_RANGE_CHECK:
-        # Validate the requested output range
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if (endIdx < 0) or (endIdx < startIdx):
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-
-        # Check input parameters
-        if optInFastLimit == TA_INTEGER_DEFAULT:
-            optInFastLimit = 5.000000e-1
-        elif (optInFastLimit < 1.000000e-2) or (optInFastLimit > 9.900000e-1):
-            return TA_RetCode.TA_BAD_PARAM
-
-        if optInSlowLimit == TA_INTEGER_DEFAULT:
-            optInSlowLimit = 5.000000e-2
-        elif (optInSlowLimit < 1.000000e-2) or (optInSlowLimit > 9.900000e-1):
-            return TA_RetCode.TA_BAD_PARAM
-
     # Constants initialization
     rad2Deg: cython.double = 180.0 / (4.0 * atan(1))
-    lookbackTotal: cython.Py_ssize_t = 32 + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MAMA)
+    lookbackTotal: cython.Py_ssize_t = 32 + unstablePeriod
 
     # Adjust start index if not enough initial data
     if startIdx < lookbackTotal:
@@ -313,10 +288,198 @@ def TA_MAMA(
 
     return TA_RetCode.TA_SUCCESS
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_MAMA(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInFastLimit: cython.double,
+    optInSlowLimit: cython.double,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outMAMA: cython.double[::1],
+    outFAMA: cython.double[::1],
+) -> cython.int:
+    """TA_MAMA - MESA Adaptive Moving Average calculation function.
+    
+    Input  = double
+    Output = double, double (MAMA and FAMA)
+    
+    Optional Parameters:
+    -------------------
+    optInFastLimit:(From 0.01 to 0.99)
+        Upper limit use in the adaptive algorithm
+    optInSlowLimit:(From 0.01 to 0.99)
+        Lower limit use in the adaptive algorithm
+    """
+    # Parameter validation section
+    if not TA_FUNC_NO_RANGE_CHECK:
+        # Validate the requested output range
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if (endIdx < 0) or (endIdx < startIdx):
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+
+        # Check input parameters
+        if optInFastLimit == TA_INTEGER_DEFAULT:
+            optInFastLimit = 5.000000e-1
+        elif (optInFastLimit < 1.000000e-2) or (optInFastLimit > 9.900000e-1):
+            return TA_RetCode.TA_BAD_PARAM
+
+        if optInSlowLimit == TA_INTEGER_DEFAULT:
+            optInSlowLimit = 5.000000e-2
+        elif (optInSlowLimit < 1.000000e-2) or (optInSlowLimit > 9.900000e-1):
+            return TA_RetCode.TA_BAD_PARAM
+
+    return TA_INT_MAMA(
+        startIdx, endIdx, inReal, optInFastLimit, optInSlowLimit,
+        TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MAMA),
+        outBegIdx, outNBElement, outMAMA, outFAMA
+    )
+
+class MAMAState:
+    """Terminal state of a MAMA, the seed of the next call
+
+    Holds the 4-bar price smoother (its running sums and the last three
+    prices), the Hilbert transform ``cycle``, ``mama``, ``fama`` and the
+    phase of the last bar.
+    """
+    def __init__(self, fastlimit: cython.double, slowlimit: cython.double):
+        lookback: cython.Py_ssize_t = TA_MAMA_Lookback(fastlimit, slowlimit)
+        if lookback < 0:
+            raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
+        self.params = (fastlimit, slowlimit)
+        self.fastlimit: cython.double = fastlimit
+        self.slowlimit: cython.double = slowlimit
+        self.lookback: cython.Py_ssize_t = lookback
+        self.today: cython.Py_ssize_t = 0
+        self.periodWMASub: cython.double = 0.0
+        self.periodWMASum: cython.double = 0.0
+        self.trailingWMAValue: cython.double = 0.0
+        self.price1: cython.double = 0.0
+        self.price2: cython.double = 0.0
+        self.price3: cython.double = 0.0
+        self.cycle: HilbertCycle = HilbertCycle()
+        self.mama: cython.double = 0.0
+        self.fama: cython.double = 0.0
+        self.prevPhase: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_MAMA_Resume(
+    inReal: cython.const[cython.double][::1],
+    state: MAMAState,
+    outMAMA: cython.double[::1],
+    outFAMA: cython.double[::1],
+) -> cython.int:
+    """MAMA loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    rad2Deg: cython.double = 180.0 / (4.0 * atan(1))
+    optInFastLimit: cython.double = state.fastlimit
+    optInSlowLimit: cython.double = state.slowlimit
+    lookbackTotal: cython.Py_ssize_t = state.lookback
+    today: cython.Py_ssize_t = state.today
+    periodWMASub: cython.double = state.periodWMASub
+    periodWMASum: cython.double = state.periodWMASum
+    trailingWMAValue: cython.double = state.trailingWMAValue
+    price1: cython.double = state.price1
+    price2: cython.double = state.price2
+    price3: cython.double = state.price3
+    cycle: HilbertCycle = state.cycle
+    mama: cython.double = state.mama
+    fama: cython.double = state.fama
+    prevPhase: cython.double = state.prevPhase
+    todayValue: cython.double
+    smoothedValue: cython.double = 0.0
+    tempReal: cython.double
+    tempReal2: cython.double
+    length: cython.Py_ssize_t = inReal.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first value that is not NaN
+    if today == 0:
+        while i < length and isnan(inReal[i]):
+            i += 1
+
+    while i < length:
+        todayValue = inReal[i]
+        if today < 3:
+            # Initialize the price smoother
+            periodWMASub += todayValue
+            periodWMASum += todayValue * (today + 1.0)
+        else:
+            periodWMASub += todayValue
+            periodWMASub -= trailingWMAValue
+            periodWMASum += todayValue * 4.0
+            trailingWMAValue = price3
+            smoothedValue = periodWMASum * 0.1
+            periodWMASum -= periodWMASub
+
+        if today >= 12:
+            cycle.update(today, smoothedValue, rad2Deg)
+
+            # Phase of the bar
+            if cycle.in_phase != 0.0:
+                tempReal2 = atan(cycle.Q1.current_value / cycle.in_phase) * rad2Deg
+            else:
+                tempReal2 = 0.0
+
+            # Calculate Delta Phase
+            tempReal = prevPhase - tempReal2
+            prevPhase = tempReal2
+            if tempReal < 1.0:
+                tempReal = 1.0
+
+            # Calculate adaptive factor
+            if tempReal > 1.0:
+                tempReal = optInFastLimit / tempReal
+                if tempReal < optInSlowLimit:
+                    tempReal = optInSlowLimit
+            else:
+                tempReal = optInFastLimit
+
+            # Calculate MAMA and FAMA
+            mama = (tempReal * todayValue) + ((1 - tempReal) * mama)
+            tempReal *= 0.5
+            fama = (tempReal * mama) + ((1 - tempReal) * fama)
+
+            if today >= lookbackTotal:
+                outMAMA[i] = mama
+                outFAMA[i] = fama
+
+        price3 = price2
+        price2 = price1
+        price1 = todayValue
+        today += 1
+        i += 1
+
+    state.today = today
+    state.periodWMASub = periodWMASub
+    state.periodWMASum = periodWMASum
+    state.trailingWMAValue = trailingWMAValue
+    state.price1 = price1
+    state.price2 = price2
+    state.price3 = price3
+    state.mama = mama
+    state.fama = fama
+    state.prevPhase = prevPhase
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("real")
 def MAMA(
     real: np.ndarray, 
     fastlimit: float = 0.5, 
     slowlimit: float = 0.05,
+    out: Optional[tuple] = None,
+    state: Optional[MAMAState] = None,
+    return_state: bool = False,
 ):
     """MAMA(real, fastlimit=0.5, slowlimit=0.05)
 
@@ -333,19 +496,30 @@ def MAMA(
     Outputs:
         mama: (ndarray) MESA Adaptive Moving Average
         fama: (ndarray) Following Adaptive Moving Average
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``((mama, fama), state)``.
     """
     real = check_array(real)
 
-    outMAMA = np.full_like(real, np.nan)
-    outFAMA = np.full_like(real, np.nan)
+    if state is not None or return_state:
+        state = resume_state(state, MAMAState, fastlimit, slowlimit)
+        outMAMA = check_out(out, real, 0, 2)
+        outFAMA = check_out(out, real, 1, 2)
+        TA_MAMA_Resume(real, state, outMAMA, outFAMA)
+        if return_state:
+            return (outMAMA, outFAMA), state
+        return outMAMA, outFAMA
+
+    outMAMA = check_out(out, real, 0, 2)
+    outFAMA = check_out(out, real, 1, 2)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_MAMA_Lookback(fastlimit, slowlimit)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_MAMA(
         0, endIdx, real[startIdx:], fastlimit, slowlimit,
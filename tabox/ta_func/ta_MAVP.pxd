@@ -3,8 +3,8 @@ cpdef Py_ssize_t TA_MAVP_Lookback(int optInMinPeriod, int optInMaxPeriod, int op
 cpdef int TA_MAVP(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inReal,
-    double[::1] inPeriods,
+    const double[::1] inReal,
+    const double[::1] inPeriods,
     int optInMinPeriod,
     int optInMaxPeriod,
     int optInMAType,
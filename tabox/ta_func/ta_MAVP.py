@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 if not cython.compiled:
@@ -49,8 +50,8 @@ def TA_MAVP_Lookback(
 def TA_MAVP(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
-    inPeriods: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
+    inPeriods: cython.const[cython.double][::1],
     optInMinPeriod: cython.int,
     optInMaxPeriod: cython.int,
     optInMAType: cython.int,
@@ -112,7 +113,7 @@ def TA_MAVP(
     outNbElement1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
 
     # 确定计算至少一个输出所需的最小价格柱数
-    lookbackTotal: cython.Py_ssize_t = TA_MAVP_Lookback(
+    lookbackTotal = TA_MAVP_Lookback(
         optInMinPeriod, optInMaxPeriod, optInMAType
     )
 
@@ -179,12 +180,14 @@ def TA_MAVP(
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("real", "periods")
 def MAVP(
     real: np.ndarray,
     periods: np.ndarray,
     minperiod: int = 2,
     maxperiod: int = 30,
     matype: int = 0,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """MAVP(real, periods[, minperiod=2, maxperiod=30, matype=0])
 
@@ -217,9 +220,8 @@ def MAVP(
         minperiod, maxperiod, matype
     )
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_MAVP(
         0,
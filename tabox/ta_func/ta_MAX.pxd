@@ -1,4 +1,4 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 cpdef double max_double(double left, double right)
 cpdef Py_ssize_t TA_MAX_Lookback(int optInTimePeriod)
-cpdef TA_MAX(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, double[::1] outReal)
\ No newline at end of file
+cpdef TA_MAX(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double[::1] outReal)
\ No newline at end of file
@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -32,7 +34,7 @@ def TA_MAXINDEX_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_
 def TA_MAXINDEX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -96,34 +98,9 @@ def TA_MAXINDEX(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
 
-    # Proceed with the calculation for the requested range
-    outIdx: cython.Py_ssize_t = 0
-    today: cython.Py_ssize_t = startIdx
-    trailingIdx: cython.Py_ssize_t = startIdx - nbInitialElementNeeded
-    highestIdx: cython.Py_ssize_t = -1
-    highest: cython.double = 0.0
-
-    while today <= endIdx:
-        tmp: cython.double = inReal[today]
-
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inReal[highestIdx]
-            i: cython.Py_ssize_t = highestIdx
-            while i + 1 <= today:
-                i += 1
-                tmp = inReal[i]
-                if tmp > highest:
-                    highestIdx = i
-                    highest = tmp
-        elif tmp >= highest:
-            highestIdx = today
-            highest = tmp
-
-        outInteger[outIdx] = highestIdx
-        outIdx += 1
-        trailingIdx += 1
-        today += 1
+    # O(n) for any period and any input, see TA_INT_EXTREMA
+    TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, True, False, None, outInteger)
+    outIdx: cython.Py_ssize_t = endIdx - startIdx + 1
 
     # Keep the outBegIdx relative to the caller input before returning
     outBegIdx[0] = startIdx
@@ -131,7 +108,8 @@ def TA_MAXINDEX(
 
     return TA_RetCode.TA_SUCCESS
 
-def MAXINDEX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real", positions=True)
+def MAXINDEX(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MAXINDEX(real[, timeperiod=30])
 
     Index of highest value over a specified period
@@ -148,9 +126,8 @@ def MAXINDEX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MAXINDEX_Lookback(timeperiod)
     
-    outInteger = np.full_like(real, 0, dtype=np.intp)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outInteger = check_out(out, real, fill=0, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     
     TA_MAXINDEX(0, endIdx, real[startIdx:], timeperiod, outBegIdx, outNBElement, outInteger[lookback:])
     return outInteger
\ No newline at end of file
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -19,8 +20,8 @@ def TA_MEDPRICE_Lookback() -> cython.Py_ssize_t:
 def TA_MEDPRICE(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -60,7 +61,8 @@ def TA_MEDPRICE(
     return TA_RetCode.TA_SUCCESS
 
 
-def MEDPRICE(inHigh: np.ndarray, inLow: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("inHigh", "inLow")
+def MEDPRICE(inHigh: np.ndarray, inLow: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MEDPRICE(inHigh, inLow[, timeperiod=30])
 
     Median Price (Overlap Studies)
@@ -87,9 +89,8 @@ def MEDPRICE(inHigh: np.ndarray, inLow: np.ndarray, timeperiod: int = 30) -> np.
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MEDPRICE_Lookback()
 
-    outReal = np.full_like(inHigh, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, inHigh)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_MEDPRICE(
         0,
@@ -1,8 +1,8 @@
 import cython
 
 import numpy as np
-from typing import List
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from typing import List, Optional
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -46,43 +46,23 @@ def TA_MFI_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_MFI(
+def TA_MFI_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
-    inVolume: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    inVolume: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """TA_MFI - Money Flow Index
-
-    Input  = High, Low, Close, Volume
-    Output = double
+    """MFI loop without parameter checks, runs without the GIL
 
-    Optional Parameters
-    -------------------
-    optInTimePeriod:(From 2 to 100000)
-       Number of period
+    The MFI unstable period is passed in by the caller.
     """
-    # Parameter checks
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if inHigh is None or inLow is None or inClose is None or inVolume is None:
-            return TA_RetCode.TA_BAD_PARAM
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
     posSumMF: cython.double
     negSumMF: cython.double
     prevValue: cython.double
@@ -96,9 +76,7 @@ def TA_MFI(
     mflow_size: cython.Py_ssize_t = optInTimePeriod
 
     # Adjust startIdx to account for the lookback period
-    lookbackTotal = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(
-        TA_FuncUnstId.TA_FUNC_UNST_MFI
-    )
+    lookbackTotal = optInTimePeriod + unstablePeriod
 
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
@@ -107,13 +85,13 @@ def TA_MFI(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     if not cython.compiled:
         mflow: List[MoneyFlow] = [MoneyFlow(0.0, 0.0) for _ in range(mflow_size)]
     else:
-        mflow: cython.pointer[MoneyFlow] = cython.cast(
-            cython.pointer[MoneyFlow], malloc(mflow_size * cython.sizeof(MoneyFlow))
+        mflow: cython.pointer(MoneyFlow) = cython.cast(
+            cython.pointer(MoneyFlow), malloc(mflow_size * cython.sizeof(MoneyFlow))
         )
         for i in range(mflow_size):
             mflow[i].positive = 0.0
@@ -223,15 +201,67 @@ def TA_MFI(
 
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_MFI(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    inVolume: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_MFI - Money Flow Index
+
+    Input  = High, Low, Close, Volume
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 2 to 100000)
+       Number of period
+    """
+    # Parameter checks
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inHigh is None or inLow is None or inClose is None or inVolume is None:
+            return TA_RetCode.TA_BAD_PARAM
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MFI)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_MFI_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, inVolume, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
 
 
+@rowwise("high", "low", "close", "volume")
 def MFI(
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
     volume: np.ndarray,
     timeperiod: int = 14,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """MFI(high, low, close, volume[, timeperiod=14])
 
@@ -269,9 +299,8 @@ def MFI(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MFI_Lookback(timeperiod)
 
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_MFI(
         0,
@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -30,7 +32,7 @@ def TA_MIDPOINT_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_MIDPOINT(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -59,14 +61,8 @@ def TA_MIDPOINT(
         if inReal is None or outReal is None:
             return TA_RetCode.TA_BAD_PARAM
 
-    lowest: cython.double
-    highest: cython.double
-    tmp: cython.double
     outIdx: cython.Py_ssize_t
     nbInitialElementNeeded: cython.Py_ssize_t
-    trailingIdx: cython.Py_ssize_t
-    today: cython.Py_ssize_t
-    i: cython.Py_ssize_t
 
     # Identify the minimum number of price bar needed to identify at least one output over the specified period.
     nbInitialElementNeeded = optInTimePeriod - 1
@@ -81,33 +77,24 @@ def TA_MIDPOINT(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
 
-    # Proceed with the calculation for the requested range.
+    # Highest goes straight to the output, lowest to a temp buffer.
+    # O(n) for any period and any input, see TA_INT_EXTREMA
+    lowest: cython.double[::1] = np.empty(endIdx - startIdx + 1, dtype=np.double)
+    TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, True, False, outReal, None)
+    TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, False, False, lowest, None)
+
     outIdx = 0
-    today = startIdx
-    trailingIdx = startIdx - nbInitialElementNeeded
-
-    while today <= endIdx:
-        # Fix: Initialize lowest and highest with the first value in the range
-        lowest = inReal[trailingIdx]
-        highest = lowest
-        # Loop through the range from trailingIdx to today (inclusive)
-        for i in range(trailingIdx, today + 1):
-            tmp = inReal[i]
-            if tmp < lowest:
-                lowest = tmp
-            elif tmp > highest:
-                highest = tmp
-        outReal[outIdx] = (highest + lowest) / 2.0
+    while outIdx <= endIdx - startIdx:
+        outReal[outIdx] = (outReal[outIdx] + lowest[outIdx]) / 2.0
         outIdx += 1
-        today += 1
-        trailingIdx += 1
 
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
     return TA_RetCode.TA_SUCCESS
 
 
-def MIDPOINT(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+@rowwise("real")
+def MIDPOINT(real: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MIDPOINT(real[, timeperiod=14])
 
     MidPoint over period (Overlap Studies)
@@ -129,9 +116,8 @@ def MIDPOINT(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MIDPOINT_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_MIDPOINT(
         0,
@@ -1,8 +1,9 @@
-from sys import prefix
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 
 
 def min_double(left: cython.double, right: cython.double) -> cython.double:
@@ -29,116 +30,27 @@ def TA_MIN_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
     return optInTimePeriod - 1
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-def TA_MIN_LARGE_TIMEPERIOD(
-    startIdx: cython.Py_ssize_t,
-    endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
-    optInTimePeriod: cython.int,
-    outReal: cython.double[::1],
-) -> cython.int:
-    n: cython.int = endIdx - startIdx + 1
-    prefixMin: cython.double[::1] = np.empty(shape=(n,), dtype=np.float64)  # [0] * n
-    suffixMin: cython.double[::1] = np.empty(shape=(n,), dtype=np.float64)
-
-    i: cython.int = 0
-    inIdx: cython.int = startIdx
-    while i < n:
-        if i % optInTimePeriod == 0:
-            prefixMin[i] = inReal[inIdx]
-        else:
-            prefixMin[i] = min_double(prefixMin[i - 1], inReal[inIdx])
-        i += 1
-        inIdx += 1
-
-    i: cython.int = n - 1
-    inIdx: cython.int = startIdx + i
-    while i >= 0:
-        if i == n - 1 or (i + 1) % optInTimePeriod == 0:
-            suffixMin[i] = inReal[inIdx]
-        else:
-            suffixMin[i] = min_double(suffixMin[i + 1], inReal[inIdx])
-        i -= 1
-        inIdx -= 1
-
-    suffix_i: cython.int = 0
-    prefix_i: cython.int = optInTimePeriod - 1
-    while suffix_i < n - optInTimePeriod + 1:
-        outReal[suffix_i] = min_double(suffixMin[suffix_i], prefixMin[prefix_i])
-        suffix_i += 1
-        prefix_i += 1
-
-    return TA_RetCode.TA_SUCCESS
-
-
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-def TA_MIN_SMALL_TIMEPERIOD(
+def TA_MIN(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outReal: cython.double[::1],
 ) -> cython.int:
-    nbInitialElementNeeded: cython.int = optInTimePeriod - 1
+    nbInitialElementNeeded: cython.Py_ssize_t = optInTimePeriod - 1
 
     if startIdx < nbInitialElementNeeded:
         startIdx = nbInitialElementNeeded
 
     if startIdx > endIdx:
-        return
-
-    outIdx: cython.int = 0
-    today: cython.int = startIdx
-    trailingIdx: cython.int = startIdx - nbInitialElementNeeded
-    lowestIdx: cython.int = -1
-    lowest: cython.double = 0.0
-
-    while today <= endIdx:
-        tmp: cython.double = inReal[today]
-
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inReal[lowestIdx]
-            i: cython.int = lowestIdx
-            while i + 1 <= today:
-                i += 1
-                tmp = inReal[i]
-                if tmp < lowest:
-                    lowestIdx = i
-                    lowest = tmp
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-        outReal[outIdx] = lowest
-        outIdx += 1
-        trailingIdx += 1
-        today += 1
-
-    return TA_RetCode.TA_SUCCESS
-
+        return TA_RetCode.TA_SUCCESS
 
-def TA_MIN(
-    startIdx: cython.Py_ssize_t,
-    endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
-    optInTimePeriod: cython.int,
-    outReal: cython.double[::1],
-) -> cython.int:
-    if optInTimePeriod < 100:
-        return TA_MIN_SMALL_TIMEPERIOD(
-            startIdx, endIdx, inReal, optInTimePeriod, outReal
-        )
-    else:
-        return TA_MIN_LARGE_TIMEPERIOD(
-            startIdx, endIdx, inReal, optInTimePeriod, outReal
-        )
+    # O(n) for any period and any input, see TA_INT_EXTREMA
+    return TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, False, False, outReal, None)
 
 
-def MIN(real: np.ndarray, timeperiod: cython.int) -> np.ndarray:
+@rowwise("real")
+def MIN(real: np.ndarray, timeperiod: cython.int, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MIN(real[, timeperiod=?])
 
     Highest value over a specified period (Math Operators)
@@ -155,6 +67,6 @@ def MIN(real: np.ndarray, timeperiod: cython.int) -> np.ndarray:
     startIdx: cython.int = check_begidx1(real)
     endIdx: cython.int = length - startIdx - 1
     lookback: cython.int = startIdx + TA_MIN_Lookback(timeperiod)
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     TA_MIN(0, endIdx, real[startIdx:], timeperiod, outReal[lookback:])
     return outReal
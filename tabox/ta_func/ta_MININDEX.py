@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -32,21 +34,15 @@ def TA_MININDEX_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_
 def TA_INT_MININDEX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outInteger: cython.Py_ssize_t[::1]
 ) -> cython.int:
     """Internal MININDEX implementation without parameter checks"""
-    lowest: cython.double
-    tmp: cython.double
     outIdx: cython.Py_ssize_t
     nbInitialElementNeeded: cython.int
-    trailingIdx: cython.Py_ssize_t
-    lowestIdx: cython.Py_ssize_t
-    today: cython.Py_ssize_t
-    i: cython.Py_ssize_t
 
     # Identify the minimum number of price bar needed
     # to identify at least one output over the specified period.
@@ -62,34 +58,9 @@ def TA_INT_MININDEX(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
 
-    # Proceed with the calculation for the requested range.
-    outIdx = 0
-    today = startIdx
-    trailingIdx = startIdx - nbInitialElementNeeded
-    lowestIdx = -1
-    lowest = 0.0
-
-    while today <= endIdx:
-        tmp = inReal[today]
-
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inReal[lowestIdx]
-            i = lowestIdx
-            while i + 1 <= today:
-                i += 1
-                tmp = inReal[i]
-                if tmp < lowest:
-                    lowestIdx = i
-                    lowest = tmp
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-
-        outInteger[outIdx] = lowestIdx
-        outIdx += 1
-        trailingIdx += 1
-        today += 1
+    # O(n) for any period and any input, see TA_INT_EXTREMA
+    TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, False, False, None, outInteger)
+    outIdx = endIdx - startIdx + 1
 
     # Keep the outBegIdx relative to the caller input before returning
     outBegIdx[0] = startIdx
@@ -100,7 +71,7 @@ def TA_INT_MININDEX(
 def TA_MININDEX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -137,7 +108,8 @@ def TA_MININDEX(
         startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outInteger
     )
 
-def MININDEX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real", positions=True)
+def MININDEX(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MININDEX(real[, timeperiod=30])
     
     Index of lowest value over a specified period
@@ -154,9 +126,8 @@ def MININDEX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MININDEX_Lookback(timeperiod)
     
-    outInteger = np.full_like(real, 0, dtype=np.intp)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outInteger = check_out(out, real, fill=0, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     
     TA_MININDEX(0, endIdx, real[startIdx:], timeperiod, outBegIdx, outNBElement, outInteger[lookback:])
     return outInteger
\ No newline at end of file
@@ -1,8 +1,10 @@
 import cython
 from cython.parallel import prange
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 
 
 def TA_MINMAX_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
@@ -14,7 +16,7 @@ def TA_MINMAX_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
 def TA_MINMAX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -30,23 +32,13 @@ def TA_MINMAX(
         return TA_RetCode.TA_BAD_PARAM
     
     outIdx: cython.Py_ssize_t = 0
-    i: cython.Py_ssize_t
-    j: cython.Py_ssize_t
-    minValue: cython.double
-    maxValue: cython.double
+    firstIdx: cython.Py_ssize_t = startIdx + optInTimePeriod - 1
 
-    # Calculate the minimum and maximum values
-    for i in range(startIdx + optInTimePeriod - 1, endIdx + 1):
-        minValue = inReal[i - optInTimePeriod + 1]
-        maxValue = minValue
-        for j in range(i - optInTimePeriod + 2, i + 1):
-            if inReal[j] < minValue:
-                minValue = inReal[j]
-            if inReal[j] > maxValue:
-                maxValue = inReal[j]
-        outMin[outIdx] = minValue
-        outMax[outIdx] = maxValue
-        outIdx += 1
+    # O(n) for any period and any input, see TA_INT_EXTREMA
+    if firstIdx <= endIdx:
+        TA_INT_EXTREMA(firstIdx, endIdx, inReal, optInTimePeriod, False, False, outMin, None)
+        TA_INT_EXTREMA(firstIdx, endIdx, inReal, optInTimePeriod, True, False, outMax, None)
+        outIdx = endIdx - firstIdx + 1
 
     outBegIdx[0] = startIdx + optInTimePeriod - 1
     outNBElement[0] = outIdx
@@ -54,7 +46,8 @@ def TA_MINMAX(
     return TA_RetCode.TA_SUCCESS
 
 
-def MINMAX(real: np.ndarray, timeperiod: cython.Py_ssize_t = 30):
+@rowwise("real")
+def MINMAX(real: np.ndarray, timeperiod: cython.Py_ssize_t = 30, out: Optional[tuple] = None):
     """MINMAX(real[, timeperiod=30])
 
     Lowest and highest values over a specified period (Math Transform)
@@ -68,16 +61,15 @@ def MINMAX(real: np.ndarray, timeperiod: cython.Py_ssize_t = 30):
     """
     real = check_array(real)
 
-    outMin = np.full_like(real, np.nan)
-    outMax = np.full_like(real, np.nan)
+    outMin = check_out(out, real, 0, 2)
+    outMax = check_out(out, real, 1, 2)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_MINMAX_Lookback(timeperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_MINMAX(0, endIdx, real[startIdx:], timeperiod, outBegIdx, outNBElement, outMin[lookback:], outMax[lookback:])
     return outMin, outMax 
\ No newline at end of file
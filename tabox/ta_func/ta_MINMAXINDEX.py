@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -27,7 +29,7 @@ def TA_MINMAXINDEX_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssi
 def TA_MINMAXINDEX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -93,51 +95,10 @@ def TA_MINMAXINDEX(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
 
-    # Proceed with the calculation for the requested range
-    outIdx: cython.Py_ssize_t = 0
-    today: cython.Py_ssize_t = startIdx
-    trailingIdx: cython.Py_ssize_t = startIdx - nbInitialElementNeeded
-    highestIdx: cython.Py_ssize_t = -1
-    highest: cython.double = 0.0
-    lowestIdx: cython.Py_ssize_t = -1
-    lowest: cython.double = 0.0
-
-    while today <= endIdx:
-        tmpHigh = tmpLow = inReal[today]
-
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inReal[highestIdx]
-            i: cython.Py_ssize_t = highestIdx
-            while i + 1 <= today:
-                i += 1
-                tmpHigh = inReal[i]
-                if tmpHigh > highest:
-                    highestIdx = i
-                    highest = tmpHigh
-        elif tmpHigh >= highest:
-            highestIdx = today
-            highest = tmpHigh
-
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inReal[lowestIdx]
-            i = lowestIdx
-            while i + 1 <= today:
-                i += 1
-                tmpLow = inReal[i]
-                if tmpLow < lowest:
-                    lowestIdx = i
-                    lowest = tmpLow
-        elif tmpLow <= lowest:
-            lowestIdx = today
-            lowest = tmpLow
-
-        outMaxIdx[outIdx] = highestIdx
-        outMinIdx[outIdx] = lowestIdx
-        outIdx += 1
-        trailingIdx += 1
-        today += 1
+    # O(n) for any period and any input, see TA_INT_EXTREMA
+    TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, True, False, None, outMaxIdx)
+    TA_INT_EXTREMA(startIdx, endIdx, inReal, optInTimePeriod, False, False, None, outMinIdx)
+    outIdx: cython.Py_ssize_t = endIdx - startIdx + 1
 
     # Keep the outBegIdx relative to the caller input before returning
     outBegIdx[0] = startIdx
@@ -145,7 +106,8 @@ def TA_MINMAXINDEX(
 
     return TA_RetCode.TA_SUCCESS
 
-def MINMAXINDEX(real: np.ndarray, timeperiod: int = 30) -> tuple[np.ndarray, np.ndarray]:
+@rowwise("real", positions=True)
+def MINMAXINDEX(real: np.ndarray, timeperiod: int = 30, out: Optional[tuple] = None) -> tuple[np.ndarray, np.ndarray]:
     """MINMAXINDEX(real[, timeperiod=30])
 
     Indexes of lowest and highest values over a specified period
@@ -165,10 +127,9 @@ def MINMAXINDEX(real: np.ndarray, timeperiod: int = 30) -> tuple[np.ndarray, np.
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MINMAXINDEX_Lookback(timeperiod)
     
-    outMinIdx = np.full_like(real, 0, dtype=np.intp)
-    outMaxIdx = np.full_like(real, 0, dtype=np.intp)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outMinIdx = check_out(out, real, 0, 2, fill=0, dtype=np.intp)
+    outMaxIdx = check_out(out, real, 1, 2, fill=0, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     
     TA_MINMAXINDEX(0, endIdx, real[startIdx:], timeperiod, outBegIdx, outNBElement, outMinIdx[lookback:], outMaxIdx[lookback:])
     return outMinIdx, outMaxIdx
\ No newline at end of file
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -26,8 +27,8 @@ def TRUE_RANGE(
     Output:
         (float) True Range
     """
-    tr = th - tl
-    temp_real2 = fabs(th - yc)
+    tr: cython.double = th - tl
+    temp_real2: cython.double = fabs(th - yc)
     if temp_real2 > tr:
         tr = temp_real2
     temp_real2 = fabs(tl - yc)
@@ -58,49 +59,26 @@ def TA_MINUS_DI_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_MINUS_DI(
+def TA_MINUS_DI_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
+    """MINUS_DI loop without parameter checks, runs without the GIL
+
+    The -DI unstable period is passed in by the caller.
     """
-    TA_MINUS_DI - Minus Directional Indicator
-    
-    Input  = High, Low, Close
-    Output = double
-    
-    Optional Parameters
-    -------------------
-    optInTimePeriod: (From 1 to 100000)
-        Number of period
-    """
-    # 参数检查
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        
-        if inHigh is None or inLow is None or inClose is None:
-            return TA_RetCode.TA_BAD_PARAM
-        
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-    
     # 计算回溯期
+    lookbackTotal: cython.Py_ssize_t
     if optInTimePeriod > 1:
-        lookbackTotal = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DI)
+        lookbackTotal = optInTimePeriod + unstablePeriod
     else:
         lookbackTotal = 1
     
@@ -112,7 +90,7 @@ def TA_MINUS_DI(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
     
     # 初始化变量
     outIdx: cython.Py_ssize_t = 0
@@ -125,6 +103,8 @@ def TA_MINUS_DI(
     diffP: cython.double  # Plus Delta
     diffM: cython.double  # Minus Delta
     tempReal: cython.double
+    tr: cython.double
+    i: cython.Py_ssize_t
     
     # 处理不需要平滑的情况
     if optInTimePeriod <= 1:
@@ -158,7 +138,7 @@ def TA_MINUS_DI(
             prevClose = inClose[today]
         
         outNBElement[0] = outIdx
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
     
     # 处理初始DM和TR
     outBegIdx[0] = today = startIdx
@@ -190,8 +170,7 @@ def TA_MINUS_DI(
         prevClose = inClose[today]
     
     # 处理不稳定期
-    unstable_period = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DI)
-    i = unstable_period + 1
+    i = unstablePeriod + 1
     while i > 0:
         i -= 1
         today += 1
@@ -251,13 +230,68 @@ def TA_MINUS_DI(
         outIdx += 1
     
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_MINUS_DI(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """
+    TA_MINUS_DI - Minus Directional Indicator
+    
+    Input  = High, Low, Close
+    Output = double
+    
+    Optional Parameters
+    -------------------
+    optInTimePeriod: (From 1 to 100000)
+        Number of period
+    """
+    # 参数检查
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        
+        if inHigh is None or inLow is None or inClose is None:
+            return TA_RetCode.TA_BAD_PARAM
+        
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+    
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DI)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_MINUS_DI_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
+
 
+@rowwise("high", "low", "close")
 def MINUS_DI(
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
-    timeperiod: int = 14
+    timeperiod: int = 14,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     MINUS_DI(high, low, close[, timeperiod=14])
@@ -290,9 +324,8 @@ def MINUS_DI(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MINUS_DI_Lookback(timeperiod)
     
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_MINUS_DI(
         0,
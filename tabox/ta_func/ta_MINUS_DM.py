@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -37,43 +38,21 @@ def TA_MINUS_DM_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_MINUS_DM(
+def TA_MINUS_DM_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """TA_MINUS_DM - Minus Directional Movement
-
-    Input  = High, Low
-    Output = double
+    """MINUS_DM loop without parameter checks, runs without the GIL
 
-    Optional Parameters
-    -------------------
-    optInTimePeriod:(From 1 to 100000)
-       Number of period
+    The -DM unstable period is passed in by the caller.
     """
-    # Parameter checks
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if (endIdx < 0) or (endIdx < startIdx):
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if inHigh is None or inLow is None:
-            return TA_RetCode.TA_BAD_PARAM
-
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
     today: cython.Py_ssize_t
     lookbackTotal: cython.Py_ssize_t
     outIdx: cython.Py_ssize_t
@@ -150,11 +129,7 @@ def TA_MINUS_DM(
     """
 
     if optInTimePeriod > 1:
-        lookbackTotal = (
-            optInTimePeriod
-            + TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DM)
-            - 1
-        )
+        lookbackTotal = optInTimePeriod + unstablePeriod - 1
     else:
         lookbackTotal = 1
 
@@ -166,7 +141,7 @@ def TA_MINUS_DM(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Indicate where the next output should be put in the outReal
     outIdx = 0
@@ -194,7 +169,7 @@ def TA_MINUS_DM(
             outIdx += 1
 
         outNBElement[0] = outIdx
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Process the initial DM
     outBegIdx[0] = startIdx
@@ -219,7 +194,7 @@ def TA_MINUS_DM(
 
     # Process subsequent DM
     # Skip the unstable period
-    i = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DM)
+    i = unstablePeriod
     while i > 0:
         i -= 1
         today += 1
@@ -260,9 +235,60 @@ def TA_MINUS_DM(
         outIdx += 1
 
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_MINUS_DM(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_MINUS_DM - Minus Directional Movement
+
+    Input  = High, Low
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 1 to 100000)
+       Number of period
+    """
+    # Parameter checks
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if (endIdx < 0) or (endIdx < startIdx):
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inHigh is None or inLow is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_MINUS_DM)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_MINUS_DM_nogil(
+            startIdx, endIdx, inHigh, inLow, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
+
 
-def MINUS_DM(high: np.ndarray, low: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+@rowwise("high", "low")
+def MINUS_DM(high: np.ndarray, low: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MINUS_DM(high, low[, timeperiod=14])
 
     Minus Directional Movement (Overlap Studies)
@@ -291,9 +317,8 @@ def MINUS_DM(high: np.ndarray, low: np.ndarray, timeperiod: int = 14) -> np.ndar
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MINUS_DM_Lookback(timeperiod)
 
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_MINUS_DM(
         0,
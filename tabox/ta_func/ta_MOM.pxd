@@ -3,7 +3,7 @@ cpdef Py_ssize_t TA_MOM_Lookback(int optInTimePeriod)
 cpdef int TA_MOM(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inReal,
+    const double[::1] inReal,
     int optInTimePeriod,
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
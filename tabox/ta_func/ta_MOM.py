@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId, TA_INTEGER_DEFAULT
@@ -30,7 +31,7 @@ def TA_MOM_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_MOM(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -114,7 +115,8 @@ def TA_MOM(
     return TA_RetCode.TA_SUCCESS
 
 
-def MOM(real: np.ndarray, timeperiod: int = 10):
+@rowwise("real")
+def MOM(real: np.ndarray, timeperiod: int = 10, out: Optional[np.ndarray] = None):
     """MOM(real[, timeperiod=10])
 
     Momentum (Overlap Studies)
@@ -134,9 +136,8 @@ def MOM(real: np.ndarray, timeperiod: int = 10):
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_MOM_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_MOM(
         0,
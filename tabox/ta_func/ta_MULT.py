@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx2, check_length2
+from .ta_utils import check_array, check_begidx2, check_length2, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -14,8 +15,8 @@ def TA_MULT_Lookback() -> cython.Py_ssize_t:
 def TA_MULT(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal0: cython.double[::1],
-    inReal1: cython.double[::1],
+    inReal0: cython.const[cython.double][::1],
+    inReal1: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -39,7 +40,8 @@ def TA_MULT(
     return TA_RetCode.TA_SUCCESS
 
 
-def MULT(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
+@rowwise("real0", "real1")
+def MULT(real0: np.ndarray, real1: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """MULT(real0, real1)
 
     Vector Arithmetic Multiply (Math Operators)
@@ -56,9 +58,8 @@ def MULT(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
     startIdx = check_begidx2(real0, real1)
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_MULT_Lookback()
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outReal = np.full_like(real0, np.nan)
+    outBegIdx, outNBElement = index_buffers()
+    outReal = check_out(out, real0)
     retCode = TA_MULT(
         0,
         endIdx,
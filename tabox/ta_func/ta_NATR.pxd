@@ -1,12 +1,26 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_TRANGE cimport TA_TRANGE_nogil
+from .ta_DX cimport TRUE_RANGE
 cdef bint TA_IS_ZERO(double v) noexcept nogil
 cpdef Py_ssize_t TA_NATR_Lookback(int optInTimePeriod)
+cdef int TA_NATR_nogil(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
+    int optInTimePeriod,
+    int unstablePeriod,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal
+) noexcept nogil
 cpdef int TA_NATR(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inHigh,
-    double[::1] inLow,
-    double[::1] inClose,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
     int optInTimePeriod,
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
@@ -1,14 +1,15 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
-from .ta_TRANGE import TA_TRANGE, TRANGE
-from .ta_SMA import TA_SMA, SMA
 
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
+    from .ta_TRANGE import TA_TRANGE_nogil
+    from .ta_DX import TRUE_RANGE
 
 def TA_IS_ZERO(v: cython.double):
     return ((-0.00000001) < v) and (v < 0.00000001)
@@ -33,91 +34,57 @@ def TA_NATR_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_NATR(
+def TA_NATR_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """TA_NATR - Normalized Average True Range
-
-    Input  = High, Low, Close
-    Output = double
+    """NATR loop without parameter checks, runs without the GIL
 
-    Optional Parameters
-    -------------------
-    optInTimePeriod:(From 1 to 100000)
-       Number of period
+    The true ranges are computed as the loop reaches them instead of into
+    a buffer; ``today`` still counts them from the first one. The NATR
+    unstable period is passed in by the caller.
     """
-    # Parameter checks
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if inHigh is None or inLow is None or inClose is None:
-            return TA_RetCode.TA_BAD_PARAM
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
     outBegIdx[0] = 0
     outNBElement[0] = 0
 
     # Adjust startIdx to account for the lookback period
-    lookbackTotal: cython.Py_ssize_t = TA_NATR_Lookback(optInTimePeriod)
+    lookbackTotal: cython.Py_ssize_t = optInTimePeriod + unstablePeriod
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
 
     if startIdx > endIdx:
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # Trap the case where no smoothing is needed
     if optInTimePeriod <= 1:
-        return TA_TRANGE(startIdx, endIdx, inHigh, inLow, inClose, outBegIdx, outNBElement, outReal)
-
-    # Allocate an intermediate buffer for TRANGE
-    length: cython.Py_ssize_t = lookbackTotal + (endIdx - startIdx) + 1
-    tempBuffer: cython.double[::1] = np.full(length, np.nan, dtype=np.double)
-
-    # Do TRANGE in the intermediate buffer
-    outBegIdx1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNbElement1: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    retCode = TA_TRANGE(
-        startIdx - lookbackTotal + 1, endIdx, inHigh, inLow, inClose,
-        outBegIdx1, outNbElement1, tempBuffer
-    )
-
-    if retCode != TA_RetCode.TA_SUCCESS:
-        return retCode
-
-    # First value of the ATR is a simple Average of the TRANGE output
-    prevATRTemp: cython.double[::1] = np.zeros(1, dtype=np.double)
-    retCode = TA_SMA(
-        optInTimePeriod - 1, optInTimePeriod - 1, tempBuffer, optInTimePeriod,
-        outBegIdx1, outNbElement1, prevATRTemp
-    )
-
-    if retCode != TA_RetCode.TA_SUCCESS:
-        return retCode
-
-    prevATR: cython.double = prevATRTemp[0]
-    today: cython.Py_ssize_t = optInTimePeriod
-    outIdx: cython.Py_ssize_t = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_NATR)
+        return TA_TRANGE_nogil(startIdx, endIdx, inHigh, inLow, inClose, outBegIdx, outNBElement, outReal)
+
+    # First value of the ATR is a simple Average of the first true ranges
+    trIdx: cython.Py_ssize_t = startIdx - lookbackTotal + 1
+    prevATR: cython.double = 0.0
+    today: cython.Py_ssize_t
+    for today in range(optInTimePeriod):
+        prevATR += TRUE_RANGE(inHigh[trIdx], inLow[trIdx], inClose[trIdx - 1])
+        trIdx += 1
+    prevATR /= optInTimePeriod
+    today = optInTimePeriod
+    outIdx: cython.Py_ssize_t = unstablePeriod
+    tempValue: cython.double
 
     # Skip the unstable period
     while outIdx != 0:
         prevATR *= optInTimePeriod - 1
-        prevATR += tempBuffer[today]
+        prevATR += TRUE_RANGE(inHigh[trIdx], inLow[trIdx], inClose[trIdx - 1])
         prevATR /= optInTimePeriod
+        trIdx += 1
         today += 1
         outIdx -= 1
 
@@ -133,29 +100,81 @@ def TA_NATR(
     # Calculate the remaining range
     while nbATR > 1:
         prevATR *= optInTimePeriod - 1
-        prevATR += tempBuffer[today]
+        prevATR += TRUE_RANGE(inHigh[trIdx], inLow[trIdx], inClose[trIdx - 1])
         prevATR /= optInTimePeriod
+        trIdx += 1
         today += 1
-        
+
         tempValue = inClose[today]
         if not TA_IS_ZERO(tempValue):
             outReal[outIdx] = (prevATR / tempValue) * 100.0
         else:
             outReal[outIdx] = 0.0
-            
+
         outIdx += 1
         nbATR -= 1
 
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
 
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_NATR(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_NATR - Normalized Average True Range
+
+    Input  = High, Low, Close
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod:(From 1 to 100000)
+       Number of period
+    """
+    # Parameter checks
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inHigh is None or inLow is None or inClose is None:
+            return TA_RetCode.TA_BAD_PARAM
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_NATR)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_NATR_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
 
+@rowwise("realHigh", "realLow", "realClose")
 def NATR(
     realHigh: np.ndarray,
     realLow: np.ndarray,
     realClose: np.ndarray,
-    timeperiod: int = 14
+    timeperiod: int = 14,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """NATR(realHigh, realLow, realClose[, timeperiod=14])
 
@@ -183,9 +202,8 @@ def NATR(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_NATR_Lookback(timeperiod)
 
-    outReal = np.full_like(realHigh, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, realHigh)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_NATR(
         0, endIdx, realHigh[startIdx:], realLow[startIdx:], realClose[startIdx:],
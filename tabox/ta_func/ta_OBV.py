@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -12,8 +13,8 @@ def TA_OBV_Lookback() -> cython.Py_ssize_t:
 def TA_OBV(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
-    inVolume: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
+    inVolume: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -58,7 +59,8 @@ def TA_OBV(
     return TA_RetCode.TA_SUCCESS
 
 
-def OBV(real: np.ndarray, volume: np.ndarray) -> np.ndarray:
+@rowwise("real", "volume")
+def OBV(real: np.ndarray, volume: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """OBV(real, volume)
     
     On Balance Volume (量价指标)
@@ -85,9 +87,8 @@ def OBV(real: np.ndarray, volume: np.ndarray) -> np.ndarray:
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_OBV(
         0,
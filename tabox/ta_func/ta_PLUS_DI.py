@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -39,50 +40,26 @@ def TA_PLUS_DI_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_PLUS_DI(
+def TA_PLUS_DI_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """
-    TA_PLUS_DI - Plus Directional Indicator
+    """PLUS_DI loop without parameter checks, runs without the GIL
 
-    Input  = High, Low, Close
-    Output = double
-
-    Optional Parameters
-    -------------------
-    optInTimePeriod: (From 1 to 100000)
-        Number of period
+    The +DI unstable period is passed in by the caller.
     """
-    # 参数检查
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if inHigh is None or inLow is None or inClose is None:
-            return TA_RetCode.TA_BAD_PARAM
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-
     # 计算回溯期
     lookbackTotal: cython.Py_ssize_t = 0
     if optInTimePeriod > 1:
-        lookbackTotal = optInTimePeriod + TA_GLOBALS_UNSTABLE_PERIOD(
-            TA_FuncUnstId.TA_FUNC_UNST_PLUS_DI
-        )
+        lookbackTotal = optInTimePeriod + unstablePeriod
     else:
         lookbackTotal = 1
 
@@ -94,7 +71,7 @@ def TA_PLUS_DI(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     outIdx: cython.Py_ssize_t = 0
     outBegIdx[0] = startIdx
@@ -142,7 +119,7 @@ def TA_PLUS_DI(
             prevClose = inClose[today]
 
         outNBElement[0] = outIdx
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     # 处理初始DM和TR
     prevPlusDM = 0.0
@@ -179,7 +156,7 @@ def TA_PLUS_DI(
         i -= 1
 
     # 跳过不稳定期
-    i = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_PLUS_DI) + 1
+    i = unstablePeriod + 1
     while i > 0:
         today += 1
         diffP = inHigh[today] - prevHigh  # 正增量
@@ -251,11 +228,63 @@ def TA_PLUS_DI(
         outIdx += 1
 
     outNBElement[0] = outIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_PLUS_DI(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """
+    TA_PLUS_DI - Plus Directional Indicator
+
+    Input  = High, Low, Close
+    Output = double
+
+    Optional Parameters
+    -------------------
+    optInTimePeriod: (From 1 to 100000)
+        Number of period
+    """
+    # 参数检查
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inHigh is None or inLow is None or inClose is None:
+            return TA_RetCode.TA_BAD_PARAM
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif optInTimePeriod < 1 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_PLUS_DI)
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_PLUS_DI_nogil(
+            startIdx, endIdx, inHigh, inLow, inClose, optInTimePeriod, unstablePeriod,
+            outBegIdx, outNBElement, outReal
+        )
+    return retCode
 
 
+@rowwise("inHigh", "inLow", "inClose")
 def PLUS_DI(
-    inHigh: np.ndarray, inLow: np.ndarray, inClose: np.ndarray, timeperiod: int = 14
+    inHigh: np.ndarray, inLow: np.ndarray, inClose: np.ndarray, timeperiod: int = 14, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     PLUS_DI(inHigh, inLow, inClose[, timeperiod=14])
@@ -284,9 +313,8 @@ def PLUS_DI(
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_PLUS_DI_Lookback(timeperiod)
 
-    outReal = np.full_like(inHigh, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, inHigh)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_PLUS_DI(
         0,
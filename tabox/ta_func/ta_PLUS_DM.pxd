@@ -1,10 +1,21 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 cpdef Py_ssize_t TA_PLUS_DM_Lookback(int optInTimePeriod)
+cdef int TA_PLUS_DM_nogil(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    int optInTimePeriod,
+    int unstablePeriod,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal
+) noexcept nogil
 cpdef int TA_PLUS_DM(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inHigh,
-    double[::1] inLow,
+    const double[::1] inHigh,
+    const double[::1] inLow,
     int optInTimePeriod,
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
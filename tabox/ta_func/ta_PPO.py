@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -53,7 +54,7 @@ def TA_PPO_Lookback(
 def TA_PPO(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInFastPeriod: cython.int,
     optInSlowPeriod: cython.int,
     optInMAType: cython.int,
@@ -168,8 +169,9 @@ def TA_PPO(
     return retCode
 
 
+@rowwise("real")
 def PPO(
-    real: np.ndarray, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0
+    real: np.ndarray, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """PPO(real[, fastperiod=12, slowperiod=26, matype=0])
 
@@ -198,9 +200,8 @@ def PPO(
         fastperiod, slowperiod, matype
     )
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_PPO(
         0,
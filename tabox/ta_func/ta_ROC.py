@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -12,7 +13,7 @@ from ..settings import TA_FUNC_NO_RANGE_CHECK
 def TA_ROC(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -98,7 +99,8 @@ def TA_ROC_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
     return optInTimePeriod
 
 
-def ROC(real: np.ndarray, timeperiod: int = 10) -> np.ndarray:
+@rowwise("real")
+def ROC(real: np.ndarray, timeperiod: int = 10, out: Optional[np.ndarray] = None) -> np.ndarray:
     """ROC(real[, timeperiod=10])
 
     Rate of change : ((price/prevPrice)-1)*100 (Momentum Indicators)
@@ -118,9 +120,8 @@ def ROC(real: np.ndarray, timeperiod: int = 10) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_ROC_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_ROC(
         0,
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -30,7 +31,7 @@ def TA_ROCR100_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_ROCR100(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -125,7 +126,8 @@ def TA_ROCR100(
     return TA_RetCode.TA_SUCCESS
 
 
-def ROCR100(real: np.ndarray, timeperiod: int = 10) -> np.ndarray:
+@rowwise("real")
+def ROCR100(real: np.ndarray, timeperiod: int = 10, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     ROCR100(real[, timeperiod=10])
 
@@ -149,9 +151,8 @@ def ROCR100(real: np.ndarray, timeperiod: int = 10) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_ROCR100_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_ROCR100(
         0,
@@ -1,5 +1,22 @@
-from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_utility cimport TA_INTEGER_DEFAULT, TA_COMPATIBILITY_METASTOCK
+from .ta_utils cimport kernel_rows
 cdef bint TA_IS_ZERO(double v) noexcept nogil
 
 cpdef Py_ssize_t TA_RSI_Lookback(int optInTimePeriod)
-cpdef int TA_RSI(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
\ No newline at end of file
+cdef int TA_RSI_nogil(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef int TA_RSI(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
+cdef extern from "math.h":
+    bint isnan(double x) nogil
+
+cdef class RSIState:
+    cdef public tuple params
+    cdef public int timeperiod
+    cdef public Py_ssize_t lookback
+    cdef public Py_ssize_t today
+    cdef public double prevValue
+    cdef public double prevGain
+    cdef public double prevLoss
+
+cpdef int TA_RSI_Resume(const double[::1] inReal, RSIState state, double[::1] outReal)
+cdef int TA_RSI_Row(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInReal, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef Py_ssize_t TA_RSI_Rows(const double[:, ::1] inReal, int optInTimePeriod, double[:, ::1] outReal)
@@ -1,4 +1,5 @@
 import cython
+from typing import Optional
 import numpy as np
 from tabox.settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -9,11 +10,13 @@ from tabox.ta_func.ta_utility import (
     TA_FuncUnstId,
 )
 
-from .ta_utils import check_array, check_begidx1, check_timeperiod, make_double_array
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 
 if not cython.compiled:
-    from .ta_utility import TA_INTEGER_DEFAULT
+    from math import isnan
+    from .ta_utility import TA_INTEGER_DEFAULT, TA_COMPATIBILITY_METASTOCK
+    from .ta_utils import kernel_rows
 
 def TA_IS_ZERO(v: cython.double) -> cython.bint:
     return ((-0.00000001) < v) and (v < 0.00000001)
@@ -25,26 +28,36 @@ def TA_RSI_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
             optInTimePeriod = 14
         elif (optInTimePeriod < 2) or (optInTimePeriod > 100000):
             return -1
+    # Metastock without an unstable period outputs the first bar of the period
+    if (TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_RSI) == 0
+            and TA_GLOBALS_COMPATIBILITY() == TA_Compatibility.TA_COMPATIBILITY_METASTOCK):
+        return optInTimePeriod - 1
     return optInTimePeriod
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_RSI(
+def TA_RSI_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
+    """RSI loop without parameter checks, runs without the GIL
+
+    The RSI unstable period and the compatibility mode are passed in by
+    the caller.
+    """
     outIdx: cython.Py_ssize_t = 0
 
     today: cython.Py_ssize_t = 0
     lookbackTotal: cython.Py_ssize_t = 0
-    unstablePeriod: cython.int = 0
     i: cython.Py_ssize_t = 0
 
     prevGain: cython.double = 0.0
@@ -54,28 +67,19 @@ def TA_RSI(
     tempValue1: cython.double = 0.0
     tempValue2: cython.double = 0.0
 
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if (endIdx < 0) or (endIdx < startIdx):
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        # min/max are checked for optInTimePeriod.
-        if optInTimePeriod == TA_INTEGER_DEFAULT:
-            optInTimePeriod = 14
-        elif (optInTimePeriod < 2) or (optInTimePeriod > 100000):
-            return TA_RetCode.TA_BAD_PARAM
-
     outBegIdx[0] = 0
     outNBElement[0] = 0
     # Adjust startIdx to account for the lookback period.
-    lookbackTotal = TA_RSI_Lookback(optInTimePeriod)
+    lookbackTotal = optInTimePeriod
+    if unstablePeriod == 0 and compatibility == TA_COMPATIBILITY_METASTOCK:
+        lookbackTotal -= 1
 
     if startIdx < lookbackTotal:
         startIdx = lookbackTotal
 
     # Make sure there is still something to evaluate.
     if startIdx > endIdx:
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     outIdx = 0  # Index into the output.
 
@@ -89,7 +93,7 @@ def TA_RSI(
         i = (endIdx - startIdx) + 1
         outNBElement[0] = i
         outReal[:i] = inReal[startIdx : startIdx + i]
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     """
     Accumulate Wilder's "Average Gain" and "Average Loss" 
@@ -99,10 +103,9 @@ def TA_RSI(
     today = startIdx - lookbackTotal
     prevValue = inReal[today]
 
-    unstablePeriod = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_RSI)
     if (
         unstablePeriod == 0
-        and TA_GLOBALS_COMPATIBILITY() == TA_Compatibility.TA_COMPATIBILITY_METASTOCK
+        and compatibility == TA_COMPATIBILITY_METASTOCK
     ):
         """
         Preserve prevValue because it may get
@@ -121,7 +124,7 @@ def TA_RSI(
         prevGain = 0.0
         prevLoss = 0.0
 
-        i: cython.Py_ssize_t = optInTimePeriod
+        i = optInTimePeriod
         while i > 0:
             tempValue1 = inReal[today]
             today += 1
@@ -149,7 +152,7 @@ def TA_RSI(
         if today > endIdx:
             outBegIdx[0] = startIdx
             outNBElement[0] = outIdx
-            return TA_RetCode.TA_SUCCESS
+            return 0  # TA_SUCCESS
 
         # Start over for the next price bar.
         today -= optInTimePeriod
@@ -257,7 +260,48 @@ def TA_RSI(
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
 
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_RSI(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if (endIdx < 0) or (endIdx < startIdx):
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        # min/max are checked for optInTimePeriod.
+        if optInTimePeriod == TA_INTEGER_DEFAULT:
+            optInTimePeriod = 14
+        elif (optInTimePeriod < 2) or (optInTimePeriod > 100000):
+            return TA_RetCode.TA_BAD_PARAM
+
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_RSI)
+    compatibility: cython.int = TA_GLOBALS_COMPATIBILITY()
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_RSI_nogil(
+            startIdx,
+            endIdx,
+            inReal,
+            optInTimePeriod,
+            unstablePeriod,
+            compatibility,
+            outBegIdx,
+            outNBElement,
+            outReal,
+        )
+    return retCode
 
 
 @cython.boundscheck(False)
@@ -395,7 +439,7 @@ def TA_S_RSI(
     prevLoss = 0.0
     today += 1
 
-    i: cython.int = optInTimePeriod
+    i = optInTimePeriod
     while i > 0:
         tempValue1 = inReal[today]
         today += 1
@@ -489,7 +533,121 @@ def TA_S_RSI(
     return TA_RetCode.TA_SUCCESS
 
 
-def RSI(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+class RSIState:
+    """Terminal state of an RSI, the seed of the next call
+
+    ``prevGain`` and ``prevLoss`` are Wilder's average gain and loss (their
+    sums during the first ``timeperiod`` bars) and ``prevValue`` the last
+    input. Only the classic calculation is resumable, not the Metastock one.
+    """
+    def __init__(self, timeperiod: cython.int):
+        if (TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_RSI) == 0
+                and TA_GLOBALS_COMPATIBILITY() == TA_Compatibility.TA_COMPATIBILITY_METASTOCK):
+            raise Exception("the Metastock RSI cannot be resumed")
+        self.params = (timeperiod,)
+        self.timeperiod: cython.int = timeperiod
+        self.lookback: cython.Py_ssize_t = TA_RSI_Lookback(timeperiod)
+        self.today: cython.Py_ssize_t = 0
+        self.prevValue: cython.double = 0.0
+        self.prevGain: cython.double = 0.0
+        self.prevLoss: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_RSI_Resume(inReal: cython.const[cython.double][::1], state: RSIState, outReal: cython.double[::1]) -> cython.int:
+    """RSI loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    optInTimePeriod: cython.int = state.timeperiod
+    lookbackTotal: cython.Py_ssize_t = state.lookback
+    today: cython.Py_ssize_t = state.today
+    prevValue: cython.double = state.prevValue
+    prevGain: cython.double = state.prevGain
+    prevLoss: cython.double = state.prevLoss
+    tempValue1: cython.double
+    tempValue2: cython.double
+    length: cython.Py_ssize_t = inReal.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first value that is not NaN
+    if today == 0:
+        while i < length and isnan(inReal[i]):
+            i += 1
+
+    while i < length:
+        tempValue1 = inReal[i]
+        tempValue2 = tempValue1 - prevValue
+        prevValue = tempValue1
+        if today > optInTimePeriod:
+            prevLoss *= optInTimePeriod - 1
+            prevGain *= optInTimePeriod - 1
+        if today > 0:
+            if tempValue2 < 0.0:
+                prevLoss -= tempValue2
+            else:
+                prevGain += tempValue2
+        if today >= optInTimePeriod:
+            prevLoss /= optInTimePeriod
+            prevGain /= optInTimePeriod
+        if today >= lookbackTotal:
+            tempValue1 = prevGain + prevLoss
+            if not TA_IS_ZERO(tempValue1):
+                outReal[i] = 100.0 * (prevGain / tempValue1)
+            else:
+                outReal[i] = 0.0
+        today += 1
+        i += 1
+
+    state.today = today
+    state.prevValue = prevValue
+    state.prevGain = prevGain
+    state.prevLoss = prevLoss
+    return TA_RetCode.TA_SUCCESS
+
+
+def TA_RSI_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_RSI_nogil as the row_kernel of TA_RSI_Rows"""
+    return TA_RSI_nogil(startIdx, endIdx, inReal, optInTimePeriod, unstablePeriod, compatibility,
+                        outBegIdx, outNBElement, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_RSI_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """RSI of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``RSI``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    check_timeperiod(optInTimePeriod)
+    lookback: cython.Py_ssize_t = TA_RSI_Lookback(optInTimePeriod)
+    unstablePeriod: cython.int = TA_GLOBALS_UNSTABLE_PERIOD(TA_FuncUnstId.TA_FUNC_UNST_RSI)
+    compatibility: cython.int = TA_GLOBALS_COMPATIBILITY()
+    return kernel_rows(TA_RSI_Row, inReal, lookback, optInTimePeriod, 0.0, unstablePeriod, compatibility, outReal)
+
+
+@rowwise("real", rows=TA_RSI_Rows)
+def RSI(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None,
+        state: Optional[RSIState] = None, return_state: bool = False) -> np.ndarray:
     """RSI(real[, timeperiod=?])
 
     Relative Strength Index (Momentum Indicators)
@@ -500,17 +658,25 @@ def RSI(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
         timeperiod: 14
     Outputs:
         real
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(real, state)``.
     """
     real = check_array(real)
     check_timeperiod(timeperiod)
 
+    if state is not None or return_state:
+        state = resume_state(state, RSIState, timeperiod)
+        outReal = check_out(out, real)
+        TA_RSI_Resume(real, state, outReal)
+        return (outReal, state) if return_state else outReal
+
     length: cython.Py_ssize_t = real.shape[0]
     begidx: cython.Py_ssize_t = check_begidx1(real)
     endidx: cython.Py_ssize_t = length - begidx - 1
     lookback = begidx + TA_RSI_Lookback(timeperiod)
-    outReal = make_double_array(length, lookback)
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(shape=(1,), dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(shape=(1,), dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_RSI(
         0,
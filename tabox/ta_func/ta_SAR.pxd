@@ -3,11 +3,33 @@ cpdef Py_ssize_t TA_SAR_Lookback(double optInAcceleration, double optInMaximum)
 cpdef int TA_SAR(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inHigh,
-    double[::1] inLow,
+    const double[::1] inHigh,
+    const double[::1] inLow,
     double optInAcceleration,
     double optInMaximum,
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
     double[::1] outReal
-)
\ No newline at end of file
+)
+
+cdef extern from "math.h":
+    bint isnan(double x) nogil
+
+cdef class SARState:
+    cdef public tuple params
+    cdef public double acceleration
+    cdef public double maximum
+    cdef public Py_ssize_t today
+    cdef public int isLong
+    cdef public double sar
+    cdef public double ep
+    cdef public double af
+    cdef public double newHigh
+    cdef public double newLow
+
+cpdef int TA_SAR_Resume(
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    SARState state,
+    double[::1] outReal
+)
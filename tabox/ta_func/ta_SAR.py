@@ -1,11 +1,15 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 from .ta_MINUS_DM import TA_MINUS_DM
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_defs import TA_REAL_DEFAULT
 
+if not cython.compiled:
+    from math import isnan
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def TA_SAR_Lookback(optInAcceleration: cython.double, optInMaximum: cython.double) -> cython.Py_ssize_t:
@@ -38,8 +42,8 @@ def TA_SAR_Lookback(optInAcceleration: cython.double, optInMaximum: cython.doubl
 def TA_SAR(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInAcceleration: cython.double,
     optInMaximum: cython.double,
     outBegIdx: cython.Py_ssize_t[::1],
@@ -262,11 +266,178 @@ def TA_SAR(
     outNBElement[0] = outIdx
     return TA_RetCode.TA_SUCCESS
 
+class SARState:
+    """Terminal state of a SAR, the seed of the next call
+
+    ``isLong`` is the current direction, ``sar`` the stop of the next bar,
+    ``ep`` the extreme point and ``af`` the acceleration factor.
+    ``newHigh`` and ``newLow`` are the last bar's range.
+    """
+    def __init__(self, optInAcceleration: cython.double, optInMaximum: cython.double):
+        if TA_SAR_Lookback(optInAcceleration, optInMaximum) < 0:
+            raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
+        self.params = (optInAcceleration, optInMaximum)
+        if optInAcceleration == TA_REAL_DEFAULT:
+            optInAcceleration = 0.02
+        if optInMaximum == TA_REAL_DEFAULT:
+            optInMaximum = 0.2
+        # Correct acceleration factor if it exceeds maximum
+        if optInAcceleration > optInMaximum:
+            optInAcceleration = optInMaximum
+        self.acceleration: cython.double = optInAcceleration
+        self.maximum: cython.double = optInMaximum
+        self.today: cython.Py_ssize_t = 0
+        self.isLong: cython.int = 0
+        self.sar: cython.double = 0.0
+        self.ep: cython.double = 0.0
+        self.af: cython.double = optInAcceleration
+        self.newHigh: cython.double = 0.0
+        self.newLow: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_SAR_Resume(
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    state: SARState,
+    outReal: cython.double[::1],
+) -> cython.int:
+    """SAR loop continued from ``state``, which is left at the last bar
+
+    The first bar of the series only sets the initial direction and has no
+    output, like ``TA_SAR``.
+    """
+    optInAcceleration: cython.double = state.acceleration
+    optInMaximum: cython.double = state.maximum
+    today: cython.Py_ssize_t = state.today
+    isLong: cython.int = state.isLong
+    sar: cython.double = state.sar
+    ep: cython.double = state.ep
+    af: cython.double = state.af
+    newHigh: cython.double = state.newHigh
+    newLow: cython.double = state.newLow
+    prevHigh: cython.double
+    prevLow: cython.double
+    diffP: cython.double
+    diffM: cython.double
+    length: cython.Py_ssize_t = inHigh.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # The series starts at its first high that is not NaN
+    if today == 0:
+        while i < length and isnan(inHigh[i]):
+            i += 1
+        if i < length:
+            newHigh = inHigh[i]
+            newLow = inLow[i]
+            today = 1
+            i += 1
+
+    if today == 1 and i < length:
+        # Initial direction from the -DM of the first two bars
+        diffP = inHigh[i] - newHigh
+        diffM = newLow - inLow[i]
+        if (diffM > 0) and (diffP < diffM):
+            isLong = 0
+            ep = inLow[i]
+            sar = newHigh
+        else:
+            isLong = 1
+            ep = inHigh[i]
+            sar = newLow
+        # Cheat on newLow and newHigh for the first iteration
+        newLow = inLow[i]
+        newHigh = inHigh[i]
+
+    while i < length:
+        prevLow = newLow
+        prevHigh = newHigh
+        newLow = inLow[i]
+        newHigh = inHigh[i]
+
+        if isLong == 1:
+            if newLow <= sar:
+                # Switch to short, output the overridden SAR
+                isLong = 0
+                sar = ep
+                if sar < prevHigh:
+                    sar = prevHigh
+                if sar < newHigh:
+                    sar = newHigh
+                outReal[i] = sar
+
+                af = optInAcceleration
+                ep = newLow
+                sar = sar + af * (ep - sar)
+                if sar < prevHigh:
+                    sar = prevHigh
+                if sar < newHigh:
+                    sar = newHigh
+            else:
+                outReal[i] = sar
+                if newHigh > ep:
+                    ep = newHigh
+                    af += optInAcceleration
+                    if af > optInMaximum:
+                        af = optInMaximum
+                sar = sar + af * (ep - sar)
+                if sar > prevLow:
+                    sar = prevLow
+                if sar > newLow:
+                    sar = newLow
+        else:
+            if newHigh >= sar:
+                # Switch to long, output the overridden SAR
+                isLong = 1
+                sar = ep
+                if sar > prevLow:
+                    sar = prevLow
+                if sar > newLow:
+                    sar = newLow
+                outReal[i] = sar
+
+                af = optInAcceleration
+                ep = newHigh
+                sar = sar + af * (ep - sar)
+                if sar > prevLow:
+                    sar = prevLow
+                if sar > newLow:
+                    sar = newLow
+            else:
+                outReal[i] = sar
+                if newLow < ep:
+                    ep = newLow
+                    af += optInAcceleration
+                    if af > optInMaximum:
+                        af = optInMaximum
+                sar = sar + af * (ep - sar)
+                if sar < prevHigh:
+                    sar = prevHigh
+                if sar < newHigh:
+                    sar = newHigh
+        today += 1
+        i += 1
+
+    state.today = today
+    state.isLong = isLong
+    state.sar = sar
+    state.ep = ep
+    state.af = af
+    state.newHigh = newHigh
+    state.newLow = newLow
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("high", "low")
 def SAR(
     high: np.ndarray,
     low: np.ndarray,
     optInAcceleration: float = 0.02,
-    optInMaximum: float = 0.2
+    optInMaximum: float = 0.2,
+    out: Optional[np.ndarray] = None,
+    state: Optional[SARState] = None,
+    return_state: bool = False,
 ) -> np.ndarray:
     """
     SAR(high, low[, optInAcceleration=0.02, optInMaximum=0.2])
@@ -284,21 +455,29 @@ def SAR(
         optInMaximum: 0.2 Maximum acceleration factor
     Outputs:
         real: Parabolic SAR values
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(real, state)``.
     """
     high = check_array(high)
     low = check_array(low)
     
     if high.shape[0] != low.shape[0]:
         raise ValueError("High and low arrays must have the same length")
+
+    if state is not None or return_state:
+        state = resume_state(state, SARState, optInAcceleration, optInMaximum)
+        outReal = check_out(out, high)
+        TA_SAR_Resume(high, low, state, outReal)
+        return (outReal, state) if return_state else outReal
     
     length: cython.Py_ssize_t = high.shape[0]
     startIdx: cython.Py_ssize_t = check_begidx1(high)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_SAR_Lookback(optInAcceleration, optInMaximum)
     
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_SAR(
         0,
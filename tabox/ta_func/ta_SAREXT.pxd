@@ -13,8 +13,8 @@ cpdef Py_ssize_t TA_SAREXT_Lookback(
 cpdef int TA_SAREXT(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inHigh,
-    double[::1] inLow,
+    const double[::1] inHigh,
+    const double[::1] inLow,
     double optInStartValue,
     double optInOffsetOnReverse,
     double optInAccelerationInitLong,
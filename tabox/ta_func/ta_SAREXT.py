@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx2
+from .ta_utils import check_array, check_begidx2, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_MINUS_DM import TA_MINUS_DM
@@ -82,8 +83,8 @@ def TA_SAREXT_Lookback(
 def TA_SAREXT(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
     optInStartValue: cython.double,
     optInOffsetOnReverse: cython.double,
     optInAccelerationInitLong: cython.double,
@@ -375,6 +376,7 @@ def TA_SAREXT(
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("high", "low")
 def SAREXT(
     high: np.ndarray,
     low: np.ndarray,
@@ -386,6 +388,7 @@ def SAREXT(
     accelerationinitshort: float = 0.02,
     accelerationshort: float = 0.02,
     accelerationmaxshort: float = 0.2,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """SAREXT(high, low[, startvalue=0, offsetonreverse=0, accelerationinitlong=0.02,
              accelerationlong=0.02, accelerationmaxlong=0.2, accelerationinitshort=0.02,
@@ -425,9 +428,8 @@ def SAREXT(
         accelerationmaxshort,
     )
 
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_SAREXT(
         0,
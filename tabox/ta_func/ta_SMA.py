@@ -1,12 +1,14 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD
 
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
+    from .ta_utils import kernel_rows
 
 def TA_SMA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
     """
@@ -25,51 +27,18 @@ def TA_SMA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_SMA(
+def TA_SMA_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
     """
-    Calculate Simple Moving Average (SMA)
-    
-    Parameters:
-        startIdx: Starting index
-        endIdx: Ending index
-        inReal: Input data array
-        optInTimePeriod: Time period
-        outBegIdx: Output starting index
-        outNBElement: Number of output elements
-        outReal: Output result array
+    SMA loop without parameter checks, runs without the GIL
     """
-    # Range check
-    if not TA_FUNC_NO_RANGE_CHECK:
-        # Validate starting index
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        
-        # Validate ending index
-        if endIdx < 0 or endIdx < startIdx:
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        
-        # Validate input array
-        if inReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-        
-        # Validate time period
-        if optInTimePeriod == -1:  # TA_INTEGER_DEFAULT
-            optInTimePeriod = 30
-        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
-            return TA_RetCode.TA_BAD_PARAM
-        
-        # Validate output array
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-    
     # Calculate lookback period
     lookbackTotal: cython.Py_ssize_t = optInTimePeriod - 1
     
@@ -81,7 +50,7 @@ def TA_SMA(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
     
     # Initialize cumulative sum
     periodTotal: cython.double = 0.0
@@ -115,23 +84,23 @@ def TA_SMA(
     outBegIdx[0] = startIdx
     outNBElement[0] = outIdx
     
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_INT_SMA(
+def TA_SMA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
     """
-    Integer version of SMA calculation
+    Calculate Simple Moving Average (SMA)
     
     Parameters:
         startIdx: Starting index
@@ -166,55 +135,107 @@ def TA_INT_SMA(
         if outReal is None:
             return TA_RetCode.TA_BAD_PARAM
     
-    # Calculate lookback period
-    lookbackTotal: cython.int = optInTimePeriod - 1
-    
-    # Adjust starting index
-    if startIdx < lookbackTotal:
-        startIdx = lookbackTotal
-    
-    # Check if there is data to process
-    if startIdx > endIdx:
-        outBegIdx[0] = 0
-        outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
-    
-    # Initialize cumulative sum
-    periodTotal: cython.double = 0.0  # Changed to double to match C implementation
-    trailingIdx: cython.int = startIdx - lookbackTotal
-    
-    # Sum values for the initial period
-    i: cython.int = trailingIdx
-    if optInTimePeriod > 1:
-        while i < startIdx:
-            periodTotal += inReal[i]
-            i += 1
+    # Run the loop without the GIL
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_SMA_nogil(startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outReal)
+    return retCode
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_INT_SMA(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """
+    Integer version of SMA calculation
     
-    # Calculate SMA
-    outIdx: cython.int = 0
-    while True:
-        periodTotal += inReal[i]
-        i += 1
+    Parameters:
+        startIdx: Starting index
+        endIdx: Ending index
+        inReal: Input data array
+        optInTimePeriod: Time period
+        outBegIdx: Output starting index
+        outNBElement: Number of output elements
+        outReal: Output result array
+    """
+    # Range check
+    if not TA_FUNC_NO_RANGE_CHECK:
+        # Validate starting index
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
         
-        tempReal: cython.double = periodTotal
+        # Validate ending index
+        if endIdx < 0 or endIdx < startIdx:
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
         
-        periodTotal -= inReal[trailingIdx]
-        trailingIdx += 1
+        # Validate input array
+        if inReal is None:
+            return TA_RetCode.TA_BAD_PARAM
         
-        outReal[outIdx] = tempReal / optInTimePeriod
-        outIdx += 1
+        # Validate time period
+        if optInTimePeriod == -1:  # TA_INTEGER_DEFAULT
+            optInTimePeriod = 30
+        elif optInTimePeriod < 2 or optInTimePeriod > 100000:
+            return TA_RetCode.TA_BAD_PARAM
         
-        if i > endIdx:
-            break
-    
-    # Set output parameters
-    outBegIdx[0] = startIdx
-    outNBElement[0] = outIdx
+        # Validate output array
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
     
-    return TA_RetCode.TA_SUCCESS
+    # Run the loop without the GIL
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_SMA_nogil(startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outReal)
+    return retCode
+
+
+def TA_SMA_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_SMA_nogil as the row_kernel of TA_SMA_Rows"""
+    return TA_SMA_nogil(startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_SMA_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """SMA of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``SMA``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    if not TA_FUNC_NO_RANGE_CHECK:
+        check_timeperiod(optInTimePeriod)
+    lookback: cython.Py_ssize_t = TA_SMA_Lookback(optInTimePeriod)
+    if lookback < 0:
+        raise ValueError("Invalid timeperiod")
+    return kernel_rows(TA_SMA_Row, inReal, lookback, optInTimePeriod, 0.0, 0, 0, outReal)
 
 
-def SMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real", rows=TA_SMA_Rows)
+def SMA(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """SMA(real[, timeperiod=?])
 
     Simple Moving Average (Overlap Studies)
@@ -234,7 +255,7 @@ def SMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
         check_timeperiod(timeperiod)
     
     # Create output array
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
     
     # Calculate starting index
@@ -247,8 +268,7 @@ def SMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
         raise ValueError("Invalid timeperiod")
     
     # Initialize output parameters
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     
     # Call core calculation function
     retcode = TA_SMA(0, endIdx, real[startIdx:], timeperiod, outBegIdx, outNBElement, outReal[lookback:])
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out
 from ..retcode import TA_RetCode
 
 if not cython.compiled:
@@ -16,7 +17,7 @@ def TA_SQRT_Lookback() -> cython.Py_ssize_t:
 def TA_SQRT(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     outReal: cython.double[::1],
 ) -> cython.int:
     outIdx: cython.Py_ssize_t = 0
@@ -26,7 +27,8 @@ def TA_SQRT(
     return TA_RetCode.TA_SUCCESS
 
 
-def SQRT(real: np.ndarray) -> np.ndarray:
+@rowwise("real")
+def SQRT(real: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """SQRT(real)
 
     Vector Square Root (Math Transform)
@@ -38,7 +40,7 @@ def SQRT(real: np.ndarray) -> np.ndarray:
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.int = real.shape[0]
 
     startIdx: cython.int = check_begidx1(real)
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_VAR import TA_INT_VAR
 
@@ -11,8 +12,8 @@ if not cython.compiled:
 @cython.wraparound(False)
 @cython.cdivision(True)
 def INT_stddev_using_precalc_ma(
-    inReal: cython.double[::1],
-    inMovAvg: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
+    inMovAvg: cython.const[cython.double][::1],
     inMovAvgBegIdx: cython.int,
     inMovAvgNbElement: cython.int,
     timePeriod: cython.int,
@@ -100,7 +101,7 @@ def TA_STDDEV_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_STDDEV(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInNbDev: cython.double,
     outBegIdx: cython.Py_ssize_t[::1],
@@ -149,7 +150,8 @@ def TA_STDDEV(
     return TA_RetCode.TA_SUCCESS
 
 
-def STDDEV(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0):
+@rowwise("real")
+def STDDEV(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0, out: Optional[np.ndarray] = None):
     """STDDEV(real[, timeperiod=5, nbdev=1.0])
 
     Standard Deviation (Statistic Functions)
@@ -165,15 +167,14 @@ def STDDEV(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0):
     real = check_array(real)
     check_timeperiod(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_STDDEV_Lookback(timeperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_STDDEV(
         0,
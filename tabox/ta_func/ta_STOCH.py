@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -67,9 +69,9 @@ def TA_STOCH_Lookback(
 def TA_STOCH(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInFastK_Period: cython.int,
     optInSlowK_Period: cython.int,
     optInSlowK_MAType: cython.int,
@@ -153,63 +155,26 @@ def TA_STOCH(
     tempBuffer_size: cython.Py_ssize_t = endIdx - (startIdx - lookbackTotal) + 1
     tempBuffer: cython.double[::1] = np.full(tempBuffer_size, np.nan, dtype=np.double)
 
+    # Rolling lowest low and highest high, O(n) for any period and any
+    # input, see TA_INT_EXTREMA
+    today: cython.Py_ssize_t = startIdx - lookbackTotal + lookbackK
+    lowestLow: cython.double[::1] = np.empty(endIdx - today + 1, dtype=np.double)
+    highestHigh: cython.double[::1] = np.empty(endIdx - today + 1, dtype=np.double)
+    TA_INT_EXTREMA(today, endIdx, inLow, optInFastK_Period, False, False, lowestLow, None)
+    TA_INT_EXTREMA(today, endIdx, inHigh, optInFastK_Period, True, False, highestHigh, None)
+
     outIdx: cython.Py_ssize_t = 0
-    trailingIdx: cython.Py_ssize_t = startIdx - lookbackTotal
-    today: cython.Py_ssize_t = trailingIdx + lookbackK
-    lowestIdx: cython.Py_ssize_t = -1
-    highestIdx: cython.Py_ssize_t = -1
-    diff: cython.double = 0.0
-    highest: cython.double = 0.0
-    lowest: cython.double = 0.0
-
-    tmp: cython.double = 0.0
-    i: cython.Py_ssize_t = 0
-
-    # 计算Fast-K值
+    lowest: cython.double
+    diff: cython.double
+    i: cython.Py_ssize_t
     while today <= endIdx:
-        # 设置最低价格
-        tmp = inLow[today]
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inLow[lowestIdx]
-            i = lowestIdx
-            while i <= today:
-                tmp = inLow[i]
-                if tmp < lowest:
-                    lowestIdx = i
-                    lowest = tmp
-                i += 1
-            diff = (highest - lowest) / 100.0
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-            diff = (highest - lowest) / 100.0
-
-        # 设置最高价格
-        tmp = inHigh[today]
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inHigh[highestIdx]
-            i = highestIdx
-            while i <= today:
-                tmp = inHigh[i]
-                if tmp > highest:
-                    highestIdx = i
-                    highest = tmp
-                i += 1
-            diff = (highest - lowest) / 100.0
-        elif tmp >= highest:
-            highestIdx = today
-            highest = tmp
-            diff = (highest - lowest) / 100.0
-
-        # 计算随机指标值
+        lowest = lowestLow[outIdx]
+        diff = (highestHigh[outIdx] - lowest) / 100.0
         if diff != 0.0:
             tempBuffer[outIdx] = (inClose[today] - lowest) / diff
         else:
             tempBuffer[outIdx] = 0.0
         outIdx += 1
-        trailingIdx += 1
         today += 1
 
     # 计算Slow-K (对Fast-K进行移动平均)
@@ -261,6 +226,7 @@ def TA_STOCH(
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("high", "low", "close")
 def STOCH(
     high: np.ndarray,
     low: np.ndarray,
@@ -270,6 +236,7 @@ def STOCH(
     slowk_matype: int = 0,
     slowd_period: int = 3,
     slowd_matype: int = 0,
+    out: Optional[tuple] = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """STOCH(high, low, close[, fastk_period=5, slowk_period=3, slowk_matype=0, slowd_period=3, slowd_matype=0])
 
@@ -311,10 +278,9 @@ def STOCH(
         fastk_period, slowk_period, slowk_matype, slowd_period, slowd_matype
     )
 
-    outSlowK = np.full_like(high, np.nan)
-    outSlowD = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outSlowK = check_out(out, high, 0, 2)
+    outSlowD = check_out(out, high, 1, 2)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_STOCH(
         0,
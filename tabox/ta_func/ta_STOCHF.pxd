@@ -1,3 +1,3 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 cpdef Py_ssize_t TA_STOCHF_Lookback(int optInFastK_Period, int optInFastD_Period, int optInFastD_MAType)
-cpdef int TA_STOCHF(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inHigh, double[::1] inLow, double[::1] inClose, int optInFastK_Period, int optInFastD_Period, int optInFastD_MAType, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outFastK, double[::1] outFastD)
\ No newline at end of file
+cpdef int TA_STOCHF(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, int optInFastK_Period, int optInFastD_Period, int optInFastD_MAType, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outFastK, double[::1] outFastD)
\ No newline at end of file
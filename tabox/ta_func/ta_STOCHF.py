@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_MA import TA_MA, TA_MA_Lookback
 
@@ -50,9 +52,9 @@ def TA_STOCHF_Lookback(
 def TA_STOCHF(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInFastK_Period: cython.int,
     optInFastD_Period: cython.int,
     optInFastD_MAType: cython.int,
@@ -103,15 +105,12 @@ def TA_STOCHF(
             return TA_RetCode.TA_BAD_PARAM
 
     # Local variables
-    tmp: cython.double
+    lowest: cython.double
     diff: cython.double
     outIdx: cython.Py_ssize_t
-    lowestIdx: cython.Py_ssize_t
-    highestIdx: cython.Py_ssize_t
     lookbackK: cython.Py_ssize_t
     lookbackFastD: cython.Py_ssize_t
     lookbackTotal: cython.Py_ssize_t
-    trailingIdx: cython.Py_ssize_t
     today: cython.Py_ssize_t
     i: cython.Py_ssize_t
     retCode: cython.int
@@ -134,60 +133,23 @@ def TA_STOCHF(
     length: cython.Py_ssize_t = endIdx - (startIdx - lookbackTotal) + 1
     tempBuffer: cython.double[::1] = np.full(length, np.nan, dtype=np.double)
 
-    # Calculate FastK values
-    outIdx: cython.Py_ssize_t = 0
-    trailingIdx: cython.Py_ssize_t = startIdx - lookbackTotal
-    today: cython.Py_ssize_t = trailingIdx + lookbackK
-    lowestIdx: cython.Py_ssize_t = -1
-    highestIdx: cython.Py_ssize_t = -1
-    diff: cython.double = 0.0
-    highest: cython.double = 0.0
-    lowest: cython.double = 0.0
+    # Rolling lowest low and highest high, O(n) for any period and any
+    # input, see TA_INT_EXTREMA
+    today = startIdx - lookbackTotal + lookbackK
+    lowestLow: cython.double[::1] = np.empty(endIdx - today + 1, dtype=np.double)
+    highestHigh: cython.double[::1] = np.empty(endIdx - today + 1, dtype=np.double)
+    TA_INT_EXTREMA(today, endIdx, inLow, optInFastK_Period, False, False, lowestLow, None)
+    TA_INT_EXTREMA(today, endIdx, inHigh, optInFastK_Period, True, False, highestHigh, None)
 
+    outIdx = 0
     while today <= endIdx:
-        # Find lowest low in the period
-        tmp = inLow[today]
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inLow[lowestIdx]
-            i = lowestIdx
-            while i <= today:
-                tmp = inLow[i]
-                if tmp < lowest:
-                    lowestIdx = i
-                    lowest = tmp
-                i += 1
-            diff = (highest - lowest) / 100.0
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-            diff = (highest - lowest) / 100.0
-
-        # Find highest high in the period
-        tmp = inHigh[today]
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inHigh[highestIdx]
-            i = highestIdx
-            while i <= today:
-                tmp = inHigh[i]
-                if tmp > highest:
-                    highestIdx = i
-                    highest = tmp
-                i += 1
-            diff = (highest - lowest) / 100.0
-        elif tmp >= highest:
-            highestIdx = today
-            highest = tmp
-            diff = (highest - lowest) / 100.0
-
-        # Calculate FastK
+        lowest = lowestLow[outIdx]
+        diff = (highestHigh[outIdx] - lowest) / 100.0
         if diff != 0.0:
             tempBuffer[outIdx] = (inClose[today] - lowest) / diff
         else:
             tempBuffer[outIdx] = 0.0
         outIdx += 1
-        trailingIdx += 1
         today += 1
 
     # Calculate FastD by smoothing FastK with moving average
@@ -211,7 +173,6 @@ def TA_STOCHF(
 
     # Copy FastK values to output
     # np.copyto(outFastK, tempBuffer[lookbackFastD : lookbackFastD + outNBElement1[0]])
-    i: cython.Py_ssize_t = 0
     for i in range(outNBElement1[0]):
         outFastK[i] = tempBuffer[lookbackFastD + i]
 
@@ -222,6 +183,7 @@ def TA_STOCHF(
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("high", "low", "close")
 def STOCHF(
     high: np.ndarray,
     low: np.ndarray,
@@ -229,6 +191,7 @@ def STOCHF(
     fastk_period: int = 5,
     fastd_period: int = 3,
     fastd_matype: int = 0,
+    out: Optional[tuple] = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     STOCHF(high, low, close[, fastk_period=5, fastd_period=3, fastd_matype=0])
@@ -267,10 +230,9 @@ def STOCHF(
         fastk_period, fastd_period, fastd_matype
     )
 
-    outFastK = np.full_like(high, np.nan)
-    outFastD = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outFastK = check_out(out, high, 0, 2)
+    outFastD = check_out(out, high, 1, 2)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_STOCHF(
         0,
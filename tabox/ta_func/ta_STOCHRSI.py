@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 from .ta_RSI import TA_RSI, TA_RSI_Lookback
@@ -61,7 +62,7 @@ def TA_STOCHRSI_Lookback(
 def TA_STOCHRSI(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInFastK_Period: cython.int,
     optInFastD_Period: cython.int,
@@ -184,12 +185,14 @@ def TA_STOCHRSI(
     return ret_code
 
 
+@rowwise("real")
 def STOCHRSI(
     real: np.ndarray,
     timeperiod: int = 14,
     fastk_period: int = 5,
     fastd_period: int = 3,
     fastd_matype: int = 0,
+    out: Optional[tuple] = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     STOCHRSI(real[, timeperiod=14, fastk_period=5, fastd_period=3, fastd_matype=0])
@@ -221,10 +224,9 @@ def STOCHRSI(
         timeperiod, fastk_period, fastd_period, fastd_matype
     )
 
-    out_fastk = np.full_like(real, np.nan)
-    out_fastd = np.full_like(real, np.nan)
-    out_beg_idx = np.zeros(1, dtype=np.intp)
-    out_nb_element = np.zeros(1, dtype=np.intp)
+    out_fastk = check_out(out, real, 0, 2)
+    out_fastd = check_out(out, real, 1, 2)
+    out_beg_idx, out_nb_element = index_buffers()
 
     ret_code = TA_STOCHRSI(
         0,
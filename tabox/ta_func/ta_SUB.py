@@ -1,7 +1,8 @@
 
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx2, check_length2
+from .ta_utils import check_array, check_begidx2, check_length2, rowwise, check_out
 from ..retcode import TA_RetCode
 
 def TA_SUB_Lookback() -> cython.int:
@@ -9,14 +10,15 @@ def TA_SUB_Lookback() -> cython.int:
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_SUB(startIdx: cython.int, endIdx: cython.int, inReal0: cython.double[::1], inReal1: cython.double[::1], outReal: cython.double[::1]) -> cython.int:
+def TA_SUB(startIdx: cython.int, endIdx: cython.int, inReal0: cython.const[cython.double][::1], inReal1: cython.const[cython.double][::1], outReal: cython.double[::1]) -> cython.int:
     outIdx: cython.int = 0
     for i in range(startIdx, endIdx+1):
         outReal[outIdx] = inReal0[i] - inReal1[i]
         outIdx += 1
     return TA_RetCode.TA_SUCCESS
 
-def SUB(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
+@rowwise("real0", "real1")
+def SUB(real0: np.ndarray, real1: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """ SUB(real0, real1)
 
     Vector Arithmetic Sub (Math Operators)
@@ -33,6 +35,6 @@ def SUB(real0: np.ndarray, real1: np.ndarray) -> np.ndarray:
     startIdx = check_begidx2(real0, real1)
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_SUB_Lookback()
-    outreal = np.full_like(real0, np.nan)
+    outreal = check_out(out, real0)
     retCode = TA_SUB( 0, endIdx, real0[startIdx:], real1[startIdx:], outreal[lookback:])
     return outreal 
\ No newline at end of file
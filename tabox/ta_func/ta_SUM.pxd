@@ -1,3 +1,7 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+from .ta_utils cimport kernel_rows
 cpdef Py_ssize_t TA_SUM_Lookback(int optInTimePeriod)
-cpdef int TA_SUM(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, double[::1] outReal)
\ No newline at end of file
+cdef int TA_SUM_nogil(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double[::1] outReal) noexcept nogil
+cpdef int TA_SUM(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double[::1] outReal)
+cdef int TA_SUM_Row(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInReal, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cpdef Py_ssize_t TA_SUM_Rows(const double[:, ::1] inReal, int optInTimePeriod, double[:, ::1] outReal)
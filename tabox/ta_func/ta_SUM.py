@@ -1,8 +1,12 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out
 from ..retcode import TA_RetCode
 
+if not cython.compiled:
+    from .ta_utils import kernel_rows
+
 
 def TA_SUM_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
     return optInTimePeriod - 1
@@ -11,13 +15,14 @@ def TA_SUM_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_SUM(
+def TA_SUM_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outReal: cython.double[::1],
 ) -> cython.int:
+    """SUM loop without parameter checks, runs without the GIL"""
     # Identify the minimum number of price bar needed to calculate at least one output.
     lookbackTotal: cython.Py_ssize_t = optInTimePeriod - 1
 
@@ -27,10 +32,11 @@ def TA_SUM(
 
     # Make sure there is still something to evaluate.
     if startIdx > endIdx:
-        return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        return 13  # TA_OUT_OF_RANGE_END_INDEX
 
     # Do the MA calculation using tight loops.
     # Add-up the initial period, except for the last value.
+    tempReal: cython.double
     periodTotal: cython.double = 0.0
     trailingIdx: cython.Py_ssize_t = startIdx - lookbackTotal
 
@@ -47,7 +53,7 @@ def TA_SUM(
         periodTotal += inReal[i]
         i += 1
 
-        tempReal: cython.double = periodTotal
+        tempReal = periodTotal
 
         periodTotal -= inReal[trailingIdx]
         trailingIdx += 1
@@ -59,10 +65,61 @@ def TA_SUM(
             break
 
     # All done. Indicate the output limits and return.
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_SUM(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[::1],
+) -> cython.int:
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_SUM_nogil(startIdx, endIdx, inReal, optInTimePeriod, outReal)
+    return retCode
+
+
+def TA_SUM_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_SUM_nogil as the row_kernel of TA_SUM_Rows"""
+    return TA_SUM_nogil(startIdx, endIdx, inReal, optInTimePeriod, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_SUM_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """SUM of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``SUM``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    check_timeperiod(optInTimePeriod)
+    lookback: cython.Py_ssize_t = TA_SUM_Lookback(optInTimePeriod)
+    return kernel_rows(TA_SUM_Row, inReal, lookback, optInTimePeriod, 0.0, 0, 0, outReal)
 
 
-def SUM(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real", rows=TA_SUM_Rows)
+def SUM(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """SUM(real[, timeperiod=?])
 
     Summation (Math Operators)
@@ -77,7 +134,7 @@ def SUM(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     real = check_array(real)
     check_timeperiod(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
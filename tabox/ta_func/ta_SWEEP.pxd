@@ -0,0 +1,3 @@
+from .ta_utility cimport PER_TO_K
+
+cpdef int TA_SWEEP_EMA(Py_ssize_t endIdx, double[:, ::1] inReal, Py_ssize_t[::1] inRow, Py_ssize_t[::1] inBegIdx, const int[::1] optInTimePeriod, int unstablePeriod, bint t3Form, double[:, ::1] outReal)
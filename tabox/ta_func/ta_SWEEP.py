@@ -0,0 +1,82 @@
+import cython
+import numpy as np
+from ..retcode import TA_RetCode
+
+if not cython.compiled:
+    from .ta_utility import PER_TO_K
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_SWEEP_EMA(
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.double[:, ::1],
+    inRow: cython.Py_ssize_t[::1],
+    inBegIdx: cython.Py_ssize_t[::1],
+    optInTimePeriod: cython.const[cython.int][::1],
+    unstablePeriod: cython.int,
+    t3Form: cython.bint,
+    outReal: cython.double[:, ::1],
+) -> cython.int:
+    """
+    TA_SWEEP_EMA - Many EMAs in a single pass over bars 0..endIdx
+
+    Row k of outReal is the EMA of optInTimePeriod[k] bars of the input row
+    inReal[inRow[k]], starting at bar inBegIdx[k], i.e. what TA_INT_EMA
+    writes for that row and start, placed at the bars it belongs to. Bars
+    before the first output are left untouched.
+
+    Each row keeps its own state, so EMAs of different periods, of
+    different inputs and seeded at different bars (the fast EMA of
+    TA_INT_MACD) all advance together, bar by bar. The seed is the sum of
+    the first optInTimePeriod[k] values accumulated in the same order as
+    TA_INT_EMA, so the rows are bit-identical to it.
+
+    outReal may be a view of inReal: the rows are updated in order for each
+    bar, so a row can take as input an earlier output row and an EMA of an
+    EMA (DEMA, TEMA, T3, TRIX) is computed in the same pass.
+
+    t3Form uses the k * x + (1 - k) * ema update and no unstable period,
+    as the six EMAs of TA_T3 do.
+    """
+    nbRow: cython.Py_ssize_t = inRow.shape[0]
+    if outReal.shape[0] != nbRow or inBegIdx.shape[0] != nbRow or optInTimePeriod.shape[0] != nbRow:
+        return TA_RetCode.TA_BAD_PARAM
+
+    periodTotal: cython.double[::1] = np.zeros(nbRow, dtype=np.double)
+    prevMA: cython.double[::1] = np.zeros(nbRow, dtype=np.double)
+    k: cython.double[::1] = np.empty(nbRow, dtype=np.double)
+    seedIdx: cython.Py_ssize_t[::1] = np.empty(nbRow, dtype=np.intp)
+    outBegIdx: cython.Py_ssize_t[::1] = np.empty(nbRow, dtype=np.intp)
+    row: cython.Py_ssize_t
+    today: cython.Py_ssize_t
+    tempReal: cython.double
+
+    for row in range(nbRow):
+        k[row] = PER_TO_K(optInTimePeriod[row])
+        seedIdx[row] = inBegIdx[row] + optInTimePeriod[row] - 1
+        if t3Form:
+            outBegIdx[row] = seedIdx[row]
+        else:
+            outBegIdx[row] = seedIdx[row] + unstablePeriod
+
+    for today in range(endIdx + 1):
+        for row in range(nbRow):
+            if today < inBegIdx[row]:
+                continue
+            tempReal = inReal[inRow[row], today]
+            if today < seedIdx[row]:
+                periodTotal[row] += tempReal
+                continue
+            if today == seedIdx[row]:
+                periodTotal[row] += tempReal
+                prevMA[row] = periodTotal[row] / optInTimePeriod[row]
+            elif t3Form:
+                prevMA[row] = (k[row] * tempReal) + ((1.0 - k[row]) * prevMA[row])
+            else:
+                prevMA[row] = ((tempReal - prevMA[row]) * k[row]) + prevMA[row]
+            if today >= outBegIdx[row]:
+                outReal[row, today] = prevMA[row]
+
+    return TA_RetCode.TA_SUCCESS
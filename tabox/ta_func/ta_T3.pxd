@@ -1,3 +1,22 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
 cpdef Py_ssize_t TA_T3_Lookback(int optInTimePeriod, double optInVFactor)
-cpdef int TA_T3(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inReal, int optInTimePeriod, double optInVFactor, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) 
\ No newline at end of file
+cpdef int TA_T3(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod, double optInVFactor, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal) 
+cdef extern from "math.h":
+    bint isnan(double x) nogil
+
+cdef class T3State:
+    cdef public tuple params
+    cdef public int timeperiod
+    cdef public double vfactor
+    cdef public Py_ssize_t today
+    cdef public int stage
+    cdef public int count
+    cdef public double total
+    cdef public double e1
+    cdef public double e2
+    cdef public double e3
+    cdef public double e4
+    cdef public double e5
+    cdef public double e6
+
+cpdef int TA_T3_Resume(const double[::1] inReal, T3State state, double[::1] outReal)
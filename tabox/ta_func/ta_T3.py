@@ -1,8 +1,12 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers, resume_state
 from ..retcode import TA_RetCode
 
+if not cython.compiled:
+    from math import isnan
+
 def TA_T3_Lookback(optInTimePeriod: cython.int, optInVFactor: cython.double) -> cython.Py_ssize_t:
     """TA_T3_Lookback(optInTimePeriod, optInVFactor) -> Py_ssize_t
 
@@ -26,7 +30,7 @@ def TA_T3_Lookback(optInTimePeriod: cython.int, optInVFactor: cython.double) ->
 def TA_T3(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInVFactor: cython.double,
     outBegIdx: cython.Py_ssize_t[::1],
@@ -160,7 +164,139 @@ def TA_T3(
     outNBElement[0] = outIdx
     return TA_RetCode.TA_SUCCESS
 
-def T3(real: np.ndarray, timeperiod: int = 5, vfactor: float = 0.7):
+class T3State:
+    """Terminal state of a T3, the seed of the next call
+
+    ``e1`` to ``e6`` are the six EMA stages. Each stage is seeded with the
+    average of its first ``timeperiod`` inputs: ``stage`` counts the seeded
+    ones and ``total``/``count`` accumulate the inputs of the next.
+    """
+    def __init__(self, timeperiod: cython.int, vfactor: cython.double):
+        if TA_T3_Lookback(timeperiod, vfactor) < 0:
+            raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
+        self.params = (timeperiod, vfactor)
+        self.timeperiod: cython.int = 5 if timeperiod == 0 else timeperiod
+        self.vfactor: cython.double = 0.7 if vfactor == 0 else vfactor
+        self.today: cython.Py_ssize_t = 0
+        self.stage: cython.int = 0
+        self.count: cython.int = 0
+        self.total: cython.double = 0.0
+        self.e1: cython.double = 0.0
+        self.e2: cython.double = 0.0
+        self.e3: cython.double = 0.0
+        self.e4: cython.double = 0.0
+        self.e5: cython.double = 0.0
+        self.e6: cython.double = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_T3_Resume(inReal: cython.const[cython.double][::1], state: T3State, outReal: cython.double[::1]) -> cython.int:
+    """T3 loop continued from ``state``, which is left at the last bar
+
+    Only the bars past the lookback of the whole series are written.
+    """
+    optInTimePeriod: cython.int = state.timeperiod
+    optInVFactor: cython.double = state.vfactor
+    k: cython.double = 2.0 / (optInTimePeriod + 1.0)
+    one_minus_k: cython.double = 1.0 - k
+    today: cython.Py_ssize_t = state.today
+    stage: cython.int = state.stage
+    count: cython.int = state.count
+    tempReal: cython.double = state.total
+    e1: cython.double = state.e1
+    e2: cython.double = state.e2
+    e3: cython.double = state.e3
+    e4: cython.double = state.e4
+    e5: cython.double = state.e5
+    e6: cython.double = state.e6
+    length: cython.Py_ssize_t = inReal.shape[0]
+    i: cython.Py_ssize_t = 0
+
+    # Calculate the constants
+    vfactor2: cython.double = optInVFactor * optInVFactor
+    c1: cython.double = -(vfactor2 * optInVFactor)
+    c2: cython.double = 3.0 * (vfactor2 - c1)
+    c3: cython.double = -6.0 * vfactor2 - 3.0 * (optInVFactor - c1)
+    c4: cython.double = 1.0 + 3.0 * optInVFactor - c1 + 3.0 * vfactor2
+
+    # The series starts at its first value that is not NaN
+    if today == 0:
+        while i < length and isnan(inReal[i]):
+            i += 1
+
+    while i < length:
+        if stage == 6:
+            e1 = (k * inReal[i]) + (one_minus_k * e1)
+            e2 = (k * e1) + (one_minus_k * e2)
+            e3 = (k * e2) + (one_minus_k * e3)
+            e4 = (k * e3) + (one_minus_k * e4)
+            e5 = (k * e4) + (one_minus_k * e5)
+            e6 = (k * e5) + (one_minus_k * e6)
+            outReal[i] = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+        else:
+            # Run the seeded stages and accumulate the next one
+            if stage == 0:
+                tempReal += inReal[i]
+            else:
+                e1 = (k * inReal[i]) + (one_minus_k * e1)
+                if stage == 1:
+                    tempReal += e1
+                else:
+                    e2 = (k * e1) + (one_minus_k * e2)
+                    if stage == 2:
+                        tempReal += e2
+                    else:
+                        e3 = (k * e2) + (one_minus_k * e3)
+                        if stage == 3:
+                            tempReal += e3
+                        else:
+                            e4 = (k * e3) + (one_minus_k * e4)
+                            if stage == 4:
+                                tempReal += e4
+                            else:
+                                e5 = (k * e4) + (one_minus_k * e5)
+                                tempReal += e5
+            count += 1
+            if count == optInTimePeriod:
+                tempReal = tempReal / optInTimePeriod
+                stage += 1
+                if stage == 1:
+                    e1 = tempReal
+                elif stage == 2:
+                    e2 = tempReal
+                elif stage == 3:
+                    e3 = tempReal
+                elif stage == 4:
+                    e4 = tempReal
+                elif stage == 5:
+                    e5 = tempReal
+                else:
+                    e6 = tempReal
+                    # Write the first output
+                    outReal[i] = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+                # The seed starts the sum of the next stage
+                count = 1
+        today += 1
+        i += 1
+
+    state.today = today
+    state.stage = stage
+    state.count = count
+    state.total = tempReal
+    state.e1 = e1
+    state.e2 = e2
+    state.e3 = e3
+    state.e4 = e4
+    state.e5 = e5
+    state.e6 = e6
+    return TA_RetCode.TA_SUCCESS
+
+
+@rowwise("real")
+def T3(real: np.ndarray, timeperiod: int = 5, vfactor: float = 0.7, out: Optional[np.ndarray] = None,
+       state: Optional[T3State] = None, return_state: bool = False):
     """T3(real, timeperiod=5, vfactor=0.7)
 
     Triple Exponential Moving Average (T3)
@@ -171,18 +307,26 @@ def T3(real: np.ndarray, timeperiod: int = 5, vfactor: float = 0.7):
         vfactor: (float) Volume Factor
     Outputs:
         real: (ndarray) T3
+
+    ``state`` continues the series from the record returned by a previous
+    call with ``return_state=True``, which returns ``(real, state)``.
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    if state is not None or return_state:
+        state = resume_state(state, T3State, timeperiod, vfactor)
+        outReal = check_out(out, real)
+        TA_T3_Resume(real, state, outReal)
+        return (outReal, state) if return_state else outReal
+
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_T3_Lookback(timeperiod, vfactor)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_T3(0, endIdx, real[startIdx:], timeperiod, vfactor,
           outBegIdx, outNBElement, outReal[lookback:])
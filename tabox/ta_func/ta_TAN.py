@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 if not cython.compiled:
@@ -16,7 +17,7 @@ def TA_TAN_Lookback() -> cython.Py_ssize_t:
 def TA_TAN(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -37,7 +38,8 @@ def TA_TAN(
     return TA_RetCode.TA_SUCCESS
 
 
-def TAN(real: np.ndarray) -> np.ndarray:
+@rowwise("real")
+def TAN(real: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """TAN(real)
 
     Vector Trigonometric Tan (Math Transform)
@@ -49,14 +51,13 @@ def TAN(real: np.ndarray) -> np.ndarray:
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_TAN_Lookback()
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
     retCode = TA_TAN(0, endIdx, real[startIdx:], outBegIdx, outNBElement, outReal[lookback:])
     if retCode != TA_RetCode.TA_SUCCESS:
         raise RuntimeError(f"TA_TAN failed with error code {retCode}")
@@ -4,12 +4,22 @@ cdef extern from "math.h":
     cpdef double fabs(double x)
 
 cpdef Py_ssize_t TA_TRANGE_Lookback()
+cdef int TA_TRANGE_nogil(
+    Py_ssize_t startIdx,
+    Py_ssize_t endIdx,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
+    Py_ssize_t[::1] outBegIdx,
+    Py_ssize_t[::1] outNBElement,
+    double[::1] outReal
+) noexcept nogil
 cpdef int TA_TRANGE(
     Py_ssize_t startIdx,
     Py_ssize_t endIdx,
-    double[::1] inHigh,
-    double[::1] inLow,
-    double[::1] inClose,
+    const double[::1] inHigh,
+    const double[::1] inLow,
+    const double[::1] inClose,
     Py_ssize_t[::1] outBegIdx,
     Py_ssize_t[::1] outNBElement,
     double[::1] outReal
@@ -1,6 +1,7 @@
+from typing import Optional
 import numpy as np
 import cython
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -19,40 +20,17 @@ def TA_TRANGE_Lookback() -> cython.Py_ssize_t:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def TA_TRANGE(
+def TA_TRANGE_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
-) -> int:
-    """
-    TA_TRANGE - True Range
-
-    Input  = High, Low, Close
-    Output = double
-
-    True Range is the maximum of the following three values:
-    - The difference between today's high and low (val1)
-    - The absolute value of the difference between yesterday's close and today's high (val2)
-    - The absolute value of the difference between yesterday's close and today's low (val3)
-
-    Note: To avoid inconsistencies, this function ignores the first price bar and only outputs valid values from the second price bar onwards.
-    """
-    # Parameter check
-    if not TA_FUNC_NO_RANGE_CHECK:
-        if startIdx < 0:
-            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
-        if (endIdx < 0) or (endIdx < startIdx):
-            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
-        if inHigh is None or inLow is None or inClose is None:
-            return TA_RetCode.TA_BAD_PARAM
-        if outReal is None:
-            return TA_RetCode.TA_BAD_PARAM
-
+) -> cython.int:
+    """TRANGE loop without parameter checks, runs without the GIL"""
     # If the start index is less than 1, adjust it to 1 (at least two price bars are required)
     if startIdx < 1:
         startIdx = 1
@@ -61,7 +39,7 @@ def TA_TRANGE(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
     outIdx: cython.Py_ssize_t = 0
     today: cython.Py_ssize_t = startIdx
@@ -70,6 +48,8 @@ def TA_TRANGE(
     tempHT: cython.double = 0.0
     tempCY: cython.double = 0.0
     greatest: cython.double = 0.0
+    val2: cython.double
+    val3: cython.double
 
     while today <= endIdx:
         # Calculate three possible volatility values
@@ -96,14 +76,59 @@ def TA_TRANGE(
 
     outNBElement[0] = outIdx
     outBegIdx[0] = startIdx
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def TA_TRANGE(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> int:
+    """
+    TA_TRANGE - True Range
+
+    Input  = High, Low, Close
+    Output = double
+
+    True Range is the maximum of the following three values:
+    - The difference between today's high and low (val1)
+    - The absolute value of the difference between yesterday's close and today's high (val2)
+    - The absolute value of the difference between yesterday's close and today's low (val3)
+
+    Note: To avoid inconsistencies, this function ignores the first price bar and only outputs valid values from the second price bar onwards.
+    """
+    # Parameter check
+    if not TA_FUNC_NO_RANGE_CHECK:
+        if startIdx < 0:
+            return TA_RetCode.TA_OUT_OF_RANGE_START_INDEX
+        if (endIdx < 0) or (endIdx < startIdx):
+            return TA_RetCode.TA_OUT_OF_RANGE_END_INDEX
+        if inHigh is None or inLow is None or inClose is None:
+            return TA_RetCode.TA_BAD_PARAM
+        if outReal is None:
+            return TA_RetCode.TA_BAD_PARAM
+
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_TRANGE_nogil(startIdx, endIdx, inHigh, inLow, inClose, outBegIdx, outNBElement, outReal)
+    return retCode
 
 
+@rowwise("inHigh", "inLow", "inClose")
 def TRANGE(
     inHigh: np.ndarray,
     inLow: np.ndarray,
     inClose: np.ndarray,
     fastperiod: int = 14,  # This parameter is only for compatibility, TRANGE does not require a period parameter
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     TRANGE(inHigh, inLow, inClose[, fastperiod=14])
@@ -137,9 +162,8 @@ def TRANGE(
     endIdx = length - startIdx - 1
     lookback = startIdx + TA_TRANGE_Lookback()
 
-    outReal = np.full_like(inHigh, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, inHigh)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_TRANGE(
         0,
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 def TA_TRIMA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
@@ -21,7 +22,7 @@ def TA_TRIMA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_TRIMA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -163,7 +164,8 @@ def TA_TRIMA(
 
     return TA_RetCode.TA_SUCCESS
 
-def TRIMA(real: np.ndarray, timeperiod: int = 30):
+@rowwise("real")
+def TRIMA(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None):
     """TRIMA(real, timeperiod=30)
 
     Triangular Moving Average
@@ -176,15 +178,14 @@ def TRIMA(real: np.ndarray, timeperiod: int = 30):
     """
     real = check_array(real)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_TRIMA_Lookback(timeperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_TRIMA(0, endIdx, real[startIdx:], timeperiod,
             outBegIdx, outNBElement, outReal[lookback:])
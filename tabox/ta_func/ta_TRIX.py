@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
@@ -34,7 +35,7 @@ def TA_TRIX_Lookback(optInTimePeriod: cython.Py_ssize_t) -> cython.Py_ssize_t:
 def TA_INT_TRIX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -134,7 +135,7 @@ def TA_INT_TRIX(
 def TA_TRIX(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -167,7 +168,8 @@ def TA_TRIX(
     )
 
 
-def TRIX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real")
+def TRIX(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """TRIX(real[, timeperiod=30])
 
     1-day Rate-Of-Change (ROC) of a Triple Smooth EMA (Overlap Studies)
@@ -187,9 +189,8 @@ def TRIX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_TRIX_Lookback(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, real)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_TRIX(
         0,
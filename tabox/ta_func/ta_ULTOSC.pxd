@@ -24,9 +24,7 @@ cdef extern from *:
             trueRange = tempDouble;                                    \
     }
     """
-    void CALC_TERMS(int day, double trueLow, double trueRange, double closeMinusTrueLow, double[::1] inLow, double[::1] inHigh, double[::1] inClose)
+    void CALC_TERMS(int day, double trueLow, double trueRange, double closeMinusTrueLow, const double[::1] inLow, const double[::1] inHigh, const double[::1] inClose)
 
-cdef tuple[double, double, double] calc_terms(Py_ssize_t day, double[::1] inLow, double[::1] inHigh, double[::1] inClose)
-cdef tuple[double, double] prime_totals(int period, Py_ssize_t startIdx, double[::1] inLow, double[::1] inHigh, double[::1] inClose)
 cpdef Py_ssize_t TA_ULTOSC_Lookback(int optInTimePeriod1, int optInTimePeriod2, int optInTimePeriod3)
-cpdef int TA_ULTOSC(Py_ssize_t startIdx, Py_ssize_t endIdx, double[::1] inHigh, double[::1] inLow, double[::1] inClose, int optInTimePeriod1, int optInTimePeriod2, int optInTimePeriod3, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
\ No newline at end of file
+cpdef int TA_ULTOSC(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inHigh, const double[::1] inLow, const double[::1] inClose, int optInTimePeriod1, int optInTimePeriod2, int optInTimePeriod3, Py_ssize_t[::1] outBegIdx, Py_ssize_t[::1] outNBElement, double[::1] outReal)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from .ta_utility import TA_GLOBALS_UNSTABLE_PERIOD, TA_FuncUnstId
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -58,9 +59,9 @@ def TA_ULTOSC_Lookback(
 @cython.wraparound(False)
 def calc_terms(
     day: cython.Py_ssize_t,
-    inLow: cython.double[::1],
-    inHigh: cython.double[::1],
-    inClose: cython.double[::1],
+    inLow: cython.const[cython.double][::1],
+    inHigh: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
 ) -> tuple[cython.double, cython.double, cython.double]:
     tempLT: cython.double = inLow[day]
     tempHT: cython.double = inHigh[day]
@@ -81,9 +82,9 @@ def calc_terms(
 def prime_totals(
     period: cython.int,
     startIdx: cython.Py_ssize_t,
-    inLow: cython.double[::1],
-    inHigh: cython.double[::1],
-    inClose: cython.double[::1],
+    inLow: cython.const[cython.double][::1],
+    inHigh: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
 ) -> tuple[cython.double, cython.double]:
     aTotal: cython.double = 0.0
     bTotal: cython.double = 0.0
@@ -108,9 +109,9 @@ def prime_totals(
 def TA_ULTOSC(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod1: cython.int,
     optInTimePeriod2: cython.int,
     optInTimePeriod3: cython.int,
@@ -289,6 +290,7 @@ def TA_ULTOSC(
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("high", "low", "close")
 def ULTOSC(
     high: np.ndarray,
     low: np.ndarray,
@@ -296,6 +298,7 @@ def ULTOSC(
     timeperiod1: int = 7,
     timeperiod2: int = 14,
     timeperiod3: int = 28,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """ULTOSC(high, low, close[, timeperiod1=7, timeperiod2=14, timeperiod3=28])
 
@@ -327,9 +330,8 @@ def ULTOSC(
     endIdx: cython.int = length - startIdx - 1
     lookback: cython.int = startIdx + TA_ULTOSC_Lookback(timeperiod1, timeperiod2, timeperiod3)
 
-    outReal: cython.double[::1] = np.full_like(high, np.nan)
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_ULTOSC(
         0,
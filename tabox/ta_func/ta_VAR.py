@@ -1,8 +1,12 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
+if not cython.compiled:
+    from .ta_utils import kernel_rows
+
 def TA_VAR_Lookback(optInTimePeriod: cython.int, optInNbDev: cython.double) -> cython.Py_ssize_t:
     """TA_VAR_Lookback(optInTimePeriod, optInNbDev) -> Py_ssize_t
 
@@ -22,16 +26,17 @@ def TA_VAR_Lookback(optInTimePeriod: cython.int, optInNbDev: cython.double) -> c
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def TA_INT_VAR(
+@cython.cdivision(True)
+def TA_VAR_nogil(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
 ) -> cython.int:
-    """Internal implementation of Variance calculation"""
+    """Variance loop without parameter checks, runs without the GIL"""
     nbInitialElementNeeded: cython.Py_ssize_t = optInTimePeriod - 1
 
     if startIdx < nbInitialElementNeeded:
@@ -40,8 +45,9 @@ def TA_INT_VAR(
     if startIdx > endIdx:
         outBegIdx[0] = 0
         outNBElement[0] = 0
-        return TA_RetCode.TA_SUCCESS
+        return 0  # TA_SUCCESS
 
+    tempReal: cython.double
     periodTotal1: cython.double = 0.0
     periodTotal2: cython.double = 0.0
     trailingIdx: cython.Py_ssize_t = startIdx - nbInitialElementNeeded
@@ -49,7 +55,7 @@ def TA_INT_VAR(
     i: cython.Py_ssize_t = trailingIdx
     if optInTimePeriod > 1:
         while i < startIdx:
-            tempReal: cython.double = inReal[i]
+            tempReal = inReal[i]
             periodTotal1 += tempReal
             tempReal *= tempReal
             periodTotal2 += tempReal
@@ -57,7 +63,7 @@ def TA_INT_VAR(
 
     outIdx: cython.Py_ssize_t = 0
     while i <= endIdx:
-        tempReal: cython.double = inReal[i]
+        tempReal = inReal[i]
         periodTotal1 += tempReal
         tempReal *= tempReal
         periodTotal2 += tempReal
@@ -65,7 +71,7 @@ def TA_INT_VAR(
         meanValue1: cython.double = periodTotal1 / optInTimePeriod
         meanValue2: cython.double = periodTotal2 / optInTimePeriod
 
-        tempReal: cython.double = inReal[trailingIdx]
+        tempReal = inReal[trailingIdx]
         periodTotal1 -= tempReal
         tempReal *= tempReal
         periodTotal2 -= tempReal
@@ -78,14 +84,32 @@ def TA_INT_VAR(
     outNBElement[0] = outIdx
     outBegIdx[0] = startIdx
 
-    return TA_RetCode.TA_SUCCESS
+    return 0  # TA_SUCCESS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_INT_VAR(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """Internal implementation of Variance calculation"""
+    retCode: cython.int
+    with cython.nogil:
+        retCode = TA_VAR_nogil(startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outReal)
+    return retCode
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def TA_VAR(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     optInNbDev: cython.double,
     outBegIdx: cython.Py_ssize_t[::1],
@@ -110,7 +134,43 @@ def TA_VAR(
 
     return TA_INT_VAR(startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outReal)
 
-def VAR(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0):
+def TA_VAR_Row(
+    startIdx: cython.Py_ssize_t,
+    endIdx: cython.Py_ssize_t,
+    inReal: cython.const[cython.double][::1],
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outBegIdx: cython.Py_ssize_t[::1],
+    outNBElement: cython.Py_ssize_t[::1],
+    outReal: cython.double[::1],
+) -> cython.int:
+    """TA_VAR_nogil as the row_kernel of TA_VAR_Rows"""
+    return TA_VAR_nogil(startIdx, endIdx, inReal, optInTimePeriod, outBegIdx, outNBElement, outReal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def TA_VAR_Rows(
+    inReal: cython.const[cython.double][:, ::1],
+    optInTimePeriod: cython.int,
+    optInNbDev: cython.double,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """VAR of every row of ``inReal`` into the same row of ``outReal``
+
+    Each row starts at its first value that is not NaN and is NaN up to
+    its lookback, like the rows of ``VAR``. The rows run without the GIL.
+    Returns the number of rows that are all NaN.
+    """
+    check_timeperiod(optInTimePeriod)
+    lookback: cython.Py_ssize_t = TA_VAR_Lookback(optInTimePeriod, optInNbDev)
+    return kernel_rows(TA_VAR_Row, inReal, lookback, optInTimePeriod, 0.0, 0, 0, outReal)
+
+
+@rowwise("real", rows=TA_VAR_Rows)
+def VAR(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0, out: Optional[np.ndarray] = None):
     """VAR(real[, timeperiod=5, nbdev=1.0])
 
     Variance (Statistic Functions)
@@ -126,15 +186,14 @@ def VAR(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0):
     real = check_array(real)
     check_timeperiod(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback = startIdx + TA_VAR_Lookback(timeperiod, nbdev)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_VAR(0, endIdx, real[startIdx:], timeperiod, nbdev,
            outBegIdx, outNBElement, outReal[lookback:])
@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1
+from .ta_utils import check_array, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 from ..settings import TA_FUNC_NO_RANGE_CHECK
 
@@ -22,9 +23,9 @@ def TA_WCLPRICE_Lookback() -> cython.Py_ssize_t:
 def TA_WCLPRICE(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
     outReal: cython.double[::1],
@@ -59,7 +60,8 @@ def TA_WCLPRICE(
 
     return TA_RetCode.TA_SUCCESS
 
-def WCLPRICE(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+@rowwise("high", "low", "close")
+def WCLPRICE(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """WCLPRICE(high, low, close)
     
     Weighted Close Price (Overlap Studies)
@@ -80,9 +82,8 @@ def WCLPRICE(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_WCLPRICE_Lookback()
     
-    outReal = np.full_like(high, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, high)
+    outBegIdx, outNBElement = index_buffers()
     
     retCode = TA_WCLPRICE(
         0,
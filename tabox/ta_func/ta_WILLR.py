@@ -1,7 +1,9 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_timeperiod, check_begidx1
+from .ta_utils import check_array, check_timeperiod, check_begidx1, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
+from .ta_EXTREMA import TA_INT_EXTREMA
 if not cython.compiled:
     from .ta_utility import TA_INTEGER_DEFAULT
 from ..settings import TA_FUNC_NO_RANGE_CHECK
@@ -30,9 +32,9 @@ def TA_WILLR_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_WILLR(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inHigh: cython.double[::1],
-    inLow: cython.double[::1],
-    inClose: cython.double[::1],
+    inHigh: cython.const[cython.double][::1],
+    inLow: cython.const[cython.double][::1],
+    inClose: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -78,61 +80,25 @@ def TA_WILLR(
         outNBElement[0] = 0
         return TA_RetCode.TA_SUCCESS
 
-    # Proceed with the calculation for the requested range.
+    # Rolling lowest low and highest high, O(n) for any period and any
+    # input, see TA_INT_EXTREMA. The highest high goes straight to outReal.
+    lowestLow: cython.double[::1] = np.empty(endIdx - startIdx + 1, dtype=np.double)
+    TA_INT_EXTREMA(startIdx, endIdx, inLow, optInTimePeriod, False, False, lowestLow, None)
+    TA_INT_EXTREMA(startIdx, endIdx, inHigh, optInTimePeriod, True, False, outReal, None)
+
     outIdx: cython.Py_ssize_t = 0
     today: cython.Py_ssize_t = startIdx
-    trailingIdx: cython.Py_ssize_t = startIdx - nbInitialElementNeeded
-    lowestIdx: cython.Py_ssize_t = -1
-    highestIdx: cython.Py_ssize_t = -1
-    lowest: cython.double = 0.0
-    highest: cython.double = 0.0
-    diff: cython.double = 0.0
-    tmp: cython.double
+    highest: cython.double
+    diff: cython.double
 
     while today <= endIdx:
-        # Set the lowest low
-        tmp = inLow[today]
-        if lowestIdx < trailingIdx:
-            lowestIdx = trailingIdx
-            lowest = inLow[lowestIdx]
-            i: cython.Py_ssize_t = lowestIdx
-            while i <= today:
-                tmp = inLow[i]
-                if tmp < lowest:
-                    lowestIdx = i
-                    lowest = tmp
-                i += 1
-            diff = (highest - lowest) / (-100.0)
-        elif tmp <= lowest:
-            lowestIdx = today
-            lowest = tmp
-            diff = (highest - lowest) / (-100.0)
-
-        # Set the highest high
-        tmp = inHigh[today]
-        if highestIdx < trailingIdx:
-            highestIdx = trailingIdx
-            highest = inHigh[highestIdx]
-            i: cython.Py_ssize_t = highestIdx
-            while i <= today:
-                tmp = inHigh[i]
-                if tmp > highest:
-                    highestIdx = i
-                    highest = tmp
-                i += 1
-            diff = (highest - lowest) / (-100.0)
-        elif tmp >= highest:
-            highestIdx = today
-            highest = tmp
-            diff = (highest - lowest) / (-100.0)
-
+        highest = outReal[outIdx]
+        diff = (highest - lowestLow[outIdx]) / (-100.0)
         if diff != 0.0:
             outReal[outIdx] = (highest - inClose[today]) / diff
         else:
             outReal[outIdx] = 0.0
         outIdx += 1
-
-        trailingIdx += 1
         today += 1
 
     outBegIdx[0] = startIdx
@@ -140,11 +106,13 @@ def TA_WILLR(
     return TA_RetCode.TA_SUCCESS
 
 
+@rowwise("inHigh", "inLow", "inClose")
 def WILLR(
     inHigh: np.ndarray,
     inLow: np.ndarray,
     inClose: np.ndarray,
     timeperiod: int = 14,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     WILLR(inHigh, inLow, inClose[, timeperiod=14])
@@ -173,9 +141,8 @@ def WILLR(
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_WILLR_Lookback(timeperiod)
 
-    outReal = np.full_like(inHigh, np.nan)
-    outBegIdx = np.zeros(1, dtype=np.intp)
-    outNBElement = np.zeros(1, dtype=np.intp)
+    outReal = check_out(out, inHigh)
+    outBegIdx, outNBElement = index_buffers()
 
     retCode = TA_WILLR(
         0,
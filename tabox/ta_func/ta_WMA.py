@@ -1,6 +1,7 @@
 import cython
+from typing import Optional
 import numpy as np
-from .ta_utils import check_array, check_begidx1, check_timeperiod
+from .ta_utils import check_array, check_begidx1, check_timeperiod, rowwise, check_out, index_buffers
 from ..retcode import TA_RetCode
 
 
@@ -14,7 +15,7 @@ def TA_WMA_Lookback(optInTimePeriod: cython.int) -> cython.Py_ssize_t:
 def TA_WMA(
     startIdx: cython.Py_ssize_t,
     endIdx: cython.Py_ssize_t,
-    inReal: cython.double[::1],
+    inReal: cython.const[cython.double][::1],
     optInTimePeriod: cython.int,
     outBegIdx: cython.Py_ssize_t[::1],
     outNBElement: cython.Py_ssize_t[::1],
@@ -128,7 +129,8 @@ def TA_WMA(
     return TA_RetCode.TA_SUCCESS
 
 
-def WMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+@rowwise("real")
+def WMA(real: np.ndarray, timeperiod: int = 30, out: Optional[np.ndarray] = None) -> np.ndarray:
     """WMA(real[, timeperiod=?])
 
     Weighted Moving Average (Overlap Studies)
@@ -143,15 +145,14 @@ def WMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     real = check_array(real)
     check_timeperiod(timeperiod)
 
-    outReal = np.full_like(real, np.nan)
+    outReal = check_out(out, real)
     length: cython.Py_ssize_t = real.shape[0]
 
     startIdx: cython.Py_ssize_t = check_begidx1(real)
     endIdx: cython.Py_ssize_t = length - startIdx - 1
     lookback: cython.Py_ssize_t = startIdx + TA_WMA_Lookback(timeperiod)
 
-    outBegIdx: cython.Py_ssize_t[::1] = np.zeros(shape=(1,), dtype=np.intp)
-    outNBElement: cython.Py_ssize_t[::1] = np.zeros(shape=(1,), dtype=np.intp)
+    outBegIdx, outNBElement = index_buffers()
 
     TA_WMA(
         0,
@@ -38,4 +38,5 @@ cpdef double TA_HIGHLOWRANGE(double inHigh, double inLow)
 cpdef int TA_CANDLECOLOR(double inClose, double inOpen)
 
 
-cdef int TA_INTEGER_DEFAULT = -1
\ No newline at end of file
+cdef int TA_INTEGER_DEFAULT = -1
+cdef int TA_COMPATIBILITY_METASTOCK
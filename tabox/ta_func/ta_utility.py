@@ -3,7 +3,8 @@
 # define TA_IS_ZERO_OR_NEG(v) (v<0.00000001)
 import cython
 import math
-from typing import List
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
 from ..retcode import TA_RetCode
 
 
@@ -212,27 +213,140 @@ class TA_Compatibility(IntEnum):
     TA_COMPATIBILITY_METASTOCK = 2
     TA_COMPATIBILITY_TA_LIB = 3
 
+# TA_COMPATIBILITY_METASTOCK as a C int, for the kernels running without the GIL
+TA_COMPATIBILITY_METASTOCK: cython.int = TA_Compatibility.TA_COMPATIBILITY_METASTOCK
+
+
+class TA_RangeType(IntEnum):
+    TA_RangeType_RealBody = 0
+    TA_RangeType_HighLow = 1
+    TA_RangeType_Shadows = 2
+
+
+class TA_CandleSettingType(IntEnum):
+    TA_BodyLong = 0
+    TA_BodyVeryLong = 1
+    TA_BodyShort = 2
+    TA_BodyDoji = 3
+    TA_ShadowLong = 4
+    TA_ShadowVeryLong = 5
+    TA_ShadowShort = 6
+    TA_ShadowVeryShort = 7
+    TA_Near = 8
+    TA_Far = 9
+    TA_Equal = 10
+    TA_AllCandleSettings = 11
+
+
+class TA_CandleSetting:
+    """How a candle pattern measures a candle: which range, averaged over
+    how many previous candles and multiplied by which factor."""
+
+    def __init__(self, settingType: TA_CandleSettingType, rangeType: TA_RangeType,
+                 avgPeriod: int, factor: float):
+        self.settingType = settingType
+        self.rangeType = rangeType
+        self.avgPeriod = avgPeriod
+        self.factor = factor
+
+    def __repr__(self):
+        return "TA_CandleSetting(%s, %s, %d, %r)" % (
+            self.settingType.name, self.rangeType.name, self.avgPeriod, self.factor)
+
+
+TA_CandleDefaultSettings = (
+    # real body is long when it's longer than the average of the 10 previous candles' real body
+    TA_CandleSetting(TA_CandleSettingType.TA_BodyLong, TA_RangeType.TA_RangeType_RealBody, 10, 1.0),
+    # real body is very long when it's longer than 3 times the average of the 10 previous candles' real body
+    TA_CandleSetting(TA_CandleSettingType.TA_BodyVeryLong, TA_RangeType.TA_RangeType_RealBody, 10, 3.0),
+    # real body is short when it's shorter than the average of the 10 previous candles' real bodies
+    TA_CandleSetting(TA_CandleSettingType.TA_BodyShort, TA_RangeType.TA_RangeType_RealBody, 10, 1.0),
+    # real body is like doji's body when it's shorter than 10% the average of the 10 previous candles' high-low range
+    TA_CandleSetting(TA_CandleSettingType.TA_BodyDoji, TA_RangeType.TA_RangeType_HighLow, 10, 0.1),
+    # shadow is long when it's longer than the real body
+    TA_CandleSetting(TA_CandleSettingType.TA_ShadowLong, TA_RangeType.TA_RangeType_RealBody, 0, 1.0),
+    # shadow is very long when it's longer than 2 times the real body
+    TA_CandleSetting(TA_CandleSettingType.TA_ShadowVeryLong, TA_RangeType.TA_RangeType_RealBody, 0, 2.0),
+    # shadow is short when it's shorter than half the average of the 10 previous candles' sum of shadows
+    TA_CandleSetting(TA_CandleSettingType.TA_ShadowShort, TA_RangeType.TA_RangeType_Shadows, 10, 1.0),
+    # shadow is very short when it's shorter than 10% the average of the 10 previous candles' high-low range
+    TA_CandleSetting(TA_CandleSettingType.TA_ShadowVeryShort, TA_RangeType.TA_RangeType_HighLow, 10, 0.1),
+    # when measuring distance between parts of candles or width of gaps
+    # "near" means "<= 20% of the average of the 5 previous candles' high-low range"
+    TA_CandleSetting(TA_CandleSettingType.TA_Near, TA_RangeType.TA_RangeType_HighLow, 5, 0.2),
+    # "far" means ">= 60% of the average of the 5 previous candles' high-low range"
+    TA_CandleSetting(TA_CandleSettingType.TA_Far, TA_RangeType.TA_RangeType_HighLow, 5, 0.6),
+    # "equal" means "<= 5% of the average of the 5 previous candles' high-low range"
+    TA_CandleSetting(TA_CandleSettingType.TA_Equal, TA_RangeType.TA_RangeType_HighLow, 5, 0.05),
+)
+
 
 class TA_Globals_t:
     unstablePeriod: List[cython.int]
     compatibility: TA_Compatibility
+    candleSettings: List[TA_CandleSetting]
 
     def __init__(self):
         self.unstablePeriod = [0] * TA_FuncUnstId.TA_FUNC_UNST_ALL
         self.compatibility = TA_Compatibility.TA_COMPATIBILITY_DEFAULT
+        self.candleSettings = [
+            TA_CandleSetting(s.settingType, s.rangeType, s.avgPeriod, s.factor)
+            for s in TA_CandleDefaultSettings
+        ]
 
 
 TA_Globals = TA_Globals_t()
 
 
+class TA_Overrides:
+    """Settings that replace ``TA_Globals`` in one context, None where they do not
+
+    ``unstablePeriod`` holds one entry per ``TA_FuncUnstId``. The record is
+    never modified: nested overrides make a new one on top of the outer.
+    """
+
+    def __init__(self, unstablePeriod: Tuple[Optional[int], ...], compatibility: Optional[TA_Compatibility]):
+        self.unstablePeriod = unstablePeriod
+        self.compatibility = compatibility
+
+
+# Overrides of the running context (thread, task), None outside any
+TA_ContextOverrides: ContextVar = ContextVar("TA_ContextOverrides", default=None)
+
+
 def TA_GLOBALS_UNSTABLE_PERIOD(id: TA_FuncUnstId) -> cython.int:
+    overrides = TA_ContextOverrides.get()
+    if overrides is not None and overrides.unstablePeriod[id] is not None:
+        return overrides.unstablePeriod[id]
     return TA_Globals.unstablePeriod[id]
 
 
 def TA_GLOBALS_COMPATIBILITY() -> TA_Compatibility:
+    overrides = TA_ContextOverrides.get()
+    if overrides is not None and overrides.compatibility is not None:
+        return overrides.compatibility
     return TA_Globals.compatibility
 
 
+def TA_OverrideSettings(unstablePeriod: dict, compatibility: Optional[TA_Compatibility]):
+    """Override the settings in the running context and return the token restoring them
+
+    ``unstablePeriod`` maps ``TA_FuncUnstId`` values to periods,
+    ``TA_FUNC_UNST_ALL`` sets all of them. The values are read by the
+    kernels once per call, before their loops, as C ints.
+    """
+    overrides = TA_ContextOverrides.get()
+    periods = [None] * TA_FuncUnstId.TA_FUNC_UNST_ALL if overrides is None else list(overrides.unstablePeriod)
+    for id, period in unstablePeriod.items():
+        if id == TA_FuncUnstId.TA_FUNC_UNST_ALL:
+            periods = [period] * TA_FuncUnstId.TA_FUNC_UNST_ALL
+        else:
+            periods[id] = period
+    if compatibility is None and overrides is not None:
+        compatibility = overrides.compatibility
+    return TA_ContextOverrides.set(TA_Overrides(tuple(periods), compatibility))
+
+
 def TA_SetUnstablePeriod(id: TA_FuncUnstId, unstablePeriod: int) -> TA_RetCode:
     if id > TA_FuncUnstId.TA_FUNC_UNST_ALL:
         return TA_RetCode.TA_BAD_PARAM
@@ -250,7 +364,7 @@ def TA_GetUnstablePeriod(id: TA_FuncUnstId) -> int:
     if id >= TA_FuncUnstId.TA_FUNC_UNST_ALL:
         return 0
 
-    return TA_Globals.unstablePeriod[id]
+    return TA_GLOBALS_UNSTABLE_PERIOD(id)
 
 
 def TA_SetCompatibility(value: TA_Compatibility) -> TA_RetCode:
@@ -259,4 +373,29 @@ def TA_SetCompatibility(value: TA_Compatibility) -> TA_RetCode:
 
 
 def TA_GetCompatibility() -> TA_Compatibility:
-    return TA_Globals.compatibility
+    return TA_GLOBALS_COMPATIBILITY()
+
+
+def TA_SetCandleSettings(settingType: TA_CandleSettingType, rangeType: TA_RangeType,
+                         avgPeriod: int, factor: float) -> TA_RetCode:
+    if settingType >= TA_CandleSettingType.TA_AllCandleSettings:
+        return TA_RetCode.TA_BAD_PARAM
+    if avgPeriod < 0:
+        return TA_RetCode.TA_BAD_PARAM
+
+    TA_Globals.candleSettings[settingType] = TA_CandleSetting(
+        TA_CandleSettingType(settingType), TA_RangeType(rangeType), avgPeriod, factor)
+    return TA_RetCode.TA_SUCCESS
+
+
+def TA_RestoreCandleDefaultSettings(settingType: TA_CandleSettingType) -> TA_RetCode:
+    if settingType > TA_CandleSettingType.TA_AllCandleSettings:
+        return TA_RetCode.TA_BAD_PARAM
+
+    if settingType == TA_CandleSettingType.TA_AllCandleSettings:
+        for s in TA_CandleDefaultSettings:
+            TA_SetCandleSettings(s.settingType, s.rangeType, s.avgPeriod, s.factor)
+    else:
+        s = TA_CandleDefaultSettings[settingType]
+        TA_SetCandleSettings(s.settingType, s.rangeType, s.avgPeriod, s.factor)
+    return TA_RetCode.TA_SUCCESS
@@ -1,9 +1,17 @@
 from .ta_utility cimport TA_INTEGER_DEFAULT
+cdef extern from "math.h":
+    bint isnan(double x) nogil
 cpdef void check_timeperiod(int timeperiod)
-cpdef int check_begidx1(double[::1] a1)
-cpdef int check_begidx2(double[::1] a1, double[::1] a2)
-cpdef int check_begidx3(double[::1] a1, double[::1] a2, double[::1] a3)
-cpdef int check_begidx4(double[::1] a1, double[::1] a2, double[::1] a3, double[::1] a4)
-cpdef check_length2(double[::1] a1, double[::1] a2)
-cpdef check_length3(double[::1] a1, double[::1] a2, double[::1] a3)
-cpdef check_length4(double[::1] a1, double[::1] a2, double[::1] a3, double[::1] a4)
\ No newline at end of file
+cpdef int check_begidx1(const double[::1] a1)
+cdef Py_ssize_t first_valid(const double[::1] a1) noexcept nogil
+ctypedef int (*row_kernel)(Py_ssize_t startIdx, Py_ssize_t endIdx, const double[::1] inReal, int optInTimePeriod,
+                           double optInReal, int unstablePeriod, int compatibility, Py_ssize_t[::1] outBegIdx,
+                           Py_ssize_t[::1] outNBElement, double[::1] outReal) noexcept nogil
+cdef Py_ssize_t kernel_rows(row_kernel kernel, const double[:, ::1] inReal, Py_ssize_t lookback, int optInTimePeriod,
+                            double optInReal, int unstablePeriod, int compatibility, double[:, ::1] outReal)
+cpdef int check_begidx2(const double[::1] a1, const double[::1] a2)
+cpdef int check_begidx3(const double[::1] a1, const double[::1] a2, const double[::1] a3)
+cpdef int check_begidx4(const double[::1] a1, const double[::1] a2, const double[::1] a3, const double[::1] a4)
+cpdef check_length2(const double[::1] a1, const double[::1] a2)
+cpdef check_length3(const double[::1] a1, const double[::1] a2, const double[::1] a3)
+cpdef check_length4(const double[::1] a1, const double[::1] a2, const double[::1] a3, const double[::1] a4)
\ No newline at end of file
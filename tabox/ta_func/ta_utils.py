@@ -1,6 +1,18 @@
-from typing import Any
+from typing import Any, Callable, Optional
+import copy
+import functools
+import inspect
+import sys
+import threading
 import numpy as np
 import cython
+from .. import settings
+
+if not cython.compiled:
+    from math import isnan
+
+# The array type of the inputs, compared by identity first
+_DOUBLE = np.dtype(np.float64)
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -8,83 +20,520 @@ def check_array(real: Any) -> np.ndarray:
     if not isinstance(real, np.ndarray):
         real = np.array(real, dtype=np.float64)
 
-    if real.dtype != np.float64:
+    if real.dtype is not _DOUBLE and real.dtype != _DOUBLE:
         raise Exception("input array type is not double")
     if real.ndim != 1:
         raise Exception("input array has wrong dimensions")
-    if not real.data.c_contiguous:
+    if not real.flags.c_contiguous:
         real = np.ascontiguousarray(real)
     return real
 
+def check_array2d(real: Any, axis: int) -> np.ndarray:
+    """Return ``real`` as a C-contiguous (n_series, n_bars) float64 array.
+
+    ``axis`` is the axis of ``real`` that runs along the bars.
+    """
+    if not isinstance(real, np.ndarray):
+        real = np.array(real, dtype=np.float64)
+
+    if real.dtype != _DOUBLE:
+        raise Exception("input array type is not double")
+    if real.ndim != 2:
+        raise Exception("input array has wrong dimensions")
+    if axis == 0 or axis == -2:
+        real = real.T
+    elif axis != 1 and axis != -1:
+        raise Exception("axis is out of range")
+    if not real.flags.c_contiguous:
+        real = np.ascontiguousarray(real)
+    return real
+
+def rowwise(*input_names: str, lookback: Optional[Callable] = None, positions: bool = False,
+            rows: Optional[Callable] = None):
+    """Let a 1-D wrapper accept 2-D arrays holding one series per row.
+
+    ``input_names`` are the names of the array arguments of the wrapper.
+    When the first input is 2-D, the wrapper gains an ``axis`` keyword
+    (the axis running along the bars, ``-1`` by default), every row goes
+    through the 1-D wrapper, so each row gets its own NaN prefix handling,
+    and the results are written into preallocated 2-D outputs: the first
+    row sizes them, the others are computed directly into their rows.
+    Tuple and dict results give a tuple or dict of 2-D outputs. A 2-D
+    ``out`` (or a tuple of them) receives the rows in place; with
+    ``axis=-1`` and C-contiguous buffers each row is computed directly
+    into ``out``.
+
+    ``rows`` is the row kernel of a single-output wrapper, like
+    ``TA_SMA_Rows``. It takes the (n_series, n_bars) inputs, the
+    parameters of the wrapper before ``out`` and the 2-D output, and
+    returns the number of rows that are all NaN. It replaces the loop over
+    the 1-D wrapper, so the matrix is checked once and the kernel runs
+    over the rows without the GIL; the row kernels share that loop through
+    :func:`kernel_rows`. Only wrappers of one input and one output have a
+    row kernel (SMA, EMA, RSI, SUM, VAR, CMO and KAMA); the others loop
+    over the 1-D wrapper holding the GIL.
+
+    The wrapper also gains ``start`` and ``last`` keywords, see
+    :func:`_tail_call`. ``lookback`` is called with the wrapper's
+    parameters by name and returns its lookback, by default the module's
+    ``TA_<name>_Lookback``. ``positions`` marks outputs holding bar
+    positions, like MAXINDEX, which are shifted back to the caller's bars.
+    Both are kept on the wrapper: ``wrapper.lookback(*args, **kwargs)``
+    returns the lookback of a call and ``wrapper.positions`` the flag.
+
+    The ``unstable_period`` and ``compatibility`` keywords run the call
+    with those settings, like ``with tabox.settings(...)`` around it.
+
+    The ``state`` and ``return_state`` keywords of the resumable wrappers
+    (see :func:`resume_state`) carry one series and are refused with 2-D
+    inputs, ``start`` or ``last``.
+
+    Like TA-Lib, ``out`` may be one of the inputs: the inputs sharing its
+    memory are copied before the kernel writes into it.
+    """
+    n_inputs = len(input_names)
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters)
+        out_index = parameters.index("out") if "out" in parameters else len(parameters)
+        defaults = [signature.parameters[name].default for name in parameters[n_inputs:out_index]]
+
+        @functools.wraps(func)
+        def wrapper(*args, axis: int = -1, start: Optional[int] = None, last: Optional[int] = None,
+                    unstable_period: Any = None, compatibility: Any = None, **kwargs):
+            if unstable_period is not None or compatibility is not None:
+                with settings(unstable_period=unstable_period, compatibility=compatibility):
+                    return wrapper(*args, axis=axis, start=start, last=last, **kwargs)
+            out = args[out_index] if len(args) > out_index else kwargs.get("out")
+            if out is not None and start is None and last is None:
+                args = _unalias(input_names, out, args, kwargs)
+            first = args[0] if args else kwargs.get(input_names[0])
+            ndim = first.ndim if type(first) is np.ndarray else np.ndim(first)
+            if start is None and last is None and ndim != 2:
+                return func(*args, **kwargs)
+            if kwargs.get("state") is not None or kwargs.get("return_state"):
+                raise Exception("state is only supported for a 1-D input without start or last")
+            if start is not None or last is not None:
+                return _tail_call(wrapper, func, input_names, lookback, positions,
+                                  args, kwargs, axis, start, last)
+
+            inputs = []
+            for i in range(n_inputs):
+                if i < len(args):
+                    inputs.append(check_array2d(args[i], axis))
+                else:
+                    inputs.append(check_array2d(kwargs.pop(input_names[i]), axis))
+            shape = inputs[0].shape
+            for a in inputs[1:]:
+                if a.shape != shape:
+                    raise Exception("input array lengths are different")
+            if shape[0] == 0:
+                raise Exception("input array has no rows")
+            params = args[n_inputs:]
+
+            out = kwargs.pop("out", None)
+            if rows is not None:
+                # Refused above unless None or False
+                kwargs.pop("state", None)
+                kwargs.pop("return_state", None)
+                return _rowwise_kernel(rows, parameters[n_inputs:out_index], defaults, inputs, params,
+                                       kwargs, out, axis)
+            if out is not None:
+                return _rowwise_out(func, inputs, params, kwargs, out, axis)
+
+            outputs = None
+            single = True
+            keys = None
+            for row in range(shape[0]):
+                if outputs is not None and keys is None and out_index < len(parameters):
+                    targets = [o[row] for o in outputs]
+                    func(*[a[row] for a in inputs], *params,
+                         out=targets[0] if single else tuple(targets), **kwargs)
+                    continue
+                result = func(*[a[row] for a in inputs], *params, **kwargs)
+                if isinstance(result, dict):
+                    keys = list(result)
+                    result = tuple(result.values())
+                if outputs is None:
+                    single = not isinstance(result, tuple)
+                    results = (result,) if single else result
+                    outputs = [np.empty(shape, dtype=r.dtype) for r in results]
+                results = (result,) if single else result
+                for out, r in zip(outputs, results):
+                    out[row] = r
+
+            if axis == 0 or axis == -2:
+                outputs = [out.T for out in outputs]
+            if keys is not None:
+                return dict(zip(keys, outputs))
+            if single:
+                return outputs[0]
+            return tuple(outputs)
+
+        wrapper.lookback = functools.partial(_warmup, func, input_names, lookback)
+        wrapper.positions = positions
+        return wrapper
+
+    return decorator
+
+def _unalias(input_names, out, args, kwargs) -> tuple:
+    """Copy the inputs sharing memory with ``out``, return the new ``args``.
+
+    The kernels read the inputs while they write the outputs, and the
+    wrappers fill the outputs with NaN first.
+    """
+    buffers = out if isinstance(out, (tuple, list)) else (out,)
+    buffers = [b for b in buffers if isinstance(b, np.ndarray)]
+    args = list(args)
+    for i, name in enumerate(input_names):
+        array = args[i] if i < len(args) else kwargs.get(name)
+        if not isinstance(array, np.ndarray) or not any(np.shares_memory(array, b) for b in buffers):
+            continue
+        if i < len(args):
+            args[i] = array.copy()
+        else:
+            kwargs[name] = array.copy()
+    return tuple(args)
+
+def _rowwise_kernel(rows, names, defaults, inputs, params, kwargs, out, axis: int):
+    """Run the row kernel ``rows`` over the 2-D ``inputs``, into ``out`` when given.
+
+    ``names`` and ``defaults`` are the parameters of the wrapper, which
+    ``params`` and ``kwargs`` give positionally or by name.
+    """
+    values = list(params)
+    for name, default in zip(names[len(params):], defaults[len(params):]):
+        values.append(kwargs.pop(name, default))
+    if kwargs:
+        raise TypeError("got an unexpected keyword argument '%s'" % next(iter(kwargs)))
+    if len(values) > len(names):
+        raise TypeError("takes %d positional arguments but %d were given" % (
+            len(names) + len(inputs), len(values) + len(inputs)))
+
+    target = None
+    buffer = None
+    if out is not None:
+        if not isinstance(out, np.ndarray) or out.ndim != 2:
+            raise Exception("output array has wrong dimensions")
+        target = out.T if axis == 0 or axis == -2 else out
+        if target.shape != inputs[0].shape:
+            raise Exception("output array shape is different")
+        if target.dtype != _DOUBLE:
+            raise Exception("output array type is not float64")
+        if target.flags.c_contiguous and target.flags.writeable:
+            buffer = target
+    if buffer is None:
+        buffer = np.empty(inputs[0].shape)
+
+    if rows(*inputs, *values, buffer):
+        raise Exception("inputs are all NaN")
+    if out is None:
+        return buffer.T if axis == 0 or axis == -2 else buffer
+    if buffer is not target:
+        target[...] = buffer
+    return out
+
+def _rowwise_out(func, inputs, params, kwargs, out, axis: int):
+    """Run ``func`` row by row into the caller's 2-D ``out`` buffers."""
+    single = not isinstance(out, (tuple, list))
+    buffers = [out] if single else list(out)
+    targets = []
+    for buffer in buffers:
+        if not isinstance(buffer, np.ndarray) or buffer.ndim != 2:
+            raise Exception("output array has wrong dimensions")
+        if axis == 0 or axis == -2:
+            buffer = buffer.T
+        if buffer.shape != inputs[0].shape:
+            raise Exception("output array shape is different")
+        targets.append(buffer)
+
+    # Rows of a C-contiguous (n_series, n_bars) buffer are contiguous, so
+    # the 1-D wrapper writes into them directly. Otherwise copy each row.
+    direct = all(t.flags.c_contiguous for t in targets)
+    for row in range(inputs[0].shape[0]):
+        rows = [t[row] for t in targets]
+        if direct:
+            func(*[a[row] for a in inputs], *params, out=rows[0] if single else tuple(rows), **kwargs)
+            continue
+        result = func(*[a[row] for a in inputs], *params, **kwargs)
+        results = result if isinstance(result, tuple) else (result,)
+        if len(results) != len(rows):
+            raise Exception("out must be a tuple of %d arrays" % len(results))
+        for target, r in zip(rows, results):
+            if target.dtype != r.dtype:
+                raise Exception("output array type is not %s" % r.dtype.name)
+            target[:] = r
+    return out
+
+def _bars(array: np.ndarray, begin: int, axis: int) -> np.ndarray:
+    """View of ``array`` from bar ``begin`` on, ``axis`` runs along the bars of 2-D arrays."""
+    if array.ndim == 2 and (axis == 0 or axis == -2):
+        return array[begin:]
+    return array[..., begin:]
+
+def _normalize(name: str) -> str:
+    if name.startswith("optIn"):
+        name = name[5:]
+    return name.replace("_", "").lower()
+
+def _default_lookback(func) -> Callable:
+    """Return ``TA_<name>_Lookback`` of the module of ``func`` as a function of the wrapper's parameters.
+
+    The lookback arguments are matched to the wrapper parameters by name,
+    ``optInFastK_Period`` takes ``fastk_period``.
+    """
+    ta_lookback = getattr(sys.modules[func.__module__], "TA_%s_Lookback" % func.__name__, None)
+    if ta_lookback is None:
+        raise Exception("%s has no lookback, start and last are not supported" % func.__name__)
+    names = [_normalize(name) for name in inspect.signature(ta_lookback).parameters]
+
+    def lookback(**params):
+        values = {_normalize(name): value for name, value in params.items()}
+        return ta_lookback(*[values[name] for name in names])
+    return lookback
+
+def _warmup(func, input_names, lookback: Optional[Callable], *args, **kwargs) -> int:
+    """Lookback of ``func`` called with ``args`` and ``kwargs``, -1 for bad parameters."""
+    kwargs.pop("out", None)
+    unstable_period = kwargs.pop("unstable_period", None)
+    compatibility = kwargs.pop("compatibility", None)
+    if unstable_period is not None or compatibility is not None:
+        with settings(unstable_period=unstable_period, compatibility=compatibility):
+            return _warmup(func, input_names, lookback, *args, **kwargs)
+    params = inspect.signature(func).bind(*args, **kwargs)
+    params.apply_defaults()
+    params = {name: value for name, value in params.arguments.items() if name not in input_names}
+    if lookback is None:
+        lookback = _default_lookback(func)
+    return lookback(**params)
+
+def _tail_call(wrapper, func, input_names, lookback, positions: bool, args, kwargs, axis: int,
+               start: Optional[int], last: Optional[int]):
+    """Compute only the bars from ``start`` on, or the ``last`` bars.
+
+    The inputs are cut to those bars plus the lookback of the function, the
+    same warm-up TA-Lib runs for a ``startIdx``. Indicators that only look
+    at their window (MAX, MIDPOINT, WILLR..., ``tabox.chunked.WINDOWED``)
+    give exactly their full history values. The ones keeping running sums
+    (SMA, SUM, VAR, CCI, LINEARREG...) start their sums at the warm-up, so
+    they match the full history only up to floating point rounding.
+    Recursive ones (EMA family, RSI, ATR, ADX, SAR...) are seeded at the
+    start of the warm-up like TA-Lib does, and their lookback includes the
+    unstable period set with ``TA_SetUnstablePeriod``. The results are as short as the requested
+    bars, or written into the tail of ``out``, which may be either that
+    short or as long as the inputs; the bars before are left untouched.
+    """
+    args = list(args)
+    inputs = []
+    for i, name in enumerate(input_names):
+        array = args[i] if i < len(args) else kwargs[name]
+        inputs.append(array if isinstance(array, np.ndarray) else np.array(array, dtype=np.float64))
+    length = inputs[0].shape[0 if inputs[0].ndim == 2 and (axis == 0 or axis == -2) else -1]
+
+    if last is not None:
+        if start is not None:
+            raise Exception("start and last cannot be given together")
+        if last < 0 or last > length:
+            raise Exception("last is out of range")
+        start = length - last
+    elif start < 0 or start > length:
+        raise Exception("start is out of range")
+
+    out = kwargs.pop("out", None)
+    warmup = _warmup(func, input_names, lookback, *args, **kwargs)
+    begin = max(0, start - warmup) if warmup >= 0 else 0
+
+    for i, name in enumerate(input_names):
+        if i < len(args):
+            args[i] = _bars(inputs[i], begin, axis)
+        else:
+            kwargs[name] = _bars(inputs[i], begin, axis)
+    result = wrapper(*args, axis=axis, **kwargs)
+
+    keys = None
+    if isinstance(result, dict):
+        keys = list(result)
+        result = tuple(result.values())
+    single = not isinstance(result, tuple)
+    results = [_bars(r, start - begin, axis) for r in ((result,) if single else result)]
+    if positions and begin > 0:
+        # Positions count from the first bar that is not NaN, which moves
+        # forward when the NaN prefix ends before the warm-up.
+        transposed = inputs[0].ndim == 2 and (axis == 0 or axis == -2)
+        prefix = inputs[0][:begin].T if transposed else inputs[0][..., :begin]
+        valid = ~np.isnan(prefix)
+        shift = np.where(valid.any(axis=-1), begin - np.argmax(valid, axis=-1), 0)
+        if inputs[0].ndim == 2:
+            shift = shift[np.newaxis, :] if transposed else shift[:, np.newaxis]
+        results = [r + shift for r in results]
+
+    if out is None:
+        if keys is not None:
+            return dict(zip(keys, results))
+        return results[0] if single else tuple(results)
+
+    buffers = [out] if single else list(out)
+    if len(buffers) != len(results):
+        raise Exception("out must be a tuple of %d arrays" % len(results))
+    for buffer, r in zip(buffers, results):
+        if not isinstance(buffer, np.ndarray):
+            raise Exception("output array is not an ndarray")
+        if buffer.dtype != r.dtype:
+            raise Exception("output array type is not %s" % r.dtype.name)
+        if buffer.ndim != r.ndim:
+            raise Exception("output array has wrong dimensions")
+        bars = buffer.shape[0 if buffer.ndim == 2 and (axis == 0 or axis == -2) else -1]
+        if bars != length and bars != length - start:
+            raise Exception("output array length is different")
+        tail = _bars(buffer, bars - (length - start), axis)
+        if tail.shape != r.shape:
+            raise Exception("output array shape is different")
+        tail[...] = r
+    return out
+
+def resume_state(state: Any, record: type, *params: Any) -> Any:
+    """Return the state record a resumable wrapper runs from.
+
+    Without ``state`` a new ``record`` for ``params`` is made, the series
+    starts at its first bar that is not NaN. Otherwise ``state``, the
+    terminal state returned by the previous call, is checked against the
+    parameters and copied, so the caller's record can seed several calls.
+    """
+    if state is None:
+        return record(*params)
+    if type(state) is not record:
+        raise Exception("state is not a %s" % record.__name__)
+    if state.params != params:
+        raise Exception("state was computed with other parameters")
+    return copy.deepcopy(state)
+
 def check_timeperiod(timeperiod: cython.int) -> None:
     if timeperiod <= 1:
         raise Exception('function failed with error code 2: Bad Parameter (TA_BAD_PARAM)')
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_begidx1(a1: cython.double[::1]) -> cython.int:
+def check_begidx1(a1: cython.const[cython.double][::1]) -> cython.int:
     length = a1.shape[0]
     for i in range(length):
         val: cython.double = a1[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         return i
     raise Exception("inputs are all NaN")
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_begidx2(a1: cython.double[::1], a2: cython.double[::1]) -> cython.int:
+def first_valid(a1: cython.const[cython.double][::1]) -> cython.Py_ssize_t:
+    """Index of the first value of ``a1`` that is not NaN, its length when all are NaN"""
+    i: cython.Py_ssize_t = 0
+    length: cython.Py_ssize_t = a1.shape[0]
+    while i < length and isnan(a1[i]):
+        i += 1
+    return i
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def kernel_rows(
+    kernel,
+    inReal: cython.const[cython.double][:, ::1],
+    lookback: cython.Py_ssize_t,
+    optInTimePeriod: cython.int,
+    optInReal: cython.double,
+    unstablePeriod: cython.int,
+    compatibility: cython.int,
+    outReal: cython.double[:, ::1],
+) -> cython.Py_ssize_t:
+    """Run ``kernel`` over every row of ``inReal`` into the same row of ``outReal``
+
+    The loop of the ``TA_<name>_Rows`` row kernels of :func:`rowwise`.
+    ``kernel`` is a ``row_kernel``: it takes the bars of one row from its
+    first value that is not NaN, and the parameters passed here (the ones
+    its function does not use are ignored). Each row is NaN up to that
+    value plus ``lookback``, all of it when ``lookback`` is negative (bad
+    parameters). The rows run without the GIL. Returns the number of rows
+    that are all NaN.
+    """
+    outBegIdx: cython.Py_ssize_t[::1]
+    outNBElement: cython.Py_ssize_t[::1]
+    outBegIdx, outNBElement = index_buffers()
+    nan: cython.double = np.nan
+    length: cython.Py_ssize_t = inReal.shape[1]
+    if lookback < 0:
+        lookback = length
+    nanRows: cython.Py_ssize_t = 0
+    row: cython.Py_ssize_t
+    i: cython.Py_ssize_t
+    startIdx: cython.Py_ssize_t
+    begin: cython.Py_ssize_t
+    with cython.nogil:
+        for row in range(inReal.shape[0]):
+            startIdx = first_valid(inReal[row])
+            begin = min(startIdx + lookback, length)
+            for i in range(begin):
+                outReal[row, i] = nan
+            if startIdx == length:
+                nanRows += 1
+            elif begin < length:
+                kernel(0, length - startIdx - 1, inReal[row, startIdx:], optInTimePeriod, optInReal,
+                       unstablePeriod, compatibility, outBegIdx, outNBElement, outReal[row, begin:])
+    return nanRows
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def check_begidx2(a1: cython.const[cython.double][::1], a2: cython.const[cython.double][::1]) -> cython.int:
     length = a1.shape[0]
     for i in range(length):
         val = a1[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         val = a2[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         return i
     raise Exception("inputs are all NaN")
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_begidx3(a1: cython.double[::1], a2: cython.double[::1], a3: cython.double[::1]) -> cython.int:
+def check_begidx3(a1: cython.const[cython.double][::1], a2: cython.const[cython.double][::1], a3: cython.const[cython.double][::1]) -> cython.int:
     length = a1.shape[0]
     for i in range(length):
         val = a1[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         val = a2[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         val = a3[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         return i
     raise Exception("inputs are all NaN")
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_begidx4(a1: cython.double[::1], a2: cython.double[::1], a3: cython.double[::1], a4: cython.double[::1]) -> cython.int:
+def check_begidx4(a1: cython.const[cython.double][::1], a2: cython.const[cython.double][::1], a3: cython.const[cython.double][::1], a4: cython.const[cython.double][::1]) -> cython.int:
     length = a1.shape[0]
     for i in range(length):
         val = a1[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         val = a2[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         val = a3[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         val = a4[i]
-        if np.isnan(val):
+        if isnan(val):
             continue
         return i
     raise Exception("inputs are all NaN")
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_length2(a1: cython.double[::1], a2: cython.double[::1]):
+def check_length2(a1: cython.const[cython.double][::1], a2: cython.const[cython.double][::1]):
     length = a1.shape[0]
     if length != a2.shape[0]:
         raise Exception("input array lengths are different")
@@ -92,7 +541,7 @@ def check_length2(a1: cython.double[::1], a2: cython.double[::1]):
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_length3(a1: cython.double[::1], a2: cython.double[::1], a3: cython.double[::1]):
+def check_length3(a1: cython.const[cython.double][::1], a2: cython.const[cython.double][::1], a3: cython.const[cython.double][::1]):
     length = a1.shape[0]
     if length != a2.shape[0]:
         raise Exception("input array lengths are different")
@@ -102,7 +551,7 @@ def check_length3(a1: cython.double[::1], a2: cython.double[::1], a3: cython.dou
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def check_length4(a1: cython.double[::1], a2: cython.double[::1], a3: cython.double[::1], a4: cython.double[::1]):
+def check_length4(a1: cython.const[cython.double][::1], a2: cython.const[cython.double][::1], a3: cython.const[cython.double][::1], a4: cython.const[cython.double][::1]):
     length = a1.shape[0]
     if length != a2.shape[0]:
         raise Exception("input array lengths are different")
@@ -115,4 +564,60 @@ def check_length4(a1: cython.double[::1], a2: cython.double[::1], a3: cython.dou
 def make_double_array(length: int, lookback: int) -> np.ndarray:
     outreal = np.empty((length,), dtype=np.float64)
     outreal[:lookback] = np.nan
-    return outreal
\ No newline at end of file
+    return outreal
+
+def check_out(out: Any, like: Any, index: int = 0, count: int = 1,
+              fill: Any = np.nan, dtype: Any = _DOUBLE) -> np.ndarray:
+    """Return the output buffer of a wrapper.
+
+    Without ``out`` a new array as long as ``like`` and filled with ``fill``
+    is allocated. Otherwise ``out`` (or ``out[index]`` of a tuple of
+    ``count`` arrays for multi-output functions) is checked and filled in
+    place, so the caller owns the memory and nothing is allocated.
+
+    The whole of ``out`` is filled, not only the lookback: the wrappers
+    check ``out`` before ``check_begidx1`` finds the leading NaN of the
+    inputs, a kernel writes nothing when the input is shorter than its
+    lookback, and some kernels (HT_ALL, each output from its own
+    lookback) leave bars after ``outBegIdx`` unwritten. The fill is one
+    sequential pass, what ``np.full`` costs without ``out``.
+    """
+    if out is None:
+        # np.empty with a positional dtype and fill, np.full costs several
+        # times more on short arrays
+        out = np.empty(len(like), dtype)
+        out.fill(fill)
+        return out
+    if count > 1:
+        if not isinstance(out, (tuple, list)) or len(out) != count:
+            raise Exception("out must be a tuple of %d arrays" % count)
+        out = out[index]
+    if not isinstance(out, np.ndarray):
+        raise Exception("output array is not an ndarray")
+    if out.dtype != dtype:
+        raise Exception("output array type is not %s" % np.dtype(dtype).name)
+    if out.ndim != 1:
+        raise Exception("output array has wrong dimensions")
+    if out.shape[0] != len(like):
+        raise Exception("output array length is different")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise Exception("output array is not a writeable contiguous array")
+    out.fill(fill)
+    return out
+
+_index_buffers = threading.local()
+
+def index_buffers() -> tuple:
+    """Return the (outBegIdx, outNBElement) pair reused by this thread.
+
+    The wrappers never read them back, so one pair per thread replaces two
+    allocations per call.
+    """
+    pair: object = getattr(_index_buffers, "pair", None)
+    if pair is None:
+        # Compiled, they are kept as typed memoryviews, which the kernels
+        # take without requesting the buffer of an ndarray on every call.
+        outBegIdx: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+        outNBElement: cython.Py_ssize_t[::1] = np.zeros(1, dtype=np.intp)
+        pair = _index_buffers.pair = (outBegIdx, outNBElement)
+    return pair
@@ -0,0 +1,90 @@
+import numpy as np
+import unittest
+
+import tabox
+from tabox.ta_func.ta_utility import TA_SetUnstablePeriod, TA_FuncUnstId
+
+
+class TestBundle(unittest.TestCase):
+
+    def assertSame(self, this_ret, that_ret):
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def prices(self, length):
+        high = np.random.random(length) + 1.0
+        low = high - np.random.random(length)
+        close = (high + low) / 2.0
+        high[:3] = np.nan
+        return high, low, close
+
+    def check_directional(self, high, low, close, timeperiod):
+        this_ret = tabox.bundle.directional(high, low, close, timeperiod=timeperiod)
+        self.assertSame(this_ret["plus_di"], tabox.PLUS_DI(high, low, close, timeperiod))
+        self.assertSame(this_ret["minus_di"], tabox.MINUS_DI(high, low, close, timeperiod))
+        self.assertSame(this_ret["dx"], tabox.DX(high, low, close, timeperiod))
+        self.assertSame(this_ret["adx"], tabox.ADX(high, low, close, timeperiod))
+        self.assertSame(this_ret["adxr"], tabox.ADXR(high, low, close, timeperiod))
+        self.assertSame(this_ret["atr"], tabox.ATR(high, low, close, timeperiod))
+        self.assertSame(this_ret["natr"], tabox.NATR(high, low, close, timeperiod))
+
+    def test_directional(self):
+        for length in (10, 40, 300):
+            for timeperiod in (2, 14):
+                self.check_directional(*self.prices(length), timeperiod)
+
+    def test_directional_unstable(self):
+        try:
+            for func_id in (TA_FuncUnstId.TA_FUNC_UNST_ADX, TA_FuncUnstId.TA_FUNC_UNST_DX,
+                            TA_FuncUnstId.TA_FUNC_UNST_ATR, TA_FuncUnstId.TA_FUNC_UNST_PLUS_DI):
+                TA_SetUnstablePeriod(func_id, 5)
+            self.check_directional(*self.prices(200), 14)
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+
+    def test_bands(self):
+        for length in (3, 50, 300):
+            real = np.random.random(length)
+            real[:2] = np.nan
+            this_ret = tabox.bundle.bands(real, timeperiod=5, nbdevup=2.0, nbdevdn=1.5)
+            upper, middle, lower = tabox.BBANDS(real, 5, 2.0, 1.5)
+            self.assertSame(this_ret["sma"], tabox.SMA(real, 5))
+            self.assertSame(this_ret["var"], tabox.VAR(real, 5))
+            self.assertSame(this_ret["stddev"], tabox.STDDEV(real, 5))
+            self.assertSame(this_ret["upperband"], upper)
+            self.assertSame(this_ret["middleband"], middle)
+            self.assertSame(this_ret["lowerband"], lower)
+
+    def check_moving_averages(self, real, timeperiod):
+        this_ret = tabox.bundle.moving_averages(real, timeperiod=timeperiod)
+        self.assertSame(this_ret["sma"], tabox.SMA(real, timeperiod))
+        self.assertSame(this_ret["ema"], tabox.EMA(real, timeperiod))
+        self.assertSame(this_ret["dema"], tabox.DEMA(real, timeperiod))
+        self.assertSame(this_ret["tema"], tabox.TEMA(real, timeperiod))
+        self.assertSame(this_ret["trix"], tabox.TRIX(real, timeperiod))
+
+    def test_moving_averages(self):
+        for length in (5, 13, 14, 50, 300):
+            real = np.random.random(length)
+            real[:2] = np.nan
+            for timeperiod in (2, 5):
+                self.check_moving_averages(real, timeperiod)
+
+    def test_moving_averages_unstable(self):
+        try:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_EMA, 5)
+            for length in (20, 300):
+                self.check_moving_averages(np.random.random(length), 10)
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+
+    def test_matrix(self):
+        matrix = np.random.random((3, 60))
+        this_ret = tabox.bundle.bands(matrix, timeperiod=10)
+        for row in range(3):
+            that_ret = tabox.bundle.bands(matrix[row], timeperiod=10)
+            for name in that_ret:
+                self.assertSame(this_ret[name][row], that_ret[name])
+
+
+if __name__ == '__main__':
+    unittest.main()
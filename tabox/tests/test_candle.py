@@ -0,0 +1,116 @@
+import numpy as np
+import unittest
+
+import talib
+import talib._ta_lib
+
+import tabox
+from tabox.ta_func.ta_utility import (TA_SetCandleSettings, TA_RestoreCandleDefaultSettings,
+                                      TA_CandleSettingType, TA_RangeType)
+
+
+def ohlc(seed, length=6000):
+    """Trending OHLC bars with gaps, marubozu and doji, so that every pattern shows up."""
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-1.0, 0.0, 1.0], length // 8 + 1), 8)[:length]
+    jump = np.where(rng.random(length) < 0.2, rng.choice([-6.0, 6.0], length), 0.0)
+    close = 1000 + np.cumsum(drift + rng.normal(size=length) + jump)
+    prev = np.roll(close, 1)
+    prev[0] = close[0]
+    open = prev + jump + rng.normal(scale=0.3, size=length)
+    open[::5] = prev[::5]
+    doji = rng.random(length) < 0.05
+    close[doji] = open[doji]
+    high = np.maximum(open, close) + rng.choice([0.0, 0.1, 1.0, 3.0], length) * rng.exponential(1.0, length)
+    low = np.minimum(open, close) - rng.choice([0.0, 0.1, 1.0, 3.0], length) * rng.exponential(1.0, length)
+    return open, high, low, close
+
+
+class TestCandle(unittest.TestCase):
+
+    def test_talib(self):
+        hits = dict.fromkeys(tabox.candle.PATTERNS, 0)
+        for seed in (0, 1, 11):
+            inputs = ohlc(seed)
+            for name in tabox.candle.PATTERNS:
+                this_ret = getattr(tabox, name)(*inputs)
+                that_ret = getattr(talib, name)(*inputs)
+                self.assertTrue(np.array_equal(this_ret, that_ret), name)
+                hits[name] += np.count_nonzero(that_ret)
+        self.assertEqual([name for name, count in hits.items() if count == 0], [])
+
+    def test_penetration(self):
+        inputs = ohlc(0)
+        for name in ("CDLABANDONEDBABY", "CDLDARKCLOUDCOVER", "CDLEVENINGDOJISTAR", "CDLEVENINGSTAR",
+                     "CDLMATHOLD", "CDLMORNINGDOJISTAR", "CDLMORNINGSTAR"):
+            for penetration in (0.0, 0.1, 0.8):
+                this_ret = getattr(tabox, name)(*inputs, penetration=penetration)
+                that_ret = getattr(talib, name)(*inputs, penetration=penetration)
+                self.assertTrue(np.array_equal(this_ret, that_ret), name)
+
+    def test_candle_settings(self):
+        settings = (
+            (TA_CandleSettingType.TA_BodyLong, TA_RangeType.TA_RangeType_Shadows, 3, 1.5),
+            (TA_CandleSettingType.TA_ShadowShort, TA_RangeType.TA_RangeType_Shadows, 0, 1.0),
+            (TA_CandleSettingType.TA_Near, TA_RangeType.TA_RangeType_RealBody, 0, 0.5),
+            (TA_CandleSettingType.TA_BodyDoji, TA_RangeType.TA_RangeType_HighLow, 20, 0.2),
+        )
+        inputs = ohlc(1, 2000)
+        try:
+            for setting in settings:
+                TA_SetCandleSettings(*setting)
+                talib._ta_lib._ta_set_candle_settings(*(int(value) for value in setting[:3]), setting[3])
+            for name in tabox.candle.PATTERNS:
+                this_ret = getattr(tabox, name)(*inputs)
+                that_ret = getattr(talib, name)(*inputs)
+                self.assertTrue(np.array_equal(this_ret, that_ret), name)
+        finally:
+            TA_RestoreCandleDefaultSettings(TA_CandleSettingType.TA_AllCandleSettings)
+            talib._ta_lib._ta_restore_candle_default_settings(int(TA_CandleSettingType.TA_AllCandleSettings))
+
+    def test_scan(self):
+        inputs = ohlc(2, 3000)
+        signals = tabox.candle.scan(*inputs)
+        self.assertEqual(signals.dtype, np.int8)
+        self.assertEqual(signals.shape, (len(tabox.candle.PATTERNS), 3000))
+        for row, name in zip(signals, tabox.candle.PATTERNS):
+            expected = getattr(tabox, name)(*inputs) // tabox.candle.SCALE
+            self.assertTrue(np.array_equal(row, expected), name)
+
+    def test_scan_options(self):
+        inputs = ohlc(2, 3000)
+        patterns = ("CDLMORNINGSTAR", "CDLDOJI")
+        signals = tabox.candle.scan(*inputs, patterns=patterns, penetration={"CDLMORNINGSTAR": 0.6})
+        self.assertTrue(np.array_equal(signals[0] * 10, tabox.CDLMORNINGSTAR(*inputs, penetration=0.6)))
+        self.assertTrue(np.array_equal(signals[1] * 10, tabox.CDLDOJI(*inputs)))
+
+        out = np.ones((2, 3000), dtype=np.int8)
+        self.assertIs(tabox.candle.scan(*inputs, patterns=patterns, out=out), out)
+        self.assertTrue(np.array_equal(out[1] * 10, tabox.CDLDOJI(*inputs)))
+        with self.assertRaises(Exception):
+            tabox.candle.scan(*inputs, patterns=patterns, out=np.zeros((2, 3000)))
+        with self.assertRaises(Exception):
+            tabox.candle.scan(*inputs, patterns=("CDLNOTHING",))
+        with self.assertRaises(Exception):
+            tabox.candle.scan(*inputs, penetration={"CDLDOJI": 0.5})
+
+    def test_leading_nan(self):
+        open, high, low, close = ohlc(3, 500)
+        for array in (open, high, low, close):
+            array[:7] = np.nan
+        signals = tabox.candle.scan(open, high, low, close)
+        trimmed = tabox.candle.scan(open[7:], high[7:], low[7:], close[7:])
+        self.assertFalse(signals[:, :7].any())
+        self.assertTrue(np.array_equal(signals[:, 7:], trimmed))
+        self.assertTrue(np.array_equal(tabox.CDLHIKKAKE(open, high, low, close)[7:],
+                                       talib.CDLHIKKAKE(open[7:], high[7:], low[7:], close[7:])))
+
+    def test_short_series(self):
+        inputs = ohlc(4, 12)
+        signals = tabox.candle.scan(*inputs)
+        for row, name in zip(signals, tabox.candle.PATTERNS):
+            self.assertTrue(np.array_equal(row.astype(np.intp) * 10, getattr(talib, name)(*inputs)), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,5 +14,35 @@ class TestCCI(unittest.TestCase):
             that_ret = that_CCI(high, low, close)
             self.assertTrue(np.allclose(this_ret, that_ret, equal_nan=True))
 
+    def test_CCI_fast(self):
+        for t in (2, 14, 50, 200):
+            for i in (t - 1, t, 300, 1000):
+                high = np.random.random(i) + 1.0
+                low = high - np.random.random(i)
+                close = (high + low) / 2.0
+                this_ret = this_CCI(high, low, close, timeperiod=t, exact=False)
+                that_ret = this_CCI(high, low, close, timeperiod=t)
+                self.assertTrue(np.allclose(this_ret, that_ret, equal_nan=True))
+
+    def test_CCI_fast_flat(self):
+        price = np.r_[np.full(5, np.nan), np.full(30, 10.0), np.random.random(30)]
+        this_ret = this_CCI(price, price, price, timeperiod=14, exact=False)
+        that_ret = this_CCI(price, price, price, timeperiod=14)
+        self.assertTrue(np.allclose(this_ret, that_ret, equal_nan=True))
+        self.assertTrue(np.all(this_ret[18:35] == 0.0))
+
+    def test_CCI_fast_interior_nan(self):
+        high = np.random.random(200) + 1.0
+        low = high - np.random.random(200)
+        close = (high + low) / 2.0
+        close[60] = np.nan
+        high[61] = np.nan
+        this_ret = this_CCI(high, low, close, timeperiod=14, exact=False)
+        that_ret = this_CCI(high, low, close, timeperiod=14)
+        self.assertTrue(np.allclose(this_ret, that_ret, equal_nan=True))
+        # NaN while a NaN is in the window, then the values come back.
+        self.assertTrue(np.isnan(this_ret[60:75]).all())
+        self.assertFalse(np.isnan(this_ret[75:]).any())
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import numpy as np
+import unittest
+
+import tabox
+
+
+class TestChunked(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.tmp = tempfile.TemporaryDirectory()
+        close = np.cumsum(rng.normal(size=2000)) + 100.0
+        self.close = self.memmap("close", close)
+        self.high = self.memmap("high", close + rng.random(2000))
+        self.low = self.memmap("low", close - rng.random(2000))
+        for real in (self.high, self.low, self.close):
+            real[:5] = np.nan
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def memmap(self, name, values=None, dtype=np.float64):
+        array = np.memmap(os.path.join(self.tmp.name, name), dtype=dtype, mode="w+", shape=(2000,))
+        if values is not None:
+            array[:] = values
+        return array
+
+    def test_resumable(self):
+        out = self.memmap("rsi")
+        for chunk_bars in (7, 300, 5000):
+            self.assertIs(tabox.chunked.compute(tabox.RSI, self.close, out, 14, chunk_bars=chunk_bars), out)
+            self.assertTrue(np.array_equal(out, tabox.RSI(self.close, 14), equal_nan=True))
+        out = self.memmap("adx")
+        tabox.chunked.compute(tabox.ADX, (self.high, self.low, self.close), out, timeperiod=10, chunk_bars=128)
+        self.assertTrue(np.array_equal(out, tabox.ADX(self.high, self.low, self.close, 10), equal_nan=True))
+        out = (self.memmap("mama"), self.memmap("fama"))
+        tabox.chunked.compute(tabox.MAMA, self.close, out, chunk_bars=100)
+        for this_ret, that_ret in zip(out, tabox.MAMA(self.close)):
+            self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_windowed(self):
+        out = self.memmap("willr")
+        tabox.chunked.compute(tabox.WILLR, (self.high, self.low, self.close), out, 14, chunk_bars=100)
+        self.assertTrue(np.array_equal(out, tabox.WILLR(self.high, self.low, self.close, 14), equal_nan=True))
+        out = (self.memmap("min"), self.memmap("max"))
+        tabox.chunked.compute(tabox.MINMAX, self.close, out, 30, chunk_bars=10)
+        for this_ret, that_ret in zip(out, tabox.MINMAX(self.close, 30)):
+            self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_positions(self):
+        # Positions count from the first bar of the whole series.
+        out = self.memmap("maxindex", dtype=np.intp)
+        for chunk_bars in (3, 64):
+            tabox.chunked.compute(tabox.MAXINDEX, self.close, out, 30, chunk_bars=chunk_bars)
+            self.assertTrue(np.array_equal(out, tabox.MAXINDEX(self.close, 30)))
+
+    def test_history(self):
+        out = self.memmap("sma")
+        with self.assertRaises(Exception):
+            tabox.chunked.compute(tabox.SMA, self.close, out, 30)
+        tabox.chunked.compute(tabox.SMA, self.close, out, 30, chunk_bars=100, exact=False)
+        self.assertTrue(np.allclose(out, tabox.SMA(self.close, 30), equal_nan=True))
+
+    def test_errors(self):
+        with self.assertRaises(Exception):
+            tabox.chunked.compute(tabox.RSI, self.close, np.zeros(10))
+        with self.assertRaises(Exception):
+            tabox.chunked.compute(tabox.RSI, self.close, self.memmap("rsi"), chunk_bars=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import tabox
+
+
+class TestCompiled(unittest.TestCase):
+
+    def test_build_info(self):
+        info = tabox.build_info()
+        self.assertIn("ta_SMA", info["modules"])
+        self.assertIn("ta_utils", info["modules"])
+        self.assertEqual(info["compiled"], all(info["modules"].values()))
+        self.assertEqual(tabox.is_compiled(), info["compiled"])
+
+    def test_require_compiled(self):
+        env = dict(os.environ, TABOX_REQUIRE_COMPILED="1")
+        result = subprocess.run([sys.executable, "-c", "import tabox"], env=env,
+                                capture_output=True, text=True)
+        if tabox.is_compiled():
+            self.assertEqual(result.returncode, 0, result.stderr)
+        else:
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn("TABOX_REQUIRE_COMPILED", result.stderr)
+
+    def test_silent(self):
+        env = dict(os.environ, TABOX_REQUIRE_COMPILED="0")
+        result = subprocess.run([sys.executable, "-W", "error", "-c", "import tabox"], env=env,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
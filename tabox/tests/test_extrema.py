@@ -0,0 +1,48 @@
+import numpy as np
+
+import tabox
+import talib
+
+import unittest
+
+def series(n=2000):
+    """Inputs that stress the window extremum logic."""
+    yield np.random.random(n)
+    yield np.arange(n, dtype=np.float64)
+    yield np.arange(n, 0, -1, dtype=np.float64)
+    yield np.full(n, 5.0)
+    yield np.round(np.random.random(n) * 4.0)
+    yield np.sin(np.arange(n) / 50.0)
+
+class TestExtrema(unittest.TestCase):
+    def assertSame(self, this_ret, that_ret, compare=np.array_equal):
+        if not isinstance(this_ret, tuple):
+            this_ret, that_ret = (this_ret,), (that_ret,)
+        for a, b in zip(this_ret, that_ret):
+            self.assertTrue(compare(a, b, equal_nan=True))
+
+    def test_single_input(self):
+        for real in series():
+            for t in (2, 3, 14, 150, 1000):
+                for name in ("MAX", "MIN", "MINMAX", "MAXINDEX", "MININDEX", "MINMAXINDEX", "MIDPOINT"):
+                    self.assertSame(getattr(tabox, name)(real, timeperiod=t),
+                                    getattr(talib, name)(real, timeperiod=t))
+
+    def test_high_low(self):
+        for real in series():
+            high = real + 1.0
+            low = real - np.round(np.random.random(len(real)))
+            close = (high + low) / 2.0
+            for t in (2, 3, 14, 150, 1000):
+                for name in ("AROON", "AROONOSC", "MIDPRICE"):
+                    self.assertSame(getattr(tabox, name)(high, low, timeperiod=t),
+                                    getattr(talib, name)(high, low, timeperiod=t))
+                self.assertSame(tabox.WILLR(high, low, close, timeperiod=t),
+                                talib.WILLR(high, low, close, timeperiod=t), np.allclose)
+                self.assertSame(tabox.STOCHF(high, low, close, fastk_period=t),
+                                talib.STOCHF(high, low, close, fastk_period=t), np.allclose)
+                self.assertSame(tabox.STOCH(high, low, close, fastk_period=t),
+                                talib.STOCH(high, low, close, fastk_period=t), np.allclose)
+
+if __name__ == '__main__':
+    unittest.main()
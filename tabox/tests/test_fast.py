@@ -0,0 +1,41 @@
+import numpy as np
+import unittest
+
+import tabox
+
+
+class TestFast(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.close = np.cumsum(rng.normal(size=100)) + 100.0
+        self.high = self.close + rng.random(100)
+        self.low = self.close - rng.random(100)
+        self.close[:3] = np.nan
+
+    def test_values(self):
+        self.assertTrue(np.array_equal(tabox.fast.SMA(self.close, 10), tabox.SMA(self.close, 10), equal_nan=True))
+        self.assertTrue(np.array_equal(tabox.fast.ATR(self.high, self.low, self.close, 14),
+                                       tabox.ATR(self.high, self.low, self.close, 14), equal_nan=True))
+        for this_ret, that_ret in zip(tabox.fast.MINMAXINDEX(self.close, 10), tabox.MINMAXINDEX(self.close, 10)):
+            self.assertTrue(np.array_equal(this_ret, that_ret))
+        out = np.zeros(100)
+        self.assertIs(tabox.fast.EMA(self.close, 10, out=out), out)
+        self.assertTrue(np.array_equal(out, tabox.EMA(self.close, 10), equal_nan=True))
+
+    def test_names(self):
+        self.assertIn("CDLDOJI", tabox.fast.__all__)
+        self.assertNotIn("TA_SMA", tabox.fast.__all__)
+        self.assertIn("RSI", dir(tabox.fast))
+        with self.assertRaises(AttributeError):
+            tabox.fast.TA_SMA
+
+    def test_one_dimension(self):
+        with self.assertRaises(Exception):
+            tabox.fast.SMA(np.vstack([self.close, self.close]), 10)
+        with self.assertRaises(TypeError):
+            tabox.fast.SMA(self.close, 10, last=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import numpy as np
+import unittest
+
+import tabox
+from tabox.ta_func.ta_utility import TA_SetUnstablePeriod, TA_FuncUnstId
+
+
+class TestHT_ALL(unittest.TestCase):
+
+    def check(self, real):
+        dcperiod, dcphase, inphase, quadrature, sine, leadsine, trendline, trendmode = tabox.HT_ALL(real)
+        # The fused pass runs the same steps as the standalone functions.
+        self.assertTrue(np.array_equal(dcperiod, tabox.HT_DCPERIOD(real), equal_nan=True))
+        self.assertTrue(np.array_equal(dcphase, tabox.HT_DCPHASE(real), equal_nan=True))
+        for this_ret, that_ret in zip((inphase, quadrature), tabox.HT_PHASOR(real)):
+            self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+        for this_ret, that_ret in zip((sine, leadsine), tabox.HT_SINE(real)):
+            self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+        self.assertTrue(np.array_equal(trendline, tabox.HT_TRENDLINE(real), equal_nan=True))
+        self.assertTrue(np.array_equal(trendmode, tabox.HT_TRENDMODE(real)))
+
+    def test_random_vector(self):
+        for i in (10, 40, 70, 300):
+            real = np.random.random(i) + 10.0
+            real[:3] = np.nan
+            self.check(real)
+
+    def test_unstable_period(self):
+        try:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_HT_DCPERIOD, 5)
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_HT_SINE, 20)
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_HT_TRENDMODE, 40)
+            self.check(np.random.random(300))
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+
+    def test_out(self):
+        real = np.random.random(200)
+        out = tuple(np.zeros(200) for _ in range(7)) + (np.ones(200, dtype=np.intp),)
+        ret = tabox.HT_ALL(real, out=out)
+        for this_ret, buf in zip(ret, out):
+            self.assertIs(this_ret, buf)
+        self.assertTrue(np.array_equal(out[7], tabox.HT_TRENDMODE(real)))
+
+
+if __name__ == '__main__':
+    unittest.main()
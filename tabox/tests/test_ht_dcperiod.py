@@ -0,0 +1,18 @@
+import numpy as np
+
+from tabox import HT_DCPERIOD as this_HT_DCPERIOD
+from talib import HT_DCPERIOD as that_HT_DCPERIOD
+
+import unittest
+
+class TestHT_DCPERIOD(unittest.TestCase):
+    def test_random_vector(self):
+        for i in range(100, 300):
+            close = np.random.random(i)
+            this_ret = this_HT_DCPERIOD(close)
+            that_ret = that_HT_DCPERIOD(close)
+
+            self.assertTrue(np.allclose(this_ret, that_ret, equal_nan=True), f"{close}, {this_ret}, {that_ret}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,18 @@
+import numpy as np
+
+from tabox import HT_DCPHASE as this_HT_DCPHASE
+from talib import HT_DCPHASE as that_HT_DCPHASE
+
+import unittest
+
+class TestHT_DCPHASE(unittest.TestCase):
+    def test_random_vector(self):
+        for i in range(100, 300):
+            close = np.random.random(i)
+            this_ret = this_HT_DCPHASE(close)
+            that_ret = that_HT_DCPHASE(close)
+
+            self.assertTrue(np.allclose(this_ret, that_ret, equal_nan=True), f"{close}, {this_ret}, {that_ret}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import numpy as np
+
+from tabox import HT_PHASOR as this_HT_PHASOR
+from talib import HT_PHASOR as that_HT_PHASOR
+
+import unittest
+
+class TestHT_PHASOR(unittest.TestCase):
+    def test_random_vector(self):
+        for i in range(100, 300):
+            close = np.random.random(i)
+            this_inphase, this_quadrature = this_HT_PHASOR(close)
+            that_inphase, that_quadrature = that_HT_PHASOR(close)
+
+            self.assertTrue(np.allclose(this_inphase, that_inphase, equal_nan=True), f"{close}, {this_inphase}, {that_inphase}")
+            self.assertTrue(np.allclose(this_quadrature, that_quadrature, equal_nan=True), f"{close}, {this_quadrature}, {that_quadrature}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import numpy as np
+
+from tabox import HT_SINE as this_HT_SINE
+from talib import HT_SINE as that_HT_SINE
+
+import unittest
+
+class TestHT_SINE(unittest.TestCase):
+    def test_random_vector(self):
+        for i in range(100, 300):
+            close = np.random.random(i)
+            this_sine, this_leadsine = this_HT_SINE(close)
+            that_sine, that_leadsine = that_HT_SINE(close)
+
+            self.assertTrue(np.allclose(this_sine, that_sine, equal_nan=True), f"{close}, {this_sine}, {that_sine}")
+            self.assertTrue(np.allclose(this_leadsine, that_leadsine, equal_nan=True), f"{close}, {this_leadsine}, {that_leadsine}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import numpy as np
+
+from tabox import HT_TRENDMODE as this_HT_TRENDMODE
+from talib import HT_TRENDMODE as that_HT_TRENDMODE
+
+import unittest
+
+class TestHT_TRENDMODE(unittest.TestCase):
+    def test_random_vector(self):
+        for i in range(100, 300):
+            close = np.random.random(i)
+            this_ret = this_HT_TRENDMODE(close)
+            that_ret = that_HT_TRENDMODE(close)
+
+            self.assertEqual(this_ret.dtype, np.intp)
+            self.assertTrue(np.array_equal(this_ret, that_ret), f"{close}, {this_ret}, {that_ret}")
+
+if __name__ == '__main__':
+    unittest.main()
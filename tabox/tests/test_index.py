@@ -0,0 +1,69 @@
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import tabox
+
+
+class TestRangeExtremaIndex(unittest.TestCase):
+
+    def series(self, length=700):
+        real = np.round(np.random.random(length) * 20.0)
+        real[:3] = np.nan
+        return real
+
+    def check_windows(self, index, real):
+        start = np.random.randint(3, len(real) - 1, 300)
+        stop = np.minimum(start + np.random.randint(1, 200, 300), len(real))
+        self.assertTrue(np.array_equal(
+            index.argmax(start, stop), [a + np.argmax(real[a:b]) for a, b in zip(start, stop)]))
+        self.assertTrue(np.array_equal(
+            index.argmin(start, stop), [a + np.argmin(real[a:b]) for a, b in zip(start, stop)]))
+        self.assertEqual(index.max(10, 60), np.max(real[10:60]))
+        self.assertEqual(index.min(10, 60), np.min(real[10:60]))
+
+    def test_windows(self):
+        real = self.series()
+        self.check_windows(tabox.index.RangeExtremaIndex(real), real)
+
+    def test_nan_skipped(self):
+        real = self.series()
+        index = tabox.index.RangeExtremaIndex(real)
+        self.assertEqual(index.argmax(0, 10), 3 + np.argmax(real[3:10]))
+        self.assertTrue(np.isnan(index.max(0, 3)))
+
+    def test_rolling(self):
+        real = self.series()
+        index = tabox.index.RangeExtremaIndex(real)
+        for period in (2, 3, 14, 100, 697, 698):
+            self.assertTrue(np.array_equal(index.rolling_max(period), tabox.MAX(real, period), equal_nan=True))
+            self.assertTrue(np.array_equal(index.rolling_min(period), tabox.MIN(real, period), equal_nan=True))
+        real = np.random.random(300)
+        index = tabox.index.RangeExtremaIndex(real)
+        self.assertTrue(np.array_equal(index.rolling_argmax(14), tabox.MAXINDEX(real, 14)))
+        self.assertTrue(np.array_equal(index.rolling_argmin(14), tabox.MININDEX(real, 14)))
+
+    def test_bad_window(self):
+        index = tabox.index.RangeExtremaIndex(self.series())
+        for start, stop in ((5, 5), (-1, 3), (0, 701)):
+            with self.assertRaises(Exception):
+                index.max(start, stop)
+
+    def test_persistence(self):
+        real = self.series()
+        path = tempfile.mkdtemp()
+        try:
+            built = tabox.index.RangeExtremaIndex(real, path=path + "/built")
+            built.save(path + "/saved")
+            for name in ("built", "saved"):
+                index = tabox.index.RangeExtremaIndex.open(path + "/" + name)
+                self.assertIsInstance(index.series, np.memmap)
+                self.check_windows(index, real)
+        finally:
+            shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import tabox
+
+
+class TestLazy(unittest.TestCase):
+
+    def test_import_is_lazy(self):
+        code = ("import sys, tabox; "
+                "print(sum(name.startswith('tabox.ta_func.ta_') for name in sys.modules)); "
+                "tabox.SMA; "
+                "print('tabox.ta_func.ta_SMA' in sys.modules)")
+        env = dict(os.environ, TABOX_REQUIRE_COMPILED="0")
+        result = subprocess.run([sys.executable, "-c", code], env=env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ["0", "True"])
+
+    def test_names(self):
+        for name in tabox.__all__:
+            self.assertIsNotNone(getattr(tabox, name))
+        self.assertIn("SMA", dir(tabox))
+        self.assertIn("TA_SMA", dir(tabox))
+        from tabox.ta_func.ta_SMA import SMA
+        self.assertIs(tabox.SMA, SMA)
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError):
+            tabox.NOT_AN_INDICATOR
+
+
+if __name__ == '__main__':
+    unittest.main()
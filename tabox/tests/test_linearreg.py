@@ -2,6 +2,8 @@ import numpy as np
 
 from tabox import LINEARREG as this_LINEARREG
 from talib import LINEARREG as that_LINEARREG
+import talib
+import tabox
 
 import unittest
 
@@ -13,6 +15,20 @@ class TestLINEARREG(unittest.TestCase):
             that_linearreg = that_LINEARREG(close)
 
             self.assertTrue(np.allclose(this_linearreg, that_linearreg, equal_nan=True), f"{close}, {this_linearreg}, {that_linearreg}")
+    def test_all(self):
+        for t in (2, 14, 200):
+            for i in (t - 1, t, 300, 5000):
+                close = np.random.random(i) * 100.0
+                this_ret = tabox.LINEARREG_ALL(close, timeperiod=t)
+                that_ret = (
+                    talib.LINEARREG(close, timeperiod=t),
+                    talib.LINEARREG_SLOPE(close, timeperiod=t),
+                    talib.LINEARREG_INTERCEPT(close, timeperiod=t),
+                    talib.LINEARREG_ANGLE(close, timeperiod=t),
+                    talib.TSF(close, timeperiod=t),
+                )
+                for this_out, that_out in zip(this_ret, that_ret):
+                    self.assertTrue(np.allclose(this_out, that_out, equal_nan=True))
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,117 @@
+import numpy as np
+import unittest
+
+import tabox
+
+
+class TestOut(unittest.TestCase):
+
+    def assertSame(self, this_ret, that_ret):
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_single(self):
+        real = np.random.random(200)
+        out = np.random.random(200)
+        this_ret = tabox.SMA(real, timeperiod=14, out=out)
+        self.assertIs(this_ret, out)
+        self.assertTrue(np.isnan(out[:13]).all())
+        self.assertSame(out, tabox.SMA(real, timeperiod=14))
+
+    def test_reuse(self):
+        out = np.empty(200)
+        for _ in range(3):
+            real = np.random.random(200)
+            tabox.RSI(real, timeperiod=14, out=out)
+            self.assertSame(out, tabox.RSI(real, timeperiod=14))
+
+    def test_leading_nan(self):
+        real = np.random.random(100)
+        real[:7] = np.nan
+        out = np.zeros(100)
+        tabox.EMA(real, timeperiod=10, out=out)
+        self.assertSame(out, tabox.EMA(real, timeperiod=10))
+
+    def test_tuple(self):
+        real = np.random.random(200)
+        out = (np.empty(200), np.empty(200), np.empty(200))
+        this_ret = tabox.BBANDS(real, timeperiod=20, out=out)
+        for buffer, ret, that in zip(out, this_ret, tabox.BBANDS(real, timeperiod=20)):
+            self.assertIs(ret, buffer)
+            self.assertSame(ret, that)
+
+        out = (np.empty(200), np.empty(200), np.empty(200))
+        tabox.MACD(real, out=out)
+        for buffer, that in zip(out, tabox.MACD(real)):
+            self.assertSame(buffer, that)
+
+    def test_integer(self):
+        real = np.random.random(100)
+        out = np.empty(100, dtype=np.intp)
+        tabox.MAXINDEX(real, timeperiod=10, out=out)
+        self.assertSame(out, tabox.MAXINDEX(real, timeperiod=10))
+
+    def test_multiple_inputs(self):
+        high = np.random.random(100) + 1.0
+        low = high - np.random.random(100)
+        close = (high + low) / 2.0
+        out = np.empty(100)
+        tabox.ATR(high, low, close, timeperiod=14, out=out)
+        self.assertSame(out, tabox.ATR(high, low, close, timeperiod=14))
+
+    def test_2d(self):
+        matrix = np.random.random((4, 100))
+        out = np.empty((4, 100))
+        self.assertIs(tabox.SMA(matrix, timeperiod=10, out=out), out)
+        self.assertSame(out, tabox.SMA(matrix, timeperiod=10))
+
+        out = np.empty((100, 4))
+        tabox.SMA(matrix.T, timeperiod=10, axis=0, out=out)
+        self.assertSame(out, tabox.SMA(matrix.T, timeperiod=10, axis=0))
+
+        out = (np.empty((4, 100)), np.empty((4, 100)))
+        tabox.MINMAX(matrix, timeperiod=10, out=out)
+        for buffer, that in zip(out, tabox.MINMAX(matrix, timeperiod=10)):
+            self.assertSame(buffer, that)
+
+    def test_in_place(self):
+        # The output may be an input, as in TA-Lib.
+        real = np.random.random(100)
+        that_ret = tabox.SMA(real, 5)
+        self.assertIs(tabox.SMA(real, 5, out=real), real)
+        self.assertSame(real, that_ret)
+
+        high = np.random.random(100) + 1.0
+        low = high - np.random.random(100)
+        close = (high + low) / 2.0
+        that_ret = tabox.ATR(high, low, close, 14)
+        tabox.ATR(high, low, close, 14, out=close)
+        self.assertSame(close, that_ret)
+
+        real = np.random.random(100)
+        that_ret = tabox.BBANDS(real, 20)
+        out = (np.empty(100), real, np.empty(100))
+        tabox.BBANDS(real, 20, out=out)
+        for buffer, that in zip(out, that_ret):
+            self.assertSame(buffer, that)
+
+        matrix = np.random.random((4, 100))
+        that_ret = tabox.EMA(matrix, 10)
+        tabox.EMA(matrix, 10, out=matrix)
+        self.assertSame(matrix, that_ret)
+
+    def test_bad_out(self):
+        real = np.random.random(100)
+        with self.assertRaises(Exception):
+            tabox.SMA(real, out=np.empty(99))
+        with self.assertRaises(Exception):
+            tabox.SMA(real, out=np.empty(100, dtype=np.float32))
+        with self.assertRaises(Exception):
+            tabox.SMA(real, out=np.empty(200)[::2])
+        with self.assertRaises(Exception):
+            tabox.BBANDS(real, out=(np.empty(100), np.empty(100)))
+        with self.assertRaises(Exception):
+            tabox.SMA(np.random.random((4, 100)), out=np.empty((4, 99)))
+
+
+if __name__ == '__main__':
+    unittest.main()
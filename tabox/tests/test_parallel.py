@@ -0,0 +1,54 @@
+import warnings
+import numpy as np
+import unittest
+
+import tabox
+
+
+class TestParallel(unittest.TestCase):
+
+    def assertSame(self, this_ret, that_ret):
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_list(self):
+        series = [np.random.random(n) for n in (50, 80, 120, 200)]
+        this_ret = tabox.parallel.map(tabox.RSI, series, workers=4, timeperiod=14)
+        self.assertEqual(len(this_ret), len(series))
+        for real, ret in zip(series, this_ret):
+            self.assertSame(ret, tabox.RSI(real, timeperiod=14))
+
+    def test_matrix(self):
+        matrix = np.random.random((6, 100))
+        this_ret = tabox.parallel.map(tabox.SMA, matrix, workers=3, timeperiod=10)
+        for row, ret in zip(matrix, this_ret):
+            self.assertSame(ret, tabox.SMA(row, timeperiod=10))
+
+    def test_tuple_inputs(self):
+        items = []
+        for _ in range(5):
+            high = np.random.random(100) + 1.0
+            low = high - np.random.random(100)
+            close = (high + low) / 2.0
+            items.append((high, low, close))
+        this_ret = tabox.parallel.map(tabox.ATR, items, workers=2, timeperiod=14)
+        for (high, low, close), ret in zip(items, this_ret):
+            self.assertSame(ret, tabox.ATR(high, low, close, timeperiod=14))
+
+    def test_gil_warning(self):
+        matrix = np.random.random((4, 100))
+        with self.assertWarns(RuntimeWarning):
+            tabox.parallel.map(tabox.WMA, matrix, workers=2, timeperiod=10)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            tabox.parallel.map(tabox.SMA, matrix, workers=2, timeperiod=10)
+            tabox.parallel.map(tabox.WMA, matrix, workers=1, timeperiod=10)
+        for name in tabox.parallel.GIL_FREE:
+            self.assertEqual(getattr(tabox, name).__name__, name)
+
+    def test_bad_workers(self):
+        with self.assertRaises(Exception):
+            tabox.parallel.map(tabox.SMA, [np.random.random(10)], workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
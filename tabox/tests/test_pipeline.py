@@ -0,0 +1,125 @@
+import numpy as np
+import unittest
+
+import tabox
+
+
+class TestPipeline(unittest.TestCase):
+
+    def assertSame(self, this_ret, that_ret):
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_dedupe(self):
+        g = tabox.pipeline.Graph()
+        close = g.input("close")
+        self.assertIs(g.EMA(close, 12), g.EMA(close, timeperiod=12))
+        self.assertIs(g.add(tabox.EMA, close, 12), g.EMA(close, 12))
+        self.assertIsNot(g.EMA(close, 12), g.EMA(close, 26))
+        # MA with matype=0 and the SMA it expands to are the same node
+        self.assertIs(g.MA(close, 20, 0), g.SMA(close, 20))
+        # STOCHRSI and BBANDS reuse the RSI, SMA and STDDEV nodes
+        g.RSI(close, 14)
+        g.STOCHRSI(close, 14)
+        g.STDDEV(close, 20)
+        n_nodes = len(g)
+        g.BBANDS(close, 20)
+        self.assertEqual(len(g), n_nodes + 1)
+
+    def test_unhashable_params(self):
+        close = np.random.random(300)
+        g = tabox.pipeline.Graph()
+        node = g.input("close")
+        ema = g.EMA(node, 10, unstable_period={"EMA": 5})
+        self.assertIs(ema, g.EMA(node, 10, unstable_period={"EMA": 5}))
+        self.assertIsNot(ema, g.EMA(node, 10, unstable_period={"EMA": 6}))
+        out = np.empty(300)
+        sma = g.SMA(node, 10, out=out)
+        self.assertIs(sma, g.SMA(node, 10, out=out))
+        self.assertIsNot(sma, g.SMA(node, 10, out=np.empty(300)))
+        g.output("ema", ema)
+        g.output("sma", sma)
+        result = g.run(close=close)
+        self.assertSame(result["ema"], tabox.EMA(close, 10, unstable_period=5))
+        self.assertIs(result["sma"], out)
+        self.assertSame(out, tabox.SMA(close, 10))
+
+    def test_run(self):
+        close = np.random.random(300)
+        high = close + np.random.random(300)
+        low = close - np.random.random(300)
+
+        g = tabox.pipeline.Graph()
+        c, h, l = g.input("close"), g.input("high"), g.input("low")
+        g.output("rsi", g.RSI(c, 14))
+        g.output("fastk", g.STOCHRSI(c, 14)[0])
+        g.output("upper", g.BBANDS(c, 20, 2.0, 1.5)[0])
+        g.output("apo", g.APO(c, 12, 26))
+        g.output("ppo", g.PPO(c, 26, 12))
+        g.output("macd", g.MACD(c, 12, 26, 9))
+        g.output("sma_rsi", g.SMA(g.RSI(c, 14), 5))
+        g.output("atr", g.ATR(h, l, c, 14))
+        result = g.run(close=close, high=high, low=low)
+
+        self.assertEqual(set(result), {"rsi", "fastk", "upper", "apo", "ppo", "macd", "sma_rsi", "atr"})
+        self.assertSame(result["rsi"], tabox.RSI(close, 14))
+        self.assertSame(result["fastk"], tabox.STOCHRSI(close, 14)[0])
+        self.assertSame(result["upper"], tabox.BBANDS(close, 20, 2.0, 1.5)[0])
+        self.assertSame(result["apo"], tabox.APO(close, 12, 26))
+        self.assertSame(result["ppo"], tabox.PPO(close, 26, 12))
+        for this_ret, that_ret in zip(result["macd"], tabox.MACD(close, 12, 26, 9)):
+            self.assertSame(this_ret, that_ret)
+        self.assertSame(result["sma_rsi"], tabox.SMA(tabox.RSI(close, 14), 5))
+        self.assertSame(result["atr"], tabox.ATR(high, low, close, 14))
+
+    def test_wrapper_keywords(self):
+        close = np.random.random(200)
+        matrix = np.random.random((200, 3))
+        out = np.empty(200)
+
+        g = tabox.pipeline.Graph()
+        c, m = g.input("close"), g.input("matrix")
+        g.output("last", g.MA(c, 10, 0, last=5))
+        g.output("start", g.BBANDS(c, 5, 2.0, 2.0, 0, start=190)[0])
+        g.output("out", g.MA(c, 10, 0, out=out))
+        g.output("unstable", g.MA(c, 10, 1, unstable_period=20))
+        g.output("compatibility", g.STOCHRSI(c, 14, compatibility="metastock")[0])
+        g.output("axis", g.APO(m, 5, 10, axis=0))
+        # The building blocks are still shared with the same keywords
+        self.assertIs(g.MA(c, 10, 1, unstable_period=20), g.EMA(c, 10, unstable_period=20))
+        self.assertIsNot(g.MA(c, 10, 1, unstable_period=20), g.EMA(c, 10))
+        result = g.run(close=close, matrix=matrix)
+
+        self.assertSame(result["last"], tabox.MA(close, 10, 0, last=5))
+        self.assertEqual(result["last"].shape, (5,))
+        self.assertSame(result["start"], tabox.BBANDS(close, 5, 2.0, 2.0, 0, start=190)[0])
+        self.assertIs(result["out"], out)
+        self.assertSame(out, tabox.MA(close, 10, 0))
+        self.assertSame(result["unstable"], tabox.MA(close, 10, 1, unstable_period=20))
+        self.assertFalse(np.array_equal(result["unstable"], tabox.MA(close, 10, 1), equal_nan=True))
+        self.assertSame(result["compatibility"], tabox.STOCHRSI(close, 14, compatibility="metastock")[0])
+        self.assertSame(result["axis"], tabox.APO(matrix, 5, 10, axis=0))
+
+    def test_once_per_node(self):
+        calls = []
+
+        def counted(real, timeperiod):
+            calls.append(timeperiod)
+            return tabox.SMA(real, timeperiod)
+
+        g = tabox.pipeline.Graph()
+        close = g.input("close")
+        g.output("a", g.add(counted, close, 5))
+        g.output("b", g.EMA(g.add(counted, close, timeperiod=5), 3))
+        g.add(counted, close, 7)  # not an output, never evaluated
+        g.run(close=np.random.random(50))
+        self.assertEqual(calls, [5])
+
+    def test_missing_input(self):
+        g = tabox.pipeline.Graph()
+        g.output("sma", g.SMA(g.input("close"), 5))
+        with self.assertRaises(Exception):
+            g.run(high=np.random.random(10))
+
+
+if __name__ == '__main__':
+    unittest.main()
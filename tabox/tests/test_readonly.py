@@ -0,0 +1,69 @@
+import inspect
+import os
+import tempfile
+import numpy as np
+import unittest
+
+import tabox
+
+
+def readonly(real):
+    # np.frombuffer on bytes gives a read-only, zero-copy array.
+    return np.frombuffer(real.tobytes(), dtype=np.float64)
+
+
+class TestReadonly(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        close = np.cumsum(rng.normal(size=300)) + 100.0
+        high = close + rng.random(300)
+        low = close - rng.random(300)
+        self.inputs = {
+            "open": close + rng.normal(scale=0.3, size=300), "high": high, "low": low, "close": close,
+            "volume": rng.random(300) * 1000.0, "real0": high, "real1": low,
+            # Inside the domain of ACOS, ASIN, LN...
+            "real": rng.random(300) * 0.9 + 0.05,
+            "periods": rng.integers(2, 30, size=300).astype(np.float64),
+        }
+        self.inputs["open_"] = self.inputs["open"]
+        for name in ("High", "Low", "Close"):
+            self.inputs["real" + name] = self.inputs[name.lower()]
+
+    def test_all_functions(self):
+        # Every wrapper takes read-only buffers without writing to them.
+        checked = 0
+        for name in tabox.__all__:
+            func = getattr(tabox, name)
+            if not name.isupper() or name.startswith("TA_") or not callable(func):
+                continue
+            names = [p.name for p in inspect.signature(func).parameters.values()
+                     if p.kind == p.POSITIONAL_OR_KEYWORD and p.default is inspect.Parameter.empty]
+            if not names or not all(n in self.inputs for n in names):
+                continue
+            inputs = [readonly(self.inputs[n]) for n in names]
+            this_ret = func(*inputs)
+            that_ret = func(*[self.inputs[n].copy() for n in names])
+            if not isinstance(this_ret, tuple):
+                this_ret, that_ret = (this_ret,), (that_ret,)
+            for this, that in zip(this_ret, that_ret):
+                self.assertTrue(np.array_equal(this, that, equal_nan=True), name)
+            for real, n in zip(inputs, names):
+                self.assertTrue(np.array_equal(real, self.inputs[n]), name)
+            checked += 1
+        self.assertGreater(checked, 150)
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as path:
+            file = os.path.join(path, "close")
+            self.inputs["close"].tofile(file)
+            close = np.memmap(file, dtype=np.float64, mode="r")
+            self.assertTrue(np.array_equal(tabox.RSI(close, 14), tabox.RSI(self.inputs["close"], 14),
+                                           equal_nan=True))
+            self.assertTrue(np.array_equal(tabox.SMA(np.vstack([close, close]), 10)[1],
+                                           tabox.SMA(self.inputs["close"], 10), equal_nan=True))
+            del close
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import pickle
+import numpy as np
+import unittest
+
+import tabox
+from tabox.ta_func.ta_utility import TA_SetUnstablePeriod, TA_FuncUnstId
+
+
+CASES = (
+    ("EMA", ("close",), (10,)),
+    ("RSI", ("close",), (14,)),
+    ("ATR", ("high", "low", "close"), (14,)),
+    ("ADX", ("high", "low", "close"), (14,)),
+    ("KAMA", ("close",), (30,)),
+    ("MAMA", ("close",), (0.5, 0.05)),
+    ("SAR", ("high", "low"), (0.02, 0.2)),
+    ("T3", ("close",), (5, 0.7)),
+)
+
+
+def flatten(result):
+    return result if isinstance(result, tuple) else (result,)
+
+
+class TestResume(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.close = np.cumsum(rng.normal(size=700)) + 100.0
+        self.high = self.close + rng.random(700)
+        self.low = self.close - rng.random(700)
+        for real in (self.high, self.low, self.close):
+            real[:3] = np.nan
+
+    def chunked(self, name, inputs, params, size):
+        func = getattr(tabox, name)
+        state = None
+        parts = []
+        for begin in range(0, len(inputs[0]), size):
+            result, state = func(*[real[begin:begin + size] for real in inputs], *params,
+                                 state=state, return_state=True)
+            parts.append(flatten(result))
+        return tuple(np.concatenate(values) for values in zip(*parts)), state
+
+    def check(self, size):
+        for name, input_names, params in CASES:
+            inputs = [getattr(self, input_name) for input_name in input_names]
+            expected = flatten(getattr(tabox, name)(*inputs, *params))
+            this_ret, _ = self.chunked(name, inputs, params, size)
+            for this, that in zip(this_ret, expected):
+                self.assertTrue(np.array_equal(this, that, equal_nan=True), (name, size))
+
+    def test_chunks(self):
+        # Consecutive chunks give exactly the values of one pass, even
+        # when the warm-up and the leading NaN span several chunks.
+        for size in (1, 2, 25, 700):
+            self.check(size)
+
+    def test_unstable_period(self):
+        try:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 20)
+            self.check(25)
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+
+    def test_state(self):
+        _, state = tabox.RSI(self.close[:100], 14, return_state=True)
+        self.assertEqual(state.today, 97)
+        self.assertEqual(state.prevValue, self.close[99])
+        _, state = tabox.T3(self.close[:100], 5, 0.7, return_state=True)
+        self.assertEqual(state.stage, 6)
+
+        # The seed is copied, it can start several continuations.
+        _, state = tabox.EMA(self.close[:100], 10, return_state=True)
+        this_ret = tabox.EMA(self.close[100:], 10, state=state)
+        that_ret = tabox.EMA(self.close[100:], 10, state=state)
+        self.assertTrue(np.array_equal(this_ret, that_ret))
+        self.assertTrue(np.array_equal(this_ret, tabox.EMA(self.close, 10)[100:]))
+
+        state = pickle.loads(pickle.dumps(tabox.KAMA(self.close[:100], 30, return_state=True)[1]))
+        self.assertTrue(np.array_equal(tabox.KAMA(self.close[100:], 30, state=state), tabox.KAMA(self.close, 30)[100:]))
+
+    def test_all_nan_chunk(self):
+        real = np.full(10, np.nan)
+        this_ret, state = tabox.EMA(real, 3, return_state=True)
+        self.assertTrue(np.isnan(this_ret).all())
+        self.assertEqual(state.today, 0)
+
+    def test_errors(self):
+        _, state = tabox.EMA(self.close, 10, return_state=True)
+        with self.assertRaises(Exception):
+            tabox.EMA(self.close, 20, state=state)
+        with self.assertRaises(Exception):
+            tabox.RSI(self.close, 10, state=state)
+        with self.assertRaises(Exception):
+            tabox.EMA(self.close, 10, state=state, last=5)
+        with self.assertRaises(Exception):
+            tabox.EMA(np.vstack([self.close, self.close]), 10, return_state=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import numpy as np
+import unittest
+
+import tabox
+
+
+class TestRowwise(unittest.TestCase):
+
+    def assertSame(self, this_ret, that_ret):
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_single_output(self):
+        matrix = np.random.random((7, 120))
+        matrix[2, :10] = np.nan
+        matrix[5, :3] = np.nan
+        this_ret = tabox.SMA(matrix, timeperiod=14, axis=1)
+        self.assertEqual(this_ret.shape, matrix.shape)
+        for row in range(matrix.shape[0]):
+            self.assertSame(this_ret[row], tabox.SMA(matrix[row], timeperiod=14))
+
+    def test_axis0(self):
+        matrix = np.random.random((120, 5))
+        this_ret = tabox.RSI(matrix, 14, axis=0)
+        self.assertEqual(this_ret.shape, matrix.shape)
+        for col in range(matrix.shape[1]):
+            self.assertSame(this_ret[:, col], tabox.RSI(np.ascontiguousarray(matrix[:, col]), 14))
+
+    def test_multi_input_output(self):
+        high = np.random.random((4, 100)) + 1.0
+        low = high - np.random.random((4, 100))
+        close = (high + low) / 2.0
+        this_ret = tabox.ATR(high, low, close=close, timeperiod=10)
+        for row in range(4):
+            self.assertSame(this_ret[row], tabox.ATR(high[row], low[row], close[row], timeperiod=10))
+
+        upper, middle, lower = tabox.BBANDS(close, timeperiod=5)
+        for row in range(4):
+            for this_ret, that_ret in zip((upper[row], middle[row], lower[row]), tabox.BBANDS(close[row], timeperiod=5)):
+                self.assertSame(this_ret, that_ret)
+
+    def test_row_kernels(self):
+        matrix = np.random.random((6, 80))
+        matrix[1, :10] = np.nan
+        matrix[4, :75] = np.nan
+        for func, args, kwargs in ((tabox.SMA, (5,), {}), (tabox.EMA, (10,), {"unstable_period": 5}),
+                                   (tabox.RSI, (14,), {"compatibility": "metastock"}), (tabox.SUM, (7,), {}),
+                                   (tabox.VAR, (), {"timeperiod": 5, "nbdev": 2.0}),
+                                   (tabox.CMO, (9,), {"compatibility": "metastock", "unstable_period": 3}),
+                                   (tabox.KAMA, (10,), {"unstable_period": 4})):
+            this_ret = func(matrix, *args, **kwargs)
+            that_ret = np.array([func(row, *args, **kwargs) for row in matrix])
+            self.assertSame(this_ret, that_ret)
+            out = np.empty_like(matrix.T)
+            self.assertIs(func(matrix.T, *args, axis=0, out=out, **kwargs), out)
+            self.assertSame(out, that_ret.T)
+
+        matrix[3] = np.nan
+        with self.assertRaises(Exception):
+            tabox.SMA(matrix, 5)
+        with self.assertRaises(TypeError):
+            tabox.EMA(matrix, 5, period=5)
+
+    def test_bad_shape(self):
+        with self.assertRaises(Exception):
+            tabox.ADD(np.random.random((3, 50)), np.random.random((2, 50)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import threading
+import numpy as np
+import unittest
+
+import tabox
+from tabox.ta_func.ta_utility import (TA_SetUnstablePeriod, TA_GetUnstablePeriod, TA_SetCompatibility,
+                                      TA_GetCompatibility, TA_FuncUnstId, TA_Compatibility)
+
+
+class TestSettings(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.close = np.cumsum(rng.normal(size=400)) + 100.0
+        self.high = self.close + rng.random(400)
+        self.low = self.close - rng.random(400)
+
+    def with_globals(self, func, *args, unstable_period=0, compatibility=TA_Compatibility.TA_COMPATIBILITY_DEFAULT):
+        try:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, unstable_period)
+            TA_SetCompatibility(compatibility)
+            return func(*args)
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+            TA_SetCompatibility(TA_Compatibility.TA_COMPATIBILITY_DEFAULT)
+
+    def test_per_call(self):
+        # The keywords give the values of the process-wide settings.
+        this_ret = tabox.ADX(self.high, self.low, self.close, 14, unstable_period=30)
+        that_ret = self.with_globals(tabox.ADX, self.high, self.low, self.close, 14, unstable_period=30)
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+        self.assertFalse(np.array_equal(this_ret, tabox.ADX(self.high, self.low, self.close, 14), equal_nan=True))
+        for this_ret, that_ret in zip(tabox.MACD(self.close, unstable_period={"EMA": 40}),
+                                      self.with_globals(tabox.MACD, self.close, unstable_period=40)):
+            self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+        this_ret = tabox.RSI(self.close, 14, compatibility="metastock")
+        that_ret = self.with_globals(tabox.RSI, self.close, 14,
+                                     compatibility=TA_Compatibility.TA_COMPATIBILITY_METASTOCK)
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+        self.assertEqual(np.isnan(this_ret).sum(), 13)
+        self.assertEqual(tabox.EMA.lookback(self.close, 10, unstable_period=5), 14)
+
+    def test_kernel_arguments(self):
+        # The public kernels resolve the settings before running their internal kernels.
+        for func, args in ((tabox.ADXR, (self.high, self.low, self.close, 14)),
+                           (tabox.MAMA, (self.close,)),
+                           (tabox.MA, (self.close, 30, 7)),
+                           (tabox.HT_TRENDLINE, (self.close,))):
+            this_ret = func(*args, unstable_period=30)
+            that_ret = self.with_globals(func, *args, unstable_period=30)
+            self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True), func.__name__)
+            self.assertFalse(np.array_equal(this_ret, func(*args), equal_nan=True), func.__name__)
+
+    def test_context(self):
+        with tabox.settings(unstable_period={"EMA": 7, TA_FuncUnstId.TA_FUNC_UNST_RSI: 3}):
+            self.assertEqual(TA_GetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_EMA), 7)
+            self.assertEqual(TA_GetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ADX), 0)
+            with tabox.settings(compatibility=TA_Compatibility.TA_COMPATIBILITY_METASTOCK):
+                self.assertEqual(TA_GetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_RSI), 3)
+                self.assertEqual(TA_GetCompatibility(), TA_Compatibility.TA_COMPATIBILITY_METASTOCK)
+            self.assertEqual(TA_GetCompatibility(), TA_Compatibility.TA_COMPATIBILITY_DEFAULT)
+            self.assertTrue(np.array_equal(tabox.EMA(self.close, 10), tabox.EMA(self.close, 10, unstable_period=7),
+                                           equal_nan=True))
+        self.assertEqual(TA_GetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_EMA), 0)
+
+        # The settings not overridden follow the process-wide ones.
+        with tabox.settings(compatibility="metastock"):
+            self.assertEqual(self.with_globals(TA_GetUnstablePeriod, TA_FuncUnstId.TA_FUNC_UNST_EMA,
+                                               unstable_period=9), 9)
+
+    def test_threads(self):
+        # Threads compute with their own settings at the same time.
+        periods = [0, 10, 50, 100]
+        results = {}
+        barrier = threading.Barrier(len(periods))
+
+        def run(period):
+            with tabox.settings(unstable_period=period):
+                barrier.wait()
+                for _ in range(5):
+                    results[period] = tabox.EMA(self.close, 10)
+
+        threads = [threading.Thread(target=run, args=(period,)) for period in periods]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for period in periods:
+            self.assertTrue(np.array_equal(results[period], tabox.EMA(self.close, 10, unstable_period=period),
+                                           equal_nan=True))
+
+        with tabox.settings(unstable_period=20):
+            this_ret = tabox.parallel.map(tabox.EMA, [self.close] * 4, workers=2, timeperiod=10)
+        for values in this_ret:
+            self.assertTrue(np.array_equal(values, tabox.EMA(self.close, 10, unstable_period=20), equal_nan=True))
+
+    def test_errors(self):
+        with self.assertRaises(Exception):
+            tabox.EMA(self.close, 10, unstable_period={"SMA": 5})
+        with self.assertRaises(Exception):
+            tabox.EMA(self.close, 10, unstable_period=-1)
+        with self.assertRaises(Exception):
+            tabox.RSI(self.close, 14, compatibility="excel")
+        self.assertEqual(TA_GetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_EMA), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import numpy as np
+import unittest
+
+import tabox
+from tabox import stream
+
+
+class TestStream(unittest.TestCase):
+
+    def assertSame(self, this_ret, that_ret):
+        self.assertTrue(np.array_equal(this_ret, that_ret, equal_nan=True))
+
+    def test_single_input(self):
+        for i in range(50, 120, 7):
+            real = np.random.random(i)
+            for t in [2, 5, 14]:
+                self.assertSame(stream.SMA(t).update_many(real), tabox.SMA(real, t))
+                self.assertSame(stream.SUM(t).update_many(real), tabox.SUM(real, t))
+                self.assertSame(stream.EMA(t).update_many(real), tabox.EMA(real, t))
+                self.assertSame(stream.RSI(t).update_many(real), tabox.RSI(real, t))
+                self.assertSame(stream.MOM(t).update_many(real), tabox.MOM(real, t))
+                self.assertSame(stream.VAR(t).update_many(real), tabox.VAR(real, t))
+                self.assertSame(stream.STDDEV(t, 2.0).update_many(real), tabox.STDDEV(real, t, 2.0))
+                for this_ret, that_ret in zip(
+                    stream.BBANDS(t, 2.0, 1.5).update_many(real), tabox.BBANDS(real, t, 2.0, 1.5)
+                ):
+                    self.assertSame(this_ret, that_ret)
+
+    def test_macd(self):
+        for i in range(60, 120, 11):
+            real = np.random.random(i)
+            for fast, slow, signal in [(12, 26, 9), (3, 10, 1), (8, 5, 4)]:
+                for this_ret, that_ret in zip(
+                    stream.MACD(fast, slow, signal).update_many(real),
+                    tabox.MACD(real, fast, slow, signal),
+                ):
+                    self.assertSame(this_ret, that_ret)
+
+    def test_hlc(self):
+        for i in range(50, 120, 7):
+            high = np.random.random(i) + 1.0
+            low = high - np.random.random(i)
+            close = (high + low) / 2.0
+            self.assertSame(stream.TRANGE().update_many(high, low, close), tabox.TRANGE(high, low, close))
+            for t in [2, 5, 14]:
+                self.assertSame(stream.ATR(t).update_many(high, low, close), tabox.ATR(high, low, close, t))
+                self.assertSame(stream.ADX(t).update_many(high, low, close), tabox.ADX(high, low, close, t))
+
+    def test_update(self):
+        real = np.random.random(100)
+        rsi = stream.RSI(14)
+        rsi.update_many(real[:60])
+        values = [rsi.update(v) for v in real[60:]]
+        self.assertSame(np.array(values), tabox.RSI(real, 14)[60:])
+
+    def test_leading_nan(self):
+        real = np.random.random(50)
+        real[:5] = np.nan
+        self.assertSame(stream.SMA(5).update_many(real), tabox.SMA(real, 5))
+        self.assertSame(stream.EMA(5).update_many(real), tabox.EMA(real, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
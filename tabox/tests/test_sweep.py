@@ -0,0 +1,92 @@
+import numpy as np
+import unittest
+
+import tabox
+from tabox.ta_func.ta_utility import TA_SetUnstablePeriod, TA_FuncUnstId
+
+
+class TestSweep(unittest.TestCase):
+
+    periods = (2, 3, 5, 14, 30, 250, 1000)
+
+    def real(self, length=600):
+        real = np.random.random(length) + 10.0
+        real[:4] = np.nan
+        return real
+
+    def check(self, name, compare, **kwargs):
+        real = self.real()
+        this_ret = getattr(tabox.sweep, name)(real, periods=self.periods, **kwargs)
+        self.assertEqual(this_ret.shape, (len(self.periods), real.shape[0]))
+        for row, period in zip(this_ret, self.periods):
+            that_ret = getattr(tabox, name)(real, period, **kwargs)
+            self.assertTrue(compare(row, that_ret, equal_nan=True))
+
+    def test_sum_family(self):
+        self.check("SUM", np.allclose)
+        self.check("SMA", np.allclose)
+        self.check("VAR", np.allclose)
+        self.check("STDDEV", np.allclose)
+        self.check("STDDEV", np.allclose, nbdev=2.5)
+
+    def test_lag_family(self):
+        self.check("MOM", np.array_equal)
+        self.check("ROC", np.array_equal)
+
+    def test_ema_family(self):
+        self.check("EMA", np.array_equal)
+        self.check("DEMA", np.array_equal)
+        self.check("TEMA", np.array_equal)
+        self.check("T3", np.array_equal)
+        self.check("T3", np.array_equal, vfactor=0.3)
+        self.check("TRIX", np.array_equal)
+
+    def test_ema_unstable(self):
+        try:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_EMA, 7)
+            self.check("EMA", np.array_equal)
+            self.check("TEMA", np.array_equal)
+            self.check_macd()
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+
+    def check_macd(self):
+        real = self.real()
+        fastperiods, slowperiods, signalperiods = (3, 12, 26), (26, 10, 12, 300), (2, 9)
+        this_ret = tabox.sweep.MACD(real, fastperiods, slowperiods, signalperiods)
+        for a, fast in enumerate(fastperiods):
+            for b, slow in enumerate(slowperiods):
+                for c, signal in enumerate(signalperiods):
+                    that_ret = tabox.MACD(real, fast, slow, signal)
+                    for this_line, that_line in zip(this_ret, that_ret):
+                        self.assertTrue(np.array_equal(this_line[a, b, c], that_line, equal_nan=True))
+
+    def test_macd(self):
+        self.check_macd()
+
+    def test_bbands(self):
+        real = self.real()
+        this_ret = tabox.sweep.BBANDS(real, self.periods, nbdevup=2.0, nbdevdn=1.5)
+        for i, period in enumerate(self.periods):
+            that_ret = tabox.BBANDS(real, period, 2.0, 1.5)
+            for this_band, that_band in zip(this_ret, that_ret):
+                self.assertTrue(np.allclose(this_band[i], that_band, equal_nan=True))
+
+    def test_out(self):
+        real = self.real()
+        out = np.zeros((len(self.periods), real.shape[0]))
+        self.assertIs(tabox.sweep.SMA(real, self.periods, out=out), out)
+        self.assertTrue(np.array_equal(out, tabox.sweep.SMA(real, self.periods), equal_nan=True))
+        with self.assertRaises(Exception):
+            tabox.sweep.SMA(real, self.periods, out=out[:, :10])
+
+    def test_bad_periods(self):
+        real = self.real()
+        with self.assertRaises(Exception):
+            tabox.sweep.SMA(real, [])
+        with self.assertRaises(Exception):
+            tabox.sweep.SMA(real, [14, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
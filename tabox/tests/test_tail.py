@@ -0,0 +1,83 @@
+import numpy as np
+import unittest
+
+import tabox
+from tabox.ta_func.ta_utility import TA_SetUnstablePeriod, TA_FuncUnstId
+
+
+class TestTail(unittest.TestCase):
+
+    def setUp(self):
+        self.high = np.random.random(500) + 11.0
+        self.low = self.high - 1.0 - np.random.random(500)
+        self.close = self.low + np.random.random(500)
+        for real in (self.high, self.low, self.close):
+            real[:3] = np.nan
+
+    def test_windowed(self):
+        # Windowed indicators give their full history values.
+        self.assertTrue(np.array_equal(tabox.MOM(self.close, 10, last=50), tabox.MOM(self.close, 10)[-50:]))
+        self.assertTrue(np.array_equal(tabox.WILLR(self.high, self.low, self.close, 14, start=100),
+                                       tabox.WILLR(self.high, self.low, self.close, 14)[100:]))
+        self.assertTrue(np.allclose(tabox.SMA(self.close, 20, last=50), tabox.SMA(self.close, 20)[-50:]))
+        for this_ret, that_ret in zip(tabox.MINMAXINDEX(self.close, 10, last=50), tabox.MINMAXINDEX(self.close, 10)):
+            self.assertTrue(np.array_equal(this_ret, that_ret[-50:]))
+        self.assertTrue(np.array_equal(tabox.CDLDOJI(self.close, self.high, self.low, self.close, last=50),
+                                       tabox.CDLDOJI(self.close, self.high, self.low, self.close)[-50:]))
+
+    def test_recursive(self):
+        # Recursive indicators start from the warm-up like TA-Lib's startIdx.
+        this_ret = tabox.EMA(self.close, 10, last=50)
+        self.assertTrue(np.array_equal(this_ret, tabox.EMA(self.close[-59:], 10)[-50:]))
+        try:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_EMA, 200)
+            self.assertTrue(np.allclose(tabox.EMA(self.close, 10, last=50), tabox.EMA(self.close, 10)[-50:]))
+        finally:
+            TA_SetUnstablePeriod(TA_FuncUnstId.TA_FUNC_UNST_ALL, 0)
+
+    def test_lookback_longer_than_series(self):
+        self.assertTrue(np.array_equal(tabox.SMA(self.close, 30, last=480), tabox.SMA(self.close, 30)[-480:],
+                                       equal_nan=True))
+        self.assertTrue(np.array_equal(tabox.SMA(self.close, 30, start=0), tabox.SMA(self.close, 30),
+                                       equal_nan=True))
+        self.assertEqual(tabox.SMA(self.close, 30, last=0).shape, (0,))
+
+    def test_multiple_outputs(self):
+        this_ret = tabox.MACD(self.close, 12, 26, 9, last=20)
+        self.assertEqual([a.shape for a in this_ret], [(20,)] * 3)
+        bands = tabox.bundle.bands(self.close, 20, start=450)
+        for name, values in tabox.bundle.bands(self.close, 20).items():
+            self.assertTrue(np.allclose(bands[name], values[450:]))
+
+    def test_out(self):
+        full = tabox.MOM(self.close, 10)
+        out = np.zeros(500)
+        self.assertIs(tabox.MOM(self.close, 10, last=50, out=out), out)
+        self.assertTrue(np.array_equal(out[-50:], full[-50:]))
+        self.assertFalse(out[:-50].any())
+        out = np.zeros(50)
+        tabox.MOM(self.close, 10, last=50, out=out)
+        self.assertTrue(np.array_equal(out, full[-50:]))
+        with self.assertRaises(Exception):
+            tabox.MOM(self.close, 10, last=50, out=np.zeros(60))
+
+    def test_2d(self):
+        closes = np.random.random((4, 300))
+        self.assertTrue(np.array_equal(tabox.MOM(closes, 10, last=30), tabox.MOM(closes, 10)[:, -30:]))
+        self.assertTrue(np.array_equal(tabox.MAXINDEX(closes.T, 10, last=30, axis=0),
+                                       tabox.MAXINDEX(closes.T, 10, axis=0)[-30:]))
+        out = np.zeros((4, 300))
+        tabox.MOM(closes, 10, last=30, out=out)
+        self.assertTrue(np.array_equal(out[:, -30:], tabox.MOM(closes, 10)[:, -30:]))
+
+    def test_bad_range(self):
+        with self.assertRaises(Exception):
+            tabox.SMA(self.close, 10, last=501)
+        with self.assertRaises(Exception):
+            tabox.SMA(self.close, 10, start=-1)
+        with self.assertRaises(Exception):
+            tabox.SMA(self.close, 10, start=10, last=10)
+
+
+if __name__ == '__main__':
+    unittest.main()